@@ -0,0 +1,123 @@
+"""Measure payload throughput with and without batch processing.
+
+A fleet of gateways (each reporting eight temperature/humidity channels) posts a new
+payload at once; those payloads are processed one at a time and as a single batch (as
+with --batch-window):
+
+    $ python benchmarks/batch_processing.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import timeit
+from pathlib import Path
+from typing import Any
+
+from ecowitt2mqtt.config import Config
+from ecowitt2mqtt.data import ProcessedData, ProcessingBatch
+from ecowitt2mqtt.helpers.calculator.channel import CHANNELS
+from ecowitt2mqtt.util import meteo_batch
+
+FIXTURE_PATH = (
+    Path(__file__).parent.parent / "tests" / "fixtures" / "payload_gw2000a_2.json"
+)
+
+
+def get_fleet_payloads(
+    payload: dict[str, Any], gateway_count: int
+) -> list[dict[str, Any]]:
+    """Get a payload for each gateway of a fleet (with its own channel values).
+
+    Args:
+        payload: An Ecowitt data payload to base the payloads on.
+        gateway_count: The number of gateways.
+
+    Returns:
+        A list of payloads.
+    """
+    payloads = []
+    for index in range(gateway_count):
+        gateway_payload = payload | {"PASSKEY": f"{index:032}"}
+        for channel in CHANNELS:
+            gateway_payload[f"temp{channel.number}f"] = f"{random.uniform(20, 95):.1f}"
+            gateway_payload[channel.humidity_key] = str(random.randint(10, 99))
+        payloads.append(gateway_payload)
+    return payloads
+
+
+def process_batch(
+    config: Config, payloads: list[dict[str, Any]], previous: list[ProcessedData]
+) -> None:
+    """Process a series of payloads as a single batch.
+
+    Args:
+        config: A Config object.
+        payloads: The payloads to process.
+        previous: The previous ProcessedData of each payload's gateway.
+    """
+    batch = ProcessingBatch()
+    for payload, previous_data in zip(payloads, previous):
+        ProcessedData(config, payload, previous_data, batch)
+    batch.finish()
+
+
+def process_each(
+    config: Config, payloads: list[dict[str, Any]], previous: list[ProcessedData]
+) -> None:
+    """Process a series of payloads one at a time.
+
+    Args:
+        config: A Config object.
+        payloads: The payloads to process.
+        previous: The previous ProcessedData of each payload's gateway.
+    """
+    for payload, previous_data in zip(payloads, previous):
+        ProcessedData(config, payload, previous_data)
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument(
+        "-n",
+        "--number",
+        default=20,
+        help="The number of times to process each fleet's payloads (default: 20)",
+        type=int,
+    )
+    args = parser.parse_args()
+
+    random.seed(0)
+    config = Config(mqtt_broker="127.0.0.1", mqtt_topic="benchmark")
+    payload = json.loads(FIXTURE_PATH.read_text())
+
+    print(f"NumPy installed: {meteo_batch.np is not None}")
+    print(
+        f"{'gateways':>8}{'each payloads/s':>18}{'batch payloads/s':>18}{'speedup':>9}"
+    )
+    for gateway_count in (1, 8, 64, 256, 1024):
+        # The gateways' previous payloads (whose channel values are all different):
+        previous = [
+            ProcessedData(config, previous_payload)
+            for previous_payload in get_fleet_payloads(payload, gateway_count)
+        ]
+        payloads = get_fleet_payloads(payload, gateway_count)
+
+        each = timeit.timeit(
+            lambda: process_each(config, payloads, previous), number=args.number
+        )
+        batch = timeit.timeit(
+            lambda: process_batch(config, payloads, previous), number=args.number
+        )
+        total = gateway_count * args.number
+        print(
+            f"{gateway_count:>8}{total / each:>18.0f}{total / batch:>18.0f}"
+            f"{each / batch:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
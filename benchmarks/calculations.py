@@ -0,0 +1,82 @@
+"""Measure how long calculating the calculated data points of a payload takes.
+
+Every test fixture is processed with and without calculated data; the difference is
+the time spent on calculated data points (and the intermediates they share). Each is
+also processed incrementally (as a repeat of the gateway's previous payload, which is
+the best case):
+
+    $ python benchmarks/calculations.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from pathlib import Path
+from typing import Any
+
+from ecowitt2mqtt.config import Config
+from ecowitt2mqtt.data import ProcessedData
+
+FIXTURES_PATH = Path(__file__).parent.parent / "tests" / "fixtures"
+
+
+def benchmark(
+    config: Config,
+    payload: dict[str, Any],
+    number: int,
+    previous: ProcessedData | None = None,
+) -> float:
+    """Benchmark processing a payload.
+
+    Args:
+        config: A Config object.
+        payload: An Ecowitt data payload.
+        number: The number of times to process the payload.
+        previous: The gateway's previous ProcessedData (if any).
+
+    Returns:
+        The mean processing time (in microseconds).
+    """
+    seconds = timeit.timeit(
+        lambda: ProcessedData(config, payload, previous), number=number
+    )
+    return seconds / number * 1e6
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument(
+        "-n",
+        "--number",
+        default=500,
+        help="The number of times to process each payload (default: 500)",
+        type=int,
+    )
+    args = parser.parse_args()
+
+    config = Config(mqtt_broker="127.0.0.1", mqtt_topic="benchmark")
+    raw_config = Config(
+        disable_calculated_data=True, mqtt_broker="127.0.0.1", mqtt_topic="benchmark"
+    )
+
+    print(f"{'fixture':<32}{'total µs':>10}{'calculated µs':>16}{'incremental µs':>16}")
+    for path in sorted(FIXTURES_PATH.glob("payload_*.json")):
+        payload = json.loads(path.read_text())
+        if "stationtype" not in payload:
+            # Payloads in other input formats are normalized by their API server
+            # first; it's enough to benchmark the Ecowitt ones:
+            continue
+
+        total = benchmark(config, payload, args.number)
+        raw = benchmark(raw_config, payload, args.number)
+        incremental = benchmark(
+            config, payload, args.number, ProcessedData(config, payload)
+        )
+        print(f"{path.stem:<32}{total:>10.1f}{total - raw:>16.1f}{incremental:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Compare the size and encoding time of each MQTT payload encoding.
+
+Every test fixture is processed the same way the topic publisher processes incoming
+data, then encoded with each encoding (with and without compression):
+
+    $ python benchmarks/encodings.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from pathlib import Path
+
+from ecowitt2mqtt.config import Config
+from ecowitt2mqtt.const import MqttEncoding
+from ecowitt2mqtt.data import ProcessedData
+from ecowitt2mqtt.helpers.publisher.mqtt import encode_mqtt_payload
+from ecowitt2mqtt.helpers.typing import CalculatedValueType
+
+FIXTURES_PATH = Path(__file__).parent.parent / "tests" / "fixtures"
+
+# A threshold low enough that every fixture is compressed:
+COMPRESSION_THRESHOLD = 1
+
+
+def benchmark(
+    data: dict[str, CalculatedValueType],
+    encoding: MqttEncoding,
+    compression_threshold: int | None,
+    number: int,
+) -> tuple[int, float]:
+    """Benchmark encoding a payload.
+
+    Args:
+        data: A processed data payload.
+        encoding: The encoding to use.
+        compression_threshold: The payload size (in bytes) at which to compress.
+        number: The number of times to encode the payload.
+
+    Returns:
+        A tuple of the payload size (in bytes) and the mean encoding time (in
+        microseconds).
+    """
+    size = len(encode_mqtt_payload(data, encoding, compression_threshold))
+    seconds = timeit.timeit(
+        lambda: encode_mqtt_payload(data, encoding, compression_threshold),
+        number=number,
+    )
+    return size, seconds / number * 1e6
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument(
+        "-n",
+        "--number",
+        default=2000,
+        help="The number of times to encode each payload (default: 2000)",
+        type=int,
+    )
+    args = parser.parse_args()
+
+    config = Config(mqtt_broker="127.0.0.1", mqtt_topic="benchmark")
+    total_micros: dict[str, float] = {}
+    total_sizes: dict[str, int] = {}
+
+    print(f"{'fixture':<32}{'encoding':<16}{'bytes':>8}{'µs':>10}")
+    for path in sorted(FIXTURES_PATH.glob("payload_*.json")):
+        payload = json.loads(path.read_text())
+        if "stationtype" not in payload:
+            # Payloads in other input formats are normalized by their API server
+            # first; it's enough to benchmark the Ecowitt ones:
+            continue
+
+        processed_data = ProcessedData(config, payload)
+        data = {key: value.value for key, value in processed_data.output.items()}
+
+        for encoding in MqttEncoding:
+            for compression_threshold in (None, COMPRESSION_THRESHOLD):
+                label = f"{encoding}+zlib" if compression_threshold else encoding
+                size, micros = benchmark(
+                    data, encoding, compression_threshold, args.number
+                )
+                total_micros[label] = total_micros.get(label, 0.0) + micros
+                total_sizes[label] = total_sizes.get(label, 0) + size
+                print(f"{path.stem:<32}{label:<16}{size:>8}{micros:>10.1f}")
+
+    print()
+    print(f"{'total':<32}{'encoding':<16}{'bytes':>8}{'µs':>10}")
+    for label, size in total_sizes.items():
+        print(f"{'':<32}{label:<16}{size:>8}{total_micros[label]:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
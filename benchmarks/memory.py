@@ -0,0 +1,172 @@
+"""Measure how much memory payloads and cached entities take up.
+
+A fleet of gateways (each reporting eight temperature/humidity channels) posts its
+payloads; tracemalloc measures the memory held by each in-flight payload (its raw data
+and its ProcessedData) and by each entity cached between payloads (the last
+ProcessedData of every gateway and the Home Assistant discovery info of every entity):
+
+    $ python benchmarks/memory.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import math
+import random
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+from aiomqtt import Client
+
+from ecowitt2mqtt.config import Config
+from ecowitt2mqtt.data import ProcessedData, ProcessedDataCache
+from ecowitt2mqtt.helpers.calculator.channel import CHANNELS
+from ecowitt2mqtt.helpers.publisher.mqtt.hass import HomeAssistantDiscoveryPublisher
+
+_T = TypeVar("_T")
+
+FIXTURE_PATH = (
+    Path(__file__).parent.parent / "tests" / "fixtures" / "payload_gw2000a_2.json"
+)
+
+
+class StandInClient:  # pylint: disable=too-few-public-methods
+    """Define a stand-in MQTT client that drops every message."""
+
+    async def publish(self, *args: Any, **kwargs: Any) -> None:
+        """Publish a message (by doing nothing).
+
+        Args:
+            *args: The positional arguments of the message.
+            **kwargs: The keyword arguments of the message.
+        """
+
+
+def get_fleet_payloads(
+    payload: dict[str, Any], gateway_count: int
+) -> list[dict[str, Any]]:
+    """Get a payload for each gateway of a fleet (with its own channel values).
+
+    Args:
+        payload: An Ecowitt data payload to base the payloads on.
+        gateway_count: The number of gateways.
+
+    Returns:
+        A list of payloads.
+    """
+    payloads = []
+    for index in range(gateway_count):
+        gateway_payload = payload | {"PASSKEY": f"{index:032}"}
+        for channel in CHANNELS:
+            gateway_payload[f"temp{channel.number}f"] = f"{random.uniform(20, 95):.1f}"
+            gateway_payload[channel.humidity_key] = str(random.randint(10, 99))
+        payloads.append(gateway_payload)
+    return payloads
+
+
+def get_filled_cache(
+    config: Config, payloads: list[dict[str, Any]]
+) -> ProcessedDataCache:
+    """Get a ProcessedDataCache that holds the ProcessedData of a series of payloads.
+
+    Args:
+        config: A Config object.
+        payloads: The payloads to process (one per gateway).
+
+    Returns:
+        A ProcessedDataCache object.
+    """
+    cache = ProcessedDataCache()
+    for payload in payloads:
+        cache.set(payload["PASSKEY"], ProcessedData(config, payload))
+    return cache
+
+
+def measure(factory: Callable[[], _T]) -> tuple[int, _T]:
+    """Measure the memory allocated (and still held) by a factory.
+
+    Args:
+        factory: A function that creates the objects to measure.
+
+    Returns:
+        The number of bytes held and the created objects (which are kept alive).
+    """
+    gc.collect()
+    before, _ = tracemalloc.get_traced_memory()
+    result = factory()
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    return after - before, result
+
+
+async def publish_all(
+    publisher: HomeAssistantDiscoveryPublisher, cache: ProcessedDataCache
+) -> None:
+    """Publish the cached ProcessedData of every gateway.
+
+    Args:
+        publisher: A HomeAssistantDiscoveryPublisher object.
+        cache: A ProcessedDataCache object.
+    """
+    for _, processed_data in cache.items():
+        await publisher.async_publish(processed_data.data, processed_data)
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument(
+        "-e",
+        "--entities",
+        default=10000,
+        help="The number of entities to cache (default: 10000)",
+        type=int,
+    )
+    args = parser.parse_args()
+
+    random.seed(0)
+    config = Config(
+        hass_discovery=True, mqtt_broker="127.0.0.1", mqtt_topic="benchmark"
+    )
+    payload = json.loads(FIXTURE_PATH.read_text())
+    entities_per_gateway = len(ProcessedData(config, payload).output)
+    gateway_count = math.ceil(args.entities / entities_per_gateway)
+    entity_count = gateway_count * entities_per_gateway
+
+    tracemalloc.start()
+
+    # The gateways' previous payloads (as the ProcessedDataCache holds them):
+    cache_bytes, cache = measure(
+        lambda: get_filled_cache(config, get_fleet_payloads(payload, gateway_count))
+    )
+
+    publisher = HomeAssistantDiscoveryPublisher(config, cast(Client, StandInClient()))
+    discovery_bytes, _ = measure(lambda: asyncio.run(publish_all(publisher, cache)))
+
+    # The gateways' next payloads (whose channel values are all different):
+    raw_bytes, payloads = measure(lambda: get_fleet_payloads(payload, gateway_count))
+    in_flight_bytes, _ = measure(
+        lambda: [
+            ProcessedData(config, next_payload, cache.get(next_payload["PASSKEY"]))
+            for next_payload in payloads
+        ]
+    )
+
+    tracemalloc.stop()
+
+    print(f"{gateway_count} gateways, {entity_count} entities")
+    print("Bytes per in-flight payload:")
+    print(f"  {'raw data':<24}{raw_bytes / gateway_count:>10.0f}")
+    print(f"  {'ProcessedData':<24}{in_flight_bytes / gateway_count:>10.0f}")
+    print("Bytes per cached entity:")
+    print(f"  {'ProcessedDataCache':<24}{cache_bytes / entity_count:>10.0f}")
+    print(f"  {'discovery info':<24}{discovery_bytes / entity_count:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
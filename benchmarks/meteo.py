@@ -0,0 +1,154 @@
+"""Compare the time and memory each meteorological calculation takes.
+
+Each calculation is timed and the peak memory it allocates along the way is traced. If
+the meteocalc package is installed, the meteocalc-based implementations that
+ecowitt2mqtt used to have (which create a meteocalc.Temp object for every temperature)
+are measured too:
+
+    $ python benchmarks/meteo.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import timeit
+import tracemalloc
+from collections.abc import Callable
+
+from ecowitt2mqtt.const import UnitOfTemperature, UnitSystem
+from ecowitt2mqtt.util.meteo import (
+    celsius_to_fahrenheit,
+    get_dew_point_in_celsius,
+    get_feels_like_in_fahrenheit,
+    get_frost_point_in_celsius,
+    get_heat_index_in_fahrenheit,
+    get_humidex,
+    get_temperature_in_celsius,
+    get_temperature_in_fahrenheit,
+)
+from ecowitt2mqtt.util.unit_conversion import TemperatureConverter
+
+try:
+    import meteocalc
+except ImportError:
+    meteocalc = None
+
+# Metric inputs (like a gateway reporting in metric would send):
+HUMIDITY = 65.0
+TEMPERATURE = 30.0
+UNIT_SYSTEM = UnitSystem.METRIC
+WIND_SPEED = 10.0
+
+
+def get_calculations() -> dict[str, Callable[[], float]]:
+    """Get the calculations to benchmark.
+
+    Returns:
+        A dictionary of calculation labels to calculations.
+    """
+    calculations: dict[str, Callable[[], float]] = {
+        "dew point": lambda: celsius_to_fahrenheit(
+            get_dew_point_in_celsius(
+                get_temperature_in_celsius(TEMPERATURE, UNIT_SYSTEM), HUMIDITY
+            )
+        ),
+        "feels like": lambda: get_feels_like_in_fahrenheit(
+            get_temperature_in_fahrenheit(TEMPERATURE, UNIT_SYSTEM),
+            HUMIDITY,
+            WIND_SPEED,
+        ),
+        "frost point": lambda: celsius_to_fahrenheit(
+            get_frost_point_in_celsius(
+                get_temperature_in_celsius(TEMPERATURE, UNIT_SYSTEM), HUMIDITY
+            )
+        ),
+        "heat index": lambda: get_heat_index_in_fahrenheit(
+            get_temperature_in_fahrenheit(TEMPERATURE, UNIT_SYSTEM), HUMIDITY
+        ),
+        "humidex": lambda: get_humidex(
+            get_temperature_in_celsius(TEMPERATURE, UNIT_SYSTEM), HUMIDITY
+        ),
+    }
+
+    if meteocalc is None:
+        return calculations
+
+    def get_meteocalc_humidex() -> float:
+        """Get a humidex the way the meteocalc-based implementation did.
+
+        Returns:
+            The index.
+        """
+        dew_point_obj = meteocalc.dew_point(meteocalc.Temp(TEMPERATURE, "c"), HUMIDITY)
+        temp_obj = meteocalc.Temp(TEMPERATURE, "c")
+        dew_point_k = TemperatureConverter.convert(
+            dew_point_obj.c, UnitOfTemperature.CELSIUS, UnitOfTemperature.KELVIN
+        )
+        humidex: int = round(
+            temp_obj.c
+            + 0.5555
+            * (6.11 * math.exp(5417.7530 * ((1 / 273.16) - (1 / dew_point_k))) - 10)
+        )
+        return humidex
+
+    calculations |= {
+        "dew point (meteocalc)": lambda: meteocalc.dew_point(
+            meteocalc.Temp(TEMPERATURE, "c"), HUMIDITY
+        ).f,
+        "feels like (meteocalc)": lambda: meteocalc.feels_like(
+            meteocalc.Temp(TEMPERATURE, "c"), HUMIDITY, WIND_SPEED
+        ).f,
+        "heat index (meteocalc)": lambda: meteocalc.heat_index(
+            meteocalc.Temp(TEMPERATURE, "c"), HUMIDITY
+        ).f,
+        "humidex (meteocalc)": get_meteocalc_humidex,
+    }
+    return calculations
+
+
+def benchmark(calculation: Callable[[], float], number: int) -> tuple[float, int]:
+    """Benchmark a calculation.
+
+    Args:
+        calculation: The calculation to benchmark.
+        number: The number of times to run the calculation.
+
+    Returns:
+        A tuple of the mean time (in microseconds) and the peak memory allocated (in
+        bytes) per calculation.
+    """
+    seconds = timeit.timeit(calculation, number=number)
+
+    tracemalloc.start()
+    try:
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        calculation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return seconds / number * 1e6, peak - current
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument(
+        "-n",
+        "--number",
+        default=100000,
+        help="The number of times to run each calculation (default: 100000)",
+        type=int,
+    )
+    args = parser.parse_args()
+
+    print(f"{'calculation':<28}{'µs':>10}{'peak bytes':>12}")
+    for label, calculation in sorted(get_calculations().items()):
+        micros, peak = benchmark(calculation, args.number)
+        print(f"{label:<28}{micros:>10.3f}{peak:>12}")
+
+
+if __name__ == "__main__":
+    main()
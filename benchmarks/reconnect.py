@@ -0,0 +1,231 @@
+"""Measure how long reconnecting to an MQTT broker takes, with and without TLS.
+
+A local stand-in broker (which accepts connections and nothing more) is connected to
+repeatedly; over TLS, once with a new context per connection (a full handshake every
+time) and once with the context ecowitt2mqtt keeps per broker (which resumes the last
+TLS session). A self-signed certificate is generated with the openssl command:
+
+    $ python benchmarks/reconnect.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import ssl
+import statistics
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from aiomqtt import Client
+
+from ecowitt2mqtt.config import Config
+from ecowitt2mqtt.helpers.publisher.mqtt.tls import get_tls_context
+
+# MQTT control packet types (the upper nibble of a packet's first byte):
+PACKET_TYPE_CONNECT = 0x1
+PACKET_TYPE_DISCONNECT = 0xE
+PACKET_TYPE_PINGREQ = 0xC
+
+CONNACK = b"\x20\x02\x00\x00"
+PINGRESP = b"\xd0\x00"
+
+
+class StandInBroker:
+    """Define a stand-in MQTT broker that accepts every connection."""
+
+    def __init__(self, ssl_context: ssl.SSLContext | None) -> None:
+        """Initialize.
+
+        Args:
+            ssl_context: The SSL context to serve TLS with (or None for plain TCP).
+        """
+        self.resumed_sessions = 0
+        self._server: asyncio.Server | None = None
+        self._ssl_context = ssl_context
+
+    @property
+    def port(self) -> int:
+        """Return the port the broker listens on.
+
+        Returns:
+            A port number.
+        """
+        assert self._server
+        port: int = self._server.sockets[0].getsockname()[1]
+        return port
+
+    async def _async_handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Handle a client connection.
+
+        Args:
+            reader: The stream to read from.
+            writer: The stream to write to.
+        """
+        if (ssl_object := writer.get_extra_info("ssl_object")) is not None:
+            self.resumed_sessions += ssl_object.session_reused
+
+        try:
+            while True:
+                header = await reader.readexactly(1)
+                # The remaining length is a variable-length integer:
+                length, multiplier = 0, 1
+                while True:
+                    byte = (await reader.readexactly(1))[0]
+                    length += (byte & 0x7F) * multiplier
+                    multiplier *= 128
+                    if not byte & 0x80:
+                        break
+                await reader.readexactly(length)
+
+                packet_type = header[0] >> 4
+                if packet_type == PACKET_TYPE_CONNECT:
+                    writer.write(CONNACK)
+                elif packet_type == PACKET_TYPE_PINGREQ:
+                    writer.write(PINGRESP)
+                elif packet_type == PACKET_TYPE_DISCONNECT:
+                    break
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def async_start(self) -> None:
+        """Start the broker."""
+        self._server = await asyncio.start_server(
+            self._async_handle_client, "127.0.0.1", 0, ssl=self._ssl_context
+        )
+
+    async def async_stop(self) -> None:
+        """Stop the broker."""
+        assert self._server
+        self._server.close()
+        await self._server.wait_closed()
+
+
+def generate_certificate(directory: Path) -> tuple[Path, Path]:
+    """Generate a self-signed certificate for 127.0.0.1.
+
+    Args:
+        directory: The directory to write the certificate and key to.
+
+    Returns:
+        A tuple of the certificate and key paths.
+    """
+    certfile = directory / "cert.pem"
+    keyfile = directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "ec",
+            "-pkeyopt",
+            "ec_paramgen_curve:prime256v1",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=127.0.0.1",
+            "-addext",
+            "subjectAltName=IP:127.0.0.1",
+            "-keyout",
+            str(keyfile),
+            "-out",
+            str(certfile),
+        ],
+        capture_output=True,
+        check=True,
+    )
+    return certfile, keyfile
+
+
+async def async_benchmark(
+    port: int,
+    get_context: Callable[[], ssl.SSLContext | None],
+    number: int,
+) -> list[float]:
+    """Benchmark connecting to the stand-in broker.
+
+    Args:
+        port: The port of the stand-in broker.
+        get_context: A callable that returns the SSL context for each connection.
+        number: The number of times to connect.
+
+    Returns:
+        The time (in milliseconds) each connection took.
+    """
+    timings = []
+    for _ in range(number):
+        start = time.perf_counter()
+        async with Client("127.0.0.1", port=port, tls_context=get_context()):
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def async_main(number: int) -> None:
+    """Run the benchmarks.
+
+    Args:
+        number: The number of times to connect in each mode.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        certfile, keyfile = generate_certificate(Path(directory))
+        server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        server_context.load_cert_chain(certfile, keyfile)
+
+        config = Config(
+            mqtt_broker="127.0.0.1",
+            mqtt_tls=True,
+            mqtt_tls_ca_file=str(certfile),
+            mqtt_topic="benchmark",
+        )
+        resumable_context = get_tls_context(config)
+        modes: list[
+            tuple[str, ssl.SSLContext | None, Callable[[], ssl.SSLContext | None]]
+        ] = [
+            ("tcp", None, lambda: None),
+            ("tls (full handshake)", server_context, lambda: get_tls_context(config)),
+            ("tls (resumed session)", server_context, lambda: resumable_context),
+        ]
+
+        print(f"{'mode':<24}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'resumed':>10}")
+        for label, context, get_context in modes:
+            broker = StandInBroker(context)
+            await broker.async_start()
+            try:
+                timings = await async_benchmark(broker.port, get_context, number)
+            finally:
+                await broker.async_stop()
+
+            p95 = statistics.quantiles(timings, n=20)[-1]
+            print(
+                f"{label:<24}{statistics.mean(timings):>10.2f}"
+                f"{statistics.median(timings):>10.2f}{p95:>10.2f}"
+                f"{broker.resumed_sessions:>10}"
+            )
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument(
+        "-n",
+        "--number",
+        default=200,
+        help="The number of times to connect in each mode (default: 200)",
+        type=int,
+    )
+    args = parser.parse_args()
+    asyncio.run(async_main(args.number))
+
+
+if __name__ == "__main__":
+    main()
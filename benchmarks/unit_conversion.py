@@ -0,0 +1,65 @@
+"""Compare converting values one at a time with converting them as a batch.
+
+Each pair of units is converted for a batch of values (like a gateway's channels
+would report) with the converter's convert and convert_many methods:
+
+    $ python benchmarks/unit_conversion.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from array import array
+
+from ecowitt2mqtt.const import (
+    UnitOfPressure,
+    UnitOfSpeed,
+    UnitOfTemperature,
+)
+from ecowitt2mqtt.util.unit_conversion import (
+    BaseUnitConverter,
+    PressureConverter,
+    SpeedConverter,
+    TemperatureConverter,
+)
+
+CONVERSIONS: list[tuple[type[BaseUnitConverter], str, str]] = [
+    (PressureConverter, UnitOfPressure.INHG, UnitOfPressure.HPA),
+    (SpeedConverter, UnitOfSpeed.MILES_PER_HOUR, UnitOfSpeed.METERS_PER_SECOND),
+    (TemperatureConverter, UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.CELSIUS),
+]
+VALUES = array("d", [68.4, 70.1, 29.92, 12.3, 55.0, 71.6, 45.2, 30.07])
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument(
+        "-n",
+        "--number",
+        default=20000,
+        help="The number of times to convert each batch (default: 20000)",
+        type=int,
+    )
+    args = parser.parse_args()
+
+    print(f"{'conversion':<20}{'convert µs':>12}{'convert_many µs':>18}")
+    for converter, from_unit, to_unit in CONVERSIONS:
+        single = timeit.timeit(
+            lambda: [converter.convert(value, from_unit, to_unit) for value in VALUES],
+            number=args.number,
+        )
+        batch = timeit.timeit(
+            lambda: converter.convert_many(VALUES, from_unit, to_unit),
+            number=args.number,
+        )
+        label = f"{from_unit} -> {to_unit}"
+        print(
+            f"{label:<20}{single / args.number * 1e6:>12.2f}"
+            f"{batch / args.number * 1e6:>18.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
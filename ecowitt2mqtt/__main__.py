@@ -10,6 +10,7 @@ from typing import Any
 import uvloop
 
 from ecowitt2mqtt.const import (
+    CONF_BATCH_WINDOW,
     CONF_BATTERY_OVERRIDES,
     CONF_BOOLEAN_BATTERY_TRUE_VALUE,
     CONF_CONFIG,
@@ -17,19 +18,50 @@ from ecowitt2mqtt.const import (
     CONF_DIAGNOSTICS,
     CONF_DISABLE_CALCULATED_DATA,
     CONF_ENDPOINT,
+    CONF_HASS_ATTRIBUTES_QOS,
     CONF_HASS_DISCOVERY,
+    CONF_HASS_DISCOVERY_MODE,
     CONF_HASS_DISCOVERY_PREFIX,
+    CONF_HASS_DISCOVERY_QOS,
+    CONF_HASS_DISCOVERY_RATE_LIMIT,
     CONF_HASS_ENTITY_ID_PREFIX,
+    CONF_HASS_REDISCOVERY_WINDOW,
+    CONF_HASS_STALE_SENSOR_INTERVALS,
+    CONF_HASS_STATE_QOS,
     CONF_INPUT_DATA_FORMAT,
     CONF_INPUT_UNIT_SYSTEM,
     CONF_LOCALE,
+    CONF_MQTT_AVAILABILITY_QOS,
+    CONF_MQTT_AVAILABILITY_TOPIC,
     CONF_MQTT_BROKER,
+    CONF_MQTT_BYTE_RATE_LIMIT,
+    CONF_MQTT_COMPRESSION_THRESHOLD,
+    CONF_MQTT_DNS_CACHE_TTL,
+    CONF_MQTT_ENCODING,
+    CONF_MQTT_FAILBACK,
+    CONF_MQTT_FAILOVER_BROKERS,
+    CONF_MQTT_HEALTH_CHECK_INTERVAL,
+    CONF_MQTT_IDLE_TIMEOUT,
+    CONF_MQTT_MAX_INFLIGHT,
+    CONF_MQTT_MESSAGE_EXPIRY,
     CONF_MQTT_PASSWORD,
     CONF_MQTT_PORT,
+    CONF_MQTT_QOS,
+    CONF_MQTT_RATE_LIMIT,
     CONF_MQTT_RETAIN,
+    CONF_MQTT_SESSION_EXPIRY,
+    CONF_MQTT_SUBTOPIC_UNITS,
+    CONF_MQTT_SUBTOPICS,
     CONF_MQTT_TLS,
+    CONF_MQTT_TLS_ALPN,
+    CONF_MQTT_TLS_CA_FILE,
+    CONF_MQTT_TLS_CERTFILE,
+    CONF_MQTT_TLS_KEYFILE,
+    CONF_MQTT_TLS_VERIFY,
     CONF_MQTT_TOPIC,
+    CONF_MQTT_TOPIC_ALIAS_MAXIMUM,
     CONF_MQTT_USERNAME,
+    CONF_MQTT_V5,
     CONF_OUTPUT_UNIT_ACCUMULATED_PRECIPITATION,
     CONF_OUTPUT_UNIT_DISTANCE,
     CONF_OUTPUT_UNIT_HUMIDITY,
@@ -41,13 +73,35 @@ from ecowitt2mqtt.const import (
     CONF_OUTPUT_UNIT_TEMPERATURE,
     CONF_PORT,
     CONF_PRECISION,
+    CONF_PUBLISHER_QUEUE_SIZE,
+    CONF_PUBLISHER_RETRIES,
     CONF_RAW_DATA,
+    CONF_SPOOL_DIRECTORY,
+    CONF_SPOOL_FSYNC,
+    CONF_SPOOL_MAX_AGE,
+    CONF_SPOOL_MAX_SIZE,
+    CONF_SPOOL_REPLAY_RATE,
     CONF_VERBOSE,
     DEFAULT_BOOLEAN_BATTERY_TRUE_VALUE,
     DEFAULT_ENDPOINT,
     DEFAULT_HASS_DISCOVERY_PREFIX,
+    DEFAULT_HASS_DISCOVERY_QOS,
+    DEFAULT_HASS_REDISCOVERY_WINDOW,
+    DEFAULT_HASS_STATE_QOS,
+    DEFAULT_MQTT_AVAILABILITY_QOS,
+    DEFAULT_MQTT_AVAILABILITY_TOPIC,
+    DEFAULT_MQTT_DNS_CACHE_TTL,
+    DEFAULT_MQTT_HEALTH_CHECK_INTERVAL,
     DEFAULT_MQTT_PORT,
+    DEFAULT_MQTT_SESSION_EXPIRY,
+    DEFAULT_MQTT_TOPIC_ALIAS_MAXIMUM,
     DEFAULT_PORT,
+    DEFAULT_PUBLISHER_QUEUE_SIZE,
+    DEFAULT_PUBLISHER_RETRIES,
+    DEFAULT_SPOOL_MAX_AGE,
+    DEFAULT_SPOOL_MAX_SIZE,
+    DEFAULT_SPOOL_REPLAY_RATE,
+    ENV_BATCH_WINDOW,
     ENV_BATTERY_OVERRIDES,
     ENV_BOOLEAN_BATTERY_TRUE_VALUE,
     ENV_CONFIG,
@@ -55,19 +109,50 @@ from ecowitt2mqtt.const import (
     ENV_DIAGNOSTICS,
     ENV_DISABLE_CALCULATED_DATA,
     ENV_ENDPOINT,
+    ENV_HASS_ATTRIBUTES_QOS,
     ENV_HASS_DISCOVERY,
+    ENV_HASS_DISCOVERY_MODE,
     ENV_HASS_DISCOVERY_PREFIX,
+    ENV_HASS_DISCOVERY_QOS,
+    ENV_HASS_DISCOVERY_RATE_LIMIT,
     ENV_HASS_ENTITY_ID_PREFIX,
+    ENV_HASS_REDISCOVERY_WINDOW,
+    ENV_HASS_STALE_SENSOR_INTERVALS,
+    ENV_HASS_STATE_QOS,
     ENV_INPUT_DATA_FORMAT,
     ENV_INPUT_UNIT_SYSTEM,
     ENV_LOCALE,
+    ENV_MQTT_AVAILABILITY_QOS,
+    ENV_MQTT_AVAILABILITY_TOPIC,
     ENV_MQTT_BROKER,
+    ENV_MQTT_BYTE_RATE_LIMIT,
+    ENV_MQTT_COMPRESSION_THRESHOLD,
+    ENV_MQTT_DNS_CACHE_TTL,
+    ENV_MQTT_ENCODING,
+    ENV_MQTT_FAILBACK,
+    ENV_MQTT_FAILOVER_BROKERS,
+    ENV_MQTT_HEALTH_CHECK_INTERVAL,
+    ENV_MQTT_IDLE_TIMEOUT,
+    ENV_MQTT_MAX_INFLIGHT,
+    ENV_MQTT_MESSAGE_EXPIRY,
     ENV_MQTT_PASSWORD,
     ENV_MQTT_PORT,
+    ENV_MQTT_QOS,
+    ENV_MQTT_RATE_LIMIT,
     ENV_MQTT_RETAIN,
+    ENV_MQTT_SESSION_EXPIRY,
+    ENV_MQTT_SUBTOPIC_UNITS,
+    ENV_MQTT_SUBTOPICS,
     ENV_MQTT_TLS,
+    ENV_MQTT_TLS_ALPN,
+    ENV_MQTT_TLS_CA_FILE,
+    ENV_MQTT_TLS_CERTFILE,
+    ENV_MQTT_TLS_KEYFILE,
+    ENV_MQTT_TLS_VERIFY,
     ENV_MQTT_TOPIC,
+    ENV_MQTT_TOPIC_ALIAS_MAXIMUM,
     ENV_MQTT_USERNAME,
+    ENV_MQTT_V5,
     ENV_OUTPUT_UNIT_ACCUMULATED_PRECIPITATION,
     ENV_OUTPUT_UNIT_DISTANCE,
     ENV_OUTPUT_UNIT_HUMIDITY,
@@ -79,16 +164,28 @@ from ecowitt2mqtt.const import (
     ENV_OUTPUT_UNIT_TEMPERATURE,
     ENV_PORT,
     ENV_PRECISION,
+    ENV_PUBLISHER_QUEUE_SIZE,
+    ENV_PUBLISHER_RETRIES,
     ENV_RAW_DATA,
+    ENV_SPOOL_DIRECTORY,
+    ENV_SPOOL_FSYNC,
+    ENV_SPOOL_MAX_AGE,
+    ENV_SPOOL_MAX_SIZE,
+    ENV_SPOOL_REPLAY_RATE,
     ENV_VERBOSE,
+    HassDiscoveryMode,
+    MqttEncoding,
+    MqttTlsVerify,
     UnitSystem,
     __version__,
 )
 from ecowitt2mqtt.core import Ecowitt
 from ecowitt2mqtt.helpers.calculator.battery import BatteryStrategy
 from ecowitt2mqtt.helpers.server import InputDataFormat
+from ecowitt2mqtt.helpers.spool import SpoolFsyncPolicy
 
 ENV_VAR_TO_CONF_MAP = {
+    ENV_BATCH_WINDOW: CONF_BATCH_WINDOW,
     ENV_BATTERY_OVERRIDES: CONF_BATTERY_OVERRIDES,
     ENV_BOOLEAN_BATTERY_TRUE_VALUE: CONF_BOOLEAN_BATTERY_TRUE_VALUE,
     ENV_CONFIG: CONF_CONFIG,
@@ -96,19 +193,50 @@ ENV_VAR_TO_CONF_MAP = {
     ENV_DIAGNOSTICS: CONF_DIAGNOSTICS,
     ENV_DISABLE_CALCULATED_DATA: CONF_DISABLE_CALCULATED_DATA,
     ENV_ENDPOINT: CONF_ENDPOINT,
+    ENV_HASS_ATTRIBUTES_QOS: CONF_HASS_ATTRIBUTES_QOS,
     ENV_HASS_DISCOVERY: CONF_HASS_DISCOVERY,
+    ENV_HASS_DISCOVERY_MODE: CONF_HASS_DISCOVERY_MODE,
     ENV_HASS_DISCOVERY_PREFIX: CONF_HASS_DISCOVERY_PREFIX,
+    ENV_HASS_DISCOVERY_QOS: CONF_HASS_DISCOVERY_QOS,
+    ENV_HASS_DISCOVERY_RATE_LIMIT: CONF_HASS_DISCOVERY_RATE_LIMIT,
     ENV_HASS_ENTITY_ID_PREFIX: CONF_HASS_ENTITY_ID_PREFIX,
+    ENV_HASS_REDISCOVERY_WINDOW: CONF_HASS_REDISCOVERY_WINDOW,
+    ENV_HASS_STALE_SENSOR_INTERVALS: CONF_HASS_STALE_SENSOR_INTERVALS,
+    ENV_HASS_STATE_QOS: CONF_HASS_STATE_QOS,
     ENV_LOCALE: CONF_LOCALE,
     ENV_INPUT_DATA_FORMAT: CONF_INPUT_DATA_FORMAT,
     ENV_INPUT_UNIT_SYSTEM: CONF_INPUT_UNIT_SYSTEM,
+    ENV_MQTT_AVAILABILITY_QOS: CONF_MQTT_AVAILABILITY_QOS,
+    ENV_MQTT_AVAILABILITY_TOPIC: CONF_MQTT_AVAILABILITY_TOPIC,
     ENV_MQTT_BROKER: CONF_MQTT_BROKER,
+    ENV_MQTT_BYTE_RATE_LIMIT: CONF_MQTT_BYTE_RATE_LIMIT,
+    ENV_MQTT_COMPRESSION_THRESHOLD: CONF_MQTT_COMPRESSION_THRESHOLD,
+    ENV_MQTT_DNS_CACHE_TTL: CONF_MQTT_DNS_CACHE_TTL,
+    ENV_MQTT_ENCODING: CONF_MQTT_ENCODING,
+    ENV_MQTT_FAILBACK: CONF_MQTT_FAILBACK,
+    ENV_MQTT_FAILOVER_BROKERS: CONF_MQTT_FAILOVER_BROKERS,
+    ENV_MQTT_HEALTH_CHECK_INTERVAL: CONF_MQTT_HEALTH_CHECK_INTERVAL,
+    ENV_MQTT_IDLE_TIMEOUT: CONF_MQTT_IDLE_TIMEOUT,
+    ENV_MQTT_MAX_INFLIGHT: CONF_MQTT_MAX_INFLIGHT,
+    ENV_MQTT_MESSAGE_EXPIRY: CONF_MQTT_MESSAGE_EXPIRY,
     ENV_MQTT_PASSWORD: CONF_MQTT_PASSWORD,
     ENV_MQTT_PORT: CONF_MQTT_PORT,
+    ENV_MQTT_QOS: CONF_MQTT_QOS,
+    ENV_MQTT_RATE_LIMIT: CONF_MQTT_RATE_LIMIT,
     ENV_MQTT_RETAIN: CONF_MQTT_RETAIN,
+    ENV_MQTT_SESSION_EXPIRY: CONF_MQTT_SESSION_EXPIRY,
+    ENV_MQTT_SUBTOPIC_UNITS: CONF_MQTT_SUBTOPIC_UNITS,
+    ENV_MQTT_SUBTOPICS: CONF_MQTT_SUBTOPICS,
     ENV_MQTT_TLS: CONF_MQTT_TLS,
+    ENV_MQTT_TLS_ALPN: CONF_MQTT_TLS_ALPN,
+    ENV_MQTT_TLS_CA_FILE: CONF_MQTT_TLS_CA_FILE,
+    ENV_MQTT_TLS_CERTFILE: CONF_MQTT_TLS_CERTFILE,
+    ENV_MQTT_TLS_KEYFILE: CONF_MQTT_TLS_KEYFILE,
+    ENV_MQTT_TLS_VERIFY: CONF_MQTT_TLS_VERIFY,
     ENV_MQTT_TOPIC: CONF_MQTT_TOPIC,
+    ENV_MQTT_TOPIC_ALIAS_MAXIMUM: CONF_MQTT_TOPIC_ALIAS_MAXIMUM,
     ENV_MQTT_USERNAME: CONF_MQTT_USERNAME,
+    ENV_MQTT_V5: CONF_MQTT_V5,
     ENV_OUTPUT_UNIT_ACCUMULATED_PRECIPITATION: (
         CONF_OUTPUT_UNIT_ACCUMULATED_PRECIPITATION
     ),
@@ -122,7 +250,14 @@ ENV_VAR_TO_CONF_MAP = {
     ENV_OUTPUT_UNIT_TEMPERATURE: CONF_OUTPUT_UNIT_TEMPERATURE,
     ENV_PORT: CONF_PORT,
     ENV_PRECISION: CONF_PRECISION,
+    ENV_PUBLISHER_QUEUE_SIZE: CONF_PUBLISHER_QUEUE_SIZE,
+    ENV_PUBLISHER_RETRIES: CONF_PUBLISHER_RETRIES,
     ENV_RAW_DATA: CONF_RAW_DATA,
+    ENV_SPOOL_DIRECTORY: CONF_SPOOL_DIRECTORY,
+    ENV_SPOOL_FSYNC: CONF_SPOOL_FSYNC,
+    ENV_SPOOL_MAX_AGE: CONF_SPOOL_MAX_AGE,
+    ENV_SPOOL_MAX_SIZE: CONF_SPOOL_MAX_SIZE,
+    ENV_SPOOL_REPLAY_RATE: CONF_SPOOL_REPLAY_RATE,
     ENV_VERBOSE: CONF_VERBOSE,
 }
 
@@ -154,6 +289,15 @@ def get_cli_arguments(args: list[str]) -> dict[str, Any]:
         description="Send data from an Ecowitt gateway to an MQTT broker",
     )
     parser.add_argument("--version", action="version", version=__version__)
+    parser.add_argument(
+        "--batch-window",
+        dest=CONF_BATCH_WINDOW,
+        help=(
+            "The amount of time (in seconds) to collect payloads for before processing "
+            "them together (default: process each payload as it arrives)"
+        ),
+        metavar=CONF_BATCH_WINDOW,
+    )
     parser.add_argument(
         "--battery-override",
         dest=CONF_BATTERY_OVERRIDES,
@@ -206,12 +350,27 @@ def get_cli_arguments(args: list[str]) -> dict[str, Any]:
         ),
         metavar=CONF_ENDPOINT,
     )
+    parser.add_argument(
+        "--hass-attributes-qos",
+        dest=CONF_HASS_ATTRIBUTES_QOS,
+        help="The MQTT QoS level to publish Home Assistant attributes with (default: 0)",
+        metavar=CONF_HASS_ATTRIBUTES_QOS,
+    )
     parser.add_argument(
         "--hass-discovery",
         action="store_true",
         dest=CONF_HASS_DISCOVERY,
         help="Publish data in the Home Assistant MQTT Discovery format",
     )
+    parser.add_argument(
+        "--hass-discovery-mode",
+        dest=CONF_HASS_DISCOVERY_MODE,
+        help=(
+            "The Home Assistant MQTT Discovery mode to use: one config per entity or "
+            f"one config per device (default: {HassDiscoveryMode.ENTITY})"
+        ),
+        metavar=CONF_HASS_DISCOVERY_MODE,
+    )
     parser.add_argument(
         "--hass-discovery-prefix",
         dest=CONF_HASS_DISCOVERY_PREFIX,
@@ -221,6 +380,24 @@ def get_cli_arguments(args: list[str]) -> dict[str, Any]:
         ),
         metavar=CONF_HASS_DISCOVERY_PREFIX,
     )
+    parser.add_argument(
+        "--hass-discovery-qos",
+        dest=CONF_HASS_DISCOVERY_QOS,
+        help=(
+            "The MQTT QoS level to publish Home Assistant MQTT Discovery configs with "
+            f"(default: {DEFAULT_HASS_DISCOVERY_QOS})"
+        ),
+        metavar=CONF_HASS_DISCOVERY_QOS,
+    )
+    parser.add_argument(
+        "--hass-discovery-rate-limit",
+        dest=CONF_HASS_DISCOVERY_RATE_LIMIT,
+        help=(
+            "The maximum number of Home Assistant MQTT Discovery messages to publish "
+            "per second (default: no limit)"
+        ),
+        metavar=CONF_HASS_DISCOVERY_RATE_LIMIT,
+    )
     parser.add_argument(
         "--hass-entity-id-prefix",
         dest=CONF_HASS_ENTITY_ID_PREFIX,
@@ -230,6 +407,34 @@ def get_cli_arguments(args: list[str]) -> dict[str, Any]:
         ),
         metavar=CONF_HASS_ENTITY_ID_PREFIX,
     )
+    parser.add_argument(
+        "--hass-rediscovery-window",
+        dest=CONF_HASS_REDISCOVERY_WINDOW,
+        help=(
+            "The number of seconds over which to spread the republishing of Home "
+            "Assistant MQTT Discovery configs when Home Assistant restarts "
+            f"(default: {DEFAULT_HASS_REDISCOVERY_WINDOW})"
+        ),
+        metavar=CONF_HASS_REDISCOVERY_WINDOW,
+    )
+    parser.add_argument(
+        "--hass-stale-sensor-intervals",
+        dest=CONF_HASS_STALE_SENSOR_INTERVALS,
+        help=(
+            "The number of update intervals a sensor can miss before its Home "
+            "Assistant entity is marked unavailable (default: never)"
+        ),
+        metavar=CONF_HASS_STALE_SENSOR_INTERVALS,
+    )
+    parser.add_argument(
+        "--hass-state-qos",
+        dest=CONF_HASS_STATE_QOS,
+        help=(
+            "The MQTT QoS level to publish Home Assistant states with "
+            f"(default: {DEFAULT_HASS_STATE_QOS})"
+        ),
+        metavar=CONF_HASS_STATE_QOS,
+    )
     parser.add_argument(
         "--input-data-format",
         dest=CONF_INPUT_DATA_FORMAT,
@@ -254,6 +459,25 @@ def get_cli_arguments(args: list[str]) -> dict[str, Any]:
         help="The locale to set (default: system default)",
         metavar=CONF_LOCALE,
     )
+    parser.add_argument(
+        "--mqtt-availability-qos",
+        dest=CONF_MQTT_AVAILABILITY_QOS,
+        help=(
+            "The MQTT QoS level to publish availability with "
+            f"(default: {DEFAULT_MQTT_AVAILABILITY_QOS})"
+        ),
+        metavar=CONF_MQTT_AVAILABILITY_QOS,
+    )
+    parser.add_argument(
+        "--mqtt-availability-topic",
+        dest=CONF_MQTT_AVAILABILITY_TOPIC,
+        help=(
+            "The MQTT topic to publish ecowitt2mqtt's availability to "
+            "(default: "
+            f"{DEFAULT_MQTT_AVAILABILITY_TOPIC.format(name='<config name>')})"
+        ),
+        metavar=CONF_MQTT_AVAILABILITY_TOPIC,
+    )
     parser.add_argument(
         "-b",
         "--mqtt-broker",
@@ -261,6 +485,93 @@ def get_cli_arguments(args: list[str]) -> dict[str, Any]:
         help="The hostname or IP address of an MQTT broker",
         metavar=CONF_MQTT_BROKER,
     )
+    parser.add_argument(
+        "--mqtt-byte-rate-limit",
+        dest=CONF_MQTT_BYTE_RATE_LIMIT,
+        help=(
+            "The maximum number of payload bytes to publish to the MQTT broker per "
+            "second (default: no limit)"
+        ),
+        metavar=CONF_MQTT_BYTE_RATE_LIMIT,
+    )
+    parser.add_argument(
+        "--mqtt-compression-threshold",
+        dest=CONF_MQTT_COMPRESSION_THRESHOLD,
+        help=(
+            "The payload size (in bytes) at which to zlib-compress payloads published "
+            "to the MQTT topic (default: never compress)"
+        ),
+        metavar=CONF_MQTT_COMPRESSION_THRESHOLD,
+    )
+    parser.add_argument(
+        "--mqtt-dns-cache-ttl",
+        dest=CONF_MQTT_DNS_CACHE_TTL,
+        help=(
+            "The number of seconds to reuse resolved MQTT broker addresses for "
+            f"(default: {DEFAULT_MQTT_DNS_CACHE_TTL})"
+        ),
+        metavar=CONF_MQTT_DNS_CACHE_TTL,
+    )
+    parser.add_argument(
+        "--mqtt-encoding",
+        dest=CONF_MQTT_ENCODING,
+        help=(
+            "The encoding of payloads published to the MQTT topic: json, msgpack, or "
+            f"cbor (default: {MqttEncoding.JSON})"
+        ),
+        metavar=CONF_MQTT_ENCODING,
+    )
+    parser.add_argument(
+        "--mqtt-failback",
+        action="store_true",
+        dest=CONF_MQTT_FAILBACK,
+        help="Move back to a preferred MQTT broker once it is healthy again",
+    )
+    parser.add_argument(
+        "--mqtt-failover-brokers",
+        dest=CONF_MQTT_FAILOVER_BROKERS,
+        help=(
+            "A comma-separated list of MQTT brokers (format: host or host:port) to fail "
+            "over to, in order of preference"
+        ),
+        metavar=CONF_MQTT_FAILOVER_BROKERS,
+    )
+    parser.add_argument(
+        "--mqtt-health-check-interval",
+        dest=CONF_MQTT_HEALTH_CHECK_INTERVAL,
+        help=(
+            "The number of seconds between MQTT broker health checks (default: "
+            f"{DEFAULT_MQTT_HEALTH_CHECK_INTERVAL})"
+        ),
+        metavar=CONF_MQTT_HEALTH_CHECK_INTERVAL,
+    )
+    parser.add_argument(
+        "--mqtt-idle-timeout",
+        dest=CONF_MQTT_IDLE_TIMEOUT,
+        help=(
+            "The number of seconds without a payload after which to disconnect from "
+            "the MQTT broker until the next one (default: stay connected)"
+        ),
+        metavar=CONF_MQTT_IDLE_TIMEOUT,
+    )
+    parser.add_argument(
+        "--mqtt-max-inflight",
+        dest=CONF_MQTT_MAX_INFLIGHT,
+        help=(
+            "The maximum number of messages that can await acknowledgement from the "
+            "MQTT broker at once (default: no limit)"
+        ),
+        metavar=CONF_MQTT_MAX_INFLIGHT,
+    )
+    parser.add_argument(
+        "--mqtt-message-expiry",
+        dest=CONF_MQTT_MESSAGE_EXPIRY,
+        help=(
+            "The number of seconds after which the MQTT broker discards undelivered "
+            "data messages (MQTT v5 only; default: never)"
+        ),
+        metavar=CONF_MQTT_MESSAGE_EXPIRY,
+    )
     parser.add_argument(
         "-p",
         "--mqtt-password",
@@ -274,18 +585,93 @@ def get_cli_arguments(args: list[str]) -> dict[str, Any]:
         help=f"The listening port of the MQTT broker (default: {DEFAULT_MQTT_PORT})",
         metavar=CONF_MQTT_PORT,
     )
+    parser.add_argument(
+        "--mqtt-qos",
+        dest=CONF_MQTT_QOS,
+        help="The MQTT QoS level to publish data to the MQTT topic with (default: 0)",
+        metavar=CONF_MQTT_QOS,
+    )
+    parser.add_argument(
+        "--mqtt-rate-limit",
+        dest=CONF_MQTT_RATE_LIMIT,
+        help=(
+            "The maximum number of messages to publish to the MQTT broker per second "
+            "(default: no limit)"
+        ),
+        metavar=CONF_MQTT_RATE_LIMIT,
+    )
     parser.add_argument(
         "--mqtt-retain",
         action="store_true",
         dest=CONF_MQTT_RETAIN,
         help="Instruct the MQTT broker to retain messages",
     )
+    parser.add_argument(
+        "--mqtt-session-expiry",
+        dest=CONF_MQTT_SESSION_EXPIRY,
+        help=(
+            "The number of seconds the MQTT broker keeps the session after a "
+            f"disconnection (MQTT v5 only; default: {DEFAULT_MQTT_SESSION_EXPIRY})"
+        ),
+        metavar=CONF_MQTT_SESSION_EXPIRY,
+    )
+    parser.add_argument(
+        "--mqtt-subtopic-units",
+        action="store_true",
+        dest=CONF_MQTT_SUBTOPIC_UNITS,
+        help="Also publish each data point's unit to <mqtt_topic>/<key>/unit",
+    )
+    parser.add_argument(
+        "--mqtt-subtopics",
+        action="store_true",
+        dest=CONF_MQTT_SUBTOPICS,
+        help="Publish each data point to its own <mqtt_topic>/<key> topic",
+    )
     parser.add_argument(
         "--mqtt-tls",
         action="store_true",
         dest=CONF_MQTT_TLS,
         help="Enable MQTT over TLS",
     )
+    parser.add_argument(
+        "--mqtt-tls-alpn",
+        dest=CONF_MQTT_TLS_ALPN,
+        help="A comma-separated list of ALPN protocols to offer the MQTT broker",
+        metavar=CONF_MQTT_TLS_ALPN,
+    )
+    parser.add_argument(
+        "--mqtt-tls-ca-file",
+        dest=CONF_MQTT_TLS_CA_FILE,
+        help=(
+            "The path to a CA bundle to verify the MQTT broker's certificate with "
+            "(default: the system's CA certificates)"
+        ),
+        metavar=CONF_MQTT_TLS_CA_FILE,
+    )
+    parser.add_argument(
+        "--mqtt-tls-certfile",
+        dest=CONF_MQTT_TLS_CERTFILE,
+        help="The path to a client certificate to authenticate with the MQTT broker",
+        metavar=CONF_MQTT_TLS_CERTFILE,
+    )
+    parser.add_argument(
+        "--mqtt-tls-keyfile",
+        dest=CONF_MQTT_TLS_KEYFILE,
+        help=(
+            "The path to the private key of the client certificate (default: the "
+            "client certificate file)"
+        ),
+        metavar=CONF_MQTT_TLS_KEYFILE,
+    )
+    parser.add_argument(
+        "--mqtt-tls-verify",
+        dest=CONF_MQTT_TLS_VERIFY,
+        help=(
+            "How much of the MQTT broker's certificate to verify: full, certificate "
+            f"(everything but the hostname), or none (default: {MqttTlsVerify.FULL})"
+        ),
+        metavar=CONF_MQTT_TLS_VERIFY,
+    )
     parser.add_argument(
         "-t",
         "--mqtt-topic",
@@ -293,6 +679,16 @@ def get_cli_arguments(args: list[str]) -> dict[str, Any]:
         help="The MQTT topic to publish device data to",
         metavar=CONF_MQTT_TOPIC,
     )
+    parser.add_argument(
+        "--mqtt-topic-alias-maximum",
+        dest=CONF_MQTT_TOPIC_ALIAS_MAXIMUM,
+        help=(
+            "The maximum number of MQTT topic aliases to use, which must not exceed "
+            "the broker's limit (MQTT v5 only; default: "
+            f"{DEFAULT_MQTT_TOPIC_ALIAS_MAXIMUM})"
+        ),
+        metavar=CONF_MQTT_TOPIC_ALIAS_MAXIMUM,
+    )
     parser.add_argument(
         "-u",
         "--mqtt-username",
@@ -300,6 +696,12 @@ def get_cli_arguments(args: list[str]) -> dict[str, Any]:
         help="A valid username for the MQTT broker",
         metavar=CONF_MQTT_USERNAME,
     )
+    parser.add_argument(
+        "--mqtt-v5",
+        action="store_true",
+        dest=CONF_MQTT_V5,
+        help="Connect to the MQTT broker with MQTT v5",
+    )
     parser.add_argument(
         "--output-unit-system",
         dest=CONF_OUTPUT_UNIT_SYSTEM,
@@ -397,12 +799,75 @@ def get_cli_arguments(args: list[str]) -> dict[str, Any]:
         ),
         metavar=CONF_PRECISION,
     )
+    parser.add_argument(
+        "--publisher-queue-size",
+        dest=CONF_PUBLISHER_QUEUE_SIZE,
+        help=(
+            "The maximum number of payloads waiting on each publisher before the "
+            f"oldest are dropped (default: {DEFAULT_PUBLISHER_QUEUE_SIZE})"
+        ),
+        metavar=CONF_PUBLISHER_QUEUE_SIZE,
+    )
+    parser.add_argument(
+        "--publisher-retries",
+        dest=CONF_PUBLISHER_RETRIES,
+        help=(
+            "The number of times a publisher retries a payload after an MQTT error "
+            f"before reconnecting (default: {DEFAULT_PUBLISHER_RETRIES})"
+        ),
+        metavar=CONF_PUBLISHER_RETRIES,
+    )
     parser.add_argument(
         "--raw-data",
         action="store_true",
         dest=CONF_RAW_DATA,
         help="Return raw data (don't attempt to translate any values)",
     )
+    parser.add_argument(
+        "--spool-directory",
+        dest=CONF_SPOOL_DIRECTORY,
+        help=(
+            "A directory to spool payloads to while the MQTT broker is unreachable "
+            "(default: no spooling)"
+        ),
+        metavar=CONF_SPOOL_DIRECTORY,
+    )
+    parser.add_argument(
+        "--spool-fsync",
+        dest=CONF_SPOOL_FSYNC,
+        help=(
+            "When to flush spooled payloads to disk "
+            f"(default: {SpoolFsyncPolicy.ALWAYS})"
+        ),
+        metavar=CONF_SPOOL_FSYNC,
+    )
+    parser.add_argument(
+        "--spool-max-age",
+        dest=CONF_SPOOL_MAX_AGE,
+        help=(
+            "The maximum age (in seconds) of a spooled payload "
+            f"(default: {DEFAULT_SPOOL_MAX_AGE})"
+        ),
+        metavar=CONF_SPOOL_MAX_AGE,
+    )
+    parser.add_argument(
+        "--spool-max-size",
+        dest=CONF_SPOOL_MAX_SIZE,
+        help=(
+            "The maximum size (in megabytes) of the spool "
+            f"(default: {DEFAULT_SPOOL_MAX_SIZE})"
+        ),
+        metavar=CONF_SPOOL_MAX_SIZE,
+    )
+    parser.add_argument(
+        "--spool-replay-rate",
+        dest=CONF_SPOOL_REPLAY_RATE,
+        help=(
+            "The maximum number of spooled payloads to replay per second "
+            f"(default: {DEFAULT_SPOOL_REPLAY_RATE})"
+        ),
+        metavar=CONF_SPOOL_REPLAY_RATE,
+    )
     parser.add_argument(
         "-v",
         "--verbose",
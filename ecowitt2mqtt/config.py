@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from collections.abc import Generator
+from importlib.util import find_spec
 from numbers import Number
 from typing import Any
 from uuid import uuid4
@@ -13,6 +14,7 @@ from pydantic import (
     ConfigDict,
     Field,
     ValidationError,
+    ValidationInfo,
     field_validator,
     model_validator,
 )
@@ -24,16 +26,38 @@ from ecowitt2mqtt.const import (
     CONF_DIAGNOSTICS,
     CONF_GATEWAYS,
     CONF_HASS_DISCOVERY,
+    CONF_MQTT_AVAILABILITY_TOPIC,
     CONF_MQTT_PASSWORD,
+    CONF_MQTT_TARGETS,
+    CONF_MQTT_TLS_CERTFILE,
+    CONF_MQTT_TLS_KEYFILE,
     CONF_MQTT_TOPIC,
     CONF_MQTT_USERNAME,
     CONF_VERBOSE,
     DEFAULT_BOOLEAN_BATTERY_TRUE_VALUE,
     DEFAULT_ENDPOINT,
     DEFAULT_HASS_DISCOVERY_PREFIX,
+    DEFAULT_HASS_DISCOVERY_QOS,
+    DEFAULT_HASS_REDISCOVERY_WINDOW,
+    DEFAULT_HASS_STATE_QOS,
+    DEFAULT_MQTT_AVAILABILITY_QOS,
+    DEFAULT_MQTT_AVAILABILITY_TOPIC,
+    DEFAULT_MQTT_DNS_CACHE_TTL,
+    DEFAULT_MQTT_HEALTH_CHECK_INTERVAL,
     DEFAULT_MQTT_PORT,
+    DEFAULT_MQTT_SESSION_EXPIRY,
+    DEFAULT_MQTT_TOPIC_ALIAS_MAXIMUM,
     DEFAULT_PORT,
+    DEFAULT_PUBLISHER_QUEUE_SIZE,
+    DEFAULT_PUBLISHER_RETRIES,
+    DEFAULT_SPOOL_MAX_AGE,
+    DEFAULT_SPOOL_MAX_SIZE,
+    DEFAULT_SPOOL_REPLAY_RATE,
     ENV_BATTERY_OVERRIDES,
+    MQTT_ENCODING_PACKAGES,
+    HassDiscoveryMode,
+    MqttEncoding,
+    MqttTlsVerify,
     UnitOfAccumulatedPrecipitation,
     UnitOfIlluminance,
     UnitOfLength,
@@ -47,8 +71,16 @@ from ecowitt2mqtt.const import (
 from ecowitt2mqtt.errors import EcowittError
 from ecowitt2mqtt.helpers.calculator.battery import BatteryStrategy
 from ecowitt2mqtt.helpers.server import InputDataFormat
+from ecowitt2mqtt.helpers.spool import SpoolFsyncPolicy
+from ecowitt2mqtt.util.network import parse_broker_address
 
 CONF_DEFAULT = "default"
+CONF_NAME = "name"
+CONF_UUID = "uuid"
+
+# MQTT broker targets can only override options that don't affect how data is processed
+# (which happens once for all of a config's targets):
+MQTT_TARGET_OPTION_PREFIXES = ("hass_", "mqtt_", "publisher_", "spool_")
 
 REQUIRES_AT_LEAST_ONE_OF = (
     CONF_MQTT_TOPIC,
@@ -111,6 +143,24 @@ def validate_port(value: int | str) -> int:
     return parsed
 
 
+def validate_qos(value: int | str) -> int:
+    """Validate an MQTT QoS level.
+
+    Args:
+        value: A value to validate.
+
+    Returns:
+        A validated QoS level.
+
+    Raises:
+        ValueError: Raises if the value is not a valid QoS level.
+    """
+    parsed = int(value)
+    if parsed not in (0, 1, 2):
+        raise ValueError(f"invalid QoS level: {value}")
+    return parsed
+
+
 class Config(BaseModel):
     """Define a config object."""
 
@@ -120,12 +170,40 @@ class Config(BaseModel):
     mqtt_broker: str
 
     # Optional MQTT parameters:
+    mqtt_availability_qos: int = DEFAULT_MQTT_AVAILABILITY_QOS
+    # Each config gets a topic of its own (see set_mqtt_availability_topic):
+    mqtt_availability_topic: str = DEFAULT_MQTT_AVAILABILITY_TOPIC.format(
+        name=CONF_DEFAULT
+    )
+    mqtt_byte_rate_limit: float | None = None
+    mqtt_compression_threshold: int | None = None
+    mqtt_dns_cache_ttl: float = DEFAULT_MQTT_DNS_CACHE_TTL
+    mqtt_encoding: MqttEncoding = MqttEncoding.JSON
+    mqtt_failback: bool = False
+    mqtt_failover_brokers: tuple[str, ...] = ()
+    mqtt_health_check_interval: float = DEFAULT_MQTT_HEALTH_CHECK_INTERVAL
+    mqtt_idle_timeout: float | None = None
+    mqtt_max_inflight: int | None = None
+    mqtt_message_expiry: int | None = None
     mqtt_password: str | None = None
     mqtt_port: int = DEFAULT_MQTT_PORT
+    mqtt_qos: int = 0
+    mqtt_rate_limit: float | None = None
     mqtt_retain: bool = False
+    mqtt_session_expiry: int = DEFAULT_MQTT_SESSION_EXPIRY
+    mqtt_subtopic_units: bool = False
+    mqtt_subtopics: bool = False
+    mqtt_targets: tuple[Config, ...] = ()
     mqtt_tls: bool = False
+    mqtt_tls_alpn: tuple[str, ...] = ()
+    mqtt_tls_ca_file: str | None = None
+    mqtt_tls_certfile: str | None = None
+    mqtt_tls_keyfile: str | None = None
+    mqtt_tls_verify: MqttTlsVerify = MqttTlsVerify.FULL
     mqtt_topic: str | None = None
+    mqtt_topic_alias_maximum: int = DEFAULT_MQTT_TOPIC_ALIAS_MAXIMUM
     mqtt_username: str | None = None
+    mqtt_v5: bool = False
 
     # Optional battery parameters:
     battery_overrides: dict[str, BatteryStrategy] = {}
@@ -133,20 +211,39 @@ class Config(BaseModel):
     default_battery_strategy: BatteryStrategy = BatteryStrategy.BOOLEAN
 
     # Optional data parameters:
+    batch_window: float | None = None
     disable_calculated_data: bool = False
     input_data_format: InputDataFormat = InputDataFormat.ECOWITT
     precision: int | None = None
     raw_data: bool = False
 
     # Optional Home Assistant MQTT Discovery parameters:
+    hass_attributes_qos: int = 0
     hass_discovery: bool = False
+    hass_discovery_mode: HassDiscoveryMode = HassDiscoveryMode.ENTITY
     hass_discovery_prefix: str = DEFAULT_HASS_DISCOVERY_PREFIX
+    hass_discovery_qos: int = DEFAULT_HASS_DISCOVERY_QOS
+    hass_discovery_rate_limit: float | None = None
     hass_entity_id_prefix: str | None = None
+    hass_rediscovery_window: float = DEFAULT_HASS_REDISCOVERY_WINDOW
+    hass_stale_sensor_intervals: int | None = None
+    hass_state_qos: int = DEFAULT_HASS_STATE_QOS
 
     # Optional HTTP parameters:
     endpoint: str = DEFAULT_ENDPOINT
     port: int = DEFAULT_PORT
 
+    # Optional publisher parameters:
+    publisher_queue_size: int = DEFAULT_PUBLISHER_QUEUE_SIZE
+    publisher_retries: int = DEFAULT_PUBLISHER_RETRIES
+
+    # Optional spool parameters:
+    spool_directory: str | None = None
+    spool_fsync: SpoolFsyncPolicy = SpoolFsyncPolicy.ALWAYS
+    spool_max_age: float = DEFAULT_SPOOL_MAX_AGE
+    spool_max_size: float = DEFAULT_SPOOL_MAX_SIZE
+    spool_replay_rate: float = DEFAULT_SPOOL_REPLAY_RATE
+
     # Optional logging parameters:
     diagnostics: bool = False
     verbose: bool = False
@@ -166,6 +263,7 @@ class Config(BaseModel):
     output_unit_system: UnitSystem = UnitSystem.IMPERIAL
 
     # Generated parameters:
+    name: str = CONF_DEFAULT
     uuid: str = Field(default_factory=lambda: uuid4().hex)
 
     # Misc. parameters:
@@ -189,6 +287,66 @@ class Config(BaseModel):
             data[CONF_BATTERY_OVERRIDES] = battery_overrides_env_var
         return data
 
+    @model_validator(mode="before")
+    @classmethod
+    def set_mqtt_availability_topic(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """Give the config an availability topic of its own (unless one is set).
+
+        Before validators run in reverse order, so this runs once any MQTT broker
+        targets have been merged (and can get availability topics of their own, too).
+
+        Args:
+            data: The config data.
+
+        Returns:
+            The potentially altered config data.
+        """
+        if CONF_MQTT_AVAILABILITY_TOPIC not in data:
+            data[CONF_MQTT_AVAILABILITY_TOPIC] = DEFAULT_MQTT_AVAILABILITY_TOPIC.format(
+                name=data.get(CONF_NAME, CONF_DEFAULT)
+            )
+        return data
+
+    @model_validator(mode="before")
+    @classmethod
+    def merge_mqtt_targets(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """Merge every MQTT broker target onto the rest of the config data.
+
+        Each target is named after the config and its position (e.g., "default.1").
+
+        Args:
+            data: The config data.
+
+        Returns:
+            The config data with complete MQTT broker targets.
+
+        Raises:
+            ValueError: Raises if a target is invalid or overrides a forbidden option.
+        """
+        if not (targets := data.get(CONF_MQTT_TARGETS)):
+            return data
+
+        base_data = {
+            key: value
+            for key, value in data.items()
+            if key not in (CONF_MQTT_TARGETS, CONF_NAME, CONF_UUID)
+        }
+        name = data.get(CONF_NAME, CONF_DEFAULT)
+        merged_targets = []
+        for index, target in enumerate(targets, start=1):
+            if not isinstance(target, dict):
+                raise ValueError(f"invalid MQTT broker target: {target}")
+            for key in target:
+                if key == CONF_MQTT_TARGETS or not key.startswith(
+                    MQTT_TARGET_OPTION_PREFIXES
+                ):
+                    raise ValueError(
+                        f"option can't be set per MQTT broker target: {key}"
+                    )
+            merged_targets.append(base_data | target | {CONF_NAME: f"{name}.{index}"})
+
+        return data | {CONF_MQTT_TARGETS: merged_targets}
+
     @model_validator(mode="before")
     @classmethod
     def set_diagnostics_verbosity(cls, data: dict[str, Any]) -> dict[str, Any]:
@@ -204,6 +362,26 @@ class Config(BaseModel):
             data[CONF_VERBOSE] = True
         return data
 
+    @field_validator("batch_window", mode="before")
+    @classmethod
+    def validate_batch_window(cls, value: float | str | None) -> float | None:
+        """Validate that the payload batch window is valid.
+
+        Args:
+            value: The amount of time (in seconds) to collect payloads for.
+
+        Returns:
+            The parsed batch window.
+
+        Raises:
+            ValueError: Raises if the window is not a positive number.
+        """
+        if value is None:
+            return None
+        if (parsed := float(value)) <= 0:
+            raise ValueError(f"invalid batch window: {value}")
+        return parsed
+
     @field_validator("battery_overrides", mode="before")
     @classmethod
     def validate_battery_overrides(
@@ -266,6 +444,68 @@ class Config(BaseModel):
         validate_boolean
     )
 
+    @field_validator("hass_discovery_rate_limit", mode="before")
+    @classmethod
+    def validate_hass_discovery_rate_limit(
+        cls, value: float | str | None
+    ) -> float | None:
+        """Validate that the MQTT Discovery rate limit is valid.
+
+        Args:
+            value: The MQTT Discovery rate limit (in messages per second).
+
+        Returns:
+            The parsed MQTT Discovery rate limit.
+
+        Raises:
+            ValueError: Raises if the rate limit is not a positive number.
+        """
+        if value is None:
+            return None
+        if (parsed := float(value)) <= 0:
+            raise ValueError(f"invalid MQTT Discovery rate limit: {value}")
+        return parsed
+
+    @field_validator("hass_rediscovery_window", mode="before")
+    @classmethod
+    def validate_hass_rediscovery_window(cls, value: float | str) -> float:
+        """Validate that the MQTT Discovery rediscovery window is valid.
+
+        Args:
+            value: The rediscovery window (in seconds).
+
+        Returns:
+            The parsed rediscovery window.
+
+        Raises:
+            ValueError: Raises if the window is negative.
+        """
+        if (parsed := float(value)) < 0:
+            raise ValueError(f"invalid rediscovery window: {value}")
+        return parsed
+
+    @field_validator("hass_stale_sensor_intervals", mode="before")
+    @classmethod
+    def validate_hass_stale_sensor_intervals(
+        cls, value: int | str | None
+    ) -> int | None:
+        """Validate that the number of intervals before a sensor is stale is valid.
+
+        Args:
+            value: The number of missed update intervals.
+
+        Returns:
+            The parsed number of missed update intervals.
+
+        Raises:
+            ValueError: Raises if the number of intervals is not a positive integer.
+        """
+        if value is None:
+            return None
+        if (parsed := int(value)) < 1:
+            raise ValueError(f"invalid number of stale sensor intervals: {value}")
+        return parsed
+
     @model_validator(mode="before")
     @classmethod
     def validate_mqtt_auth(cls, data: dict[str, Any]) -> dict[str, Any]:
@@ -286,16 +526,342 @@ class Config(BaseModel):
             raise ValueError("Invalid MQTT auth configuration")
         return data
 
+    @field_validator("mqtt_compression_threshold", mode="before")
+    @classmethod
+    def validate_mqtt_compression_threshold(cls, value: int | str | None) -> int | None:
+        """Validate that the MQTT payload compression threshold is valid.
+
+        Args:
+            value: The payload size (in bytes) at which to compress.
+
+        Returns:
+            The parsed compression threshold.
+
+        Raises:
+            ValueError: Raises if the threshold is not a positive integer.
+        """
+        if value is None:
+            return None
+        if (parsed := int(value)) < 1:
+            raise ValueError(f"invalid MQTT compression threshold: {value}")
+        return parsed
+
+    @field_validator("mqtt_dns_cache_ttl", mode="before")
+    @classmethod
+    def validate_mqtt_dns_cache_ttl(cls, value: float | str) -> float:
+        """Validate that the MQTT broker DNS cache TTL is valid.
+
+        Args:
+            value: The amount of time (in seconds) to cache DNS results for.
+
+        Returns:
+            The parsed DNS cache TTL.
+
+        Raises:
+            ValueError: Raises if the TTL is negative.
+        """
+        if (parsed := float(value)) < 0:
+            raise ValueError(f"invalid MQTT DNS cache TTL: {value}")
+        return parsed
+
+    @field_validator("mqtt_encoding")
+    @classmethod
+    def validate_mqtt_encoding(cls, value: MqttEncoding) -> MqttEncoding:
+        """Validate that the package an MQTT payload encoding needs is installed.
+
+        Args:
+            value: The MQTT payload encoding.
+
+        Returns:
+            The MQTT payload encoding.
+
+        Raises:
+            ValueError: Raises if the encoding's package isn't installed.
+        """
+        if (package := MQTT_ENCODING_PACKAGES.get(value)) and not find_spec(package):
+            raise ValueError(
+                f"The {value} encoding requires the {package} package (install "
+                "ecowitt2mqtt[encodings] to get it)"
+            )
+        return value
+
+    validate_mqtt_failback = field_validator("mqtt_failback", mode="before")(
+        validate_boolean
+    )
+
+    @field_validator("mqtt_failover_brokers", mode="before")
+    @classmethod
+    def validate_mqtt_failover_brokers(
+        cls, value: list[str] | str | None
+    ) -> tuple[str, ...]:
+        """Validate that the MQTT failover brokers are valid.
+
+        Args:
+            value: A list (or comma-separated string) of "host" or "host:port"
+                addresses.
+
+        Returns:
+            The parsed failover brokers.
+
+        Raises:
+            ValueError: Raises if a broker address is invalid.
+        """
+        if value is None:
+            return ()
+        if isinstance(value, str):
+            value = value.split(",")
+
+        brokers = tuple(broker.strip() for broker in value if broker.strip())
+        for broker in brokers:
+            try:
+                validate_port(parse_broker_address(broker, DEFAULT_MQTT_PORT).port)
+            except ValueError as err:
+                raise ValueError(f"invalid MQTT failover broker: {broker}") from err
+        return brokers
+
+    @field_validator("mqtt_health_check_interval", mode="before")
+    @classmethod
+    def validate_mqtt_health_check_interval(cls, value: float | str) -> float:
+        """Validate that the MQTT broker health check interval is valid.
+
+        Args:
+            value: The amount of time (in seconds) between health checks.
+
+        Returns:
+            The parsed health check interval.
+
+        Raises:
+            ValueError: Raises if the interval is not a positive number.
+        """
+        if (parsed := float(value)) <= 0:
+            raise ValueError(f"invalid MQTT health check interval: {value}")
+        return parsed
+
+    @field_validator("mqtt_idle_timeout", mode="before")
+    @classmethod
+    def validate_mqtt_idle_timeout(cls, value: float | str | None) -> float | None:
+        """Validate that the MQTT idle timeout is valid.
+
+        Args:
+            value: The amount of time (in seconds) without a payload to disconnect
+                after.
+
+        Returns:
+            The parsed idle timeout.
+
+        Raises:
+            ValueError: Raises if the timeout is not a positive number.
+        """
+        if value is None:
+            return None
+        if (parsed := float(value)) <= 0:
+            raise ValueError(f"invalid MQTT idle timeout: {value}")
+        return parsed
+
+    @field_validator("mqtt_max_inflight", mode="before")
+    @classmethod
+    def validate_mqtt_max_inflight(cls, value: int | str | None) -> int | None:
+        """Validate that the maximum number of in-flight messages is valid.
+
+        Args:
+            value: The maximum number of in-flight messages.
+
+        Returns:
+            The parsed maximum number of in-flight messages.
+
+        Raises:
+            ValueError: Raises if the maximum is not a positive integer.
+        """
+        if value is None:
+            return None
+        if (parsed := int(value)) < 1:
+            raise ValueError(f"invalid maximum number of in-flight messages: {value}")
+        return parsed
+
+    @field_validator("mqtt_message_expiry", mode="before")
+    @classmethod
+    def validate_mqtt_message_expiry(cls, value: int | str | None) -> int | None:
+        """Validate that the MQTT message expiry interval is valid.
+
+        Args:
+            value: The message expiry interval (in seconds).
+
+        Returns:
+            The parsed message expiry interval.
+
+        Raises:
+            ValueError: Raises if the interval is not a positive integer.
+        """
+        if value is None:
+            return None
+        if (parsed := int(value)) < 1:
+            raise ValueError(f"invalid MQTT message expiry interval: {value}")
+        return parsed
+
     validate_mqtt_port = field_validator("mqtt_port", mode="before")(validate_port)
 
+    @field_validator("mqtt_byte_rate_limit", "mqtt_rate_limit", mode="before")
+    @classmethod
+    def validate_mqtt_rate_limit(
+        cls, value: float | str | None, info: ValidationInfo
+    ) -> float | None:
+        """Validate that an MQTT publish rate limit is valid.
+
+        Args:
+            value: The rate limit (in messages or bytes per second).
+            info: Information about the field being validated.
+
+        Returns:
+            The parsed rate limit.
+
+        Raises:
+            ValueError: Raises if the rate limit is not a positive number.
+        """
+        if value is None:
+            return None
+        if (parsed := float(value)) <= 0:
+            raise ValueError(f"invalid {info.field_name}: {value}")
+        return parsed
+
     validate_mqtt_retain = field_validator("mqtt_retain", mode="before")(
         validate_boolean
     )
 
+    @field_validator("mqtt_session_expiry", mode="before")
+    @classmethod
+    def validate_mqtt_session_expiry(cls, value: int | str) -> int:
+        """Validate that the MQTT session expiry interval is valid.
+
+        Args:
+            value: The session expiry interval (in seconds).
+
+        Returns:
+            The parsed session expiry interval.
+
+        Raises:
+            ValueError: Raises if the interval is negative.
+        """
+        if (parsed := int(value)) < 0:
+            raise ValueError(f"invalid MQTT session expiry interval: {value}")
+        return parsed
+
+    validate_mqtt_subtopic_units = field_validator(
+        "mqtt_subtopic_units", mode="before"
+    )(validate_boolean)
+
+    validate_mqtt_subtopics = field_validator("mqtt_subtopics", mode="before")(
+        validate_boolean
+    )
+
     validate_mqtt_tls = field_validator("mqtt_tls", mode="before")(validate_boolean)
 
+    @field_validator("mqtt_tls_alpn", mode="before")
+    @classmethod
+    def validate_mqtt_tls_alpn(cls, value: list[str] | str | None) -> tuple[str, ...]:
+        """Validate the ALPN protocols to offer an MQTT broker over TLS.
+
+        Args:
+            value: A list (or comma-separated string) of ALPN protocol names.
+
+        Returns:
+            The parsed ALPN protocols.
+        """
+        if value is None:
+            return ()
+        if isinstance(value, str):
+            value = value.split(",")
+        return tuple(protocol.strip() for protocol in value if protocol.strip())
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_mqtt_tls_client_certificate(
+        cls, data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Validate that a TLS client key comes with a client certificate.
+
+        Args:
+            data: The config data.
+
+        Returns:
+            The config data with the TLS client certificate validated.
+
+        Raises:
+            ValueError: Raises if a key is present without a certificate.
+        """
+        if (
+            data.get(CONF_MQTT_TLS_KEYFILE) is not None
+            and data.get(CONF_MQTT_TLS_CERTFILE) is None
+        ):
+            raise ValueError("Invalid MQTT TLS client certificate configuration")
+        return data
+
+    @field_validator("mqtt_topic_alias_maximum", mode="before")
+    @classmethod
+    def validate_mqtt_topic_alias_maximum(cls, value: int | str) -> int:
+        """Validate that the maximum number of MQTT topic aliases is valid.
+
+        Args:
+            value: The maximum number of topic aliases.
+
+        Returns:
+            The parsed maximum number of topic aliases.
+
+        Raises:
+            ValueError: Raises if the maximum is out of range.
+        """
+        if not 0 <= (parsed := int(value)) <= 65535:
+            raise ValueError(f"invalid maximum number of MQTT topic aliases: {value}")
+        return parsed
+
+    validate_mqtt_v5 = field_validator("mqtt_v5", mode="before")(validate_boolean)
+
     validate_port = field_validator("port", mode="before")(validate_port)
 
+    validate_qos = field_validator(
+        "hass_attributes_qos",
+        "hass_discovery_qos",
+        "hass_state_qos",
+        "mqtt_availability_qos",
+        "mqtt_qos",
+        mode="before",
+    )(validate_qos)
+
+    @field_validator("publisher_queue_size", mode="before")
+    @classmethod
+    def validate_publisher_queue_size(cls, value: int | str) -> int:
+        """Validate that the publisher queue size is valid.
+
+        Args:
+            value: The maximum number of payloads waiting on each publisher.
+
+        Returns:
+            The parsed queue size.
+
+        Raises:
+            ValueError: Raises if the queue size is not a positive integer.
+        """
+        if (parsed := int(value)) < 1:
+            raise ValueError(f"invalid publisher queue size: {value}")
+        return parsed
+
+    @field_validator("publisher_retries", mode="before")
+    @classmethod
+    def validate_publisher_retries(cls, value: int | str) -> int:
+        """Validate that the number of publisher retries is valid.
+
+        Args:
+            value: The number of times a publisher retries a payload.
+
+        Returns:
+            The parsed number of retries.
+
+        Raises:
+            ValueError: Raises if the number of retries is negative.
+        """
+        if (parsed := int(value)) < 0:
+            raise ValueError(f"invalid number of publisher retries: {value}")
+        return parsed
+
     validate_raw_data = field_validator("raw_data", mode="before")(validate_boolean)
 
     @model_validator(mode="before")
@@ -320,6 +886,27 @@ class Config(BaseModel):
             )
         return data
 
+    @field_validator(
+        "spool_max_age", "spool_max_size", "spool_replay_rate", mode="before"
+    )
+    @classmethod
+    def validate_spool_limit(cls, value: float | str, info: ValidationInfo) -> float:
+        """Validate that a spool limit is valid.
+
+        Args:
+            value: The spool limit.
+            info: Information about the field being validated.
+
+        Returns:
+            The parsed spool limit.
+
+        Raises:
+            ValueError: Raises if the limit is not a positive number.
+        """
+        if (parsed := float(value)) <= 0:
+            raise ValueError(f"invalid {info.field_name}: {value}")
+        return parsed
+
     validate_verbose = field_validator("verbose", mode="before")(validate_boolean)
 
 
@@ -366,13 +953,15 @@ class Configs:
 
         # Store the default config:
         default_config = config | config_file_config
-        self._configs[CONF_DEFAULT] = self._validate_config(default_config)
+        self._configs[CONF_DEFAULT] = self._validate_config(
+            default_config | {CONF_NAME: CONF_DEFAULT}
+        )
 
         # Store configs for any gateways:
         gateways_file_config = config_file_config.get(CONF_GATEWAYS, {})
         for passkey, gateway_config in gateways_file_config.items():
             self._configs[passkey] = self._validate_config(
-                default_config | gateway_config
+                default_config | gateway_config | {CONF_NAME: passkey}
             )
 
     def __repr__(self) -> str:
@@ -417,6 +1006,16 @@ class Configs:
         """
         return self._configs.get(passkey, self.default_config)
 
+    def items(self) -> Generator[tuple[str, Config]]:
+        """Get a generator to loop through all stored Config objects and their names.
+
+        The default config is named "default"; all others are named by passkey.
+
+        Returns:
+            An Generator of (name, Config) tuples.
+        """
+        return ((name, config) for name, config in self._configs.items())
+
     def iterate(self) -> Generator[Config]:
         """Get a generator to loop through all stored Config objects.
 
@@ -424,3 +1023,17 @@ class Configs:
             An Generator of all stored Config objects.
         """
         return (config for config in self._configs.values())
+
+    def targets(self) -> Generator[tuple[str, Config]]:
+        """Get a generator to loop through every MQTT broker target and its name.
+
+        A config is its own first target (and shares its name); any others are named
+        after the config and their position (e.g., "default.1").
+
+        Returns:
+            An Generator of (name, Config) tuples.
+        """
+        for name, config in self.items():
+            yield name, config
+            for index, target in enumerate(config.mqtt_targets, start=1):
+                yield f"{name}.{index}", target
@@ -9,7 +9,12 @@ __version__ = "2024.10.0"
 
 LOGGER = logging.getLogger(__package__)
 
+# Availability payloads:
+AVAILABILITY_OFFLINE: Final = "offline"
+AVAILABILITY_ONLINE: Final = "online"
+
 # Configuration keys:
+CONF_BATCH_WINDOW: Final = "batch_window"
 CONF_BATTERY_OVERRIDES: Final = "battery_overrides"
 CONF_BOOLEAN_BATTERY_TRUE_VALUE: Final = "boolean_battery_true_value"
 CONF_CONFIG: Final = "config"
@@ -18,19 +23,51 @@ CONF_DIAGNOSTICS: Final = "diagnostics"
 CONF_DISABLE_CALCULATED_DATA: Final = "disable_calculated_data"
 CONF_ENDPOINT: Final = "endpoint"
 CONF_GATEWAYS: Final = "gateways"
+CONF_HASS_ATTRIBUTES_QOS: Final = "hass_attributes_qos"
 CONF_HASS_DISCOVERY: Final = "hass_discovery"
+CONF_HASS_DISCOVERY_MODE: Final = "hass_discovery_mode"
 CONF_HASS_DISCOVERY_PREFIX: Final = "hass_discovery_prefix"
+CONF_HASS_DISCOVERY_QOS: Final = "hass_discovery_qos"
+CONF_HASS_DISCOVERY_RATE_LIMIT: Final = "hass_discovery_rate_limit"
 CONF_HASS_ENTITY_ID_PREFIX: Final = "hass_entity_id_prefix"
+CONF_HASS_REDISCOVERY_WINDOW: Final = "hass_rediscovery_window"
+CONF_HASS_STALE_SENSOR_INTERVALS: Final = "hass_stale_sensor_intervals"
+CONF_HASS_STATE_QOS: Final = "hass_state_qos"
 CONF_INPUT_DATA_FORMAT: Final = "input_data_format"
 CONF_INPUT_UNIT_SYSTEM: Final = "input_unit_system"
 CONF_LOCALE: Final = "locale"
+CONF_MQTT_AVAILABILITY_QOS: Final = "mqtt_availability_qos"
+CONF_MQTT_AVAILABILITY_TOPIC: Final = "mqtt_availability_topic"
 CONF_MQTT_BROKER: Final = "mqtt_broker"
+CONF_MQTT_BYTE_RATE_LIMIT: Final = "mqtt_byte_rate_limit"
+CONF_MQTT_COMPRESSION_THRESHOLD: Final = "mqtt_compression_threshold"
+CONF_MQTT_DNS_CACHE_TTL: Final = "mqtt_dns_cache_ttl"
+CONF_MQTT_ENCODING: Final = "mqtt_encoding"
+CONF_MQTT_FAILBACK: Final = "mqtt_failback"
+CONF_MQTT_FAILOVER_BROKERS: Final = "mqtt_failover_brokers"
+CONF_MQTT_HEALTH_CHECK_INTERVAL: Final = "mqtt_health_check_interval"
+CONF_MQTT_IDLE_TIMEOUT: Final = "mqtt_idle_timeout"
+CONF_MQTT_MAX_INFLIGHT: Final = "mqtt_max_inflight"
+CONF_MQTT_MESSAGE_EXPIRY: Final = "mqtt_message_expiry"
 CONF_MQTT_PASSWORD: Final = "mqtt_password"
 CONF_MQTT_PORT: Final = "mqtt_port"
+CONF_MQTT_QOS: Final = "mqtt_qos"
+CONF_MQTT_RATE_LIMIT: Final = "mqtt_rate_limit"
 CONF_MQTT_RETAIN: Final = "mqtt_retain"
+CONF_MQTT_SESSION_EXPIRY: Final = "mqtt_session_expiry"
+CONF_MQTT_SUBTOPIC_UNITS: Final = "mqtt_subtopic_units"
+CONF_MQTT_SUBTOPICS: Final = "mqtt_subtopics"
+CONF_MQTT_TARGETS: Final = "mqtt_targets"
 CONF_MQTT_TLS: Final = "mqtt_tls"
+CONF_MQTT_TLS_ALPN: Final = "mqtt_tls_alpn"
+CONF_MQTT_TLS_CA_FILE: Final = "mqtt_tls_ca_file"
+CONF_MQTT_TLS_CERTFILE: Final = "mqtt_tls_certfile"
+CONF_MQTT_TLS_KEYFILE: Final = "mqtt_tls_keyfile"
+CONF_MQTT_TLS_VERIFY: Final = "mqtt_tls_verify"
 CONF_MQTT_TOPIC: Final = "mqtt_topic"
+CONF_MQTT_TOPIC_ALIAS_MAXIMUM: Final = "mqtt_topic_alias_maximum"
 CONF_MQTT_USERNAME: Final = "mqtt_username"
+CONF_MQTT_V5: Final = "mqtt_v5"
 CONF_OUTPUT_UNIT_ACCUMULATED_PRECIPITATION: Final = (
     "output_unit_accumulated_precipitation"
 )
@@ -44,7 +81,14 @@ CONF_OUTPUT_UNIT_SYSTEM: Final = "output_unit_system"
 CONF_OUTPUT_UNIT_TEMPERATURE: Final = "output_unit_temperature"
 CONF_PORT: Final = "port"
 CONF_PRECISION: Final = "precision"
+CONF_PUBLISHER_QUEUE_SIZE: Final = "publisher_queue_size"
+CONF_PUBLISHER_RETRIES: Final = "publisher_retries"
 CONF_RAW_DATA: Final = "raw_data"
+CONF_SPOOL_DIRECTORY: Final = "spool_directory"
+CONF_SPOOL_FSYNC: Final = "spool_fsync"
+CONF_SPOOL_MAX_AGE: Final = "spool_max_age"
+CONF_SPOOL_MAX_SIZE: Final = "spool_max_size"
+CONF_SPOOL_REPLAY_RATE: Final = "spool_replay_rate"
 CONF_VERBOSE: Final = "verbose"
 
 # Data points (glob):
@@ -147,10 +191,25 @@ DATA_POINT_YRAIN_PIEZO: Final = "yrain_piezo"
 DEFAULT_BOOLEAN_BATTERY_TRUE_VALUE: Final = 1
 DEFAULT_ENDPOINT: Final = "/data/report"
 DEFAULT_HASS_DISCOVERY_PREFIX: Final = "homeassistant"
+DEFAULT_HASS_DISCOVERY_QOS: Final = 1
+DEFAULT_HASS_REDISCOVERY_WINDOW: Final = 10.0
+DEFAULT_HASS_STATE_QOS: Final = 1
+DEFAULT_MQTT_AVAILABILITY_QOS: Final = 1
+DEFAULT_MQTT_AVAILABILITY_TOPIC: Final = "ecowitt2mqtt/{name}/availability"
+DEFAULT_MQTT_DNS_CACHE_TTL: Final = 300.0
+DEFAULT_MQTT_HEALTH_CHECK_INTERVAL: Final = 5.0
 DEFAULT_MQTT_PORT: Final = 1883
+DEFAULT_MQTT_SESSION_EXPIRY: Final = 3600
+DEFAULT_MQTT_TOPIC_ALIAS_MAXIMUM: Final = 10
 DEFAULT_PORT: Final = 8080
+DEFAULT_PUBLISHER_QUEUE_SIZE: Final = 100
+DEFAULT_PUBLISHER_RETRIES: Final = 2
+DEFAULT_SPOOL_MAX_AGE: Final = 604800.0
+DEFAULT_SPOOL_MAX_SIZE: Final = 100.0
+DEFAULT_SPOOL_REPLAY_RATE: Final = 10.0
 
 # Environment variables:
+ENV_BATCH_WINDOW: Final = "ECOWITT2MQTT_BATCH_WINDOW"
 ENV_BATTERY_OVERRIDES: Final = "ECOWITT2MQTT_BATTERY_OVERRIDE"
 ENV_BOOLEAN_BATTERY_TRUE_VALUE: Final = "ECOWITT2MQTT_BOOLEAN_BATTERY_TRUE_VALUE"
 ENV_CONFIG: Final = "ECOWITT2MQTT_CONFIG"
@@ -158,19 +217,50 @@ ENV_DEFAULT_BATTERY_STRATEGY: Final = "ECOWITT2MQTT_DEFAULT_BATTERY_STRATEGY"
 ENV_DIAGNOSTICS: Final = "ECOWITT2MQTT_DIAGNOSTICS"
 ENV_DISABLE_CALCULATED_DATA: Final = "ECOWITT2MQTT_DISABLE_CALCULATED_DATA"
 ENV_ENDPOINT: Final = "ECOWITT2MQTT_ENDPOINT"
+ENV_HASS_ATTRIBUTES_QOS: Final = "ECOWITT2MQTT_HASS_ATTRIBUTES_QOS"
 ENV_HASS_DISCOVERY: Final = "ECOWITT2MQTT_HASS_DISCOVERY"
+ENV_HASS_DISCOVERY_MODE: Final = "ECOWITT2MQTT_HASS_DISCOVERY_MODE"
 ENV_HASS_DISCOVERY_PREFIX: Final = "ECOWITT2MQTT_HASS_DISCOVERY_PREFIX"
+ENV_HASS_DISCOVERY_QOS: Final = "ECOWITT2MQTT_HASS_DISCOVERY_QOS"
+ENV_HASS_DISCOVERY_RATE_LIMIT: Final = "ECOWITT2MQTT_HASS_DISCOVERY_RATE_LIMIT"
 ENV_HASS_ENTITY_ID_PREFIX: Final = "ECOWITT2MQTT_HASS_ENTITY_ID_PREFIX"
+ENV_HASS_REDISCOVERY_WINDOW: Final = "ECOWITT2MQTT_HASS_REDISCOVERY_WINDOW"
+ENV_HASS_STALE_SENSOR_INTERVALS: Final = "ECOWITT2MQTT_HASS_STALE_SENSOR_INTERVALS"
+ENV_HASS_STATE_QOS: Final = "ECOWITT2MQTT_HASS_STATE_QOS"
 ENV_INPUT_DATA_FORMAT: Final = "ECOWITT2MQTT_INPUT_DATA_FORMAT"
 ENV_INPUT_UNIT_SYSTEM: Final = "ECOWITT2MQTT_INPUT_UNIT_SYSTEM"
 ENV_LOCALE: Final = "ECOWITT2MQTT_LOCALE"
+ENV_MQTT_AVAILABILITY_QOS: Final = "ECOWITT2MQTT_MQTT_AVAILABILITY_QOS"
+ENV_MQTT_AVAILABILITY_TOPIC: Final = "ECOWITT2MQTT_MQTT_AVAILABILITY_TOPIC"
 ENV_MQTT_BROKER: Final = "ECOWITT2MQTT_MQTT_BROKER"
+ENV_MQTT_BYTE_RATE_LIMIT: Final = "ECOWITT2MQTT_MQTT_BYTE_RATE_LIMIT"
+ENV_MQTT_COMPRESSION_THRESHOLD: Final = "ECOWITT2MQTT_MQTT_COMPRESSION_THRESHOLD"
+ENV_MQTT_DNS_CACHE_TTL: Final = "ECOWITT2MQTT_MQTT_DNS_CACHE_TTL"
+ENV_MQTT_ENCODING: Final = "ECOWITT2MQTT_MQTT_ENCODING"
+ENV_MQTT_FAILBACK: Final = "ECOWITT2MQTT_MQTT_FAILBACK"
+ENV_MQTT_FAILOVER_BROKERS: Final = "ECOWITT2MQTT_MQTT_FAILOVER_BROKERS"
+ENV_MQTT_HEALTH_CHECK_INTERVAL: Final = "ECOWITT2MQTT_MQTT_HEALTH_CHECK_INTERVAL"
+ENV_MQTT_IDLE_TIMEOUT: Final = "ECOWITT2MQTT_MQTT_IDLE_TIMEOUT"
+ENV_MQTT_MAX_INFLIGHT: Final = "ECOWITT2MQTT_MQTT_MAX_INFLIGHT"
+ENV_MQTT_MESSAGE_EXPIRY: Final = "ECOWITT2MQTT_MQTT_MESSAGE_EXPIRY"
 ENV_MQTT_PASSWORD: Final = "ECOWITT2MQTT_MQTT_PASSWORD"
 ENV_MQTT_PORT: Final = "ECOWITT2MQTT_MQTT_PORT"
+ENV_MQTT_QOS: Final = "ECOWITT2MQTT_MQTT_QOS"
+ENV_MQTT_RATE_LIMIT: Final = "ECOWITT2MQTT_MQTT_RATE_LIMIT"
 ENV_MQTT_RETAIN: Final = "ECOWITT2MQTT_MQTT_RETAIN"
+ENV_MQTT_SESSION_EXPIRY: Final = "ECOWITT2MQTT_MQTT_SESSION_EXPIRY"
+ENV_MQTT_SUBTOPIC_UNITS: Final = "ECOWITT2MQTT_MQTT_SUBTOPIC_UNITS"
+ENV_MQTT_SUBTOPICS: Final = "ECOWITT2MQTT_MQTT_SUBTOPICS"
 ENV_MQTT_TLS: Final = "ECOWITT2MQTT_MQTT_TLS"
+ENV_MQTT_TLS_ALPN: Final = "ECOWITT2MQTT_MQTT_TLS_ALPN"
+ENV_MQTT_TLS_CA_FILE: Final = "ECOWITT2MQTT_MQTT_TLS_CA_FILE"
+ENV_MQTT_TLS_CERTFILE: Final = "ECOWITT2MQTT_MQTT_TLS_CERTFILE"
+ENV_MQTT_TLS_KEYFILE: Final = "ECOWITT2MQTT_MQTT_TLS_KEYFILE"
+ENV_MQTT_TLS_VERIFY: Final = "ECOWITT2MQTT_MQTT_TLS_VERIFY"
 ENV_MQTT_TOPIC: Final = "ECOWITT2MQTT_MQTT_TOPIC"
+ENV_MQTT_TOPIC_ALIAS_MAXIMUM: Final = "ECOWITT2MQTT_MQTT_TOPIC_ALIAS_MAXIMUM"
 ENV_MQTT_USERNAME: Final = "ECOWITT2MQTT_MQTT_USERNAME"
+ENV_MQTT_V5: Final = "ECOWITT2MQTT_MQTT_V5"
 ENV_OUTPUT_UNIT_ACCUMULATED_PRECIPITATION: Final = (
     "ECOWITT2MQTT_OUTPUT_UNIT_ACCUMULATED_PRECIPITATION"
 )
@@ -186,10 +276,50 @@ ENV_OUTPUT_UNIT_SYSTEM: Final = "ECOWITT2MQTT_OUTPUT_UNIT_SYSTEM"
 ENV_OUTPUT_UNIT_TEMPERATURE: Final = "ECOWITT2MQTT_OUTPUT_UNIT_TEMPERATURE"
 ENV_PORT: Final = "ECOWITT2MQTT_PORT"
 ENV_PRECISION: Final = "ECOWITT2MQTT_PRECISION"
+ENV_PUBLISHER_QUEUE_SIZE: Final = "ECOWITT2MQTT_PUBLISHER_QUEUE_SIZE"
+ENV_PUBLISHER_RETRIES: Final = "ECOWITT2MQTT_PUBLISHER_RETRIES"
 ENV_RAW_DATA: Final = "ECOWITT2MQTT_RAW_DATA"
+ENV_SPOOL_DIRECTORY: Final = "ECOWITT2MQTT_SPOOL_DIRECTORY"
+ENV_SPOOL_FSYNC: Final = "ECOWITT2MQTT_SPOOL_FSYNC"
+ENV_SPOOL_MAX_AGE: Final = "ECOWITT2MQTT_SPOOL_MAX_AGE"
+ENV_SPOOL_MAX_SIZE: Final = "ECOWITT2MQTT_SPOOL_MAX_SIZE"
+ENV_SPOOL_REPLAY_RATE: Final = "ECOWITT2MQTT_SPOOL_REPLAY_RATE"
 ENV_VERBOSE: Final = "ECOWITT2MQTT_VERBOSE"
 
 
+# Home Assistant MQTT Discovery modes:
+class HassDiscoveryMode(StrEnum):
+    """Define Home Assistant MQTT Discovery modes."""
+
+    DEVICE = "device"
+    ENTITY = "entity"
+
+
+# MQTT payload encodings:
+class MqttEncoding(StrEnum):
+    """Define MQTT payload encodings."""
+
+    CBOR = "cbor"
+    JSON = "json"
+    MSGPACK = "msgpack"
+
+
+# The (optional) packages that non-JSON encodings require:
+MQTT_ENCODING_PACKAGES: Final = {
+    MqttEncoding.CBOR: "cbor2",
+    MqttEncoding.MSGPACK: "msgpack",
+}
+
+
+# MQTT TLS verification modes:
+class MqttTlsVerify(StrEnum):
+    """Define how much of an MQTT broker's TLS certificate is verified."""
+
+    CERTIFICATE = "certificate"
+    FULL = "full"
+    NONE = "none"
+
+
 # Unit systems:
 class UnitSystem(StrEnum):
     """Define unit systems."""
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any
+import math
+from array import array
+from collections.abc import Callable
+from dataclasses import InitVar, dataclass, field
+from typing import Any, NamedTuple
+from weakref import WeakValueDictionary
 
 from ecowitt2mqtt.config import Config
 from ecowitt2mqtt.const import (
@@ -70,11 +74,18 @@ from ecowitt2mqtt.const import (
 from ecowitt2mqtt.helpers.calculator import (
     CalculatedDataPoint,
     CalculationFailedError,
-    CalculationKeysMissingError,
     Calculator,
     SimpleCalculator,
 )
 from ecowitt2mqtt.helpers.calculator.battery import BatteryCalculator
+from ecowitt2mqtt.helpers.calculator.channel import (
+    Channel,
+    ChannelBatchEntry,
+    calculate_channel_data_points,
+    calculate_channel_data_points_batch,
+    get_channels,
+)
+from ecowitt2mqtt.helpers.calculator.graph import CalculationGraph, get_payload_keys
 from ecowitt2mqtt.helpers.calculator.heap import HeapCalculator
 from ecowitt2mqtt.helpers.calculator.humidity import (
     AbsoluteHumidityCalculator,
@@ -128,6 +139,7 @@ from ecowitt2mqtt.helpers.calculator.wind import (
 from ecowitt2mqtt.helpers.device import Device, get_device_from_raw_payload
 from ecowitt2mqtt.helpers.typing import PreCalculatedValueType
 from ecowitt2mqtt.util import glob_search
+from ecowitt2mqtt.util.expiring_cache import ExpiringCache
 
 CALCULATOR_MAP: dict[str, type[Calculator]] = {
     DATA_POINT_BEAUFORT_SCALE: BeaufortScaleCalculator,
@@ -190,6 +202,9 @@ CALCULATOR_MAP: dict[str, type[Calculator]] = {
     DATA_POINT_WINDDIR_NAME: WindDirNameCalculator,
 }
 
+DEFAULT_PROCESSED_DATA_CACHE_MAX_SIZE = 1024
+DEFAULT_PROCESSED_DATA_CACHE_TTL = 3600.0
+
 DEFAULT_KEYS_TO_IGNORE = [
     "PASSKEY",
     "dateutc",
@@ -198,6 +213,11 @@ DEFAULT_KEYS_TO_IGNORE = [
     "stationtype",
 ]
 
+# The key schemas of the payloads that are currently around, by their keys:
+_PAYLOAD_SCHEMAS: WeakValueDictionary[tuple[str, ...], PayloadSchema] = (
+    WeakValueDictionary()
+)
+
 # Map which data points tend to come with keys embedded at their end:
 UNIT_SUFFIX_MAP = {
     DATA_POINT_GLOB_BAROM: "in",
@@ -226,6 +246,63 @@ def get_calculator_instance(config: Config, payload_key: str) -> Calculator | No
     return calculator_class(config, payload_key, data_point_key)
 
 
+def get_payload_key_schema(payload_key: str) -> PayloadKeySchema:
+    """Get how a payload key is normalized and how its values are parsed.
+
+    Values of keys that a calculator exists for are parsed as numbers; values of other
+    keys are parsed as numbers if possible.
+
+    Args:
+        payload_key: An Ecowitt payload key.
+
+    Returns:
+        A PayloadKeySchema object.
+    """
+    key = remove_unit_from_key(payload_key)
+    _, calculator_class = glob_search(CALCULATOR_MAP, key)
+    if calculator_class is None:
+        return PayloadKeySchema(key, get_typed_value)
+    return PayloadKeySchema(key, get_typed_number)
+
+
+def get_payload_schema(
+    payload_keys: tuple[str, ...], previous: PayloadSchema | None = None
+) -> PayloadSchema:
+    """Get the (interned) key schema of a payload.
+
+    Gateways post the same keys (in the same order) every time, so payloads with the
+    same keys share a single PayloadSchema for as long as any of them is around.
+
+    Args:
+        payload_keys: The keys of an Ecowitt data payload (in order).
+        previous: The schema of the gateway's previous payload (if any), whose key
+            schemas are reused.
+
+    Returns:
+        A PayloadSchema object.
+    """
+    if (schema := _PAYLOAD_SCHEMAS.get(payload_keys)) is None:
+        schema = _PAYLOAD_SCHEMAS[payload_keys] = PayloadSchema(payload_keys, previous)
+    return schema
+
+
+def get_typed_number(value: float | int | str) -> PreCalculatedValueType | None:
+    """Take a value that should be a number and return it as a float (if possible).
+
+    Args:
+        value: An input value.
+
+    Returns:
+        A float, the value as a string (if it isn't a number), or None (if the value is
+        empty).
+    """
+    if value.__class__ is float:
+        return value
+    if value == "":
+        return None
+    return get_typed_value(value)
+
+
 def get_typed_value(value: float | int | str) -> float | str:
     """Take a string and return its properly typed counterpart (if possible).
 
@@ -265,6 +342,102 @@ def remove_unit_from_key(key: str) -> str:
     return key[:-suffix_length]
 
 
+class PayloadKeySchema(NamedTuple):
+    """Define how a payload key is normalized and how its values are parsed."""
+
+    key: str
+    # Returns None for values that should be skipped (e.g., empty sensor values):
+    parse: Callable[[float | int | str], PreCalculatedValueType | None]
+
+
+class PayloadSchema:
+    """Define the key schema of payloads with the same keys.
+
+    Each normalized key is assigned a position, by which PayloadValues objects store
+    their values.
+    """
+
+    __slots__ = ("__weakref__", "key_schemas", "payload_keys", "positions")
+
+    def __init__(
+        self, payload_keys: tuple[str, ...], previous: PayloadSchema | None = None
+    ) -> None:
+        """Initialize.
+
+        Args:
+            payload_keys: The keys of an Ecowitt data payload (in order).
+            previous: Another PayloadSchema whose key schemas can be reused.
+        """
+        known_key_schemas = (
+            {}
+            if previous is None
+            else dict(zip(previous.payload_keys, previous.key_schemas))
+        )
+        key_schemas: list[PayloadKeySchema | None] = []
+        for payload_key in payload_keys:
+            if payload_key in DEFAULT_KEYS_TO_IGNORE:
+                key_schemas.append(None)
+            elif (key_schema := known_key_schemas.get(payload_key)) is not None:
+                key_schemas.append(key_schema)
+            else:
+                key_schemas.append(get_payload_key_schema(payload_key))
+
+        # Ignored keys have no key schema:
+        self.key_schemas: tuple[PayloadKeySchema | None, ...] = tuple(key_schemas)
+        self.payload_keys: tuple[str, ...] = payload_keys
+        self.positions: dict[str, int] = {}
+        for key_schema in key_schemas:
+            if key_schema is not None:
+                self.positions.setdefault(key_schema.key, len(self.positions))
+
+
+class PayloadValues:
+    """Define the normalized values of a payload, stored by their schema position.
+
+    Numbers are kept in an array of doubles (rather than as float objects in a dict);
+    anything else (strings, NaN, etc.) is kept on the side.
+    """
+
+    __slots__ = ("_numbers", "_others", "_schema")
+
+    def __init__(
+        self, schema: PayloadSchema, payload: dict[str, PreCalculatedValueType]
+    ) -> None:
+        """Initialize.
+
+        Args:
+            schema: The PayloadSchema of the payload.
+            payload: A dictionary of normalized keys to PreCalculatedValueType objects.
+        """
+        # Positions without a number (i.e., values that are missing or kept on the
+        # side) hold NaN:
+        self._numbers = array("d", [math.nan]) * len(schema.positions)
+        self._others: dict[int, PreCalculatedValueType] = {}
+        self._schema = schema
+
+        for key, value in payload.items():
+            position = schema.positions[key]
+            if isinstance(value, float) and not math.isnan(value):
+                self._numbers[position] = value
+            else:
+                self._others[position] = value
+
+    def get(self, key: str) -> PreCalculatedValueType | None:
+        """Get the normalized value of a key.
+
+        Args:
+            key: A normalized payload key.
+
+        Returns:
+            The value (or None if the payload doesn't have one).
+        """
+        if (position := self._schema.positions.get(key)) is None:
+            return None
+        if math.isnan(value := self._numbers[position]):
+            return self._others.get(position)
+        return value
+
+
 @dataclass(frozen=True)
 class ProcessedData:
     """Define a processed data payload."""
@@ -298,48 +471,160 @@ class ProcessedData:
 
     config: Config
     data: dict[str, Any]
+    previous: InitVar[ProcessedData | None] = None
+    batch: InitVar[ProcessingBatch | None] = None
     device: Device = field(init=False)
+    schema: PayloadSchema = field(init=False, repr=False)
     output: dict[str, CalculatedDataPoint] = field(default_factory=dict)
+    values: PayloadValues = field(init=False, repr=False)
 
-    def __post_init__(self) -> None:
-        """Initialize."""
+    def __post_init__(
+        self, previous: ProcessedData | None, batch: ProcessingBatch | None
+    ) -> None:
+        """Initialize.
+
+        If the gateway's previous ProcessedData (processed with the same config) is
+        provided, data points whose inputs haven't changed since are reused from it
+        instead of being calculated again (as is its payload key schema).
+
+        If a ProcessingBatch is provided, channel data points are left to it (and the
+        ProcessedData is complete once the batch is finished).
+
+        Args:
+            previous: The gateway's previous ProcessedData (if any).
+            batch: The ProcessingBatch the payload is part of (if any).
+        """
         object.__setattr__(self, "device", get_device_from_raw_payload(self.data))
 
-        normalized_payload = {
-            remove_unit_from_key(payload_key): get_typed_value(value)
-            for payload_key, value in self.data.items()
-            if payload_key not in DEFAULT_KEYS_TO_IGNORE
-        }
+        payload_keys = tuple(self.data)
+        if previous is not None and previous.schema.payload_keys == payload_keys:
+            schema = previous.schema
+        else:
+            schema = get_payload_schema(
+                payload_keys, None if previous is None else previous.schema
+            )
 
-        self._process_raw_data_points(normalized_payload)
+        normalized_payload: dict[str, PreCalculatedValueType] = {}
+        for payload_key, key_schema, value in zip(
+            payload_keys, schema.key_schemas, self.data.values()
+        ):
+            if key_schema is None:
+                continue
+            if (typed_value := key_schema.parse(value)) is None:
+                LOGGER.debug("Skipping empty value of %s", payload_key)
+                continue
+            normalized_payload[key_schema.key] = typed_value
+        object.__setattr__(self, "schema", schema)
+        object.__setattr__(self, "values", PayloadValues(schema, normalized_payload))
+
+        previous_output: dict[str, CalculatedDataPoint] = {}
+        unchanged_keys: set[str] = set()
+        if previous is not None and previous.config is self.config:
+            previous_output = previous.output
+            unchanged_keys = {
+                key
+                for key, value in normalized_payload.items()
+                if previous.values.get(key) == value
+            }
+
+        self._process_raw_data_points(
+            normalized_payload, previous_output, unchanged_keys
+        )
+        channels: list[Channel] = []
         if not self.config.disable_calculated_data:
-            self._process_calculated_data_points(normalized_payload)
+            self._process_calculated_data_points(
+                normalized_payload, previous_output, unchanged_keys
+            )
+            channels = self._process_channel_data_points(
+                normalized_payload, previous_output, unchanged_keys
+            )
+
+        if not channels:
+            return
+        if batch is None:
+            self.output.update(
+                calculate_channel_data_points(self.config, normalized_payload, channels)
+            )
+        else:
+            batch.add(self.config, normalized_payload, channels, self.output.update)
 
     def _process_calculated_data_points(
-        self, payload: dict[str, PreCalculatedValueType]
+        self,
+        payload: dict[str, PreCalculatedValueType],
+        previous_output: dict[str, CalculatedDataPoint],
+        unchanged_keys: set[str],
     ) -> None:
         """Process "from-scratch" data points that can be calculated from others.
 
         Unlike raw data points, if a calculator doesn't exist for some reason or the
         keys necessary to calculate the data point don't exist, we silently move on.
+        Intermediates that several data points share (like the dew point) are
+        calculated once per payload.
 
         Args:
             payload: A dictionary of keys to PreCalculatedValueType objects.
+            previous_output: The previous output of the gateway.
+            unchanged_keys: The payload keys whose values haven't changed since.
         """
+        graph = CalculationGraph(self.config, payload)
+
         for key in self.CALCULATED_DATA_POINTS:
             if calculator := get_calculator_instance(self.config, key):
-                try:
-                    self.output[key] = calculator.calculate_from_payload(payload)
-                except CalculationKeysMissingError:
+                if not graph.has_inputs(calculator.INPUTS):
                     LOGGER.debug("Cannot calculate %s due to missing keys", key)
+                elif key in previous_output and get_payload_keys(
+                    calculator.INPUTS
+                ).issubset(unchanged_keys):
+                    self.output[key] = previous_output[key]
+                else:
+                    self.output[key] = calculator.calculate_from_payload(graph)
+
+    def _process_channel_data_points(
+        self,
+        payload: dict[str, PreCalculatedValueType],
+        previous_output: dict[str, CalculatedDataPoint],
+        unchanged_keys: set[str],
+    ) -> list[Channel]:
+        """Process data points calculated for each temperature/humidity channel.
+
+        Channels whose temperature and humidity haven't changed reuse their previous
+        data points; the rest are returned, so that they can be calculated in a single
+        batch.
+
+        Args:
+            payload: A dictionary of keys to PreCalculatedValueType objects.
+            previous_output: The previous output of the gateway.
+            unchanged_keys: The payload keys whose values haven't changed since.
+
+        Returns:
+            The channels whose data points need to be calculated.
+        """
+        channels = []
+        for channel in get_channels(payload):
+            keys = channel.data_point_keys.values()
+            if (
+                channel.temperature_key in unchanged_keys
+                and channel.humidity_key in unchanged_keys
+                and all(key in previous_output for key in keys)
+            ):
+                for key in keys:
+                    self.output[key] = previous_output[key]
+            else:
+                channels.append(channel)
+        return channels
 
     def _process_raw_data_points(
-        self, payload: dict[str, PreCalculatedValueType]
+        self,
+        payload: dict[str, PreCalculatedValueType],
+        previous_output: dict[str, CalculatedDataPoint],
+        unchanged_keys: set[str],
     ) -> None:
         """Process data points for which raw data was provided.
 
         Args:
             payload: A dictionary of keys to PreCalculatedValueType objects.
+            previous_output: The previous output of the gateway.
+            unchanged_keys: The payload keys whose values haven't changed since.
         """
         for key, value in payload.items():
             if (
@@ -348,6 +633,9 @@ class ProcessedData:
             ):
                 LOGGER.debug("Skipping processing of calculated data point: %s", key)
                 continue
+            if key in unchanged_keys and key in previous_output:
+                self.output[key] = previous_output[key]
+                continue
             if (calculator := get_calculator_instance(self.config, key)) is None:
                 LOGGER.debug("No calculator found for %s", key)
                 self.output[key] = CalculatedDataPoint(data_point_key=key, value=value)
@@ -365,3 +653,74 @@ class ProcessedData:
                 self.output[key] = calculator.calculate_from_value(value)
             except CalculationFailedError as err:
                 LOGGER.debug("Cannot calculate %s (raw value: %s): %s", key, value, err)
+
+
+class ProcessingBatch:
+    """Define a batch of payloads that are processed together.
+
+    ProcessedData objects created with a batch leave their channel data points to it,
+    so that the channels of every payload in the batch are calculated column-wise (see
+    calculate_channel_data_points_batch). They're complete once the batch is finished.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._callbacks: list[Callable[[dict[str, CalculatedDataPoint]], None]] = []
+        self._entries: list[ChannelBatchEntry] = []
+
+    def __len__(self) -> int:
+        """Return the number of payloads waiting for their channels to be calculated.
+
+        Returns:
+            The number of payloads.
+        """
+        return len(self._entries)
+
+    def add(
+        self,
+        config: Config,
+        payload: dict[str, PreCalculatedValueType],
+        channels: list[Channel],
+        callback: Callable[[dict[str, CalculatedDataPoint]], None],
+    ) -> None:
+        """Add a payload whose channels need to be calculated.
+
+        Args:
+            config: A Config object.
+            payload: A dictionary of keys to PreCalculatedValueType objects.
+            channels: The channels to calculate.
+            callback: A function to call with the calculated channel data points.
+        """
+        self._callbacks.append(callback)
+        self._entries.append((config, payload, channels))
+
+    def finish(self) -> None:
+        """Calculate the channels of every payload in the batch."""
+        callbacks, self._callbacks = self._callbacks, []
+        entries, self._entries = self._entries, []
+        for callback, output in zip(
+            callbacks, calculate_channel_data_points_batch(entries)
+        ):
+            callback(output)
+
+
+class ProcessedDataCache(ExpiringCache[str, ProcessedData]):
+    """Define a bounded cache of the last ProcessedData of each gateway (by its ID).
+
+    Gateways that haven't posted within the TTL are evicted; once the cache is full, the
+    gateway that posted least recently is, too.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = DEFAULT_PROCESSED_DATA_CACHE_MAX_SIZE,
+        ttl: float = DEFAULT_PROCESSED_DATA_CACHE_TTL,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            max_size: The maximum number of gateways to cache.
+            ttl: The amount of time (in seconds) to cache a quiet gateway for.
+        """
+        super().__init__(max_size=max_size, ttl=ttl)
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import locale
-from collections.abc import Callable, Iterable
+import re
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from functools import wraps
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from ecowitt2mqtt.const import UnitSystem
 from ecowitt2mqtt.errors import EcowittError
@@ -17,10 +17,7 @@ from ecowitt2mqtt.util.unit_conversion import BaseUnitConverter
 if TYPE_CHECKING:
     from ecowitt2mqtt.config import Config
 
-_CalculatorT = TypeVar("_CalculatorT", bound="Calculator")
-_CalculateFromPayloadFuncT = Callable[
-    [_CalculatorT, dict[str, PreCalculatedValueType]], "CalculatedDataPoint"
-]
+_DIGIT_PATTERN = re.compile(r"\d")
 
 
 class CalculationFailedError(EcowittError):
@@ -29,10 +26,25 @@ class CalculationFailedError(EcowittError):
     pass
 
 
-class CalculationKeysMissingError(EcowittError):
-    """Define an error when keys required for a calculated data point are missing."""
+def round_value(value: CalculatedValueType, precision: int) -> CalculatedValueType:
+    """Round a calculated value (if it is a number) to a precision.
 
-    pass
+    Args:
+        value: A calculated value.
+        precision: The number of decimal places to round to.
+
+    Returns:
+        The rounded value (or the value as-is if it isn't a number).
+    """
+    if isinstance(value, (float, int)):
+        return round(float(value), precision)
+    if isinstance(value, str) and _DIGIT_PATTERN.search(value):
+        try:
+            # Strings that got this far might use a non-standard float notation:
+            return round(locale.atof(value), precision)
+        except ValueError:
+            pass
+    return value
 
 
 class DataPointType(Enum):
@@ -42,7 +54,7 @@ class DataPointType(Enum):
     NON_BOOLEAN = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class CalculatedDataPoint:
     """Define a calculated data point."""
 
@@ -57,6 +69,8 @@ class Calculator:
     """Define a calculator."""
 
     DEFAULT_INPUT_UNIT: str
+    # The payload keys and intermediates that calculate_from_payload reads:
+    INPUTS: tuple[str, ...] = ()
     UNIT_OVERRIDE_CONFIG_OPTION: str | None = None
 
     def __init__(self, config: Config, payload_key: str, data_point_key: str) -> None:
@@ -116,12 +130,12 @@ class Calculator:
         """
 
     def calculate_from_payload(  # type: ignore[empty-body]
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
         Args:
-            payload: An Ecowitt data payload.
+            payload: An Ecowitt data payload (along with any intermediates).
         """
 
     def get_calculated_data_point(
@@ -149,15 +163,7 @@ class Calculator:
             )
 
         if self._config.precision:
-            if isinstance(value, float):
-                value = round(value, self._config.precision)
-            else:
-                try:
-                    value = round(locale.atof(str(value)), self._config.precision)
-                except ValueError:
-                    # This conversion is in place to see if we have a non-standard float
-                    # notation; if we can't parse it as such, leave the value as-is:
-                    pass
+            value = round_value(value, self._config.precision)
 
         data_point = CalculatedDataPoint(
             data_point_key=self._data_point_key,
@@ -171,55 +177,6 @@ class Calculator:
 
         return data_point
 
-    @staticmethod
-    def requires_keys(
-        *keys: Iterable[str],
-    ) -> Callable[[_CalculateFromPayloadFuncT], _CalculateFromPayloadFuncT]:
-        """Define a decorator that requires certain payload keys to exist.
-
-        Args:
-            keys: A series of strings.
-
-        Returns:
-            A decorated Callable.
-        """
-
-        def decorator(
-            func: _CalculateFromPayloadFuncT,
-        ) -> _CalculateFromPayloadFuncT:
-            """Decorate.
-
-            Args:
-                func: The Callable to decorate.
-
-            Returns:
-                A decorated Callable.
-            """
-
-            @wraps(func)
-            def wrapper(
-                calculator: _CalculatorT, payload: dict[str, PreCalculatedValueType]
-            ) -> CalculatedDataPoint:
-                """Wrap.
-
-                Args:
-                    calculator: A Calculator subclass.
-                    payload: A payload to run the calculator on.
-
-                Returns:
-                    A parsed CalculatedDataPoint object.
-
-                Raises:
-                    CalculationKeysMissingError: Raised if required keys are missing.
-                """
-                if not all(k in payload for k in keys):
-                    raise CalculationKeysMissingError
-                return func(calculator, payload)
-
-            return wrapper
-
-        return decorator
-
 
 class SimpleCalculator(Calculator):
     """Define a calculator that returns a value as-is (with an added unit)."""
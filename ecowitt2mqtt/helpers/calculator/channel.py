@@ -0,0 +1,238 @@
+"""Define calculators for temperature/humidity channels (e.g., WH31 sensors)."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from ecowitt2mqtt.const import (
+    DATA_POINT_DEWPOINT,
+    DATA_POINT_FROST_RISK,
+    DATA_POINT_HEATINDEX,
+    DATA_POINT_HUMIDITY,
+    DATA_POINT_HUMIDITY_ABS,
+    DATA_POINT_TEMP,
+)
+from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint, Calculator
+from ecowitt2mqtt.helpers.calculator.humidity import AbsoluteHumidityCalculator
+from ecowitt2mqtt.helpers.calculator.temperature import (
+    DewPointCalculator,
+    FrostRiskCalculator,
+    HeatIndexCalculator,
+    get_frost_risk,
+)
+from ecowitt2mqtt.helpers.typing import PreCalculatedValueType
+from ecowitt2mqtt.util.meteo import (
+    celsius_to_fahrenheit,
+    get_temperature_in_celsius,
+    get_temperature_in_fahrenheit,
+)
+from ecowitt2mqtt.util.meteo_batch import get_humidity_metrics
+from ecowitt2mqtt.util.unit_conversion import (
+    BaseUnitConverter,
+    TemperatureConverter,
+    VolumeConverter,
+)
+
+if TYPE_CHECKING:
+    from ecowitt2mqtt.config import Config
+
+# Gateways support up to eight temperature/humidity channels:
+CHANNEL_COUNT = 8
+
+
+# The data points calculated for each channel:
+CHANNEL_DATA_POINTS = (
+    DATA_POINT_DEWPOINT,
+    DATA_POINT_FROST_RISK,
+    DATA_POINT_HEATINDEX,
+    DATA_POINT_HUMIDITY_ABS,
+)
+
+
+@dataclass(frozen=True)
+class Channel:
+    """Define a temperature/humidity channel."""
+
+    number: int
+    temperature_key: str
+    humidity_key: str
+    # The output key of each data point calculated for the channel:
+    data_point_keys: dict[str, str]
+
+
+CHANNELS = tuple(
+    Channel(
+        number=number,
+        temperature_key=f"{DATA_POINT_TEMP}{number}",
+        humidity_key=f"{DATA_POINT_HUMIDITY}{number}",
+        data_point_keys={
+            data_point: f"{data_point}{number}" for data_point in CHANNEL_DATA_POINTS
+        },
+    )
+    for number in range(1, CHANNEL_COUNT + 1)
+)
+
+# A payload's config, the payload itself, and the channels to calculate for it:
+ChannelBatchEntry = tuple["Config", Mapping[str, PreCalculatedValueType], list[Channel]]
+
+
+def calculate_channel_data_points(
+    config: Config,
+    payload: Mapping[str, PreCalculatedValueType],
+    channels: list[Channel],
+) -> dict[str, CalculatedDataPoint]:
+    """Calculate the data points of a series of channels (in a single batch).
+
+    Args:
+        config: A Config object.
+        payload: An Ecowitt data payload.
+        channels: The channels to calculate (see get_channels).
+
+    Returns:
+        A dictionary of output keys to CalculatedDataPoint objects.
+    """
+    return calculate_channel_data_points_batch([(config, payload, channels)])[0]
+
+
+def calculate_channel_data_points_batch(
+    entries: Sequence[ChannelBatchEntry],
+) -> list[dict[str, CalculatedDataPoint]]:
+    """Calculate the data points of the channels of several payloads (in one batch).
+
+    The channels of every payload are laid out column-wise, so that each metric (and
+    the conversion of it to each output unit) is calculated for all of them at once.
+
+    Args:
+        entries: A series of (config, payload, channels) tuples.
+
+    Returns:
+        A dictionary of output keys to CalculatedDataPoint objects for each entry.
+    """
+    rows: list[tuple[int, Config, Channel]] = []
+    temperatures_c: list[float] = []
+    temperatures_f: list[float] = []
+    humidities: list[float] = []
+    for index, (config, payload, channels) in enumerate(entries):
+        for channel in channels:
+            temperature = cast(float, payload[channel.temperature_key])
+            rows.append((index, config, channel))
+            temperatures_c.append(
+                get_temperature_in_celsius(temperature, config.input_unit_system)
+            )
+            temperatures_f.append(
+                get_temperature_in_fahrenheit(temperature, config.input_unit_system)
+            )
+            humidities.append(cast(float, payload[channel.humidity_key]))
+
+    metrics = get_humidity_metrics(temperatures_c, temperatures_f, humidities)
+    columns: tuple[
+        tuple[str, type[Calculator], Sequence[Any], type[BaseUnitConverter] | None],
+        ...,
+    ] = (
+        (
+            DATA_POINT_DEWPOINT,
+            DewPointCalculator,
+            [
+                None if dew_point_c is None else celsius_to_fahrenheit(dew_point_c)
+                for dew_point_c in metrics.dew_point_c
+            ],
+            TemperatureConverter,
+        ),
+        (
+            DATA_POINT_FROST_RISK,
+            FrostRiskCalculator,
+            [
+                None
+                if frost_point_c is None
+                else get_frost_risk(temperature_c, frost_point_c, absolute_humidity)
+                for temperature_c, frost_point_c, absolute_humidity in zip(
+                    temperatures_c, metrics.frost_point_c, metrics.absolute_humidity
+                )
+            ],
+            None,
+        ),
+        (
+            DATA_POINT_HEATINDEX,
+            HeatIndexCalculator,
+            metrics.heat_index_f,
+            TemperatureConverter,
+        ),
+        (
+            DATA_POINT_HUMIDITY_ABS,
+            AbsoluteHumidityCalculator,
+            metrics.absolute_humidity,
+            VolumeConverter,
+        ),
+    )
+
+    outputs: list[dict[str, CalculatedDataPoint]] = [{} for _ in entries]
+    for data_point_key, calculator_class, values, unit_converter in columns:
+        calculators = [
+            calculator_class(
+                config, channel.data_point_keys[data_point_key], data_point_key
+            )
+            for _, config, channel in rows
+        ]
+        if unit_converter is not None:
+            values = _convert_column(values, calculators, unit_converter)
+        for (index, _, channel), calculator, value in zip(rows, calculators, values):
+            outputs[index][channel.data_point_keys[data_point_key]] = (
+                calculator.get_calculated_data_point(value)
+            )
+
+    return outputs
+
+
+def _convert_column(
+    values: Sequence[float | None],
+    calculators: list[Calculator],
+    unit_converter: type[BaseUnitConverter],
+) -> list[float | None]:
+    """Convert a column of values to the output unit of each row's calculator.
+
+    Values that are converted to the same unit are converted together.
+
+    Args:
+        values: The values (in the calculators' default input unit).
+        calculators: The calculator of each row.
+        unit_converter: The BaseUnitConverter subclass to convert with.
+
+    Returns:
+        The converted values.
+    """
+    indices_by_unit: dict[str, list[int]] = {}
+    for index, (calculator, value) in enumerate(zip(calculators, values)):
+        if value is not None and (output_unit := calculator.output_unit):
+            indices_by_unit.setdefault(output_unit, []).append(index)
+
+    converted = list(values)
+    for output_unit, indices in indices_by_unit.items():
+        for index, value in zip(
+            indices,
+            unit_converter.convert_many(
+                [cast(float, values[index]) for index in indices],
+                calculators[indices[0]].DEFAULT_INPUT_UNIT,
+                output_unit,
+            ),
+        ):
+            converted[index] = value
+    return converted
+
+
+def get_channels(payload: Mapping[str, PreCalculatedValueType]) -> list[Channel]:
+    """Get the channels that a payload has a numeric temperature and humidity for.
+
+    Args:
+        payload: An Ecowitt data payload.
+
+    Returns:
+        A list of Channel objects.
+    """
+    return [
+        channel
+        for channel in CHANNELS
+        if isinstance(payload.get(channel.temperature_key), float)
+        and isinstance(payload.get(channel.humidity_key), float)
+    ]
@@ -0,0 +1,231 @@
+"""Define a dependency graph for calculated data points."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+from ecowitt2mqtt.const import (
+    DATA_POINT_HUMIDITY,
+    DATA_POINT_HUMIDITYIN,
+    DATA_POINT_TEMP,
+    DATA_POINT_TEMPIN,
+)
+from ecowitt2mqtt.helpers.typing import PreCalculatedValueType
+from ecowitt2mqtt.util.meteo import (
+    get_absolute_humidity_in_metric,
+    get_dew_point_in_celsius,
+    get_frost_point_from_dew_point_in_celsius,
+    get_humidex_from_dew_point,
+    get_relative_strain_index,
+    get_simmer_index_in_fahrenheit,
+    get_temperature_in_celsius,
+    get_temperature_in_fahrenheit,
+)
+
+if TYPE_CHECKING:
+    from ecowitt2mqtt.config import Config
+
+INTERMEDIATE_ABSOLUTE_HUMIDITY: Final = "absolute_humidity"
+INTERMEDIATE_ABSOLUTE_HUMIDITY_IN: Final = "absolute_humidity_in"
+INTERMEDIATE_DEW_POINT_C: Final = "dew_point_c"
+INTERMEDIATE_FROST_POINT_C: Final = "frost_point_c"
+INTERMEDIATE_HUMIDEX: Final = "humidex_index"
+INTERMEDIATE_RELATIVE_STRAIN_INDEX: Final = "relative_strain_index"
+INTERMEDIATE_SIMMER_INDEX_F: Final = "simmer_index_f"
+INTERMEDIATE_TEMP_C: Final = "temp_c"
+INTERMEDIATE_TEMP_F: Final = "temp_f"
+INTERMEDIATE_TEMPIN_C: Final = "tempin_c"
+
+
+@dataclass(frozen=True)
+class Intermediate:
+    """Define a value that several calculated data points are derived from.
+
+    The calculation is called with the config and the value of each input (in order).
+    """
+
+    inputs: tuple[str, ...]
+    calculate: Callable[..., float]
+
+
+INTERMEDIATES: dict[str, Intermediate] = {
+    INTERMEDIATE_ABSOLUTE_HUMIDITY: Intermediate(
+        (INTERMEDIATE_TEMP_C, DATA_POINT_HUMIDITY),
+        lambda _, temp_c, humidity: get_absolute_humidity_in_metric(temp_c, humidity),
+    ),
+    INTERMEDIATE_ABSOLUTE_HUMIDITY_IN: Intermediate(
+        (INTERMEDIATE_TEMPIN_C, DATA_POINT_HUMIDITYIN),
+        lambda _, temp_c, humidity: get_absolute_humidity_in_metric(temp_c, humidity),
+    ),
+    INTERMEDIATE_DEW_POINT_C: Intermediate(
+        (INTERMEDIATE_TEMP_C, DATA_POINT_HUMIDITY),
+        lambda _, temp_c, humidity: get_dew_point_in_celsius(temp_c, humidity),
+    ),
+    INTERMEDIATE_FROST_POINT_C: Intermediate(
+        (INTERMEDIATE_TEMP_C, INTERMEDIATE_DEW_POINT_C),
+        lambda _, temp_c, dew_point_c: get_frost_point_from_dew_point_in_celsius(
+            temp_c, dew_point_c
+        ),
+    ),
+    INTERMEDIATE_HUMIDEX: Intermediate(
+        (INTERMEDIATE_TEMP_C, INTERMEDIATE_DEW_POINT_C),
+        lambda _, temp_c, dew_point_c: get_humidex_from_dew_point(temp_c, dew_point_c),
+    ),
+    INTERMEDIATE_RELATIVE_STRAIN_INDEX: Intermediate(
+        (INTERMEDIATE_TEMP_C, DATA_POINT_HUMIDITY),
+        lambda _, temp_c, humidity: get_relative_strain_index(temp_c, humidity),
+    ),
+    INTERMEDIATE_SIMMER_INDEX_F: Intermediate(
+        (INTERMEDIATE_TEMP_F, DATA_POINT_HUMIDITY),
+        lambda _, temp_f, humidity: get_simmer_index_in_fahrenheit(temp_f, humidity),
+    ),
+    INTERMEDIATE_TEMP_C: Intermediate(
+        (DATA_POINT_TEMP,),
+        lambda config, temp: get_temperature_in_celsius(temp, config.input_unit_system),
+    ),
+    INTERMEDIATE_TEMP_F: Intermediate(
+        (DATA_POINT_TEMP,),
+        lambda config, temp: get_temperature_in_fahrenheit(
+            temp, config.input_unit_system
+        ),
+    ),
+    INTERMEDIATE_TEMPIN_C: Intermediate(
+        (DATA_POINT_TEMPIN,),
+        lambda config, temp: get_temperature_in_celsius(temp, config.input_unit_system),
+    ),
+}
+
+# The payload keys that each series of inputs is calculated from (there are only as
+# many series as there are calculators and intermediates):
+_PAYLOAD_KEYS: dict[tuple[str, ...], frozenset[str]] = {}
+
+
+class CalculationGraph(Mapping[str, PreCalculatedValueType]):
+    """Define a payload that calculates the intermediates it is asked for.
+
+    Each intermediate is calculated at most once per payload (including when its
+    calculation fails); whether an input is available is resolved once, too, so that
+    every data point depending on a missing payload key can be skipped up front.
+    """
+
+    def __init__(
+        self, config: Config, payload: Mapping[str, PreCalculatedValueType]
+    ) -> None:
+        """Initialize.
+
+        Args:
+            config: A Config object.
+            payload: A mapping of keys to PreCalculatedValueType objects.
+        """
+        self._available: dict[str, bool] = {}
+        self._config = config
+        self._errors: dict[str, ValueError] = {}
+        self._payload = payload
+        self._values: dict[str, float] = {}
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a payload key or intermediate is available.
+
+        Args:
+            key: A payload key or intermediate.
+
+        Returns:
+            Whether the key is available.
+        """
+        name = str(key)
+        if (available := self._available.get(name)) is not None:
+            return available
+
+        if (intermediate := INTERMEDIATES.get(name)) is None:
+            available = name in self._payload
+        else:
+            available = self.has_inputs(intermediate.inputs)
+
+        self._available[name] = available
+        return available
+
+    def __getitem__(self, key: str) -> PreCalculatedValueType:
+        """Return the value of a payload key or intermediate.
+
+        Args:
+            key: A payload key or intermediate.
+
+        Returns:
+            The value.
+
+        Raises:
+            KeyError: Raised when an input of the intermediate is missing.
+            ValueError: Raised when the intermediate cannot be calculated.
+        """
+        if (intermediate := INTERMEDIATES.get(key)) is None:
+            return self._payload[key]
+
+        if key in self._values:
+            return self._values[key]
+        if key in self._errors:
+            raise self._errors[key]
+        if key not in self:
+            raise KeyError(key)
+
+        try:
+            value = intermediate.calculate(
+                self._config, *(self[input_key] for input_key in intermediate.inputs)
+            )
+        except ValueError as err:
+            self._errors[key] = err
+            raise
+
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the payload keys.
+
+        Returns:
+            An iterator of payload keys.
+        """
+        return iter(self._payload)
+
+    def __len__(self) -> int:
+        """Return the number of payload keys.
+
+        Returns:
+            The number of payload keys.
+        """
+        return len(self._payload)
+
+    def has_inputs(self, inputs: Iterable[str]) -> bool:
+        """Return whether every one of a series of inputs is available.
+
+        Args:
+            inputs: A series of payload keys and intermediates.
+
+        Returns:
+            Whether every input is available.
+        """
+        return all(input_key in self for input_key in inputs)
+
+
+def get_payload_keys(inputs: tuple[str, ...]) -> frozenset[str]:
+    """Get the payload keys that a series of inputs is ultimately calculated from.
+
+    Args:
+        inputs: A series of payload keys and intermediates.
+
+    Returns:
+        A set of payload keys.
+    """
+    if (payload_keys := _PAYLOAD_KEYS.get(inputs)) is not None:
+        return payload_keys
+
+    keys: set[str] = set()
+    for input_key in inputs:
+        if (intermediate := INTERMEDIATES.get(input_key)) is None:
+            keys.add(input_key)
+        else:
+            keys |= get_payload_keys(intermediate.inputs)
+
+    payload_keys = _PAYLOAD_KEYS[inputs] = frozenset(keys)
+    return payload_keys
@@ -2,27 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import cast
 
-from ecowitt2mqtt.const import (
-    CONF_OUTPUT_UNIT_HUMIDITY,
-    DATA_POINT_HUMIDITY,
-    DATA_POINT_HUMIDITYIN,
-    DATA_POINT_TEMP,
-    DATA_POINT_TEMPIN,
-    PERCENTAGE,
-    UnitOfVolume,
-)
+from ecowitt2mqtt.const import CONF_OUTPUT_UNIT_HUMIDITY, PERCENTAGE, UnitOfVolume
 from ecowitt2mqtt.helpers.calculator import (
     CalculatedDataPoint,
     Calculator,
     SimpleCalculator,
 )
-from ecowitt2mqtt.helpers.typing import PreCalculatedValueType
-from ecowitt2mqtt.util.meteo import (
-    get_absolute_humidity_in_metric,
-    get_temperature_meteocalc_object,
+from ecowitt2mqtt.helpers.calculator.graph import (
+    INTERMEDIATE_ABSOLUTE_HUMIDITY,
+    INTERMEDIATE_ABSOLUTE_HUMIDITY_IN,
 )
+from ecowitt2mqtt.helpers.typing import PreCalculatedValueType
 from ecowitt2mqtt.util.unit_conversion import VolumeConverter
 
 
@@ -30,6 +23,7 @@ class AbsoluteHumidityCalculator(Calculator):
     """Define an absolute humidity calculator."""
 
     DEFAULT_INPUT_UNIT = UnitOfVolume.GRAMS_PER_CUBIC_METER
+    INPUTS = (INTERMEDIATE_ABSOLUTE_HUMIDITY,)
     UNIT_OVERRIDE_CONFIG_OPTION = CONF_OUTPUT_UNIT_HUMIDITY
 
     @property
@@ -50,18 +44,8 @@ class AbsoluteHumidityCalculator(Calculator):
         """
         return UnitOfVolume.GRAMS_PER_CUBIC_METER
 
-    def _calculate_value(self, temp: float, humidity: float) -> CalculatedDataPoint:
-        """Calculate the absolute humidity."""
-        temp_obj = get_temperature_meteocalc_object(
-            temp, self._config.input_unit_system
-        )
-
-        value = get_absolute_humidity_in_metric(temp_obj, humidity)
-        return self.get_calculated_data_point(value, unit_converter=VolumeConverter)
-
-    @Calculator.requires_keys(DATA_POINT_TEMP, DATA_POINT_HUMIDITY)
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -71,17 +55,19 @@ class AbsoluteHumidityCalculator(Calculator):
         Returns:
             A parsed CalculatedDataPoint object.
         """
-        temp = cast(float, payload[DATA_POINT_TEMP])
-        humidity = cast(float, payload[DATA_POINT_HUMIDITY])
-        return self._calculate_value(temp, humidity)
+        absolute_humidity = cast(float, payload[INTERMEDIATE_ABSOLUTE_HUMIDITY])
+        return self.get_calculated_data_point(
+            absolute_humidity, unit_converter=VolumeConverter
+        )
 
 
 class IndoorAbsoluteHumidityCalculator(AbsoluteHumidityCalculator):
     """Define an absolute humidity calculator."""
 
-    @Calculator.requires_keys(DATA_POINT_TEMPIN, DATA_POINT_HUMIDITYIN)
+    INPUTS = (INTERMEDIATE_ABSOLUTE_HUMIDITY_IN,)
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -91,9 +77,10 @@ class IndoorAbsoluteHumidityCalculator(AbsoluteHumidityCalculator):
         Returns:
             A parsed CalculatedDataPoint object.
         """
-        temp = cast(float, payload[DATA_POINT_TEMPIN])
-        humidity = cast(float, payload[DATA_POINT_HUMIDITYIN])
-        return self._calculate_value(temp, humidity)
+        absolute_humidity = cast(float, payload[INTERMEDIATE_ABSOLUTE_HUMIDITY_IN])
+        return self.get_calculated_data_point(
+            absolute_humidity, unit_converter=VolumeConverter
+        )
 
 
 class RelativeHumidityCalculator(SimpleCalculator):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import cast
 
 from ecowitt2mqtt.const import (
@@ -63,6 +64,8 @@ class IlluminanceCalculator(BaseIlluminanceCalculator):
 class PerceivedIlluminanceCalculator(BaseIlluminanceCalculator):
     """Define a perceived illuminance calculator."""
 
+    INPUTS = (DATA_POINT_SOLARRADIATION,)
+
     @property
     def output_unit(self) -> str:
         """Get the output unit of measurement for this calculation.
@@ -72,9 +75,8 @@ class PerceivedIlluminanceCalculator(BaseIlluminanceCalculator):
         """
         return PERCENTAGE
 
-    @Calculator.requires_keys(DATA_POINT_SOLARRADIATION)
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import cast
 
-import meteocalc
-
 from ecowitt2mqtt.backports.enum import StrEnum
 from ecowitt2mqtt.const import (
     CONF_OUTPUT_UNIT_TEMPERATURE,
@@ -17,18 +16,24 @@ from ecowitt2mqtt.const import (
     UnitOfTemperature,
 )
 from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint, Calculator
+from ecowitt2mqtt.helpers.calculator.graph import (
+    INTERMEDIATE_ABSOLUTE_HUMIDITY,
+    INTERMEDIATE_DEW_POINT_C,
+    INTERMEDIATE_FROST_POINT_C,
+    INTERMEDIATE_HUMIDEX,
+    INTERMEDIATE_RELATIVE_STRAIN_INDEX,
+    INTERMEDIATE_SIMMER_INDEX_F,
+    INTERMEDIATE_TEMP_C,
+    INTERMEDIATE_TEMP_F,
+)
 from ecowitt2mqtt.helpers.typing import PreCalculatedValueType
+from ecowitt2mqtt.util.bands import BandTable
 from ecowitt2mqtt.util.meteo import (
-    get_absolute_humidity_in_metric,
-    get_dew_point_meteocalc_object,
-    get_feels_like_meteocalc_object,
-    get_frost_point_meteocalc_object,
-    get_heat_index_meteocalc_object,
-    get_humidex,
-    get_relative_strain_index,
-    get_simmer_index_meteocalc_object,
-    get_temperature_meteocalc_object,
-    get_wind_chill_meteocalc_object,
+    celsius_to_fahrenheit,
+    get_feels_like_in_fahrenheit,
+    get_heat_index_in_fahrenheit,
+    get_temperature_in_fahrenheit,
+    get_wind_chill_in_fahrenheit,
 )
 from ecowitt2mqtt.util.unit_conversion import TemperatureConverter
 
@@ -94,6 +99,10 @@ HUMIDEX_PERCEPTION_RATINGS: list[HumidexPerceptionRating] = [
     ),
 ]
 
+HUMIDEX_PERCEPTION_BANDS: BandTable[HumidexPerception] = BandTable(
+    (r.minimum, r.maximum, r.perception) for r in HUMIDEX_PERCEPTION_RATINGS
+)
+
 
 class RsiPerception(StrEnum):
     """Define types of relative strain index perception."""
@@ -142,6 +151,11 @@ RELATIVE_STRAIN_INDEX_PERCEPTION_RATINGS: list[RsiPerceptionRating] = [
     ),
 ]
 
+RELATIVE_STRAIN_INDEX_PERCEPTION_BANDS: BandTable[RsiPerception] = BandTable(
+    (r.minimum, r.maximum, r.perception)
+    for r in RELATIVE_STRAIN_INDEX_PERCEPTION_RATINGS
+)
+
 
 class SimmerZone(StrEnum):
     """Define types of simmer zone."""
@@ -161,8 +175,8 @@ class SimmerZoneRating:
     """Define a dataclass to store a simmer zone rating."""
 
     zone: SimmerZone
-    minimum_f: float | None = None
-    maximum_f: float | None = None
+    minimum_f: float
+    maximum_f: float
 
 
 SIMMER_ZONE_RATINGS: list[SimmerZoneRating] = [
@@ -208,6 +222,10 @@ SIMMER_ZONE_RATINGS: list[SimmerZoneRating] = [
     ),
 ]
 
+SIMMER_ZONE_BANDS: BandTable[SimmerZone] = BandTable(
+    (r.minimum_f, r.maximum_f, r.zone) for r in SIMMER_ZONE_RATINGS
+)
+
 
 class ThermalPerception(StrEnum):
     """Define types of thermal perception."""
@@ -274,6 +292,36 @@ THERMAL_PERCEPTION_RATINGS: list[ThermalPerceptionRating] = [
     ),
 ]
 
+THERMAL_PERCEPTION_BANDS: BandTable[ThermalPerception] = BandTable(
+    (r.minimum_c, r.maximum_c, r.perception) for r in THERMAL_PERCEPTION_RATINGS
+)
+
+
+def get_frost_risk(
+    temperature_c: float, frost_point_c: float, absolute_humidity: float
+) -> FrostRisk:
+    """Get the risk of frost forming.
+
+    Args:
+        temperature_c: A temperature in Celsius.
+        frost_point_c: A frost point in Celsius.
+        absolute_humidity: An absolute humidity (in g/m³).
+
+    Returns:
+        A FrostRisk value.
+    """
+    if temperature_c <= 1.0 and frost_point_c <= 0:
+        if absolute_humidity <= FROST_RISK_HUMIDITY_ABS_THRESHOLD:
+            return FrostRisk.UNLIKELY
+        return FrostRisk.VERY_PROBABLE
+    if (
+        temperature_c <= 4.0
+        and frost_point_c <= 0.5
+        and absolute_humidity > FROST_RISK_HUMIDITY_ABS_THRESHOLD
+    ):
+        return FrostRisk.PROBABLE
+    return FrostRisk.NO_RISK
+
 
 class BaseTemperatureCalculator(Calculator):
     """Define a base temperature calculator."""
@@ -303,9 +351,10 @@ class BaseTemperatureCalculator(Calculator):
 class DewPointCalculator(BaseTemperatureCalculator):
     """Define a dew point calculator."""
 
-    @Calculator.requires_keys(DATA_POINT_TEMP, DATA_POINT_HUMIDITY)
+    INPUTS = (INTERMEDIATE_DEW_POINT_C,)
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -315,26 +364,24 @@ class DewPointCalculator(BaseTemperatureCalculator):
         Returns:
             A parsed CalculatedDataPoint object.
         """
-        temp = cast(float, payload[DATA_POINT_TEMP])
-        humidity = cast(float, payload[DATA_POINT_HUMIDITY])
-
-        dew_point_obj = get_dew_point_meteocalc_object(
-            temp, humidity, self._config.input_unit_system
-        )
+        try:
+            dew_point_c = cast(float, payload[INTERMEDIATE_DEW_POINT_C])
+        except ValueError as err:
+            LOGGER.debug("%s", err)
+            return self.get_calculated_data_point(None)
 
         return self.get_calculated_data_point(
-            dew_point_obj.f, unit_converter=TemperatureConverter
+            celsius_to_fahrenheit(dew_point_c), unit_converter=TemperatureConverter
         )
 
 
 class FeelsLikeCalculator(BaseTemperatureCalculator):
     """Define a "feels like" calculator."""
 
-    @Calculator.requires_keys(
-        DATA_POINT_TEMP, DATA_POINT_HUMIDITY, DATA_POINT_WINDSPEED
-    )
+    INPUTS = (INTERMEDIATE_TEMP_F, DATA_POINT_HUMIDITY, DATA_POINT_WINDSPEED)
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -344,25 +391,24 @@ class FeelsLikeCalculator(BaseTemperatureCalculator):
         Returns:
             A parsed CalculatedDataPoint object.
         """
-        temp = cast(float, payload[DATA_POINT_TEMP])
+        temp_f = cast(float, payload[INTERMEDIATE_TEMP_F])
         humidity = cast(float, payload[DATA_POINT_HUMIDITY])
         wind_speed = cast(float, payload[DATA_POINT_WINDSPEED])
 
-        feels_like_obj = get_feels_like_meteocalc_object(
-            temp, humidity, wind_speed, self._config.input_unit_system
-        )
+        feels_like_f = get_feels_like_in_fahrenheit(temp_f, humidity, wind_speed)
 
         return self.get_calculated_data_point(
-            feels_like_obj.f, unit_converter=TemperatureConverter
+            feels_like_f, unit_converter=TemperatureConverter
         )
 
 
 class FrostPointCalculator(BaseTemperatureCalculator):
     """Define a frost point calculator."""
 
-    @Calculator.requires_keys(DATA_POINT_TEMP, DATA_POINT_HUMIDITY)
+    INPUTS = (INTERMEDIATE_FROST_POINT_C,)
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -372,25 +418,28 @@ class FrostPointCalculator(BaseTemperatureCalculator):
         Returns:
             A parsed CalculatedDataPoint object.
         """
-        temp = cast(float, payload[DATA_POINT_TEMP])
-        humidity = cast(float, payload[DATA_POINT_HUMIDITY])
-
-        temp_obj = get_temperature_meteocalc_object(
-            temp, self._config.input_unit_system
-        )
-        frost_point_obj = get_frost_point_meteocalc_object(temp_obj, humidity)
+        try:
+            frost_point_c = cast(float, payload[INTERMEDIATE_FROST_POINT_C])
+        except ValueError as err:
+            LOGGER.debug("%s", err)
+            return self.get_calculated_data_point(None)
 
         return self.get_calculated_data_point(
-            frost_point_obj.f, unit_converter=TemperatureConverter
+            celsius_to_fahrenheit(frost_point_c), unit_converter=TemperatureConverter
         )
 
 
 class FrostRiskCalculator(Calculator):
     """Define a frost risk calculator."""
 
-    @Calculator.requires_keys(DATA_POINT_TEMP, DATA_POINT_HUMIDITY)
+    INPUTS = (
+        INTERMEDIATE_ABSOLUTE_HUMIDITY,
+        INTERMEDIATE_FROST_POINT_C,
+        INTERMEDIATE_TEMP_C,
+    )
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -400,38 +449,26 @@ class FrostRiskCalculator(Calculator):
         Returns:
             A parsed CalculatedDataPoint object.
         """
-        temp = cast(float, payload[DATA_POINT_TEMP])
-        humidity = cast(float, payload[DATA_POINT_HUMIDITY])
+        try:
+            frost_point_c = cast(float, payload[INTERMEDIATE_FROST_POINT_C])
+        except ValueError as err:
+            LOGGER.debug("%s", err)
+            return self.get_calculated_data_point(None)
 
-        temp_obj = get_temperature_meteocalc_object(
-            temp, self._config.input_unit_system
+        absolute_humidity = cast(float, payload[INTERMEDIATE_ABSOLUTE_HUMIDITY])
+        temp_c = cast(float, payload[INTERMEDIATE_TEMP_C])
+        return self.get_calculated_data_point(
+            get_frost_risk(temp_c, frost_point_c, absolute_humidity)
         )
-        absolute_humidity = get_absolute_humidity_in_metric(temp_obj, humidity)
-        frost_point_obj = get_frost_point_meteocalc_object(temp_obj, humidity)
-
-        if temp_obj.c <= 1.0 and frost_point_obj.c <= 0:
-            if absolute_humidity <= FROST_RISK_HUMIDITY_ABS_THRESHOLD:
-                value = FrostRisk.UNLIKELY
-            else:
-                value = FrostRisk.VERY_PROBABLE
-        elif (
-            temp_obj.c <= 4.0
-            and frost_point_obj.c <= 0.5
-            and absolute_humidity > FROST_RISK_HUMIDITY_ABS_THRESHOLD
-        ):
-            value = FrostRisk.PROBABLE
-        else:
-            value = FrostRisk.NO_RISK
-
-        return self.get_calculated_data_point(value)
 
 
 class HeatIndexCalculator(BaseTemperatureCalculator):
     """Define a heat index calculator."""
 
-    @Calculator.requires_keys(DATA_POINT_TEMP, DATA_POINT_HUMIDITY)
+    INPUTS = (INTERMEDIATE_TEMP_F, DATA_POINT_HUMIDITY)
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -441,24 +478,23 @@ class HeatIndexCalculator(BaseTemperatureCalculator):
         Returns:
             A parsed CalculatedDataPoint object.
         """
-        temp = cast(float, payload[DATA_POINT_TEMP])
+        temp_f = cast(float, payload[INTERMEDIATE_TEMP_F])
         humidity = cast(float, payload[DATA_POINT_HUMIDITY])
 
-        heat_index_obj = get_heat_index_meteocalc_object(
-            temp, humidity, self._config.input_unit_system
-        )
+        heat_index_f = get_heat_index_in_fahrenheit(temp_f, humidity)
 
         return self.get_calculated_data_point(
-            heat_index_obj.f, unit_converter=TemperatureConverter
+            heat_index_f, unit_converter=TemperatureConverter
         )
 
 
 class HumidexCalculator(Calculator):
     """Define a humidex calculator."""
 
-    @Calculator.requires_keys(DATA_POINT_TEMP, DATA_POINT_HUMIDITY)
+    INPUTS = (INTERMEDIATE_HUMIDEX,)
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -468,10 +504,11 @@ class HumidexCalculator(Calculator):
         Returns:
             A parsed CalculatedDataPoint object.
         """
-        temp = cast(float, payload[DATA_POINT_TEMP])
-        humidity = cast(float, payload[DATA_POINT_HUMIDITY])
-
-        humidex = get_humidex(temp, humidity, self._config.input_unit_system)
+        try:
+            humidex = payload[INTERMEDIATE_HUMIDEX]
+        except ValueError as err:
+            LOGGER.debug("%s", err)
+            return self.get_calculated_data_point(None)
 
         return self.get_calculated_data_point(humidex)
 
@@ -479,9 +516,10 @@ class HumidexCalculator(Calculator):
 class HumidexPerceptionCalculator(Calculator):
     """Define a humidex perception calculator."""
 
-    @Calculator.requires_keys(DATA_POINT_TEMP, DATA_POINT_HUMIDITY)
+    INPUTS = (INTERMEDIATE_HUMIDEX,)
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -491,29 +529,24 @@ class HumidexPerceptionCalculator(Calculator):
         Returns:
             A parsed CalculatedDataPoint object.
         """
-        temp = cast(float, payload[DATA_POINT_TEMP])
-        humidity = cast(float, payload[DATA_POINT_HUMIDITY])
-
-        humidex = get_humidex(temp, humidity, self._config.input_unit_system)
-
         try:
-            rating = next(
-                r
-                for r in HUMIDEX_PERCEPTION_RATINGS
-                if r.minimum <= humidex < r.maximum
-            )
-        except StopIteration:
+            humidex = cast(float, payload[INTERMEDIATE_HUMIDEX])
+        except ValueError as err:
+            LOGGER.debug("%s", err)
             return self.get_calculated_data_point(None)
 
-        return self.get_calculated_data_point(rating.perception)
+        return self.get_calculated_data_point(
+            HUMIDEX_PERCEPTION_BANDS.classify(humidex)
+        )
 
 
 class RsiCalculator(Calculator):
     """Define a relative strain index calculator."""
 
-    @Calculator.requires_keys(DATA_POINT_TEMP, DATA_POINT_HUMIDITY)
+    INPUTS = (INTERMEDIATE_RELATIVE_STRAIN_INDEX,)
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -523,13 +556,8 @@ class RsiCalculator(Calculator):
         Returns:
             A parsed CalculatedDataPoint object.
         """
-        temp = cast(float, payload[DATA_POINT_TEMP])
-        humidity = cast(float, payload[DATA_POINT_HUMIDITY])
-
         try:
-            rsi = get_relative_strain_index(
-                temp, humidity, self._config.input_unit_system
-            )
+            rsi = payload[INTERMEDIATE_RELATIVE_STRAIN_INDEX]
         except ValueError as err:
             LOGGER.debug("%s", err)
             return self.get_calculated_data_point(None)
@@ -540,9 +568,10 @@ class RsiCalculator(Calculator):
 class RsiPerceptionCalculator(Calculator):
     """Define a relative strain index perception calculator."""
 
-    @Calculator.requires_keys(DATA_POINT_TEMP, DATA_POINT_HUMIDITY)
+    INPUTS = (INTERMEDIATE_RELATIVE_STRAIN_INDEX,)
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -552,32 +581,24 @@ class RsiPerceptionCalculator(Calculator):
         Returns:
             A parsed CalculatedDataPoint object.
         """
-        temp = cast(float, payload[DATA_POINT_TEMP])
-        humidity = cast(float, payload[DATA_POINT_HUMIDITY])
-
         try:
-            rsi = get_relative_strain_index(
-                temp, humidity, self._config.input_unit_system
-            )
+            rsi = cast(float, payload[INTERMEDIATE_RELATIVE_STRAIN_INDEX])
         except ValueError as err:
             LOGGER.debug("%s", err)
             return self.get_calculated_data_point(None)
 
-        rating = next(
-            r
-            for r in RELATIVE_STRAIN_INDEX_PERCEPTION_RATINGS
-            if r.minimum <= rsi < r.maximum
+        return self.get_calculated_data_point(
+            RELATIVE_STRAIN_INDEX_PERCEPTION_BANDS.classify(rsi)
         )
 
-        return self.get_calculated_data_point(rating.perception)
-
 
 class SimmerIndexCalculator(BaseTemperatureCalculator):
     """Define a simmer index calculator."""
 
-    @Calculator.requires_keys(DATA_POINT_TEMP, DATA_POINT_HUMIDITY)
+    INPUTS = (DATA_POINT_TEMP, INTERMEDIATE_SIMMER_INDEX_F)
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -587,33 +608,24 @@ class SimmerIndexCalculator(BaseTemperatureCalculator):
         Returns:
             A parsed CalculatedDataPoint object.
         """
-        temp = cast(float, payload[DATA_POINT_TEMP])
-        humidity = cast(float, payload[DATA_POINT_HUMIDITY])
-
-        temp_obj = get_temperature_meteocalc_object(
-            temp, self._config.input_unit_system
-        )
         try:
-            simmer_obj = get_simmer_index_meteocalc_object(
-                temp_obj, humidity, self._config.input_unit_system
-            )
+            simmer_index_f = cast(float, payload[INTERMEDIATE_SIMMER_INDEX_F])
         except ValueError as err:
-            LOGGER.debug("%s (temperature: %s)", err, temp_obj)
+            LOGGER.debug("%s (temperature: %s)", err, payload[DATA_POINT_TEMP])
             return self.get_calculated_data_point(None)
 
-        simmer_obj = cast(meteocalc.Temp, simmer_obj)
-
         return self.get_calculated_data_point(
-            simmer_obj.f, unit_converter=TemperatureConverter
+            simmer_index_f, unit_converter=TemperatureConverter
         )
 
 
 class SimmerZoneCalculator(Calculator):
     """Define a simmer zone calculator."""
 
-    @Calculator.requires_keys(DATA_POINT_TEMP, DATA_POINT_HUMIDITY)
+    INPUTS = (DATA_POINT_TEMP, INTERMEDIATE_SIMMER_INDEX_F)
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -623,32 +635,15 @@ class SimmerZoneCalculator(Calculator):
         Returns:
             A parsed CalculatedDataPoint object.
         """
-        temp = cast(float, payload[DATA_POINT_TEMP])
-        humidity = cast(float, payload[DATA_POINT_HUMIDITY])
-
-        temp_obj = get_temperature_meteocalc_object(
-            temp, self._config.input_unit_system
-        )
         try:
-            simmer_obj = get_simmer_index_meteocalc_object(
-                temp_obj, humidity, self._config.input_unit_system
-            )
+            simmer_index_f = cast(float, payload[INTERMEDIATE_SIMMER_INDEX_F])
         except ValueError as err:
-            LOGGER.debug("%s (temperature: %s)", err, temp_obj)
-            return self.get_calculated_data_point(None)
-
-        simmer_obj = cast(meteocalc.Temp, simmer_obj)
-
-        try:
-            rating = next(
-                r
-                for r in SIMMER_ZONE_RATINGS
-                if r.minimum_f <= simmer_obj.f < r.maximum_f
-            )
-        except StopIteration:
+            LOGGER.debug("%s (temperature: %s)", err, payload[DATA_POINT_TEMP])
             return self.get_calculated_data_point(None)
 
-        return self.get_calculated_data_point(rating.zone)
+        return self.get_calculated_data_point(
+            SIMMER_ZONE_BANDS.classify(simmer_index_f)
+        )
 
 
 class TemperatureCalculator(BaseTemperatureCalculator):
@@ -667,11 +662,11 @@ class TemperatureCalculator(BaseTemperatureCalculator):
         """
         float_value = cast(float, value)
 
-        temp_obj = get_temperature_meteocalc_object(
+        temp_f = get_temperature_in_fahrenheit(
             float_value, self._config.input_unit_system
         )
 
-        if temp_obj.f < IMPERIAL_LOW_THRESHOLD or temp_obj.f > IMPERIAL_HIGH_THRESHOLD:
+        if temp_f < IMPERIAL_LOW_THRESHOLD or temp_f > IMPERIAL_HIGH_THRESHOLD:
             LOGGER.warning(
                 'Value of "%s" (%s) with input unit system "%s" seems suspicious',
                 self._payload_key,
@@ -680,16 +675,17 @@ class TemperatureCalculator(BaseTemperatureCalculator):
             )
 
         return self.get_calculated_data_point(
-            temp_obj.f, unit_converter=TemperatureConverter
+            temp_f, unit_converter=TemperatureConverter
         )
 
 
 class ThermalPerceptionCalculator(Calculator):
     """Define a thermal perception calculator."""
 
-    @Calculator.requires_keys(DATA_POINT_TEMP, DATA_POINT_HUMIDITY)
+    INPUTS = (INTERMEDIATE_DEW_POINT_C,)
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -699,28 +695,24 @@ class ThermalPerceptionCalculator(Calculator):
         Returns:
             A parsed CalculatedDataPoint object.
         """
-        temp = cast(float, payload[DATA_POINT_TEMP])
-        humidity = cast(float, payload[DATA_POINT_HUMIDITY])
-
-        dew_point_obj = get_dew_point_meteocalc_object(
-            temp, humidity, self._config.input_unit_system
-        )
+        try:
+            dew_point_c = cast(float, payload[INTERMEDIATE_DEW_POINT_C])
+        except ValueError as err:
+            LOGGER.debug("%s", err)
+            return self.get_calculated_data_point(None)
 
-        rating = next(
-            r
-            for r in THERMAL_PERCEPTION_RATINGS
-            if r.minimum_c <= dew_point_obj.c < r.maximum_c
+        return self.get_calculated_data_point(
+            THERMAL_PERCEPTION_BANDS.classify(dew_point_c)
         )
 
-        return self.get_calculated_data_point(rating.perception)
-
 
 class WindChillCalculator(BaseTemperatureCalculator):
     """Define a wind chill calculator."""
 
-    @Calculator.requires_keys(DATA_POINT_TEMP, DATA_POINT_WINDSPEED)
+    INPUTS = (DATA_POINT_TEMP, INTERMEDIATE_TEMP_F, DATA_POINT_WINDSPEED)
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -730,24 +722,22 @@ class WindChillCalculator(BaseTemperatureCalculator):
         Returns:
             A parsed CalculatedDataPoint object.
         """
-        temp = cast(float, payload[DATA_POINT_TEMP])
+        temp_f = cast(float, payload[INTERMEDIATE_TEMP_F])
         wind_speed = cast(float, payload[DATA_POINT_WINDSPEED])
 
         try:
-            wind_chill_obj = get_wind_chill_meteocalc_object(
-                temp, wind_speed, self._config.input_unit_system
-            )
+            wind_chill_f = get_wind_chill_in_fahrenheit(temp_f, wind_speed)
         except ValueError as err:
             LOGGER.debug(
                 "%s (current temperature: %s, current wind speed: %s)",
                 err,
-                temp,
+                payload[DATA_POINT_TEMP],
                 wind_speed,
             )
             return self.get_calculated_data_point(None)
 
         return self.get_calculated_data_point(
-            wind_chill_obj.f, unit_converter=TemperatureConverter
+            wind_chill_f, unit_converter=TemperatureConverter
         )
 
     def calculate_from_value(
@@ -763,9 +753,7 @@ class WindChillCalculator(BaseTemperatureCalculator):
         """
         float_value = cast(float, value)
 
-        temp_obj = get_temperature_meteocalc_object(
-            float_value, self._config.input_unit_system
-        )
         return self.get_calculated_data_point(
-            temp_obj.f, unit_converter=TemperatureConverter
+            get_temperature_in_fahrenheit(float_value, self._config.input_unit_system),
+            unit_converter=TemperatureConverter,
         )
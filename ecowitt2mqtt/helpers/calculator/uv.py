@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import cast
 
@@ -88,6 +89,8 @@ SAFE_EXPOSURE_INFO_MAP: dict[str, SafeExposureInfo] = {
 class SafeExposureCalculator(Calculator):
     """Define a safe exposure calculator."""
 
+    INPUTS = (DATA_POINT_UV,)
+
     @property
     def output_unit(self) -> str:
         """Get the output unit of measurement for this calculation.
@@ -97,9 +100,8 @@ class SafeExposureCalculator(Calculator):
         """
         return UnitOfTime.MINUTES
 
-    @Calculator.requires_keys(DATA_POINT_UV)
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
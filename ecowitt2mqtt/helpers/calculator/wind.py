@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import cast
 
@@ -19,6 +20,7 @@ from ecowitt2mqtt.helpers.calculator import (
     SimpleCalculator,
 )
 from ecowitt2mqtt.helpers.typing import PreCalculatedValueType
+from ecowitt2mqtt.util.bands import BandTable
 from ecowitt2mqtt.util.unit_conversion import SpeedConverter
 
 WIND_DIR_NAMES = [
@@ -238,13 +240,24 @@ BEAUFORT_SCALE_RATINGS: list[BeaufortScaleRating] = [
     ),
 ]
 
+# The Beaufort scale ratings, by the wind speed unit of each input unit system:
+BEAUFORT_SCALE_BANDS: dict[str, BandTable[BeaufortScaleRating]] = {
+    UnitSystem.IMPERIAL: BandTable(
+        (r.minimum_mph, r.maximum_mph, r) for r in BEAUFORT_SCALE_RATINGS
+    ),
+    UnitSystem.METRIC: BandTable(
+        (r.minimum_kmh, r.maximum_kmh, r) for r in BEAUFORT_SCALE_RATINGS
+    ),
+}
+
 
 class BeaufortScaleCalculator(Calculator):
     """Define a Beaufort Scale calculator."""
 
-    @Calculator.requires_keys(DATA_POINT_WINDSPEED)
+    INPUTS = (DATA_POINT_WINDSPEED,)
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -256,18 +269,11 @@ class BeaufortScaleCalculator(Calculator):
         """
         wind_speed = cast(float, payload[DATA_POINT_WINDSPEED])
 
-        rating = next(
-            r
-            for r in BEAUFORT_SCALE_RATINGS
-            if (
-                self._config.input_unit_system == UnitSystem.IMPERIAL
-                and r.minimum_mph <= wind_speed < r.maximum_mph
-            )
-            or (
-                self._config.input_unit_system == UnitSystem.METRIC
-                and r.minimum_kmh <= wind_speed < r.maximum_kmh
-            )
+        rating = BEAUFORT_SCALE_BANDS[self._config.input_unit_system].classify(
+            wind_speed
         )
+        if rating is None:
+            return self.get_calculated_data_point(None)
 
         return self.get_calculated_data_point(
             rating.number,
@@ -295,9 +301,10 @@ class WindDirCalculator(SimpleCalculator):
 class WindDirNameCalculator(Calculator):
     """Define a wind direction name calculator."""
 
-    @Calculator.requires_keys(DATA_POINT_GLOB_WINDDIR)
+    INPUTS = (DATA_POINT_GLOB_WINDDIR,)
+
     def calculate_from_payload(
-        self, payload: dict[str, PreCalculatedValueType]
+        self, payload: Mapping[str, PreCalculatedValueType]
     ) -> CalculatedDataPoint:
         """Perform the calculation.
 
@@ -32,7 +32,7 @@ STATION_TYPE_BRAND_MAP = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Device:
     """Define a data object to provide device details."""
 
@@ -0,0 +1,328 @@
+"""Define a minimal metrics registry (rendered in the Prometheus text format)."""
+
+from __future__ import annotations
+
+from typing import TypeVar
+
+from ecowitt2mqtt.backports.enum import StrEnum
+
+METRICS_ENDPOINT = "/metrics"
+
+# The upper bounds (in seconds) of histogram buckets, suited to publish latencies:
+DEFAULT_HISTOGRAM_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+LabelsT = tuple[tuple[str, str], ...]
+
+_MetricT = TypeVar("_MetricT", bound="Metric")
+
+
+class MetricType(StrEnum):
+    """Define a metric type."""
+
+    COUNTER = "counter"
+    GAUGE = "gauge"
+    HISTOGRAM = "histogram"
+
+
+def escape_label_value(value: str) -> str:
+    """Escape a label value for the Prometheus text format.
+
+    Args:
+        value: A label value.
+
+    Returns:
+        The escaped label value.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels: LabelsT) -> str:
+    """Format a set of labels for the Prometheus text format.
+
+    Args:
+        labels: A tuple of (name, value) pairs.
+
+    Returns:
+        The formatted labels (or an empty string if there are none).
+    """
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{escape_label_value(value)}"' for name, value in labels)
+    return f"{{{pairs}}}"
+
+
+def format_value(value: float) -> str:
+    """Format a metric value for the Prometheus text format.
+
+    Args:
+        value: A metric value.
+
+    Returns:
+        The formatted value.
+    """
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class Metric:
+    """Define a metric with zero or more labeled values."""
+
+    TYPE: MetricType
+
+    def __init__(self, name: str, description: str) -> None:
+        """Initialize.
+
+        Args:
+            name: The name of the metric.
+            description: A description of the metric.
+        """
+        self._values: dict[LabelsT, float] = {}
+        self.description = description
+        self.name = name
+
+    @staticmethod
+    def _get_labels(labels: dict[str, str]) -> LabelsT:
+        """Get a hashable (and consistently ordered) version of a set of labels.
+
+        Args:
+            labels: A dictionary of labels.
+
+        Returns:
+            A tuple of (name, value) pairs.
+        """
+        return tuple(sorted(labels.items()))
+
+    def get(self, **labels: str) -> float:
+        """Get the current value for a set of labels.
+
+        Args:
+            **labels: The labels of the value.
+
+        Returns:
+            The value (or 0 if it has never been set).
+        """
+        return self._values.get(self._get_labels(labels), 0.0)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment the value for a set of labels.
+
+        Args:
+            amount: The amount to increment by.
+            **labels: The labels of the value.
+        """
+        key = self._get_labels(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> list[str]:
+        """Render the metric in the Prometheus text format.
+
+        Returns:
+            A list of lines.
+        """
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+        for labels, value in self._values.items():
+            lines.append(f"{self.name}{format_labels(labels)} {format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    """Define a metric that only ever goes up."""
+
+    TYPE = MetricType.COUNTER
+
+
+class Gauge(Metric):
+    """Define a metric that can go up and down."""
+
+    TYPE = MetricType.GAUGE
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrement the value for a set of labels.
+
+        Args:
+            amount: The amount to decrement by.
+            **labels: The labels of the value.
+        """
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the value for a set of labels.
+
+        Args:
+            value: The value to set.
+            **labels: The labels of the value.
+        """
+        self._values[self._get_labels(labels)] = value
+
+
+class Histogram(Metric):
+    """Define a metric that counts observations in buckets.
+
+    The value of a set of labels (as returned by ``get``) is the sum of its
+    observations.
+    """
+
+    TYPE = MetricType.HISTOGRAM
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        buckets: tuple[float, ...] = DEFAULT_HISTOGRAM_BUCKETS,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            name: The name of the metric.
+            description: A description of the metric.
+            buckets: The (sorted) upper bounds of the buckets.
+        """
+        super().__init__(name, description)
+        self._bucket_counts: dict[LabelsT, list[int]] = {}
+        self._buckets = buckets
+        self._counts: dict[LabelsT, int] = {}
+
+    def get_count(self, **labels: str) -> int:
+        """Get the number of observations for a set of labels.
+
+        Args:
+            **labels: The labels of the observations.
+
+        Returns:
+            The number of observations.
+        """
+        return self._counts.get(self._get_labels(labels), 0)
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation for a set of labels.
+
+        Args:
+            value: The observed value.
+            **labels: The labels of the observation.
+        """
+        key = self._get_labels(labels)
+        bucket_counts = self._bucket_counts.setdefault(key, [0] * len(self._buckets))
+        # Buckets are cumulative:
+        for index, bound in enumerate(self._buckets):
+            if value <= bound:
+                bucket_counts[index] += 1
+        self._counts[key] = self._counts.get(key, 0) + 1
+        self.inc(value, **labels)
+
+    def render(self) -> list[str]:
+        """Render the metric in the Prometheus text format.
+
+        Returns:
+            A list of lines.
+        """
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+        for labels, value in self._values.items():
+            for bound, bucket_count in zip(
+                self._buckets, self._bucket_counts[labels], strict=True
+            ):
+                bucket_labels = format_labels((*labels, ("le", format_value(bound))))
+                lines.append(f"{self.name}_bucket{bucket_labels} {bucket_count}")
+            count = self._counts[labels]
+            inf_labels = format_labels((*labels, ("le", "+Inf")))
+            lines.append(f"{self.name}_bucket{inf_labels} {count}")
+            lines.append(
+                f"{self.name}_sum{format_labels(labels)} {format_value(value)}"
+            )
+            lines.append(f"{self.name}_count{format_labels(labels)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Define a registry of metrics."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._metrics: dict[str, Metric] = {}
+
+    def _get_or_create(
+        self, metric_class: type[_MetricT], name: str, description: str
+    ) -> _MetricT:
+        """Get a metric by name (creating it if it doesn't exist).
+
+        Args:
+            metric_class: The type of metric.
+            name: The name of the metric.
+            description: A description of the metric.
+
+        Returns:
+            A Metric object.
+
+        Raises:
+            TypeError: Raises if the metric exists with a different type.
+        """
+        if (metric := self._metrics.get(name)) is None:
+            metric = self._metrics[name] = metric_class(name, description)
+        if not isinstance(metric, metric_class):
+            raise TypeError(f"{name} is already registered as a {metric.TYPE}")
+        return metric
+
+    def counter(self, name: str, description: str) -> Counter:
+        """Get a counter by name (creating it if it doesn't exist).
+
+        Args:
+            name: The name of the counter.
+            description: A description of the counter.
+
+        Returns:
+            A Counter object.
+        """
+        return self._get_or_create(Counter, name, description)
+
+    def gauge(self, name: str, description: str) -> Gauge:
+        """Get a gauge by name (creating it if it doesn't exist).
+
+        Args:
+            name: The name of the gauge.
+            description: A description of the gauge.
+
+        Returns:
+            A Gauge object.
+        """
+        return self._get_or_create(Gauge, name, description)
+
+    def histogram(self, name: str, description: str) -> Histogram:
+        """Get a histogram by name (creating it if it doesn't exist).
+
+        Args:
+            name: The name of the histogram.
+            description: A description of the histogram.
+
+        Returns:
+            A Histogram object.
+        """
+        return self._get_or_create(Histogram, name, description)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format.
+
+        Returns:
+            The rendered metrics.
+        """
+        lines: list[str] = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
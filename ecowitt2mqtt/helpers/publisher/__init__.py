@@ -5,6 +5,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 
 from ecowitt2mqtt.config import Config
+from ecowitt2mqtt.data import ProcessedData
 from ecowitt2mqtt.helpers.typing import CalculatedValueType
 
 
@@ -20,11 +21,17 @@ class Publisher(ABC):  # pylint: disable=too-few-public-methods
         self._config = config
 
     @abstractmethod
-    async def async_publish(self, data: dict[str, CalculatedValueType]) -> None:
+    async def async_publish(
+        self,
+        data: dict[str, CalculatedValueType],
+        processed_data: ProcessedData | None = None,
+    ) -> None:
         """Publish the data.
 
         Args:
             data: A data payload.
+            processed_data: The payload's ProcessedData (if it has already been
+                processed).
 
         Raises:
             NotImplementedError: Raised if not implemented.
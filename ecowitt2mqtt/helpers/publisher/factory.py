@@ -5,24 +5,36 @@ from __future__ import annotations
 from aiomqtt import Client
 
 from ecowitt2mqtt.config import Config
-from ecowitt2mqtt.helpers.publisher import Publisher
-from ecowitt2mqtt.helpers.publisher.mqtt import TopicPublisher
+from ecowitt2mqtt.helpers.publisher.mqtt import MqttPublisher, TopicPublisher
 from ecowitt2mqtt.helpers.publisher.mqtt.hass import HomeAssistantDiscoveryPublisher
+from ecowitt2mqtt.helpers.publisher.mqtt.throttle import PublishThrottle
+from ecowitt2mqtt.helpers.publisher.mqtt.v5 import TopicAliases
 
 
-def get_publishers(config: Config, client: Client) -> list[Publisher]:
+def get_publishers(
+    config: Config, client: Client, throttle: PublishThrottle | None = None
+) -> list[MqttPublisher]:
     """Get configured MQTT publishers.
 
     Args:
         config: A Config object.
         client: An MQTT Client object.
+        throttle: A PublishThrottle object shared by everything publishing to the same
+            MQTT broker.
 
     Returns:
         A list of MqttPublisher objects.
     """
-    publishers: list[Publisher] = []
+    if throttle is None:
+        throttle = PublishThrottle(config)
+    # The publishers share a client (and therefore its topic aliases):
+    topic_aliases = TopicAliases(config.mqtt_topic_alias_maximum)
+
+    publishers: list[MqttPublisher] = []
     if config.hass_discovery:
-        publishers.append(HomeAssistantDiscoveryPublisher(config, client))
+        publishers.append(
+            HomeAssistantDiscoveryPublisher(config, client, throttle, topic_aliases)
+        )
     if config.mqtt_topic:
-        publishers.append(TopicPublisher(config, client))
+        publishers.append(TopicPublisher(config, client, throttle, topic_aliases))
     return publishers
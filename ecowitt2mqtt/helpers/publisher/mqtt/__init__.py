@@ -2,17 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import zlib
 from datetime import datetime
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 
-from aiomqtt import Client
+from aiomqtt import Client, MqttError
 
 from ecowitt2mqtt.config import Config
-from ecowitt2mqtt.const import LOGGER
+from ecowitt2mqtt.const import LOGGER, MqttEncoding
 from ecowitt2mqtt.data import ProcessedData
 from ecowitt2mqtt.helpers.publisher import Publisher
+from ecowitt2mqtt.helpers.publisher.mqtt.throttle import PublishThrottle
+from ecowitt2mqtt.helpers.publisher.mqtt.v5 import (
+    TopicAliases,
+    get_publish_properties,
+)
 from ecowitt2mqtt.helpers.typing import CalculatedValueType
+from ecowitt2mqtt.util.expiring_cache import ExpiringCache
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None  # type: ignore[assignment]
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Key sets (and keys) that go a day without being published are forgotten (and set up
+# again if they ever come back):
+PUBLISHED_UNIT_CACHE_MAX_SIZE = 65536
+SUBTOPIC_CACHE_MAX_SIZE = 1024
+SUBTOPIC_CACHE_TTL = 86400.0
 
 
 def generate_mqtt_payload(data: CalculatedValueType) -> bytes:
@@ -33,6 +57,59 @@ def generate_mqtt_payload(data: CalculatedValueType) -> bytes:
     return converted_data.encode("utf-8")
 
 
+def generate_mqtt_value_payload(data: CalculatedValueType) -> bytes:
+    """Generate a binary MQTT payload from a single value.
+
+    The value is encoded as it would be in a JSON payload, except that strings
+    (including datetimes, which become ISO 8601 strings) aren't quoted.
+
+    Args:
+        data: The parsed value to use in a CalculatedDataPoint.
+
+    Returns:
+        Raw bytes.
+    """
+    if isinstance(data, datetime):
+        data = json_serializer(data)
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    return json.dumps(data, default=json_serializer).encode("utf-8")
+
+
+def encode_mqtt_payload(
+    data: CalculatedValueType,
+    encoding: MqttEncoding = MqttEncoding.JSON,
+    compression_threshold: int | None = None,
+) -> bytes:
+    """Generate a binary MQTT payload in a particular encoding.
+
+    Datetimes are encoded as ISO 8601 strings in JSON, as Timestamp extension types in
+    MessagePack, and as epoch-based date/time tags in CBOR.
+
+    Payloads of at least ``compression_threshold`` bytes are compressed with zlib. A
+    zlib stream always starts with 0x78, which can't begin a JSON object or a
+    MessagePack/CBOR map, so consumers can tell compressed payloads apart.
+
+    Args:
+        data: The parsed value to use in a CalculatedDataPoint.
+        encoding: The encoding to use.
+        compression_threshold: The payload size (in bytes) at which to compress.
+
+    Returns:
+        Raw bytes.
+    """
+    if encoding == MqttEncoding.CBOR:
+        payload = cbor2.dumps(data, datetime_as_timestamp=True)
+    elif encoding == MqttEncoding.MSGPACK:
+        payload = cast(bytes, msgpack.packb(data, datetime=True))
+    else:
+        payload = generate_mqtt_payload(data)
+
+    if compression_threshold and len(payload) >= compression_threshold:
+        return zlib.compress(payload)
+    return payload
+
+
 # pylint: disable=inconsistent-return-statements
 def json_serializer(obj: Any) -> float | int | str:  # type: ignore[return]
     """Define a custom JSON serializer.
@@ -47,36 +124,257 @@ def json_serializer(obj: Any) -> float | int | str:  # type: ignore[return]
         return obj.isoformat()
 
 
-class MqttPublisher(Publisher):  # pylint: disable=too-few-public-methods
+class MqttMessage(NamedTuple):
+    """Define an outgoing MQTT message."""
+
+    topic: str
+    payload: bytes
+    retain: bool
+    qos: int
+    # Whether the message is only worth delivering for a limited time (e.g., state):
+    expires: bool = False
+
+
+class MqttPublisher(Publisher):
     """Define a base MQTT publisher."""
 
-    def __init__(self, config: Config, client: Client) -> None:
+    def __init__(
+        self,
+        config: Config,
+        client: Client,
+        throttle: PublishThrottle | None = None,
+        topic_aliases: TopicAliases | None = None,
+    ) -> None:
         """Initialize.
 
         Args:
             config: A Config object.
             client: An MQTT Client object.
+            throttle: A PublishThrottle object shared by everything publishing to the
+                same MQTT broker.
+            topic_aliases: A TopicAliases object shared by everything publishing with
+                the same MQTT client.
         """
         super().__init__(config)
         self._client = client
+        self._throttle = throttle or PublishThrottle(config)
+        self._topic_aliases = topic_aliases or TopicAliases(
+            config.mqtt_topic_alias_maximum
+        )
+
+    @property
+    def client(self) -> Client:
+        """Return the MQTT client this publisher uses.
+
+        Returns:
+            An MQTT Client object.
+        """
+        return self._client
+
+    @client.setter
+    def client(self, client: Client) -> None:
+        """Set the MQTT client this publisher uses (e.g., after a reconnection).
+
+        Args:
+            client: An MQTT Client object.
+        """
+        self._client = client
+        # Topic aliases don't outlive the connection they were set up on:
+        self._topic_aliases.reset()
+
+    @property
+    def subscriptions(self) -> list[str]:
+        """Return the MQTT topics this publisher wants to receive messages from.
+
+        Returns:
+            A list of MQTT topics.
+        """
+        return []
+
+    async def _async_publish_message(self, message: MqttMessage) -> None:
+        """Publish a single MQTT message.
+
+        Args:
+            message: An MqttMessage object.
+        """
+        async with self._throttle.async_reserve(len(message.payload)):
+            if not self._config.mqtt_v5:
+                await self._client.publish(
+                    message.topic,
+                    payload=message.payload,
+                    qos=message.qos,
+                    retain=message.retain,
+                )
+                return
+
+            # Nothing may be awaited between resolving the topic alias and handing the
+            # message to the client (so that it reaches the broker in order):
+            topic, properties = get_publish_properties(
+                self._config, message, self._topic_aliases
+            )
+            await self._client.publish(
+                topic,
+                payload=message.payload,
+                qos=message.qos,
+                retain=message.retain,
+                properties=properties,
+            )
+
+    async def async_handle_message(self, topic: str, payload: bytes) -> None:
+        """Handle a message received on one of this publisher's subscriptions.
+
+        Args:
+            topic: The MQTT topic the message was received on.
+            payload: The message payload.
+        """
+
+    async def async_stop(self) -> None:
+        """Stop any work this publisher is doing in the background."""
 
 
 class TopicPublisher(MqttPublisher):  # pylint: disable=too-few-public-methods
     """Define an MQTT publisher that publishes to a topic."""
 
-    async def async_publish(self, data: dict[str, CalculatedValueType]) -> None:
+    def __init__(
+        self,
+        config: Config,
+        client: Client,
+        throttle: PublishThrottle | None = None,
+        topic_aliases: TopicAliases | None = None,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            config: A Config object.
+            client: An MQTT Client object.
+            throttle: A PublishThrottle object shared by everything publishing to the
+                same MQTT broker.
+            topic_aliases: A TopicAliases object shared by everything publishing with
+                the same MQTT client.
+        """
+        super().__init__(config, client, throttle, topic_aliases)
+        self._published_units: ExpiringCache[str, str] = ExpiringCache(
+            max_size=PUBLISHED_UNIT_CACHE_MAX_SIZE, ttl=SUBTOPIC_CACHE_TTL
+        )
+        self._subtopics: ExpiringCache[tuple[str, ...], list[tuple[str, str, str]]] = (
+            ExpiringCache(max_size=SUBTOPIC_CACHE_MAX_SIZE, ttl=SUBTOPIC_CACHE_TTL)
+        )
+
+    def _get_subtopics(self, keys: tuple[str, ...]) -> list[tuple[str, str, str]]:
+        """Get the subtopics for a set of payload keys.
+
+        A gateway sends the same set of keys with nearly every payload, so the topics
+        are only built the first time each set is seen.
+
+        Args:
+            keys: The payload keys (in payload order).
+
+        Returns:
+            A list of (key, value topic, unit topic) tuples.
+        """
+        if (subtopics := self._subtopics.get(keys)) is None:
+            base_topic = cast(str, self._config.mqtt_topic).rstrip("/")
+            subtopics = [
+                (key, f"{base_topic}/{key}", f"{base_topic}/{key}/unit") for key in keys
+            ]
+            self._subtopics.set(keys, subtopics)
+        return subtopics
+
+    async def _async_publish_subtopics(
+        self,
+        data: dict[str, CalculatedValueType],
+        units: dict[str, str | None],
+    ) -> None:
+        """Publish each data point to its own subtopic.
+
+        Args:
+            data: A data payload.
+            units: The unit of each data point (if it has one).
+
+        Raises:
+            MqttError: Raised on any MQTT error.
+        """
+        messages: list[MqttMessage] = []
+        new_units: dict[str, str] = {}
+
+        for key, topic, unit_topic in self._get_subtopics(tuple(data)):
+            messages.append(
+                MqttMessage(
+                    topic,
+                    generate_mqtt_value_payload(data[key]),
+                    self._config.mqtt_retain,
+                    self._config.mqtt_qos,
+                    expires=True,
+                )
+            )
+            # Units rarely change, so they're only published (and retained) when they
+            # do:
+            if (unit := units.get(key)) and self._published_units.get(key) != unit:
+                new_units[key] = unit
+                messages.append(
+                    MqttMessage(
+                        unit_topic,
+                        generate_mqtt_payload(unit),
+                        True,
+                        self._config.mqtt_qos,
+                    )
+                )
+
+        tasks = [
+            asyncio.create_task(self._async_publish_message(message))
+            for message in messages
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except MqttError:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        for key, unit in new_units.items():
+            self._published_units.set(key, unit)
+
+    async def async_publish(
+        self,
+        data: dict[str, CalculatedValueType],
+        processed_data: ProcessedData | None = None,
+    ) -> None:
         """Publish to MQTT.
 
         Args:
             data: A data payload.
+            processed_data: The payload's ProcessedData (if it has already been
+                processed).
         """
+        units: dict[str, str | None] = {}
         if not self._config.raw_data:
-            processed_data = ProcessedData(self._config, data)
+            if processed_data is None:
+                processed_data = ProcessedData(self._config, data)
             data = {key: value.value for key, value in processed_data.output.items()}
+            if self._config.mqtt_subtopic_units:
+                units = {
+                    key: value.unit for key, value in processed_data.output.items()
+                }
+
+        if self._config.mqtt_subtopics:
+            await self._async_publish_subtopics(data, units)
+            LOGGER.info("Published to subtopics of %s", self._config.mqtt_topic)
+            LOGGER.debug("Published data: %s", data)
+            return
 
         topic = cast(str, self._config.mqtt_topic)
-        await self._client.publish(
-            topic, payload=generate_mqtt_payload(data), retain=self._config.mqtt_retain
+        await self._async_publish_message(
+            MqttMessage(
+                topic,
+                encode_mqtt_payload(
+                    data,
+                    self._config.mqtt_encoding,
+                    self._config.mqtt_compression_threshold,
+                ),
+                self._config.mqtt_retain,
+                self._config.mqtt_qos,
+                expires=True,
+            )
         )
 
         LOGGER.info("Published to %s", self._config.mqtt_topic)
@@ -0,0 +1,357 @@
+"""Define MQTT broker failover (backed by active health checks)."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import ssl
+from collections.abc import Callable
+from contextlib import suppress
+from ipaddress import ip_address
+
+from ecowitt2mqtt.config import Config
+from ecowitt2mqtt.const import LOGGER
+from ecowitt2mqtt.errors import EcowittError
+from ecowitt2mqtt.helpers.metrics import MetricsRegistry
+from ecowitt2mqtt.helpers.publisher.mqtt.tls import get_tls_context
+from ecowitt2mqtt.util.network import BrokerAddress, parse_broker_address
+
+# The amount of time (in seconds) a broker has to accept a health check connection:
+HEALTH_CHECK_TIMEOUT = 1.0
+
+
+class FailbackRequestedError(EcowittError):
+    """Define an error raised to move the connection back to a preferred broker."""
+
+    pass
+
+
+class DnsCache:
+    """Define a cache of resolved MQTT broker hostnames.
+
+    Resolving a hostname on every reconnection attempt adds a DNS round trip to every
+    failover (and fails outright while DNS is unavailable), so results are reused until
+    their TTL expires; when resolution fails, a stale result is better than none.
+
+    A hostname can resolve to several addresses; an address that fails is moved to the
+    back of the line, so that the next attempt uses another one.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """Initialize.
+
+        Args:
+            ttl: The amount of time (in seconds) to reuse a result for.
+        """
+        self._entries: dict[str, tuple[list[str], float]] = {}
+        self._ttl = ttl
+
+    def demote(self, host: str, address: str) -> None:
+        """Move an address that failed to the back of the line.
+
+        Args:
+            host: A hostname.
+            address: The address of the hostname that failed.
+        """
+        if (entry := self._entries.get(host)) is not None and address in entry[0]:
+            entry[0].remove(address)
+            entry[0].append(address)
+
+    async def async_resolve(self, host: str) -> str:
+        """Resolve a hostname to an IP address.
+
+        Args:
+            host: A hostname (or IP address).
+
+        Returns:
+            An IP address (or the hostname itself if it has never been resolved).
+        """
+        with suppress(ValueError):
+            ip_address(host)
+            return host
+
+        loop = asyncio.get_running_loop()
+        if (entry := self._entries.get(host)) is not None and loop.time() < entry[1]:
+            return entry[0][0]
+
+        try:
+            addresses = await loop.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        except OSError as err:
+            if entry is None:
+                LOGGER.debug("Unable to resolve %s: %s", host, err)
+                return host
+            LOGGER.warning(
+                "Unable to resolve %s (using its last known address): %s", host, err
+            )
+            return entry[0][0]
+
+        # Addresses are kept in the order the resolver prefers (without duplicates):
+        resolved = list(dict.fromkeys(str(address[4][0]) for address in addresses))
+        self._entries[host] = (resolved, loop.time() + self._ttl)
+        return resolved[0]
+
+
+class BrokerPool:
+    """Define an ordered list of MQTT brokers to fail over between.
+
+    The first broker is preferred. When the connection to the current broker is lost,
+    the next broker that passed its last health check is connected to right away; only
+    once no broker is known to be healthy does the usual backoff apply (which a broker
+    passing a health check cuts short). With failback enabled, the connection moves
+    back to a preferred broker as soon as it is healthy again.
+    """
+
+    def __init__(
+        self, config: Config, name: str, metrics: MetricsRegistry | None = None
+    ) -> None:
+        """Initialize.
+
+        Args:
+            config: A Config object.
+            name: The name of the config (for metrics).
+            metrics: A MetricsRegistry object to record metrics in.
+        """
+        if metrics is None:
+            metrics = MetricsRegistry()
+
+        self._brokers = [
+            BrokerAddress(config.mqtt_broker, config.mqtt_port),
+            *(
+                parse_broker_address(broker, config.mqtt_port)
+                for broker in config.mqtt_failover_brokers
+            ),
+        ]
+        self._config = config
+        self._current_index = 0
+        self._dns_cache = DnsCache(config.mqtt_dns_cache_ttl)
+        self._failback = config.mqtt_failback
+        self._failed_at: float | None = None
+        self._health_check_interval = config.mqtt_health_check_interval
+        self._health_check_task: asyncio.Task | None = None
+        self._healthy = [True] * len(self._brokers)
+        self._host: str | None = None
+        self._name = name
+        self._recovered_event = asyncio.Event()
+        self._tls_contexts: dict[int, ssl.SSLContext] = {}
+        # With TLS, the broker's certificate is issued for its hostname, so that's what
+        # the connection has to use:
+        self._resolve_hosts = not config.mqtt_tls
+
+        self._broker_up = metrics.gauge(
+            "ecowitt2mqtt_mqtt_broker_up",
+            "Whether an MQTT broker passed its last health check (or connection)",
+        )
+        self._failovers = metrics.counter(
+            "ecowitt2mqtt_mqtt_failovers_total",
+            "The number of times the connection moved to another MQTT broker",
+        )
+        self._failover_time = metrics.histogram(
+            "ecowitt2mqtt_mqtt_failover_seconds",
+            "The time from losing an MQTT broker to connecting to one again",
+        )
+        self._recovered_event.set()
+
+    @property
+    def current(self) -> BrokerAddress:
+        """Return the broker to connect to.
+
+        Returns:
+            A BrokerAddress object.
+        """
+        return self._brokers[self._current_index]
+
+    @property
+    def failback_broker(self) -> BrokerAddress | None:
+        """Return the preferred broker to fail back to (if there is one).
+
+        Returns:
+            A BrokerAddress object (or None if failback is disabled or no broker that is
+            preferred over the current one is healthy).
+        """
+        if not self._failback:
+            return None
+        for index in range(self._current_index):
+            if self._healthy[index]:
+                return self._brokers[index]
+        return None
+
+    @property
+    def recovered(self) -> bool:
+        """Return whether a broker is believed to be healthy.
+
+        Returns:
+            Whether a broker is believed to be healthy.
+        """
+        return self._recovered_event.is_set()
+
+    @property
+    def tls_context(self) -> ssl.SSLContext | None:
+        """Return the SSL context to connect to the current broker with.
+
+        Each broker gets a context of its own (built the first time it's needed), so
+        that reconnecting to it can resume the TLS session of its last connection.
+
+        Returns:
+            An SSLContext object (or None if TLS is disabled).
+        """
+        if not self._config.mqtt_tls:
+            return None
+        if (context := self._tls_contexts.get(self._current_index)) is None:
+            context = self._tls_contexts[self._current_index] = get_tls_context(
+                self._config
+            )
+        return context
+
+    async def _async_probe(self, broker: BrokerAddress) -> bool:
+        """Check whether a broker accepts connections.
+
+        Args:
+            broker: A BrokerAddress object.
+
+        Returns:
+            Whether the broker is healthy.
+        """
+        host = await self._dns_cache.async_resolve(broker.host)
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, broker.port), HEALTH_CHECK_TIMEOUT
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+
+        writer.close()
+        with suppress(OSError):
+            await writer.wait_closed()
+        return True
+
+    async def _async_run_health_checks(self, on_change: Callable[[], None]) -> None:
+        """Check the health of every broker until stopped.
+
+        Args:
+            on_change: A callback to run when a broker is healthy again after every
+                broker had failed, or when it's time to fail back.
+        """
+        while True:
+            recovered = self._recovered_event.is_set()
+            await self.async_check_health()
+            if (
+                not recovered and self._recovered_event.is_set()
+            ) or self.failback_broker is not None:
+                on_change()
+            await asyncio.sleep(self._health_check_interval)
+
+    def _set_healthy(self, index: int, healthy: bool) -> None:
+        """Record whether a broker is healthy.
+
+        Args:
+            index: The index of the broker.
+            healthy: Whether the broker is healthy.
+        """
+        broker = self._brokers[index]
+        if healthy != self._healthy[index]:
+            LOGGER.info(
+                "MQTT broker %s is %s", broker, "healthy" if healthy else "unhealthy"
+            )
+        self._healthy[index] = healthy
+        self._broker_up.set(int(healthy), gateway=self._name, broker=str(broker))
+        if healthy:
+            self._recovered_event.set()
+
+    def _switch_to(self, index: int) -> None:
+        """Switch to another broker.
+
+        Args:
+            index: The index of the broker.
+        """
+        if index != self._current_index:
+            self._failovers.inc(1, gateway=self._name, broker=str(self._brokers[index]))
+        self._current_index = index
+
+    async def async_check_health(self) -> None:
+        """Check the health of every broker."""
+        results = await asyncio.gather(
+            *(self._async_probe(broker) for broker in self._brokers)
+        )
+        for index, healthy in enumerate(results):
+            self._set_healthy(index, healthy)
+
+    async def async_get_host(self) -> str:
+        """Get the host to connect to the current broker with.
+
+        Returns:
+            An IP address (from the DNS cache) or hostname.
+        """
+        if self._resolve_hosts:
+            self._host = await self._dns_cache.async_resolve(self.current.host)
+        else:
+            self._host = self.current.host
+        return self._host
+
+    async def async_stop(self) -> None:
+        """Stop checking the health of brokers."""
+        if self._health_check_task is not None:
+            self._health_check_task.cancel()
+            await asyncio.gather(self._health_check_task, return_exceptions=True)
+            self._health_check_task = None
+
+    async def async_wait_for_recovery(self, timeout: float) -> None:
+        """Wait until a broker is healthy again (or a timeout passes).
+
+        Args:
+            timeout: The maximum amount of time (in seconds) to wait.
+        """
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._recovered_event.wait(), timeout)
+
+    def fail_back(self) -> None:
+        """Move back to the preferred broker that is healthy (if there is one)."""
+        if (broker := self.failback_broker) is None:
+            return
+        LOGGER.info("Failing back to MQTT broker %s", broker)
+        self._switch_to(self._brokers.index(broker))
+
+    def fail_over(self) -> bool:
+        """Move on from the current broker (after losing the connection to it).
+
+        Returns:
+            Whether a healthy broker is available to connect to right away.
+        """
+        if self._failed_at is None:
+            self._failed_at = asyncio.get_running_loop().time()
+        if self._host is not None:
+            self._dns_cache.demote(self.current.host, self._host)
+        self._set_healthy(self._current_index, False)
+
+        count = len(self._brokers)
+        for offset in range(1, count):
+            index = (self._current_index + offset) % count
+            if self._healthy[index]:
+                LOGGER.info("Failing over to MQTT broker %s", self._brokers[index])
+                self._switch_to(index)
+                return True
+
+        # No broker is known to be healthy, so try the next one after a backoff:
+        self._recovered_event.clear()
+        self._switch_to((self._current_index + 1) % count)
+        return False
+
+    def mark_connected(self) -> None:
+        """Record a successful connection to the current broker."""
+        self._set_healthy(self._current_index, True)
+        if self._failed_at is not None:
+            self._failover_time.observe(
+                asyncio.get_running_loop().time() - self._failed_at, gateway=self._name
+            )
+            self._failed_at = None
+
+    def start(self, on_change: Callable[[], None]) -> None:
+        """Start checking the health of brokers (if there is more than one).
+
+        Args:
+            on_change: A callback to run when a broker is healthy again after every
+                broker had failed, or when it's time to fail back.
+        """
+        if len(self._brokers) > 1:
+            self._health_check_task = asyncio.create_task(
+                self._async_run_health_checks(on_change)
+            )
@@ -4,14 +4,18 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import asdict, dataclass
-from typing import TypedDict
+import random
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from typing import Any, TypedDict, cast
 
 from aiomqtt import Client, MqttError
 
 from ecowitt2mqtt.backports.enum import StrEnum
 from ecowitt2mqtt.config import Config
 from ecowitt2mqtt.const import (
+    AVAILABILITY_OFFLINE,
+    AVAILABILITY_ONLINE,
     DATA_POINT_BEAUFORT_SCALE,
     DATA_POINT_CO2,
     DATA_POINT_CO2_24H,
@@ -82,6 +86,7 @@ from ecowitt2mqtt.const import (
     DATA_POINT_YEARLY_RAIN,
     DATA_POINT_YRAIN_PIEZO,
     LOGGER,
+    HassDiscoveryMode,
 )
 from ecowitt2mqtt.data import ProcessedData
 from ecowitt2mqtt.helpers.calculator import CalculatedDataPoint, DataPointType
@@ -90,8 +95,17 @@ from ecowitt2mqtt.helpers.calculator.battery import (
     get_battery_strategy,
 )
 from ecowitt2mqtt.helpers.device import Device
-from ecowitt2mqtt.helpers.publisher.mqtt import MqttPublisher, generate_mqtt_payload
+from ecowitt2mqtt.helpers.publisher.mqtt import (
+    MqttMessage,
+    MqttPublisher,
+    generate_mqtt_payload,
+)
+from ecowitt2mqtt.helpers.publisher.mqtt.scheduler import DiscoveryScheduler
+from ecowitt2mqtt.helpers.publisher.mqtt.throttle import PublishThrottle
+from ecowitt2mqtt.helpers.publisher.mqtt.v5 import TopicAliases
 from ecowitt2mqtt.helpers.typing import CalculatedValueType
+from ecowitt2mqtt.util.expiring_cache import ExpiringCache
+from ecowitt2mqtt.util.timer_wheel import TimerWheel
 
 
 class DeviceClass(StrEnum):
@@ -165,11 +179,30 @@ class HassDiscoveryDevice:
     sw_version: str
 
 
+@dataclass(frozen=True)
+class HassDiscoveryOrigin:
+    """Define the origin of device-based MQTT Discovery payloads."""
+
+    name: str
+    support_url: str
+
+
 @dataclass
+class HassDeviceDiscoveryInfo:
+    """Define a device-based MQTT Discovery payload."""
+
+    config_topic: str
+    device: HassDiscoveryDevice
+    origin: HassDiscoveryOrigin
+    components: dict[str, dict[str, Any]] = field(default_factory=dict)
+    qos: int = 1
+
+
+@dataclass(slots=True)
 class HassDiscoveryInfo:
     """Define an MQTT Discovery payload."""
 
-    availability_topic: str
+    availability_topic: str | None
     config_topic: str
     device: HassDiscoveryDevice
     json_attributes_topic: str
@@ -178,6 +211,8 @@ class HassDiscoveryInfo:
     state_topic: str
     unique_id: str
 
+    availability: list[dict[str, str]] | None = None
+    availability_mode: str | None = None
     device_class: str | None = None
     entity_category: str | None = None
     icon: str | None = None
@@ -187,8 +222,27 @@ class HassDiscoveryInfo:
     unit_of_measurement: str | None = None
 
 
-AVAILABILITY_OFFLINE = "offline"
-AVAILABILITY_ONLINE = "online"
+HASS_DEVICE_COMPONENT_EXCLUDED_KEYS = ("config_topic", "device")
+
+HASS_ORIGIN = HassDiscoveryOrigin(
+    name="ecowitt2mqtt", support_url="https://github.com/bachya/ecowitt2mqtt"
+)
+
+HASS_STATUS_ONLINE = b"online"
+HASS_STATUS_TOPIC_SUFFIX = "status"
+
+AVAILABILITY_MODE_ALL = "all"
+
+DEFAULT_STALE_SENSOR_INTERVAL = 60.0
+# The number of devices whose MQTT Discovery device is shared by their entities:
+DISCOVERY_DEVICE_CACHE_SIZE = 1024
+
+# Entities (and devices) that go a day without reporting are forgotten (and discovered
+# again if they ever come back):
+DISCOVERY_INFO_CACHE_MAX_SIZE = 65536
+DISCOVERY_INFO_CACHE_TTL = 86400.0
+STALE_SENSOR_CHECK_INTERVAL = 1.0
+STALE_SENSOR_MAX_RETRY_INTERVAL = 60.0
 
 DATA_POINT_BATTERY_BOOLEAN = "battery_boolean"
 DATA_POINT_BATTERY_NUMERIC = "battery_numeric"
@@ -444,35 +498,283 @@ STATE_CLASS_OVERRIDES = {
 }
 
 
-def get_availability_payload(
-    data_point: CalculatedDataPoint,
-) -> str:
-    """Get the availability payload for a data point.
+@lru_cache(maxsize=DISCOVERY_DEVICE_CACHE_SIZE)
+def get_discovery_device(device: Device) -> HassDiscoveryDevice:
+    """Get the MQTT Discovery device of a device.
 
-    Right now, this is hardcoded to always available.
+    The same object is shared by every entity of the device (rather than each entity
+    holding a copy of it).
 
     Args:
-        data_point: A parsed CalculatedDataPoint object.
+        device: A Device object.
 
     Returns:
-        An availability string.
+        A HassDiscoveryDevice object.
     """
-    return AVAILABILITY_ONLINE
+    return HassDiscoveryDevice(
+        identifiers=[device.unique_id],
+        manufacturer=device.manufacturer,
+        model=device.model,
+        name=device.name,
+        sw_version=device.station_type,
+    )
 
 
 class HomeAssistantDiscoveryPublisher(MqttPublisher):  # pylint: disable=too-few-public-methods
     """Define an MQTT publisher for the MQTT Discovery standard."""
 
-    def __init__(self, config: Config, client: Client) -> None:
+    def __init__(
+        self,
+        config: Config,
+        client: Client,
+        throttle: PublishThrottle | None = None,
+        topic_aliases: TopicAliases | None = None,
+    ) -> None:
         """Initialize.
 
         Args:
             config: A Config object.
             client: An MQTT Client object.
+            throttle: A PublishThrottle object shared by everything publishing to the
+                same MQTT broker.
+            topic_aliases: A TopicAliases object shared by everything publishing with
+                the same MQTT client.
+        """
+        super().__init__(config, client, throttle, topic_aliases)
+
+        self._discovery_infos: ExpiringCache[
+            str, HassDeviceDiscoveryInfo | HassDiscoveryInfo
+        ] = ExpiringCache(
+            max_size=DISCOVERY_INFO_CACHE_MAX_SIZE, ttl=DISCOVERY_INFO_CACHE_TTL
+        )
+        self._discovery_scheduler: DiscoveryScheduler | None = None
+        self._last_payload_times: ExpiringCache[str, float] = ExpiringCache(
+            max_size=DISCOVERY_DEVICE_CACHE_SIZE, ttl=DISCOVERY_INFO_CACHE_TTL
+        )
+        self._rediscovery_task: asyncio.Task | None = None
+        self._stale_sensor_task: asyncio.Task | None = None
+        self._stale_sensor_wheel: TimerWheel[str] | None = None
+
+        if config.hass_discovery_rate_limit:
+            self._discovery_scheduler = DiscoveryScheduler(
+                self._async_publish_message,
+                config.hass_discovery_rate_limit,
+                self._forget_discovery_info,
+            )
+
+        if config.hass_stale_sensor_intervals:
+            # Entities whose sensors are reporting are tracked (by their availability
+            # topic) until they go too long without an update:
+            self._stale_sensor_wheel = TimerWheel(STALE_SENSOR_CHECK_INTERVAL)
+
+    @property
+    def discovery_backlog(self) -> int:
+        """Return the number of MQTT Discovery messages waiting to be published.
+
+        Returns:
+            A message count.
+        """
+        if self._discovery_scheduler is None:
+            return 0
+        return self._discovery_scheduler.backlog
+
+    @property
+    def subscriptions(self) -> list[str]:
+        """Return the MQTT topics this publisher wants to receive messages from.
+
+        Returns:
+            A list of MQTT topics.
+        """
+        return [f"{self._config.hass_discovery_prefix}/{HASS_STATUS_TOPIC_SUFFIX}"]
+
+    async def _async_expire_stale_sensors(self, wheel: TimerWheel[str]) -> None:
+        """Mark entities unavailable once their sensors stop reporting.
+
+        Args:
+            wheel: The TimerWheel that tracks when sensors last reported.
         """
-        super().__init__(config, client)
+        loop = asyncio.get_running_loop()
+        retry_interval = STALE_SENSOR_CHECK_INTERVAL
 
-        self._discovery_infos: dict[str, HassDiscoveryInfo] = {}
+        while wheel:
+            await asyncio.sleep(STALE_SENSOR_CHECK_INTERVAL)
+            expired = wheel.advance(loop.time())
+
+            for idx, availability_topic in enumerate(expired):
+                LOGGER.info("Sensor has stopped reporting: %s", availability_topic)
+                try:
+                    await self._async_publish_message(
+                        MqttMessage(
+                            availability_topic,
+                            generate_mqtt_payload(AVAILABILITY_OFFLINE),
+                            True,
+                            self._config.mqtt_availability_qos,
+                        )
+                    )
+                except MqttError as err:
+                    LOGGER.error(
+                        "There was an MQTT error while marking sensors stale "
+                        "(retrying in %s seconds): %s",
+                        retry_interval,
+                        err,
+                    )
+                    # Back off while the broker is unreachable (unless the sensors
+                    # report first):
+                    retry_time = loop.time() + retry_interval
+                    for failed_availability_topic in expired[idx:]:
+                        wheel.schedule(failed_availability_topic, retry_time)
+                    retry_interval = min(
+                        retry_interval * 2, STALE_SENSOR_MAX_RETRY_INTERVAL
+                    )
+                    break
+            else:
+                if expired:
+                    retry_interval = STALE_SENSOR_CHECK_INTERVAL
+
+    async def _async_rediscover(self) -> None:
+        """Republish all known discovery configs over a jittered window."""
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        window = self._config.hass_rediscovery_window
+
+        # Each config is assigned a random offset within the window so that a Home
+        # Assistant restart doesn't produce a single burst of retained messages:
+        schedule = sorted(
+            (
+                (random.uniform(0, window), unique_id, discovery_info)  # noqa: S311  # nosec: B311
+                for unique_id, discovery_info in self._discovery_infos.items()
+            ),
+            key=lambda item: item[0],
+        )
+        LOGGER.info(
+            "Republishing %s discovery config(s) over %s seconds", len(schedule), window
+        )
+
+        for offset, unique_id, discovery_info in schedule:
+            if (delay := start_time + offset - loop.time()) > 0:
+                await asyncio.sleep(delay)
+
+            config_message = self._get_config_message(discovery_info)
+            if self._discovery_scheduler:
+                # Entities that are already pending will have their config sent anyway:
+                if unique_id not in self._discovery_scheduler:
+                    self._discovery_scheduler.schedule(unique_id, config_message, [])
+                continue
+
+            try:
+                await self._async_publish_message(config_message)
+            except MqttError as err:
+                LOGGER.error("There was an MQTT error during rediscovery: %s", err)
+                # Anything we didn't get to will be rediscovered with the next payload:
+                self._discovery_infos.clear()
+                return
+
+    def _forget_discovery_info(self, unique_id: str) -> None:
+        """Forget that discovery info was published for an entity (or device).
+
+        Args:
+            unique_id: The unique ID of the entity (or device).
+        """
+        self._discovery_infos.pop(unique_id)
+
+    def _get_config_message(
+        self, discovery_info: HassDeviceDiscoveryInfo | HassDiscoveryInfo
+    ) -> MqttMessage:
+        """Get the discovery config message for an entity (or device).
+
+        Args:
+            discovery_info: A HassDeviceDiscoveryInfo or HassDiscoveryInfo object.
+
+        Returns:
+            An MqttMessage object.
+        """
+        return MqttMessage(
+            discovery_info.config_topic,
+            generate_mqtt_payload(
+                asdict(
+                    discovery_info,
+                    dict_factory=lambda x: {k: v for (k, v) in x if v is not None},
+                )
+            ),
+            # We always retain the config payload:
+            # https://github.com/bachya/ecowitt2mqtt/issues/760#issuecomment-1821340217
+            True,
+            self._config.hass_discovery_qos,
+        )
+
+    def _get_device_discovery_info(
+        self,
+        device: Device,
+        components: dict[str, dict[str, Any]],
+    ) -> HassDeviceDiscoveryInfo:
+        """Get the device-based discovery payload for a device.
+
+        Components that have been published before are kept (gateways don't always
+        include every sensor in every payload), so the config only ever grows.
+
+        Args:
+            device: A Device object.
+            components: The components found in the latest payload, keyed by their
+                unique ID.
+
+        Returns:
+            A HassDeviceDiscoveryInfo object.
+        """
+        if isinstance(
+            cached := self._discovery_infos.get(device.unique_id),
+            HassDeviceDiscoveryInfo,
+        ):
+            components = cached.components | components
+
+        return HassDeviceDiscoveryInfo(
+            config_topic=(
+                f"{self._config.hass_discovery_prefix}/device/{device.unique_id}/config"
+            ),
+            device=get_discovery_device(device),
+            origin=HASS_ORIGIN,
+            components=components,
+            qos=self._config.hass_state_qos,
+        )
+
+    @staticmethod
+    def _get_device_discovery_component(
+        data_point: CalculatedDataPoint, discovery_info: HassDiscoveryInfo
+    ) -> dict[str, Any]:
+        """Get the component (within a device-based payload) for an entity.
+
+        Args:
+            data_point: A parsed CalculatedDataPoint object.
+            discovery_info: The entity's HassDiscoveryInfo object.
+
+        Returns:
+            A component dictionary.
+        """
+        return {
+            "platform": PLATFORM_MAP[data_point.data_type],
+            **{
+                key: value
+                for key, value in asdict(discovery_info).items()
+                if value is not None and key not in HASS_DEVICE_COMPONENT_EXCLUDED_KEYS
+            },
+        }
+
+    def _get_base_topic(
+        self, device: Device, payload_key: str, data_point: CalculatedDataPoint
+    ) -> str:
+        """Get the topic that an entity's topics are nested under.
+
+        Args:
+            device: A Device object.
+            payload_key: The key of the data point in the payload.
+            data_point: A parsed CalculatedDataPoint object.
+
+        Returns:
+            An MQTT topic.
+        """
+        return (
+            f"{self._config.hass_discovery_prefix}/{PLATFORM_MAP[data_point.data_type]}"
+            f"/{device.unique_id}/{payload_key}"
+        )
 
     def _get_data_point_key(
         self, payload_key: str, data_point: CalculatedDataPoint
@@ -495,28 +797,31 @@ class HomeAssistantDiscoveryPublisher(MqttPublisher):  # pylint: disable=too-few
         self, device: Device, payload_key: str, data_point: CalculatedDataPoint
     ) -> HassDiscoveryInfo:
         """Get the discovery payload from a payload."""
-        base_topic = (
-            f"{self._config.hass_discovery_prefix}/{PLATFORM_MAP[data_point.data_type]}"
-            f"/{device.unique_id}/{payload_key}"
-        )
+        base_topic = self._get_base_topic(device, payload_key, data_point)
 
         discovery = HassDiscoveryInfo(
-            availability_topic=f"{base_topic}/availability",
+            # Availability is tracked for ecowitt2mqtt as a whole (via the MQTT client's
+            # Last Will), not per entity:
+            availability_topic=self._config.mqtt_availability_topic,
             config_topic=f"{base_topic}/config",
-            device=HassDiscoveryDevice(
-                identifiers=[device.unique_id],
-                manufacturer=device.manufacturer,
-                model=device.model,
-                name=device.name,
-                sw_version=device.station_type,
-            ),
+            device=get_discovery_device(device),
             json_attributes_topic=f"{base_topic}/attributes",
             name=payload_key,
             retain=self._config.mqtt_retain,
             state_topic=f"{base_topic}/state",
             unique_id=f"{device.unique_id}_{payload_key}",
+            # Home Assistant subscribes to the entity's topics with this QoS level:
+            qos=self._config.hass_state_qos,
         )
 
+        if self._stale_sensor_wheel is not None:
+            # An entity is only available while both ecowitt2mqtt and its sensor are:
+            discovery.availability = [
+                {"topic": self._config.mqtt_availability_topic},
+                {"topic": f"{base_topic}/availability"},
+            ]
+            discovery.availability_mode = AVAILABILITY_MODE_ALL
+            discovery.availability_topic = None
         if self._config.hass_entity_id_prefix:
             discovery.object_id = f"{self._config.hass_entity_id_prefix}_{payload_key}"
         if data_point.unit:
@@ -542,74 +847,231 @@ class HomeAssistantDiscoveryPublisher(MqttPublisher):  # pylint: disable=too-few
 
         return discovery
 
-    async def async_publish(self, data: dict[str, CalculatedValueType]) -> None:
+    def _get_stale_sensor_deadline(
+        self, device: Device, data: dict[str, CalculatedValueType]
+    ) -> float:
+        """Get the time by which a device's sensors must report again.
+
+        Args:
+            device: A Device object.
+            data: A data payload.
+
+        Returns:
+            A loop time.
+        """
+        now = asyncio.get_running_loop().time()
+        last_payload_time = self._last_payload_times.get(device.unique_id)
+        self._last_payload_times.set(device.unique_id, now)
+
+        # Prefer the update interval the gateway reports; if there isn't one, assume
+        # that the gateway keeps up the pace it has shown so far:
+        try:
+            interval = float(cast(str, data[DATA_POINT_INTERVAL]))
+        except (KeyError, TypeError, ValueError):
+            if last_payload_time is None:
+                interval = DEFAULT_STALE_SENSOR_INTERVAL
+            else:
+                interval = now - last_payload_time
+
+        return now + interval * cast(int, self._config.hass_stale_sensor_intervals)
+
+    def _get_messages_to_publish(
+        self,
+        unique_id: str,
+        discovery_info: HassDeviceDiscoveryInfo | HassDiscoveryInfo,
+        state_messages: list[MqttMessage],
+    ) -> list[MqttMessage]:
+        """Get the messages to publish right away for an entity (or device).
+
+        A new or changed config is published ahead of the state messages; when
+        discovery is rate limited, both are handed to the scheduler instead.
+
+        Args:
+            unique_id: The unique ID of the entity (or device).
+            discovery_info: A HassDeviceDiscoveryInfo or HassDiscoveryInfo object.
+            state_messages: The entity's (or device's) state messages.
+
+        Returns:
+            A list of MqttMessage objects.
+        """
+        if self._discovery_infos.get(unique_id) != discovery_info:
+            LOGGER.debug("Publishing discovery info for %s", unique_id)
+            self._discovery_infos.set(unique_id, discovery_info)
+            config_message = self._get_config_message(discovery_info)
+            if self._discovery_scheduler:
+                self._discovery_scheduler.schedule(
+                    unique_id, config_message, state_messages
+                )
+                return []
+            return [config_message, *state_messages]
+
+        if self._discovery_scheduler and self._discovery_scheduler.update(
+            unique_id, state_messages
+        ):
+            # Until the config is out, its state waits alongside it:
+            return []
+
+        return state_messages
+
+    async def async_handle_message(self, topic: str, payload: bytes) -> None:
+        """Handle a message received on one of this publisher's subscriptions.
+
+        Home Assistant publishes its birth message on the status topic when it starts;
+        since a restarted Home Assistant may not have our (retained) configs anymore,
+        that is the moment to republish them.
+
+        Args:
+            topic: The MQTT topic the message was received on.
+            payload: The message payload.
+        """
+        if payload != HASS_STATUS_ONLINE:
+            return
+
+        LOGGER.info("Home Assistant came online")
+
+        if self._rediscovery_task and not self._rediscovery_task.done():
+            self._rediscovery_task.cancel()
+        self._rediscovery_task = asyncio.create_task(self._async_rediscover())
+
+    async def async_publish(
+        self,
+        data: dict[str, CalculatedValueType],
+        processed_data: ProcessedData | None = None,
+    ) -> None:
         """Publish to MQTT.
 
         Args:
             data: A data payload.
+            processed_data: The payload's ProcessedData (if it has already been
+                processed).
 
         Raises:
             MqttError: Raised on any MQTT error.
         """
-        processed_data = ProcessedData(self._config, data)
+        if processed_data is None:
+            processed_data = ProcessedData(self._config, data)
+        device_mode = self._config.hass_discovery_mode == HassDiscoveryMode.DEVICE
+        device_components: dict[str, dict[str, Any]] = {}
+        device_state_messages: list[MqttMessage] = []
+        newly_available_topics: list[str] = []
         tasks: list[asyncio.Task] = []
 
+        if self._stale_sensor_wheel is not None:
+            stale_sensor_deadline = self._get_stale_sensor_deadline(
+                processed_data.device, data
+            )
+
         for payload_key, data_point in processed_data.output.items():
             discovery_info = self._get_discovery_info(
                 processed_data.device, payload_key, data_point
             )
 
-            if self._discovery_infos.get(discovery_info.unique_id) != discovery_info:
-                LOGGER.debug(
-                    "Publishing discovery info for %s", discovery_info.unique_id
+            state_messages = [
+                MqttMessage(
+                    topic,
+                    generate_mqtt_payload(payload),
+                    self._config.mqtt_retain,
+                    qos,
+                    expires=True,
+                )
+                for topic, payload, qos in (
+                    (
+                        discovery_info.json_attributes_topic,
+                        data_point.attributes,
+                        self._config.hass_attributes_qos,
+                    ),
+                    (
+                        discovery_info.state_topic,
+                        data_point.value,
+                        self._config.hass_state_qos,
+                    ),
                 )
-                self._discovery_infos[discovery_info.unique_id] = discovery_info
-                tasks.append(
-                    asyncio.create_task(
-                        self._client.publish(
-                            discovery_info.config_topic,
-                            payload=generate_mqtt_payload(
-                                asdict(
-                                    discovery_info,
-                                    dict_factory=lambda x: {
-                                        k: v for (k, v) in x if v is not None
-                                    },
+            ]
+
+            if self._stale_sensor_wheel is not None:
+                availability_topic = (
+                    f"{self._get_base_topic(processed_data.device, payload_key, data_point)}"
+                    "/availability"
+                )
+                if availability_topic not in self._stale_sensor_wheel:
+                    # The sensor is new (or has started reporting again); this doesn't
+                    # need to wait for discovery, since the topic is retained:
+                    newly_available_topics.append(availability_topic)
+                    tasks.append(
+                        asyncio.create_task(
+                            self._async_publish_message(
+                                MqttMessage(
+                                    availability_topic,
+                                    generate_mqtt_payload(AVAILABILITY_ONLINE),
+                                    True,
+                                    self._config.mqtt_availability_qos,
                                 )
-                            ),
-                            # We always retain the config payload:
-                            # https://github.com/bachya/ecowitt2mqtt/issues/760#issuecomment-1821340217
-                            retain=True,
+                            )
                         )
                     )
+                self._stale_sensor_wheel.schedule(
+                    availability_topic, stale_sensor_deadline
                 )
 
-            for topic, payload in (
-                (
-                    discovery_info.availability_topic,
-                    get_availability_payload(data_point),
-                ),
-                (discovery_info.json_attributes_topic, data_point.attributes),
-                (
-                    discovery_info.state_topic,
-                    data_point.value,
-                ),
-            ):
-                tasks.append(
-                    asyncio.create_task(
-                        self._client.publish(
-                            topic,
-                            payload=generate_mqtt_payload(payload),
-                            retain=self._config.mqtt_retain,
-                        )
-                    )
+            if device_mode:
+                # All of the device's entities are discovered by a single config:
+                device_components[discovery_info.unique_id] = (
+                    self._get_device_discovery_component(data_point, discovery_info)
+                )
+                device_state_messages.extend(state_messages)
+                continue
+
+            tasks.extend(
+                asyncio.create_task(self._async_publish_message(message))
+                for message in self._get_messages_to_publish(
+                    discovery_info.unique_id, discovery_info, state_messages
+                )
+            )
+
+        if device_mode:
+            tasks.extend(
+                asyncio.create_task(self._async_publish_message(message))
+                for message in self._get_messages_to_publish(
+                    processed_data.device.unique_id,
+                    self._get_device_discovery_info(
+                        processed_data.device, device_components
+                    ),
+                    device_state_messages,
                 )
+            )
+
+        if backlog := self.discovery_backlog:
+            LOGGER.debug("MQTT Discovery backlog: %s message(s)", backlog)
+
+        if self._stale_sensor_wheel and (
+            self._stale_sensor_task is None or self._stale_sensor_task.done()
+        ):
+            self._stale_sensor_task = asyncio.create_task(
+                self._async_expire_stale_sensors(self._stale_sensor_wheel)
+            )
 
         try:
             await asyncio.gather(*tasks)
         except MqttError:
             for task in tasks:
                 task.cancel()
+            if self._stale_sensor_wheel is not None:
+                # Make sure these sensors are announced as available next time:
+                for availability_topic in newly_available_topics:
+                    self._stale_sensor_wheel.cancel(availability_topic)
             raise
 
         LOGGER.info("Published to Home Assistant MQTT Discovery")
         LOGGER.debug("Published data: %s", processed_data.output)
+
+    async def async_stop(self) -> None:
+        """Stop rediscovery, paced discovery, and the expiry of stale sensors."""
+        if self._discovery_scheduler is not None:
+            await self._discovery_scheduler.async_stop()
+
+        for task in (self._rediscovery_task, self._stale_sensor_task):
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        self._rediscovery_task = None
+        self._stale_sensor_task = None
@@ -0,0 +1,237 @@
+"""Define a pipeline that feeds payloads to a single MQTT publisher."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from aiomqtt import MqttError
+
+from ecowitt2mqtt.config import Config
+from ecowitt2mqtt.const import LOGGER
+from ecowitt2mqtt.data import ProcessedData
+from ecowitt2mqtt.helpers.metrics import MetricsRegistry
+from ecowitt2mqtt.helpers.publisher.mqtt import MqttPublisher
+
+# The delay (in seconds) before the first retry (which doubles with every retry):
+RETRY_BASE_DELAY = 0.5
+
+
+class QueuedPayload(NamedTuple):
+    """Define a payload waiting to be published."""
+
+    # A number that increases with every payload (so that payloads waiting on several
+    # pipelines can be put back in order):
+    sequence: int
+    payload: dict[str, Any]
+    queued_at: float
+    # The payload's ProcessedData, shared by every publisher (and broker target) that
+    # needs it (publishers process the payload themselves if it is missing):
+    processed_data: ProcessedData | None = None
+    # The names of the pipelines that still need the payload (or None if every pipeline
+    # does):
+    publishers: frozenset[str] | None = None
+    # Whether the payload is being replayed from the spool (where it stays until every
+    # pipeline has published it):
+    spooled: bool = False
+
+
+class PublisherPipeline:
+    """Define a bounded queue (and a task to work through it) in front of a publisher.
+
+    Every publisher works through payloads at its own pace, so a slow or failing
+    publisher only holds up itself: once its queue is full, the oldest payloads are
+    dropped to make room for new ones.
+
+    MQTT errors are retried (with exponential backoff); once the retries run out, the
+    pipeline stops and records the error so that the connection can be re-established.
+    Any other error only costs the publisher the payload that caused it.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        publisher: MqttPublisher,
+        gateway: str,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            config: A Config object.
+            publisher: The MqttPublisher to feed.
+            gateway: The name of the gateway the publisher belongs to (for metrics).
+            metrics: A MetricsRegistry object to record metrics in.
+        """
+        if metrics is None:
+            metrics = MetricsRegistry()
+
+        self._idle_event = asyncio.Event()
+        self._in_flight: QueuedPayload | None = None
+        self._labels = {
+            "gateway": gateway,
+            "publisher": type(publisher).__name__,
+        }
+        self._max_size = config.publisher_queue_size
+        self._max_retries = config.publisher_retries
+        self._publisher = publisher
+        self._queue: deque[QueuedPayload] = deque()
+        self._queue_event = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.error: MqttError | None = None
+
+        self._dropped = metrics.counter(
+            "ecowitt2mqtt_publisher_dropped_payloads_total",
+            "The number of payloads dropped because a publisher's queue was full",
+        )
+        self._errors = metrics.counter(
+            "ecowitt2mqtt_publisher_errors_total",
+            "The number of payloads a publisher failed to publish",
+        )
+        self._latency = metrics.histogram(
+            "ecowitt2mqtt_publisher_latency_seconds",
+            "The time from a payload being queued to it being published",
+        )
+        self._queue_size = metrics.gauge(
+            "ecowitt2mqtt_publisher_queue_size",
+            "The number of payloads waiting on a publisher",
+        )
+        self._retries = metrics.counter(
+            "ecowitt2mqtt_publisher_retries_total",
+            "The number of times a publisher retried a payload after an MQTT error",
+        )
+        self._idle_event.set()
+        self._queue_size.set(0, **self._labels)
+
+    @property
+    def name(self) -> str:
+        """Return the name of the pipeline (i.e., of its publisher).
+
+        Returns:
+            A name.
+        """
+        return self._labels["publisher"]
+
+    async def _async_publish(self, queued_payload: QueuedPayload) -> None:
+        """Publish a payload (retrying MQTT errors).
+
+        Args:
+            queued_payload: A QueuedPayload object.
+
+        Raises:
+            MqttError: Raised once the retries have run out.
+        """
+        attempt = 0
+        while True:
+            try:
+                await self._publisher.async_publish(
+                    queued_payload.payload, queued_payload.processed_data
+                )
+            except MqttError as err:
+                if attempt >= self._max_retries:
+                    raise
+                delay = RETRY_BASE_DELAY * 2**attempt
+                attempt += 1
+                LOGGER.warning(
+                    "%s failed to publish (retrying in %s seconds): %s",
+                    self._labels["publisher"],
+                    delay,
+                    err,
+                )
+                self._retries.inc(1, **self._labels)
+                await asyncio.sleep(delay)
+            except Exception as err:  # pylint: disable=broad-except
+                LOGGER.exception(
+                    "%s failed to publish a payload: %s", self._labels["publisher"], err
+                )
+                self._errors.inc(1, **self._labels)
+                return
+            else:
+                self._latency.observe(
+                    asyncio.get_running_loop().time() - queued_payload.queued_at,
+                    **self._labels,
+                )
+                return
+
+    async def _async_run(self, on_error: Callable[[], None]) -> None:
+        """Work through the queue until the pipeline is stopped.
+
+        Args:
+            on_error: A callback to run if the pipeline stops on an MQTT error.
+        """
+        while True:
+            if not self._queue:
+                self._idle_event.set()
+                self._queue_event.clear()
+                await self._queue_event.wait()
+                continue
+
+            self._in_flight = self._queue.popleft()
+            self._queue_size.set(len(self._queue), **self._labels)
+            try:
+                await self._async_publish(self._in_flight)
+            except MqttError as err:
+                # The in-flight payload is kept, so that it isn't lost:
+                self._errors.inc(1, **self._labels)
+                self.error = err
+                self._idle_event.set()
+                on_error()
+                return
+            self._in_flight = None
+
+    async def async_stop(self) -> list[QueuedPayload]:
+        """Stop the pipeline.
+
+        Returns:
+            The payloads that weren't published (in the order they were queued).
+        """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        unpublished = list(self._queue)
+        if self._in_flight is not None:
+            unpublished.insert(0, self._in_flight)
+        self._in_flight = None
+        self._queue.clear()
+        self._queue_size.set(0, **self._labels)
+        self._idle_event.set()
+        return unpublished
+
+    async def async_wait_idle(self) -> None:
+        """Wait until every queued payload has been handled (or the pipeline fails)."""
+        await self._idle_event.wait()
+
+    def start(self, on_error: Callable[[], None]) -> None:
+        """Start working through the queue.
+
+        Args:
+            on_error: A callback to run if the pipeline stops on an MQTT error.
+        """
+        self.error = None
+        self._task = asyncio.create_task(self._async_run(on_error))
+
+    def submit(self, queued_payload: QueuedPayload) -> None:
+        """Add a payload to the queue.
+
+        Args:
+            queued_payload: A QueuedPayload object.
+        """
+        if len(self._queue) >= self._max_size:
+            dropped = self._queue.popleft()
+            LOGGER.warning(
+                "%s is falling behind; dropping payload %s",
+                self._labels["publisher"],
+                dropped.sequence,
+            )
+            self._dropped.inc(1, **self._labels)
+
+        self._queue.append(queued_payload)
+        self._queue_size.set(len(self._queue), **self._labels)
+        # A failed pipeline stays idle until it is restarted:
+        if self.error is None:
+            self._idle_event.clear()
+        self._queue_event.set()
@@ -0,0 +1,168 @@
+"""Define a rate-paced scheduler for MQTT Discovery messages."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from aiomqtt import MqttError
+
+from ecowitt2mqtt.const import LOGGER
+from ecowitt2mqtt.helpers.publisher.mqtt import MqttMessage
+
+
+@dataclass
+class DiscoveryEntry:
+    """Define the messages that are waiting to discover a single entity."""
+
+    config_message: MqttMessage
+    state_messages: list[MqttMessage] = field(default_factory=list)
+    config_sent: bool = False
+
+    def __len__(self) -> int:
+        """Return the number of unsent messages in this entry.
+
+        Returns:
+            A message count.
+        """
+        return int(not self.config_sent) + len(self.state_messages)
+
+
+class DiscoveryScheduler:
+    """Define a scheduler that paces MQTT Discovery publishes.
+
+    Each entity awaiting discovery owns a single entry: its config message followed by
+    its latest state messages. Entries are sent in the order they were scheduled (so an
+    entity's config always reaches the broker before its first state) and newer state
+    for a still-pending entity replaces what is queued, so the backlog doesn't grow with
+    repeated payloads.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[MqttMessage], Awaitable[None]],
+        rate_limit: float,
+        on_failure: Callable[[str], None],
+    ) -> None:
+        """Initialize.
+
+        Args:
+            publish: A coroutine function that publishes a single MqttMessage.
+            rate_limit: The maximum number of messages to publish per second.
+            on_failure: A callback to run (with an entity's unique ID) when the
+                entity's discovery messages could not be published.
+        """
+        self._publish = publish
+        self._interval = 1 / rate_limit
+        self._next_send_time = 0.0
+        self._on_failure = on_failure
+        self._pending: OrderedDict[str, DiscoveryEntry] = OrderedDict()
+        self._task: asyncio.Task | None = None
+
+    def __contains__(self, unique_id: object) -> bool:
+        """Return whether an entity is pending discovery.
+
+        Args:
+            unique_id: The unique ID of the entity.
+
+        Returns:
+            Whether the entity is pending discovery.
+        """
+        return unique_id in self._pending
+
+    @property
+    def backlog(self) -> int:
+        """Return the number of messages waiting to be published.
+
+        Returns:
+            A message count.
+        """
+        return sum(len(entry) for entry in self._pending.values())
+
+    async def _async_publish(self, message: MqttMessage) -> None:
+        """Publish a single message once the rate limit allows it.
+
+        Args:
+            message: An MqttMessage object.
+        """
+        loop = asyncio.get_running_loop()
+        if (delay := self._next_send_time - loop.time()) > 0:
+            await asyncio.sleep(delay)
+        self._next_send_time = max(loop.time(), self._next_send_time) + self._interval
+
+        await self._publish(message)
+
+    async def _async_run(self) -> None:
+        """Publish pending entries until none remain."""
+        while self._pending:
+            unique_id, entry = next(iter(self._pending.items()))
+            try:
+                await self._async_publish(entry.config_message)
+                entry.config_sent = True
+                # State that arrives while we're publishing replaces the list (leaving
+                # the one we're working through untouched), so always re-check it:
+                while state_messages := entry.state_messages:
+                    await self._async_publish(state_messages[0])
+                    state_messages.pop(0)
+            except MqttError as err:
+                LOGGER.error("There was an MQTT error during discovery: %s", err)
+                # Forget everything that hasn't made it out so that the publisher
+                # re-schedules it with the next payload:
+                for failed_unique_id in self._pending:
+                    self._on_failure(failed_unique_id)
+                self._pending.clear()
+                return
+
+            LOGGER.debug("Published discovery info for %s", unique_id)
+            if self._pending.get(unique_id) is entry:
+                del self._pending[unique_id]
+
+        LOGGER.debug("MQTT Discovery backlog drained")
+
+    async def async_stop(self) -> None:
+        """Stop publishing (forgetting whatever is still pending)."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        for unique_id in self._pending:
+            self._on_failure(unique_id)
+        self._pending.clear()
+
+    def schedule(
+        self,
+        unique_id: str,
+        config_message: MqttMessage,
+        state_messages: list[MqttMessage],
+    ) -> None:
+        """Schedule an entity's discovery (replacing any pending entry for it).
+
+        Args:
+            unique_id: The unique ID of the entity.
+            config_message: The entity's discovery config message.
+            state_messages: The entity's initial state messages.
+        """
+        # A changed config restarts the entity's discovery at the back of the line:
+        self._pending.pop(unique_id, None)
+        self._pending[unique_id] = DiscoveryEntry(config_message, state_messages)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._async_run())
+
+    def update(self, unique_id: str, state_messages: list[MqttMessage]) -> bool:
+        """Replace the queued state messages of an entity that is pending discovery.
+
+        Args:
+            unique_id: The unique ID of the entity.
+            state_messages: The entity's latest state messages.
+
+        Returns:
+            Whether the entity is pending discovery.
+        """
+        if (entry := self._pending.get(unique_id)) is None:
+            return False
+        entry.state_messages = state_messages
+        return True
@@ -0,0 +1,147 @@
+"""Define an outgoing MQTT publish throttle."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from ecowitt2mqtt.config import Config
+from ecowitt2mqtt.helpers.metrics import MetricsRegistry
+
+
+class TokenBucket:
+    """Define a token bucket rate limiter.
+
+    Callers reserve tokens up front (which may drive the balance negative) and then
+    wait until the bucket has refilled enough to cover their reservation. This keeps
+    callers in first-come, first-served order and allows a single request to be larger
+    than the bucket's capacity.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """Initialize.
+
+        Args:
+            rate: The number of tokens added per second.
+            capacity: The maximum number of tokens the bucket holds (defaults to a
+                second's worth).
+        """
+        self._capacity = rate if capacity is None else capacity
+        self._last_refill: float | None = None
+        self._rate = rate
+        self._tokens = self._capacity
+
+    async def async_acquire(self, amount: float = 1.0) -> float:
+        """Take tokens from the bucket (waiting until they're available).
+
+        Args:
+            amount: The number of tokens to take.
+
+        Returns:
+            The amount of time (in seconds) spent waiting.
+        """
+        now = asyncio.get_running_loop().time()
+        if self._last_refill is not None:
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._last_refill) * self._rate
+            )
+        self._last_refill = now
+
+        self._tokens -= amount
+        if self._tokens >= 0:
+            return 0.0
+        delay = -self._tokens / self._rate
+        await asyncio.sleep(delay)
+        return delay
+
+
+class PublishThrottle:
+    """Define a throttle for everything published to a single MQTT broker.
+
+    Messages are limited by count and size (each with its own token bucket) and by the
+    number of messages that may be awaiting acknowledgement from the broker at once.
+    """
+
+    def __init__(self, config: Config, metrics: MetricsRegistry | None = None) -> None:
+        """Initialize.
+
+        Args:
+            config: A Config object.
+            metrics: A MetricsRegistry object to record metrics in.
+        """
+        if metrics is None:
+            metrics = MetricsRegistry()
+
+        self._broker = f"{config.mqtt_broker}:{config.mqtt_port}"
+        self._byte_bucket: TokenBucket | None = None
+        self._inflight_semaphore: asyncio.Semaphore | None = None
+        self._message_bucket: TokenBucket | None = None
+
+        self._bytes_published = metrics.counter(
+            "ecowitt2mqtt_mqtt_published_bytes_total",
+            "The number of payload bytes published to the MQTT broker",
+        )
+        self._inflight = metrics.gauge(
+            "ecowitt2mqtt_mqtt_inflight_messages",
+            "The number of messages awaiting acknowledgement from the MQTT broker",
+        )
+        self._messages_published = metrics.counter(
+            "ecowitt2mqtt_mqtt_published_messages_total",
+            "The number of messages published to the MQTT broker",
+        )
+        self._throttled_seconds = metrics.counter(
+            "ecowitt2mqtt_mqtt_throttled_seconds_total",
+            "The amount of time messages spent waiting on the MQTT rate limits",
+        )
+        self._inflight.set(0, broker=self._broker)
+
+        limits = metrics.gauge(
+            "ecowitt2mqtt_mqtt_limit",
+            "The configured MQTT publish limits (0 means unlimited)",
+        )
+        if config.mqtt_rate_limit:
+            self._message_bucket = TokenBucket(config.mqtt_rate_limit)
+        if config.mqtt_byte_rate_limit:
+            self._byte_bucket = TokenBucket(config.mqtt_byte_rate_limit)
+        if config.mqtt_max_inflight:
+            self._inflight_semaphore = asyncio.Semaphore(config.mqtt_max_inflight)
+        for limit, value in (
+            ("bytes_per_second", config.mqtt_byte_rate_limit),
+            ("inflight_messages", config.mqtt_max_inflight),
+            ("messages_per_second", config.mqtt_rate_limit),
+        ):
+            limits.set(value or 0, broker=self._broker, limit=limit)
+
+    @asynccontextmanager
+    async def async_reserve(self, size: int) -> AsyncIterator[None]:
+        """Wait for the limits to allow a message to be published.
+
+        The message should be published (and acknowledged) within the context.
+
+        Args:
+            size: The size (in bytes) of the message's payload.
+
+        Yields:
+            Nothing (once the message may be published).
+        """
+        throttled_seconds = 0.0
+        if self._message_bucket:
+            throttled_seconds += await self._message_bucket.async_acquire()
+        if self._byte_bucket:
+            throttled_seconds += await self._byte_bucket.async_acquire(size)
+        if throttled_seconds:
+            self._throttled_seconds.inc(throttled_seconds, broker=self._broker)
+
+        if self._inflight_semaphore:
+            await self._inflight_semaphore.acquire()
+        self._inflight.inc(broker=self._broker)
+        try:
+            yield
+        finally:
+            self._inflight.dec(broker=self._broker)
+            if self._inflight_semaphore:
+                self._inflight_semaphore.release()
+
+        self._bytes_published.inc(size, broker=self._broker)
+        self._messages_published.inc(broker=self._broker)
@@ -0,0 +1,95 @@
+"""Define TLS helpers for MQTT connections."""
+
+from __future__ import annotations
+
+import socket
+import ssl
+from typing import cast
+
+from ecowitt2mqtt.config import Config
+from ecowitt2mqtt.const import MqttTlsVerify
+
+
+class _ResumableSSLSocket(ssl.SSLSocket):
+    """Define an SSL socket that hands its TLS session to its context when closed."""
+
+    def close(self) -> None:
+        """Close the socket (keeping its TLS session for the next connection)."""
+        if (session := self.session) is not None:
+            cast(ResumableSSLContext, self.context).session = session
+        super().close()
+
+
+class ResumableSSLContext(ssl.SSLContext):
+    """Define an SSL context that resumes the TLS session of its last connection.
+
+    Resuming a session skips most of the TLS handshake (and, with it, a round trip and
+    the broker's certificate verification), which is what makes reconnecting after a
+    dropped connection fast. A session is only valid for the broker that issued it, so
+    each broker needs a context of its own.
+    """
+
+    sslsocket_class = _ResumableSSLSocket
+    session: ssl.SSLSession | None = None
+
+    def wrap_socket(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        sock: socket.socket,
+        server_side: bool = False,
+        do_handshake_on_connect: bool = True,
+        suppress_ragged_eofs: bool = True,
+        server_hostname: str | bytes | None = None,
+        session: ssl.SSLSession | None = None,
+    ) -> ssl.SSLSocket:
+        """Wrap a socket (resuming the last TLS session if there is one).
+
+        Args:
+            sock: The socket to wrap.
+            server_side: Whether the socket is on the server side.
+            do_handshake_on_connect: Whether to perform the handshake on connection.
+            suppress_ragged_eofs: Whether to treat unexpected EOFs as normal ones.
+            server_hostname: The hostname of the server.
+            session: The TLS session to resume.
+
+        Returns:
+            An SSL socket.
+        """
+        if session is None and not server_side:
+            session = self.session
+        return super().wrap_socket(
+            sock,
+            server_side=server_side,
+            do_handshake_on_connect=do_handshake_on_connect,
+            suppress_ragged_eofs=suppress_ragged_eofs,
+            server_hostname=server_hostname,
+            session=session,
+        )
+
+
+def get_tls_context(config: Config) -> ResumableSSLContext:
+    """Get an SSL context for connecting to an MQTT broker.
+
+    Args:
+        config: A Config object.
+
+    Returns:
+        A ResumableSSLContext object.
+    """
+    context = ResumableSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+    if config.mqtt_tls_verify == MqttTlsVerify.NONE:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    else:
+        context.check_hostname = config.mqtt_tls_verify == MqttTlsVerify.FULL
+        if config.mqtt_tls_ca_file:
+            context.load_verify_locations(cafile=config.mqtt_tls_ca_file)
+        else:
+            context.load_default_certs()
+
+    if config.mqtt_tls_certfile:
+        context.load_cert_chain(config.mqtt_tls_certfile, config.mqtt_tls_keyfile)
+    if config.mqtt_tls_alpn:
+        context.set_alpn_protocols(list(config.mqtt_tls_alpn))
+
+    return context
@@ -0,0 +1,161 @@
+"""Define MQTT v5 helpers."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+from paho.mqtt.packettypes import PacketTypes
+from paho.mqtt.properties import Properties
+
+from ecowitt2mqtt.config import Config
+
+if TYPE_CHECKING:
+    from ecowitt2mqtt.helpers.publisher.mqtt import MqttMessage
+
+CLIENT_ID_PREFIX = "ecowitt2mqtt-"
+# Every broker must accept client IDs of up to 23 characters:
+CLIENT_ID_HASH_LENGTH = 23 - len(CLIENT_ID_PREFIX)
+
+
+class TopicAliases:
+    """Define the topic aliases in use on a single MQTT v5 connection.
+
+    A topic earns an alias the second time it is published (i.e., once it has proven to
+    be published repeatedly), for as long as there are aliases left. The first message
+    published with an alias carries the full topic (which is how the broker learns the
+    alias); every message after it carries an empty topic.
+
+    Aliases only live as long as the connection, so the table must be reset whenever the
+    client reconnects.
+    """
+
+    def __init__(self, maximum: int) -> None:
+        """Initialize.
+
+        Args:
+            maximum: The maximum number of aliases to use (which must not exceed the
+                broker's Topic Alias Maximum).
+        """
+        self._aliases: dict[str, int] = {}
+        self._maximum = maximum
+        self._seen_topics: set[str] = set()
+
+    def __len__(self) -> int:
+        """Return the number of aliases in use.
+
+        Returns:
+            The number of aliases in use.
+        """
+        return len(self._aliases)
+
+    def get(self, topic: str) -> tuple[str, int | None]:
+        """Get the topic and alias to publish a message with.
+
+        Args:
+            topic: The full MQTT topic.
+
+        Returns:
+            A tuple of the topic to publish to (empty once the broker knows the alias)
+            and the alias to publish with (if any).
+        """
+        if (alias := self._aliases.get(topic)) is not None:
+            return "", alias
+
+        if topic in self._seen_topics and len(self._aliases) < self._maximum:
+            alias = self._aliases[topic] = len(self._aliases) + 1
+            return topic, alias
+
+        self._seen_topics.add(topic)
+        return topic, None
+
+    def reset(self) -> None:
+        """Forget all aliases (e.g., after a reconnection)."""
+        self._aliases.clear()
+        self._seen_topics.clear()
+
+
+def get_client_id(config: Config) -> str:
+    """Get a client ID that stays the same across restarts.
+
+    The ID is derived from the config's name and where it publishes to, so that each
+    config (and each instance of ecowitt2mqtt publishing elsewhere) resumes its own
+    session.
+
+    Args:
+        config: A Config object.
+
+    Returns:
+        A client ID.
+    """
+    identity = "\0".join(
+        str(value)
+        for value in (
+            config.name,
+            config.mqtt_username,
+            config.mqtt_topic,
+            config.hass_discovery_prefix if config.hass_discovery else None,
+        )
+    )
+    digest = hashlib.sha256(identity.encode()).hexdigest()
+    return f"{CLIENT_ID_PREFIX}{digest[:CLIENT_ID_HASH_LENGTH]}"
+
+
+def get_client_session_options(config: Config) -> dict[str, Any]:
+    """Get the MQTT client options that let the session survive a reconnection.
+
+    With MQTT v5, the session (and anything the broker queued for our subscriptions)
+    survives a reconnection (or a restart), which requires a client ID that stays the
+    same. MQTT 3.1.1 clients keep the client's defaults (paho-mqtt refuses to connect
+    with a clean start option at all).
+
+    Args:
+        config: A Config object.
+
+    Returns:
+        A dictionary of keyword arguments for the MQTT client.
+    """
+    if not config.mqtt_v5:
+        return {}
+    return {"clean_start": False, "identifier": get_client_id(config)}
+
+
+def get_connect_properties(config: Config) -> Properties | None:
+    """Get the MQTT v5 properties to connect with.
+
+    Args:
+        config: A Config object.
+
+    Returns:
+        A Properties object (or None if MQTT v5 isn't in use).
+    """
+    if not config.mqtt_v5:
+        return None
+
+    properties = Properties(PacketTypes.CONNECT)  # type: ignore[no-untyped-call]
+    properties.SessionExpiryInterval = config.mqtt_session_expiry
+    return properties
+
+
+def get_publish_properties(
+    config: Config, message: MqttMessage, topic_aliases: TopicAliases
+) -> tuple[str, Properties]:
+    """Get the topic and MQTT v5 properties to publish a message with.
+
+    Args:
+        config: A Config object.
+        message: An MqttMessage object.
+        topic_aliases: The TopicAliases object for the current connection.
+
+    Returns:
+        A tuple of the topic to publish to and a Properties object.
+    """
+    properties = Properties(PacketTypes.PUBLISH)  # type: ignore[no-untyped-call]
+
+    topic, alias = topic_aliases.get(message.topic)
+    if alias is not None:
+        properties.TopicAlias = alias
+    if message.expires and config.mqtt_message_expiry:
+        properties.MessageExpiryInterval = config.mqtt_message_expiry
+
+    return topic, properties
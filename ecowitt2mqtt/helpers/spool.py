@@ -0,0 +1,322 @@
+"""Define a disk-backed spool for payloads that can't be published yet."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import time
+import zlib
+from collections.abc import Collection, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
+
+from ecowitt2mqtt.backports.enum import StrEnum
+from ecowitt2mqtt.const import LOGGER
+
+DEFAULT_SEGMENT_SIZE = 1024 * 1024
+
+SEGMENT_FILE_SUFFIX = ".seg"
+
+# Every record is a header (the time it was spooled, the length of the body, and a
+# CRC32 of the body) followed by the JSON-encoded payload (or, for a payload that only
+# some publishers still need, a JSON array of the payload and those publishers):
+RECORD_HEADER = struct.Struct("<dII")
+
+
+class SpoolFsyncPolicy(StrEnum):
+    """Define when spooled payloads are flushed to disk."""
+
+    ALWAYS = "always"
+    NEVER = "never"
+    SEGMENT = "segment"
+
+
+class SpooledPayload(NamedTuple):
+    """Define a payload waiting in the spool."""
+
+    payload: dict[str, Any]
+    # The names of the publishers that still need the payload (or None if every
+    # publisher does):
+    publishers: frozenset[str] | None = None
+
+
+@dataclass
+class SpoolSegment:
+    """Define a single segment file in the spool."""
+
+    path: Path
+    count: int = 0
+    newest: float = 0.0
+    size: int = 0
+
+
+class Spool:
+    """Define an append-only, segment-based spool of payloads.
+
+    Payloads are appended to an active segment file until it grows past the segment
+    size, at which point it is sealed and a new one is started. Sealed segments are
+    memory-mapped for replay and deleted once every payload in them has been replayed
+    (or once they fall outside of the size or age retention limits).
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        fsync: SpoolFsyncPolicy,
+        max_age: float,
+        max_size: int,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            directory: The directory to store segment files in.
+            fsync: When to flush spooled payloads to disk.
+            max_age: The maximum age (in seconds) of a spooled payload.
+            max_size: The maximum size (in bytes) of the spool.
+            segment_size: The size (in bytes) at which a segment is sealed.
+        """
+        self._active: SpoolSegment | None = None
+        self._active_file: BinaryIO | None = None
+        self._directory = directory
+        self._fsync = fsync
+        # The publishers that still need the oldest payload (if fewer than its record
+        # says):
+        self._head_publishers: frozenset[str] | None = None
+        self._max_age = max_age
+        self._max_size = max_size
+        self._read_map: mmap.mmap | None = None
+        self._read_offset = 0
+        self._segment_size = segment_size
+        self._segments: list[SpoolSegment] = []
+
+        directory.mkdir(parents=True, exist_ok=True)
+        for path in sorted(directory.glob(f"*{SEGMENT_FILE_SUFFIX}")):
+            segment = self._load_segment(path)
+            if segment.count:
+                self._segments.append(segment)
+            else:
+                path.unlink()
+
+        if self._segments:
+            LOGGER.info("Found %s spooled payload(s) in %s", len(self), self._directory)
+            self._enforce_retention()
+
+    def __len__(self) -> int:
+        """Return the number of payloads waiting to be replayed.
+
+        Returns:
+            A payload count.
+        """
+        count = sum(segment.count for segment in self._segments)
+        if self._active:
+            count += self._active.count
+        return count
+
+    @staticmethod
+    def _iterate_records(
+        buffer: mmap.mmap, offset: int = 0
+    ) -> Iterator[tuple[float, bytes, int]]:
+        """Iterate over the valid records in a buffer.
+
+        Args:
+            buffer: A memory-mapped segment file.
+            offset: The offset to start reading at.
+
+        Yields:
+            The spool time, body, and end offset of each record.
+        """
+        size = len(buffer)
+        while offset + RECORD_HEADER.size <= size:
+            timestamp, length, checksum = RECORD_HEADER.unpack_from(buffer, offset)
+            start = offset + RECORD_HEADER.size
+            if not length or start + length > size:
+                # A record that was only partially written (e.g., because of a crash)
+                # marks the end of the segment:
+                return
+            body = buffer[start : start + length]
+            if zlib.crc32(body) != checksum:
+                return
+            offset = start + length
+            yield timestamp, body, offset
+
+    def _close_active(self) -> None:
+        """Seal the active segment so that it can be replayed."""
+        if self._active is None or self._active_file is None:
+            return
+        if self._fsync != SpoolFsyncPolicy.NEVER:
+            os.fsync(self._active_file.fileno())
+        self._active_file.close()
+        self._segments.append(self._active)
+        self._active = None
+        self._active_file = None
+
+    def _close_reader(self) -> None:
+        """Stop reading the oldest segment."""
+        if self._read_map is not None:
+            self._read_map.close()
+            self._read_map = None
+        self._head_publishers = None
+        self._read_offset = 0
+
+    def _drop_oldest(self, reason: str) -> None:
+        """Delete the oldest sealed segment.
+
+        Args:
+            reason: The reason the segment is being deleted.
+        """
+        self._close_reader()
+        segment = self._segments.pop(0)
+        if segment.count:
+            LOGGER.warning(
+                "Dropping %s spooled payload(s) from %s (%s)",
+                segment.count,
+                segment.path,
+                reason,
+            )
+        segment.path.unlink(missing_ok=True)
+
+    def _enforce_retention(self) -> None:
+        """Delete sealed segments that fall outside of the retention limits."""
+        cutoff = time.time() - self._max_age
+        while self._segments and self._segments[0].newest < cutoff:
+            self._drop_oldest("older than the maximum age")
+
+        size = sum(segment.size for segment in self._segments)
+        if self._active:
+            size += self._active.size
+        while self._segments and size > self._max_size:
+            size -= self._segments[0].size
+            self._drop_oldest("over the maximum size")
+
+    def _load_segment(self, path: Path) -> SpoolSegment:
+        """Load an existing segment file.
+
+        Args:
+            path: The path to the segment file.
+
+        Returns:
+            A SpoolSegment object.
+        """
+        segment = SpoolSegment(path, size=path.stat().st_size)
+        if not segment.size:
+            return segment
+
+        with path.open("rb") as segment_file, mmap.mmap(
+            segment_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as buffer:
+            for timestamp, _, _ in self._iterate_records(buffer):
+                segment.count += 1
+                segment.newest = timestamp
+        return segment
+
+    def _open_active(self) -> tuple[SpoolSegment, BinaryIO]:
+        """Start a new active segment.
+
+        Returns:
+            The active SpoolSegment object and its open file.
+        """
+        segments = self._segments
+        sequence = int(segments[-1].path.stem) + 1 if segments else 0
+        path = self._directory / f"{sequence:020d}{SEGMENT_FILE_SUFFIX}"
+        self._active = SpoolSegment(path)
+        self._active_file = path.open("ab")
+        return self._active, self._active_file
+
+    def append(
+        self, payload: dict[str, Any], publishers: Collection[str] | None = None
+    ) -> None:
+        """Add a payload to the end of the spool.
+
+        Args:
+            payload: An API request payload.
+            publishers: The names of the publishers that still need the payload (if
+                not every publisher does).
+        """
+        if publishers is None:
+            body = json.dumps(payload).encode()
+        else:
+            body = json.dumps([payload, sorted(publishers)]).encode()
+        timestamp = time.time()
+        if self._active is None or self._active_file is None:
+            active, active_file = self._open_active()
+        else:
+            active, active_file = self._active, self._active_file
+
+        active_file.write(
+            RECORD_HEADER.pack(timestamp, len(body), zlib.crc32(body)) + body
+        )
+        active_file.flush()
+        if self._fsync == SpoolFsyncPolicy.ALWAYS:
+            os.fsync(active_file.fileno())
+
+        active.count += 1
+        active.newest = timestamp
+        active.size += RECORD_HEADER.size + len(body)
+        if active.size >= self._segment_size:
+            self._close_active()
+        self._enforce_retention()
+
+    def close(self) -> None:
+        """Flush and close any open segment files."""
+        self._close_reader()
+        self._close_active()
+
+    def peek(self) -> SpooledPayload | None:
+        """Return the oldest payload in the spool (without removing it).
+
+        Returns:
+            A SpooledPayload object (or None if the spool is empty).
+        """
+        cutoff = time.time() - self._max_age
+        while True:
+            if self._read_map is None:
+                if not self._segments:
+                    if not self._active or not self._active.count:
+                        return None
+                    self._close_active()
+                with self._segments[0].path.open("rb") as segment_file:
+                    self._read_map = mmap.mmap(
+                        segment_file.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+
+            for timestamp, body, _ in self._iterate_records(
+                self._read_map, self._read_offset
+            ):
+                if timestamp >= cutoff:
+                    if isinstance(record := json.loads(body), list):
+                        payload, publishers = record
+                        return SpooledPayload(
+                            payload, self._head_publishers or frozenset(publishers)
+                        )
+                    return SpooledPayload(record, self._head_publishers)
+                self.pop()
+                break
+            else:
+                # Every payload in this segment has been replayed:
+                self._segments[0].count = 0
+                self._drop_oldest("replayed")
+
+    def narrow(self, publishers: Collection[str]) -> None:
+        """Narrow down the publishers that still need the oldest payload.
+
+        Records are never rewritten, so this only lasts until the spool is reopened (at
+        which point the payload goes to every publisher its record names again).
+
+        Args:
+            publishers: The names of the publishers that still need the payload.
+        """
+        self._head_publishers = frozenset(publishers)
+
+    def pop(self) -> None:
+        """Remove the oldest payload from the spool."""
+        self._head_publishers = None
+        if self._read_map is None:
+            return
+        _, length, _ = RECORD_HEADER.unpack_from(self._read_map, self._read_offset)
+        self._read_offset += RECORD_HEADER.size + length
+        self._segments[0].count -= 1
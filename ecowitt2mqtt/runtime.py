@@ -3,20 +3,45 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import traceback
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager, suppress
-from ssl import SSLContext
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import uvicorn
-from aiomqtt import Client, MqttError
+from aiomqtt import Client, MqttError, ProtocolVersion, Will
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
 from ecowitt2mqtt.config import Config
-from ecowitt2mqtt.const import LOGGER
+from ecowitt2mqtt.const import (
+    AVAILABILITY_OFFLINE,
+    AVAILABILITY_ONLINE,
+    LOGGER,
+    MqttTlsVerify,
+)
+from ecowitt2mqtt.data import ProcessedData, ProcessedDataCache, ProcessingBatch
+from ecowitt2mqtt.errors import EcowittError
+from ecowitt2mqtt.helpers.metrics import METRICS_ENDPOINT, MetricsRegistry
 from ecowitt2mqtt.helpers.publisher.factory import get_publishers
+from ecowitt2mqtt.helpers.publisher.mqtt import MqttPublisher
+from ecowitt2mqtt.helpers.publisher.mqtt.failover import (
+    BrokerPool,
+    FailbackRequestedError,
+)
+from ecowitt2mqtt.helpers.publisher.mqtt.pipeline import (
+    PublisherPipeline,
+    QueuedPayload,
+)
+from ecowitt2mqtt.helpers.publisher.mqtt.throttle import PublishThrottle
+from ecowitt2mqtt.helpers.publisher.mqtt.v5 import (
+    get_client_session_options,
+    get_connect_properties,
+)
 from ecowitt2mqtt.helpers.server import APIServer, get_api_server
+from ecowitt2mqtt.helpers.spool import Spool
 
 if TYPE_CHECKING:
     from ecowitt2mqtt.core import Ecowitt
@@ -25,10 +50,18 @@ DEFAULT_HOST = "0.0.0.0"  # noqa: S104, # nosec: B104
 DEFAULT_MAX_RETRY_INTERVAL = 60
 DEFAULT_PENDING_CALLS_THRESHOLD = 500
 
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
 UVICORN_LOG_LEVEL_DEBUG = "debug"
 UVICORN_LOG_LEVEL_ERROR = "error"
 
 
+class IdleTimeoutError(EcowittError):
+    """Define an error raised to disconnect an MQTT loop that has gone idle."""
+
+    pass
+
+
 class Runtime:
     """Define the runtime manager."""
 
@@ -39,11 +72,24 @@ class Runtime:
             ecowitt: An Ecowitt object.
         """
         self._api_servers: dict[str, APIServer] = {}
-        self._mqtt_loop_tasks: list[asyncio.Task] = []
+        # Payloads waiting for the batch window to close (if batching is enabled):
+        self._batch_handle: asyncio.TimerHandle | None = None
+        self._batch_payloads: list[dict[str, Any]] = []
+        self._config_names = {
+            config.uuid: name for name, config in ecowitt.configs.targets()
+        }
+        self._metrics = MetricsRegistry()
+        self._mqtt_loop_tasks: dict[str, asyncio.Task] = {}
         self._payload_events: dict[str, asyncio.Event] = {}
         self._payload_lock = asyncio.Lock()
         self._payload_queues: dict[str, asyncio.Queue] = {}
+        self._processed_data_cache = ProcessedDataCache()
         self._rest_api_server_task: asyncio.Task | None = None
+        # A number that increases with every payload (so that payloads waiting on
+        # several pipelines can be put back in order):
+        self._sequence = itertools.count()
+        self._spools: dict[str, Spool] = {}
+        self._throttles: dict[str, PublishThrottle] = {}
         self.ecowitt = ecowitt
 
         @asynccontextmanager
@@ -52,15 +98,38 @@ class Runtime:
             yield
 
             # Upon shutdown:
-            for task in self._mqtt_loop_tasks:
+            if self._batch_handle is not None:
+                # Payloads waiting for the batch window are queued right away:
+                self._batch_handle.cancel()
+                self._process_payload_batch()
+
+            for task in self._mqtt_loop_tasks.values():
                 if task.done():
                     continue
-                with suppress(asyncio.CancelledError):
-                    LOGGER.debug("Cancelling MQTT loop: %s", task.get_name())
-                    task.cancel()
+                LOGGER.debug("Cancelling MQTT loop: %s", task.get_name())
+                task.cancel()
+            # Give the MQTT loops a chance to hand back the payloads their publishers
+            # hadn't gotten to:
+            await asyncio.gather(
+                *self._mqtt_loop_tasks.values(), return_exceptions=True
+            )
+
+            # Anything that hasn't been published yet is kept for next time:
+            for config_uuid, spool in self._spools.items():
+                if queue := self._payload_queues.get(config_uuid):
+                    while not queue.empty():
+                        queued_payload = queue.get_nowait()
+                        spool.append(queued_payload.payload, queued_payload.publishers)
+                spool.close()
             LOGGER.debug("Runtime shutdown complete")
 
         fastapi = FastAPI(lifespan=lifespan)
+        fastapi.add_api_route(
+            METRICS_ENDPOINT,
+            self._async_get_metrics,
+            methods=["get"],
+            response_class=PlainTextResponse,
+        )
         for config in ecowitt.configs.iterate():
             if config.endpoint not in self._api_servers:
                 api_server = self._api_servers[config.endpoint] = get_api_server(
@@ -68,6 +137,15 @@ class Runtime:
                 )
                 api_server.add_payload_callback(self._process_payload)
 
+        for name, config in ecowitt.configs.targets():
+            if config.spool_directory:
+                self._spools[config.uuid] = Spool(
+                    Path(config.spool_directory) / name,
+                    fsync=config.spool_fsync,
+                    max_age=config.spool_max_age,
+                    max_size=int(config.spool_max_size * 1024 * 1024),
+                )
+
         if ecowitt.configs.default_config.verbose:
             uvicorn_log_level = UVICORN_LOG_LEVEL_DEBUG
         else:
@@ -101,42 +179,154 @@ class Runtime:
 
         async def create_loop() -> None:
             """Create the loop."""
+            broker_pool = BrokerPool(
+                config, self._config_names[config.uuid], self._metrics
+            )
+            # Publishers outlive individual connections so that whatever they know
+            # (e.g., which entities have been discovered) survives a reconnection:
+            pipelines: list[PublisherPipeline] = []
+            publishers: list[MqttPublisher] = []
             retry_attempt = 0
+            spool = self._spools.get(config.uuid)
+            throttle = self._get_publish_throttle(config)
+            # Health checks wake the loop up when a broker recovers (or it's time to
+            # fail back):
+            broker_pool.start(payload_event.set)
             try:
                 while True:
                     try:
                         async with Client(
-                            config.mqtt_broker,
+                            await broker_pool.async_get_host(),
                             logger=LOGGER,
                             password=config.mqtt_password,
-                            port=config.mqtt_port,
-                            tls_context=SSLContext() if config.mqtt_tls else None,
+                            port=broker_pool.current.port,
+                            tls_context=broker_pool.tls_context,
+                            # Unless the context verifies the hostname itself, the
+                            # client would insist on doing so:
+                            tls_insecure=(
+                                config.mqtt_tls_verify != MqttTlsVerify.FULL
+                                if config.mqtt_tls
+                                else None
+                            ),
                             username=config.mqtt_username,
+                            max_inflight_messages=config.mqtt_max_inflight,
+                            properties=get_connect_properties(config),
+                            protocol=ProtocolVersion.V5 if config.mqtt_v5 else None,
+                            # If we go away without disconnecting, the broker tells
+                            # everyone on our behalf:
+                            will=Will(
+                                config.mqtt_availability_topic,
+                                payload=AVAILABILITY_OFFLINE,
+                                qos=config.mqtt_availability_qos,
+                                retain=True,
+                            ),
+                            **get_client_session_options(config),
                         ) as client:
                             client.pending_calls_threshold = (
                                 DEFAULT_PENDING_CALLS_THRESHOLD
                             )
-                            publishers = get_publishers(config, client)
-                            while True:
-                                await payload_event.wait()
-                                while not queue.empty():
-                                    payload = await queue.get()
-                                    LOGGER.debug("Publishing payload: %s", payload)
-                                    tasks = [
-                                        publisher.async_publish(payload)
-                                        for publisher in publishers
-                                    ]
-                                    await asyncio.gather(*tasks)
-
-                                if config.diagnostics:
-                                    LOGGER.info("*** DIAGNOSTICS COLLECTED")
-                                    self.stop()
-
-                                payload_event.clear()
-                                retry_attempt = 0
+                            broker_pool.mark_connected()
+                            if publishers:
+                                for publisher in publishers:
+                                    publisher.client = client
+                            else:
+                                publishers = get_publishers(config, client, throttle)
+                                pipelines = [
+                                    PublisherPipeline(
+                                        config,
+                                        publisher,
+                                        self._config_names[config.uuid],
+                                        self._metrics,
+                                    )
+                                    for publisher in publishers
+                                ]
+
+                            async with throttle.async_reserve(len(AVAILABILITY_ONLINE)):
+                                await client.publish(
+                                    config.mqtt_availability_topic,
+                                    payload=AVAILABILITY_ONLINE,
+                                    qos=config.mqtt_availability_qos,
+                                    retain=True,
+                                )
+                            listen_task = await self._async_create_listen_task(
+                                client, publishers
+                            )
+                            for pipeline in pipelines:
+                                # A publisher that runs out of retries wakes the loop
+                                # up to reconnect:
+                                pipeline.start(payload_event.set)
+                            if not queue.empty():
+                                # Payloads were left over from the last connection:
+                                payload_event.set()
+                            try:
+                                while True:
+                                    if spool is not None and len(spool):
+                                        await self._async_replay_spool(
+                                            config, spool, queue, pipelines
+                                        )
+
+                                    try:
+                                        await asyncio.wait_for(
+                                            payload_event.wait(),
+                                            config.mqtt_idle_timeout,
+                                        )
+                                    except asyncio.TimeoutError:
+                                        raise IdleTimeoutError from None
+                                    self._raise_pipeline_error(pipelines)
+                                    if broker_pool.failback_broker is not None:
+                                        raise FailbackRequestedError
+                                    while not queue.empty():
+                                        queued_payload = queue.get_nowait()
+                                        LOGGER.debug(
+                                            "Publishing payload: %s",
+                                            queued_payload.payload,
+                                        )
+                                        self._submit_payload(queued_payload, pipelines)
+
+                                    if config.diagnostics:
+                                        await self._async_wait_for_pipelines(pipelines)
+                                        LOGGER.info("*** DIAGNOSTICS COLLECTED")
+                                        self.stop()
+
+                                    payload_event.clear()
+                                    retry_attempt = 0
+                            except (
+                                asyncio.CancelledError,
+                                FailbackRequestedError,
+                                IdleTimeoutError,
+                            ):
+                                # A clean disconnection doesn't trigger the Last Will:
+                                with suppress(MqttError):
+                                    await client.publish(
+                                        config.mqtt_availability_topic,
+                                        payload=AVAILABILITY_OFFLINE,
+                                        qos=config.mqtt_availability_qos,
+                                        retain=True,
+                                    )
+                                raise
+                            finally:
+                                if listen_task:
+                                    listen_task.cancel()
+                                await self._async_stop_pipelines(
+                                    pipelines, queue, spool
+                                )
+                    except FailbackRequestedError:
+                        payload_event.clear()
+                        broker_pool.fail_back()
+                    except IdleTimeoutError:
+                        LOGGER.info(
+                            "No payloads for %s seconds; disconnecting: %s",
+                            config.mqtt_idle_timeout,
+                            config.uuid,
+                        )
+                        await self._async_forget_mqtt_loop(config, publishers)
+                        return
                     except MqttError as err:
                         LOGGER.error("There was an MQTT error: %s", err)
                         payload_event.clear()
+                        if broker_pool.fail_over():
+                            # Another broker is healthy, so there's no need to wait:
+                            continue
                         retry_attempt += 1
                         delay = min(retry_attempt**2, DEFAULT_MAX_RETRY_INTERVAL)
                         LOGGER.info(
@@ -144,41 +334,451 @@ class Runtime:
                             delay,
                             retry_attempt,
                         )
-                        await asyncio.sleep(delay)
+                        if spool is None:
+                            await broker_pool.async_wait_for_recovery(delay)
+                        else:
+                            await self._async_spool_payloads(
+                                spool, queue, payload_event, delay, broker_pool
+                            )
             except Exception as err:  # pylint: disable=broad-except
                 LOGGER.exception("%s exception caused a shutdown: %s", type(err), err)
                 LOGGER.debug("".join(traceback.format_tb(err.__traceback__)))
                 self.stop()
+            finally:
+                # Whatever ended the loop (including it being cancelled), nothing the
+                # publishers started in the background may outlive it:
+                await self._async_stop_publishers(publishers)
+                await broker_pool.async_stop()
 
         task = asyncio.create_task(create_loop())
         task.set_name(config.uuid)
         return task
 
-    def _process_payload(self, payload: dict[str, Any]) -> None:
-        """Define an endpoint for the Ecowitt device to post data to.
+    async def _async_create_listen_task(
+        self, client: Client, publishers: list[MqttPublisher]
+    ) -> asyncio.Task | None:
+        """Subscribe to the topics publishers want and route incoming messages to them.
+
+        Args:
+            client: An MQTT Client object.
+            publishers: A list of MqttPublisher objects.
+
+        Returns:
+            An asyncio Task object (or None if no publisher has subscriptions).
+        """
+        subscriptions: dict[str, list[MqttPublisher]] = {}
+        for publisher in publishers:
+            for topic in publisher.subscriptions:
+                subscriptions.setdefault(topic, []).append(publisher)
+
+        if not subscriptions:
+            return None
+
+        for topic in subscriptions:
+            LOGGER.debug("Subscribing to %s", topic)
+            await client.subscribe(topic)
+
+        async def listen() -> None:
+            """Listen for incoming messages."""
+            try:
+                async for message in client.messages:
+                    for topic, subscribers in subscriptions.items():
+                        if not message.topic.matches(topic):
+                            continue
+                        for publisher in subscribers:
+                            await publisher.async_handle_message(topic, message.payload)
+            except MqttError as err:
+                LOGGER.debug("Stopped listening for MQTT messages: %s", err)
+
+        return asyncio.create_task(listen())
+
+    async def _async_get_metrics(self) -> PlainTextResponse:
+        """Return the current metrics (in the Prometheus text format).
+
+        Returns:
+            A FastAPI PlainTextResponse object.
+        """
+        return PlainTextResponse(
+            self._metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE
+        )
+
+    async def _async_replay_spool(
+        self,
+        config: Config,
+        spool: Spool,
+        queue: asyncio.Queue,
+        pipelines: list[PublisherPipeline],
+    ) -> None:
+        """Publish spooled payloads (at a limited rate) until none remain.
+
+        Args:
+            config: A Config object.
+            spool: The Spool to replay.
+            queue: An asyncio Queue object.
+            pipelines: A list of PublisherPipeline objects.
+        """
+        LOGGER.info("Replaying %s spooled payload(s)", len(spool))
+        interval = 1 / config.spool_replay_rate
+
+        while (spooled_payload := spool.peek()) is not None:
+            # Payloads that arrive during the replay join the back of the spool so
+            # that everything is published in the order it was received:
+            while not queue.empty():
+                queued_payload = queue.get_nowait()
+                spool.append(queued_payload.payload, queued_payload.publishers)
+
+            LOGGER.debug("Publishing spooled payload: %s", spooled_payload.payload)
+            # A payload only leaves the spool once every publisher has handled it:
+            self._submit_payload(
+                self._get_queued_payload(
+                    spooled_payload.payload,
+                    publishers=spooled_payload.publishers,
+                    spooled=True,
+                ),
+                pipelines,
+            )
+            await self._async_wait_for_pipelines(pipelines)
+            spool.pop()
+            await asyncio.sleep(interval)
+
+        LOGGER.info("Finished replaying spooled payloads")
+
+    @staticmethod
+    async def _async_stop_pipelines(
+        pipelines: list[PublisherPipeline], queue: asyncio.Queue, spool: Spool | None
+    ) -> None:
+        """Stop publisher pipelines and keep the payloads they hadn't published.
+
+        Payloads go to the spool (if there is one) or back to the front of the queue,
+        so that they're published once the connection is re-established – but only by
+        the pipelines that hadn't published them yet (so that a failing publisher
+        doesn't cause the others to publish duplicates). A payload that was being
+        replayed from the spool is still at the front of it, so it isn't added again.
+
+        Args:
+            pipelines: A list of PublisherPipeline objects.
+            queue: An asyncio Queue object.
+            spool: The Spool to add payloads to (if any).
+        """
+        unpublished: dict[int, QueuedPayload] = {}
+        pending: dict[int, set[str]] = {}
+        for pipeline in pipelines:
+            for queued_payload in await pipeline.async_stop():
+                unpublished[queued_payload.sequence] = queued_payload
+                pending.setdefault(queued_payload.sequence, set()).add(pipeline.name)
+
+        all_publishers = {pipeline.name for pipeline in pipelines}
+        queued_payloads = [
+            unpublished[sequence]._replace(
+                publishers=(
+                    None
+                    if pending[sequence] == all_publishers
+                    else frozenset(pending[sequence])
+                )
+            )
+            for sequence in sorted(unpublished)
+        ]
+
+        if spool is not None:
+            for queued_payload in queued_payloads:
+                if not queued_payload.spooled:
+                    spool.append(queued_payload.payload, queued_payload.publishers)
+                elif queued_payload.publishers is not None:
+                    # A replayed payload is still at the front of the spool; it only
+                    # needs to be replayed to the publishers that didn't publish it:
+                    spool.narrow(queued_payload.publishers)
+            return
+
+        while not queue.empty():
+            queued_payloads.append(queue.get_nowait())
+        for queued_payload in queued_payloads:
+            queue.put_nowait(queued_payload)
+
+    @staticmethod
+    async def _async_stop_publishers(publishers: list[MqttPublisher]) -> None:
+        """Stop whatever a series of publishers is doing in the background.
+
+        Args:
+            publishers: A list of MqttPublisher objects.
+        """
+        await asyncio.gather(*(publisher.async_stop() for publisher in publishers))
+
+    @staticmethod
+    async def _async_wait_for_pipelines(pipelines: list[PublisherPipeline]) -> None:
+        """Wait for every publisher pipeline to handle the payloads it has been given.
+
+        Args:
+            pipelines: A list of PublisherPipeline objects.
+        """
+        await asyncio.gather(*(pipeline.async_wait_idle() for pipeline in pipelines))
+        Runtime._raise_pipeline_error(pipelines)
+
+    @staticmethod
+    def _raise_pipeline_error(pipelines: list[PublisherPipeline]) -> None:
+        """Raise the error of the first publisher pipeline that has failed (if any).
+
+        Args:
+            pipelines: A list of PublisherPipeline objects.
+
+        Raises:
+            MqttError: Raised if a pipeline has run out of retries.
+        """
+        for pipeline in pipelines:
+            if pipeline.error is not None:
+                raise pipeline.error
+
+    @staticmethod
+    def _submit_payload(
+        queued_payload: QueuedPayload, pipelines: list[PublisherPipeline]
+    ) -> None:
+        """Hand a payload to every publisher pipeline that still needs it.
+
+        Args:
+            queued_payload: A QueuedPayload object.
+            pipelines: A list of PublisherPipeline objects.
+        """
+        for pipeline in pipelines:
+            if (
+                queued_payload.publishers is None
+                or pipeline.name in queued_payload.publishers
+            ):
+                pipeline.submit(queued_payload)
+
+    @staticmethod
+    async def _async_spool_payloads(
+        spool: Spool,
+        queue: asyncio.Queue,
+        payload_event: asyncio.Event,
+        delay: float,
+        broker_pool: BrokerPool,
+    ) -> None:
+        """Spool incoming payloads for a period of time (or until a broker recovers).
+
+        Args:
+            spool: The Spool to add payloads to.
+            queue: An asyncio Queue object.
+            payload_event: An asyncio Event object.
+            delay: The amount of time (in seconds) to spool payloads for.
+            broker_pool: The BrokerPool of the MQTT loop.
+        """
+        loop = asyncio.get_running_loop()
+        end_time = loop.time() + delay
+
+        while True:
+            payload_event.clear()
+            while not queue.empty():
+                queued_payload = queue.get_nowait()
+                spool.append(queued_payload.payload, queued_payload.publishers)
+            if broker_pool.recovered or (remaining := end_time - loop.time()) <= 0:
+                return
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(payload_event.wait(), remaining)
+
+    def _get_publish_throttle(self, config: Config) -> PublishThrottle:
+        """Get the publish throttle for a config's MQTT broker.
+
+        Configs that publish to the same MQTT broker share a throttle (using the limits
+        of whichever config connects first).
+
+        Args:
+            config: A Config object.
+
+        Returns:
+            A PublishThrottle object.
+        """
+        broker = f"{config.mqtt_broker}:{config.mqtt_port}"
+        if (throttle := self._throttles.get(broker)) is None:
+            throttle = self._throttles[broker] = PublishThrottle(config, self._metrics)
+        return throttle
+
+    async def _async_forget_mqtt_loop(
+        self, config: Config, publishers: list[MqttPublisher]
+    ) -> None:
+        """Forget the MQTT loop of a config once it has disconnected for being idle.
+
+        Everything the loop held (its publishers included) goes with it; the next
+        payload for the config creates a new one.
 
         Args:
+            config: A Config object.
+            publishers: The loop's MqttPublisher objects.
+        """
+        # Stop the publishers first, so that their background tasks can't overlap
+        # with those of a new loop for the same config:
+        await self._async_stop_publishers(publishers)
+
+        del self._mqtt_loop_tasks[config.uuid]
+        del self._payload_events[config.uuid]
+        queue = self._payload_queues.pop(config.uuid)
+
+        spool = self._spools.get(config.uuid)
+        if not queue.empty() or (spool is not None and len(spool)):
+            # Payloads arrived (or were handed back) while disconnecting:
+            self._payload_queues[config.uuid] = queue
+            self._get_payload_event(config).set()
+
+    def _get_processed_data(
+        self,
+        config: Config,
+        payload: dict[str, Any],
+        batch: ProcessingBatch | None = None,
+    ) -> ProcessedData | None:
+        """Process a payload once for all of a config's MQTT broker targets.
+
+        Whatever hasn't changed since the gateway's previous payload is reused from
+        its ProcessedData.
+
+        Args:
+            config: A Config object.
             payload: An API request payload.
+            batch: The ProcessingBatch the payload is part of (if any).
+
+        Returns:
+            A ProcessedData object (or None if no publisher needs one or processing
+            failed).
         """
-        config = self.ecowitt.configs.get(payload["PASSKEY"])
+        if config.raw_data and not any(
+            target.hass_discovery for target in (config, *config.mqtt_targets)
+        ):
+            return None
 
-        # Store the payload in the appropriate queue:
-        queue = self._payload_queues.setdefault(config.uuid, asyncio.Queue())
-        queue.put_nowait(payload)
+        gateway_id = payload["PASSKEY"]
+        try:
+            processed_data = ProcessedData(
+                config, payload, self._processed_data_cache.get(gateway_id), batch
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            # Each publisher processes (and reports on) the payload itself instead:
+            LOGGER.debug("Unable to process payload: %s", err)
+            return None
 
-        # If there isn't an active MQTT loop for this payload, create it first and
-        # instruct it to publish the payload once it's connected:
+        self._processed_data_cache.set(gateway_id, processed_data)
+        return processed_data
+
+    def _get_queued_payload(
+        self,
+        payload: dict[str, Any],
+        processed_data: ProcessedData | None = None,
+        *,
+        publishers: frozenset[str] | None = None,
+        spooled: bool = False,
+    ) -> QueuedPayload:
+        """Get a payload ready to be queued.
+
+        Args:
+            payload: An API request payload.
+            processed_data: The payload's ProcessedData (if any).
+            publishers: The names of the publishers that still need the payload (if
+                not every publisher does).
+            spooled: Whether the payload is being replayed from the spool.
+
+        Returns:
+            A QueuedPayload object.
+        """
+        return QueuedPayload(
+            next(self._sequence),
+            payload,
+            asyncio.get_running_loop().time(),
+            processed_data,
+            publishers,
+            spooled,
+        )
+
+    def _get_payload_event(self, config: Config) -> asyncio.Event:
+        """Get the event that wakes up the MQTT loop for a config.
+
+        If there isn't an active MQTT loop for the config, it is created first.
+
+        Args:
+            config: A Config object.
+
+        Returns:
+            An asyncio Event object.
+        """
         if (payload_event := self._payload_events.get(config.uuid)) is None:
+            queue = self._payload_queues.setdefault(config.uuid, asyncio.Queue())
             payload_event = self._payload_events[config.uuid] = asyncio.Event()
-            self._mqtt_loop_tasks.append(
-                self._async_create_mqtt_loop_task(config, queue, payload_event)
+            self._mqtt_loop_tasks[config.uuid] = self._async_create_mqtt_loop_task(
+                config, queue, payload_event
+            )
+        return payload_event
+
+    def _process_payload(self, payload: dict[str, Any]) -> None:
+        """Define an endpoint for the Ecowitt device to post data to.
+
+        Args:
+            payload: An API request payload.
+        """
+        if (batch_window := self.ecowitt.configs.default_config.batch_window) is None:
+            config = self.ecowitt.configs.get(payload["PASSKEY"])
+            self._queue_payload(
+                config, payload, self._get_processed_data(config, payload)
             )
+            return
+
+        # The payload is processed along with any others that arrive within the window:
+        self._batch_payloads.append(payload)
+        if self._batch_handle is None:
+            self._batch_handle = asyncio.get_running_loop().call_later(
+                batch_window, self._process_payload_batch
+            )
+
+    def _process_payload_batch(self) -> None:
+        """Process the payloads that arrived within the batch window (together)."""
+        payloads, self._batch_payloads = self._batch_payloads, []
+        self._batch_handle = None
+        LOGGER.debug("Processing a batch of %s payload(s)", len(payloads))
 
-        payload_event.set()
+        batch = ProcessingBatch()
+        configs = [self.ecowitt.configs.get(payload["PASSKEY"]) for payload in payloads]
+        processed_data = [
+            self._get_processed_data(config, payload, batch)
+            for config, payload in zip(configs, payloads)
+        ]
+        try:
+            batch.finish()
+        except Exception as err:  # pylint: disable=broad-except
+            # Each publisher processes (and reports on) the payloads itself instead:
+            LOGGER.debug("Unable to process payload batch: %s", err)
+            processed_data = [None] * len(payloads)
+
+        for config, payload, data in zip(configs, payloads, processed_data):
+            self._queue_payload(config, payload, data)
+
+    def _queue_payload(
+        self,
+        config: Config,
+        payload: dict[str, Any],
+        processed_data: ProcessedData | None,
+    ) -> None:
+        """Queue a payload for each of a config's MQTT broker targets.
+
+        Args:
+            config: A Config object.
+            payload: An API request payload.
+            processed_data: The payload's ProcessedData (if any).
+        """
+        # The payload is processed once, no matter how many brokers it is published to:
+        queued_payload = self._get_queued_payload(payload, processed_data)
+
+        for target in (config, *config.mqtt_targets):
+            # Store the payload in the appropriate queue:
+            queue = self._payload_queues.setdefault(target.uuid, asyncio.Queue())
+            queue.put_nowait(queued_payload)
+
+            # Instruct the MQTT loop to publish the payload once it's connected:
+            self._get_payload_event(target).set()
 
     async def async_start(self) -> None:
         """Start the runtime."""
         LOGGER.debug("Starting runtime")
+
+        # Payloads that were spooled before a restart don't have to wait for the next
+        # one to arrive:
+        for _, config in self.ecowitt.configs.targets():
+            if (spool := self._spools.get(config.uuid)) is not None and len(spool):
+                self._get_payload_event(config).set()
+
         self._rest_api_server_task = asyncio.create_task(self._uvicorn.serve())
         try:
             await self._rest_api_server_task
@@ -0,0 +1,86 @@
+"""Define banded classification tables."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+
+class BandTable(Generic[_T]):
+    """Define a table that classifies values into half-open bands.
+
+    Each band covers the values from its minimum (inclusive) to its maximum
+    (exclusive). The bands are sorted and compiled into a list of boundaries when the
+    table is created, so classifying a value is a binary search (rather than a scan
+    over every band). Values that don't fall in any band (including NaN) are
+    classified as None.
+    """
+
+    def __init__(self, bands: Iterable[tuple[float, float, _T]]) -> None:
+        """Initialize.
+
+        Args:
+            bands: A series of (minimum, maximum, classification) tuples (in any
+                order).
+
+        Raises:
+            ValueError: Raised when a band is empty or when two bands overlap.
+        """
+        self._boundaries: list[float] = []
+        self._classifications: list[_T | None] = []
+
+        for minimum, maximum, classification in sorted(bands, key=lambda b: b[0]):
+            if minimum >= maximum:
+                raise ValueError(f"Band [{minimum}, {maximum}) is empty")
+
+            if self._boundaries:
+                if minimum < self._boundaries[-1]:
+                    raise ValueError(
+                        f"Band [{minimum}, {maximum}) overlaps the previous band"
+                    )
+                if minimum > self._boundaries[-1]:
+                    # Values in the gap between two bands aren't classified:
+                    self._classifications.append(None)
+                    self._boundaries.append(minimum)
+            else:
+                self._boundaries.append(minimum)
+
+            self._classifications.append(classification)
+            self._boundaries.append(maximum)
+
+    def classify(self, value: float) -> _T | None:
+        """Classify a value.
+
+        Args:
+            value: The value to classify.
+
+        Returns:
+            The classification of the band the value falls in (or None if it doesn't
+            fall in any).
+        """
+        index = bisect_right(self._boundaries, value) - 1
+        if 0 <= index < len(self._classifications):
+            return self._classifications[index]
+        return None
+
+    def classify_many(self, values: Iterable[float]) -> list[_T | None]:
+        """Classify a series of values.
+
+        Args:
+            values: The values to classify.
+
+        Returns:
+            The classification of each value (in order).
+        """
+        boundaries = self._boundaries
+        classifications = self._classifications
+        count = len(classifications)
+
+        results: list[_T | None] = []
+        for value in values:
+            index = bisect_right(boundaries, value) - 1
+            results.append(classifications[index] if 0 <= index < count else None)
+        return results
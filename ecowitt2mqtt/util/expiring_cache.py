@@ -0,0 +1,119 @@
+"""Define a bounded cache whose entries expire."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+_KeyT = TypeVar("_KeyT", bound=Hashable)
+_ValueT = TypeVar("_ValueT")
+
+
+class ExpiringCache(Generic[_KeyT, _ValueT]):
+    """Define a bounded cache whose entries expire.
+
+    Keys that haven't been used (stored or looked up) within the TTL are evicted; once
+    the cache is full, the key that was used least recently is, too.
+    """
+
+    def __init__(self, *, max_size: int, ttl: float) -> None:
+        """Initialize.
+
+        Args:
+            max_size: The maximum number of keys to cache.
+            ttl: The amount of time (in seconds) to cache an unused key for.
+        """
+        self._entries: OrderedDict[_KeyT, tuple[float, _ValueT]] = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a key is cached (without counting as a use of it).
+
+        Args:
+            key: The key to check.
+
+        Returns:
+            Whether the key is cached.
+        """
+        self._evict_expired(time.monotonic())
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of cached keys.
+
+        Returns:
+            The number of cached keys.
+        """
+        return len(self._entries)
+
+    def _evict_expired(self, now: float) -> None:
+        """Evict the keys that have gone unused.
+
+        Args:
+            now: The current (monotonic) time.
+        """
+        while self._entries:
+            used_at, _ = next(iter(self._entries.values()))
+            if now - used_at < self._ttl:
+                return
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every key."""
+        self._entries.clear()
+
+    def get(self, key: _KeyT) -> _ValueT | None:
+        """Get the value of a key.
+
+        Args:
+            key: The key to get.
+
+        Returns:
+            The value (or None if the key isn't cached).
+        """
+        now = time.monotonic()
+        self._evict_expired(now)
+        if (entry := self._entries.get(key)) is None:
+            return None
+        self._entries[key] = (now, entry[1])
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def items(self) -> list[tuple[_KeyT, _ValueT]]:
+        """Get every cached key and its value (without counting as a use of them).
+
+        Returns:
+            A list of (key, value) tuples (from least to most recently used).
+        """
+        self._evict_expired(time.monotonic())
+        return [(key, value) for key, (_, value) in self._entries.items()]
+
+    def pop(self, key: _KeyT) -> _ValueT | None:
+        """Remove a key.
+
+        Args:
+            key: The key to remove.
+
+        Returns:
+            The key's value (or None if it wasn't cached).
+        """
+        if (entry := self._entries.pop(key, None)) is None:
+            return None
+        return entry[1]
+
+    def set(self, key: _KeyT, value: _ValueT) -> None:
+        """Store the value of a key.
+
+        Args:
+            key: The key to store.
+            value: The value to store.
+        """
+        now = time.monotonic()
+        self._evict_expired(now)
+        self._entries[key] = (now, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
@@ -1,189 +1,245 @@
-"""Define various meteorological utils."""
+"""Define various meteorological utils.
+
+Every function works on plain floats, with the unit of each temperature spelled out in
+its name, so that calculators can chain them without creating intermediate objects.
+"""
 
 from __future__ import annotations
 
 import math
-from typing import cast
 
-import meteocalc
+from ecowitt2mqtt.const import UnitSystem
+
+# Arden Buck's dew point constants (b, c) for positive and negative temperatures:
+DEW_POINT_CONSTANTS_NEGATIVE = (17.966, 247.15)
+DEW_POINT_CONSTANTS_POSITIVE = (17.368, 238.88)
+
+# Rothfusz regression coefficients for the heat index:
+HEAT_INDEX_C1 = -42.379
+HEAT_INDEX_C2 = 2.04901523
+HEAT_INDEX_C3 = 10.14333127
+HEAT_INDEX_C4 = -0.22475541
+HEAT_INDEX_C5 = -6.83783e-3
+HEAT_INDEX_C6 = -5.481717e-2
+HEAT_INDEX_C7 = 1.22874e-3
+HEAT_INDEX_C8 = 8.5282e-4
+HEAT_INDEX_C9 = -1.99e-6
 
-from ecowitt2mqtt.const import UnitOfTemperature, UnitSystem
-from ecowitt2mqtt.util.unit_conversion import TemperatureConverter
+
+def celsius_to_fahrenheit(celsius: float) -> float:
+    """Convert a temperature in Celsius to Fahrenheit.
+
+    Args:
+        celsius: A temperature in Celsius.
+
+    Returns:
+        A temperature in Fahrenheit.
+    """
+    return celsius * 9 / 5.0 + 32
+
+
+def fahrenheit_to_celsius(fahrenheit: float) -> float:
+    """Convert a temperature in Fahrenheit to Celsius.
+
+    Args:
+        fahrenheit: A temperature in Fahrenheit.
+
+    Returns:
+        A temperature in Celsius.
+    """
+    return (fahrenheit - 32) * 5 / 9.0
 
 
 def get_absolute_humidity_in_metric(
-    temp_obj: meteocalc.Temp, relative_humidity: float
+    temperature_c: float, relative_humidity: float
 ) -> float:
     """Get the absolute humidity (amount of water vapor in the air) in metric.
 
     Args:
-        temp_obj: A meteocalc.Temp object.
+        temperature_c: A temperature in Celsius.
         relative_humidity: A float representing relative humidity.
 
     Returns:
-        A float representing absolute humidity.
+        A float representing absolute humidity (in g/m³).
     """
-    return cast(
-        float,
-        (
-            6.112
-            * math.exp((17.67 * temp_obj.c) / (temp_obj.c + 243.5))
-            * relative_humidity
-            * 2.1674
-        )
-        / (273.15 + temp_obj.c),
-    )
+    return (
+        6.112
+        * math.exp((17.67 * temperature_c) / (temperature_c + 243.5))
+        * relative_humidity
+        * 2.1674
+    ) / (273.15 + temperature_c)
 
 
-def get_dew_point_meteocalc_object(
-    temperature: float, relative_humidity: float, unit_system: UnitSystem
-) -> meteocalc.Temp:
-    """Get a dew point meteocalc object.
+def get_dew_point_in_celsius(temperature_c: float, relative_humidity: float) -> float:
+    """Get the dew point.
 
     Args:
-        temperature: A float representing temperature.
+        temperature_c: A temperature in Celsius.
         relative_humidity: A float representing relative humidity.
-        unit_system: The target unit system.
 
     Returns:
-        A meteocalc.Temp object.
+        A dew point in Celsius.
+
+    Raises:
+        ValueError: Raised when the relative humidity is out of range.
     """
-    temp_obj = get_temperature_meteocalc_object(temperature, unit_system)
-    return meteocalc.dew_point(temp_obj, relative_humidity)
+    if relative_humidity < 1 or relative_humidity > 100:
+        raise ValueError(
+            f'Incorrect value for humidity: "{relative_humidity}". Correct range 1-100.'
+        )
 
+    b, c = (
+        DEW_POINT_CONSTANTS_POSITIVE
+        if temperature_c > 0
+        else DEW_POINT_CONSTANTS_NEGATIVE
+    )
+    log_pa = math.log(
+        relative_humidity / 100.0 * math.exp(b * temperature_c / (c + temperature_c))
+    )
+    return c * log_pa / (b - log_pa)
 
-def get_feels_like_meteocalc_object(
-    temperature: float,
-    relative_humidity: float,
-    wind_speed: float,
-    unit_system: UnitSystem,
-) -> meteocalc.Temp:
-    """Get a "feels like" meteocalc object.
+
+def get_feels_like_in_fahrenheit(
+    temperature_f: float, relative_humidity: float, wind_speed: float
+) -> float:
+    """Get the "feels like" temperature.
+
+    This is the wind chill in cold, windy weather, the heat index in hot weather, and
+    the temperature itself otherwise.
 
     Args:
-        temperature: A float representing temperature.
+        temperature_f: A temperature in Fahrenheit.
         relative_humidity: A float representing relative humidity.
         wind_speed: A float representing wind speed.
-        unit_system: The target unit system.
 
     Returns:
-        A meteocalc.Temp object.
+        A "feels like" temperature in Fahrenheit.
     """
-    temp_obj = get_temperature_meteocalc_object(temperature, unit_system)
-    return meteocalc.feels_like(temp_obj, relative_humidity, wind_speed)
+    if temperature_f <= 50 and wind_speed > 3:
+        return get_wind_chill_in_fahrenheit(temperature_f, wind_speed)
+    if temperature_f >= 80:
+        return get_heat_index_in_fahrenheit(temperature_f, relative_humidity)
+    return temperature_f
 
 
-def get_frost_point_meteocalc_object(
-    temp_obj: meteocalc.Temp, relative_humidity: float
-) -> meteocalc.Temp:
-    """Get a frost point meteocalc object.
+def get_frost_point_in_celsius(temperature_c: float, relative_humidity: float) -> float:
+    """Get the frost point.
 
     Args:
-        temp_obj: A meteocalc.Temp object.
+        temperature_c: A temperature in Celsius.
         relative_humidity: A float representing relative humidity.
 
     Returns:
-        A meteocalc.Temp object.
+        A frost point in Celsius.
     """
-    dew_point_obj = meteocalc.dew_point(temp_obj, relative_humidity)
-    absolute_temp_c = temp_obj.c + 273.15
-    absolute_dew_point_c = dew_point_obj.c + 273.15
+    return get_frost_point_from_dew_point_in_celsius(
+        temperature_c, get_dew_point_in_celsius(temperature_c, relative_humidity)
+    )
 
-    return get_temperature_meteocalc_object(
-        (
-            absolute_dew_point_c
-            + (
-                2671.02
-                / (
-                    (2954.61 / absolute_temp_c)
-                    + 2.193665 * math.log(absolute_temp_c)
-                    - 13.3448
-                )
+
+def get_frost_point_from_dew_point_in_celsius(
+    temperature_c: float, dew_point_c: float
+) -> float:
+    """Get the frost point from an already-calculated dew point.
+
+    Args:
+        temperature_c: A temperature in Celsius.
+        dew_point_c: A dew point in Celsius.
+
+    Returns:
+        A frost point in Celsius.
+    """
+    absolute_temp_c = temperature_c + 273.15
+    absolute_dew_point_c = dew_point_c + 273.15
+
+    return (
+        absolute_dew_point_c
+        + (
+            2671.02
+            / (
+                (2954.61 / absolute_temp_c)
+                + 2.193665 * math.log(absolute_temp_c)
+                - 13.3448
             )
-            - absolute_temp_c
         )
-        - 273.15,
-        UnitSystem.METRIC,
-    )
+        - absolute_temp_c
+    ) - 273.15
 
 
-def get_heat_index_meteocalc_object(
-    temperature: float,
-    relative_humidity: float,
-    unit_system: UnitSystem,
-) -> meteocalc.Temp:
-    """Get a heat index meteocalc object.
+def get_heat_index_in_fahrenheit(
+    temperature_f: float, relative_humidity: float
+) -> float:
+    """Get the heat index.
 
     Args:
-        temperature: A float representing temperature.
+        temperature_f: A temperature in Fahrenheit.
         relative_humidity: A float representing relative humidity.
-        unit_system: A target unit system.
 
     Returns:
-        A meteocalc.Temp object.
+        A heat index in Fahrenheit.
     """
-    temp_obj = get_temperature_meteocalc_object(temperature, unit_system)
-    return meteocalc.heat_index(temp_obj, relative_humidity)
+    # The simplified formula is used when the heat index is below 80°F:
+    heat_index = 0.5 * (
+        temperature_f + 61.0 + (temperature_f - 68.0) * 1.2 + relative_humidity * 0.094
+    )
+    if heat_index < 80:
+        return heat_index
 
+    # ...otherwise, the Rothfusz regression is:
+    return math.fsum(
+        (
+            HEAT_INDEX_C1,
+            HEAT_INDEX_C2 * temperature_f,
+            HEAT_INDEX_C3 * relative_humidity,
+            HEAT_INDEX_C4 * temperature_f * relative_humidity,
+            HEAT_INDEX_C5 * temperature_f**2,
+            HEAT_INDEX_C6 * relative_humidity**2,
+            HEAT_INDEX_C7 * temperature_f**2 * relative_humidity,
+            HEAT_INDEX_C8 * temperature_f * relative_humidity**2,
+            HEAT_INDEX_C9 * temperature_f**2 * relative_humidity**2,
+        )
+    )
 
-def get_humidex(
-    temperature: float, relative_humidity: float, unit_system: UnitSystem
-) -> int:
+
+def get_humidex(temperature_c: float, relative_humidity: float) -> int:
     """Get a humidex.
 
     Args:
-        temperature: A float representing temperature.
+        temperature_c: A temperature in Celsius.
         relative_humidity: A float representing relative humidity.
-        unit_system: The target unit system.
 
     Returns:
         The index.
     """
-    dew_point_obj = get_dew_point_meteocalc_object(
-        temperature, relative_humidity, unit_system
+    return get_humidex_from_dew_point(
+        temperature_c, get_dew_point_in_celsius(temperature_c, relative_humidity)
     )
-    temp_obj = get_temperature_meteocalc_object(temperature, unit_system)
-
-    return cast(
-        int,
-        round(
-            temp_obj.c
-            + (
-                0.5555
-                * (
-                    (
-                        6.11
-                        * math.exp(
-                            5417.7530
-                            * (
-                                (1 / 273.16)
-                                - (
-                                    1
-                                    / TemperatureConverter.convert(
-                                        dew_point_obj.c,
-                                        UnitOfTemperature.CELSIUS,
-                                        UnitOfTemperature.KELVIN,
-                                    )
-                                )
-                            )
-                        )
-                    )
-                    - 10
-                )
-            )
-        ),
+
+
+def get_humidex_from_dew_point(temperature_c: float, dew_point_c: float) -> int:
+    """Get a humidex from an already-calculated dew point.
+
+    Args:
+        temperature_c: A temperature in Celsius.
+        dew_point_c: A dew point in Celsius.
+
+    Returns:
+        The index.
+    """
+    dew_point_k = dew_point_c + 273.15
+    return round(
+        temperature_c
+        + 0.5555
+        * (6.11 * math.exp(5417.7530 * ((1 / 273.16) - (1 / dew_point_k))) - 10)
     )
 
 
-def get_relative_strain_index(
-    temperature: float, relative_humidity: float, unit_system: UnitSystem
-) -> float:
-    """Get a simmer index meteocalc object.
+def get_relative_strain_index(temperature_c: float, relative_humidity: float) -> float:
+    """Get a relative strain index.
 
     Args:
-        temperature: A float representing temperature.
+        temperature_c: A temperature in Celsius.
         relative_humidity: A float representing relative humidity.
-        unit_system: A target unit system.
 
     Returns:
         The index.
@@ -191,94 +247,109 @@ def get_relative_strain_index(
     Raises:
         ValueError: Raised when the index cannot be calculated.
     """
-    temp_obj = get_temperature_meteocalc_object(temperature, unit_system)
-
-    if temp_obj.c < 26 or temp_obj.c > 35:
+    if temperature_c < 26 or temperature_c > 35:
         raise ValueError(
             "Relative Strain Index is only valid for temperatures above 26°C and "
             "below 35°C"
         )
 
-    return cast(
-        float,
-        round(
-            (temp_obj.c - 21)
-            / (
-                58
-                - (
-                    relative_humidity
-                    * (6.112 * pow(10, 7.5 * temp_obj.c / (237.7 + temp_obj.c)))
-                    / 100
-                )
-            ),
-            2,
+    return round(
+        (temperature_c - 21)
+        / (
+            58
+            - (
+                relative_humidity
+                * (6.112 * pow(10, 7.5 * temperature_c / (237.7 + temperature_c)))
+                / 100
+            )
         ),
+        2,
     )
 
 
-def get_simmer_index_meteocalc_object(
-    temp_obj: meteocalc.Temp, relative_humidity: float, unit_system: UnitSystem
-) -> meteocalc.Temp:
-    """Get a simmer index meteocalc object.
+def get_simmer_index_in_fahrenheit(
+    temperature_f: float, relative_humidity: float
+) -> float:
+    """Get a simmer index.
 
     Args:
-        temp_obj: A meteocalc.Temp object.
+        temperature_f: A temperature in Fahrenheit.
         relative_humidity: A float representing relative humidity.
-        unit_system: A target unit system.
 
     Returns:
-        A meteocalc.Temp object (if it exists).
+        A simmer index in Fahrenheit.
 
     Raises:
         ValueError: Raised when the index cannot be calculated.
     """
-    if temp_obj.f < 70:
+    if temperature_f < 70:
         raise ValueError(
-            "Simmer Index is only valid for temperatures above "
-            f"{'70°F' if unit_system == UnitSystem.IMPERIAL else '21.1°C'}"
+            "Simmer Index is only valid for temperatures above 70°F (21.1°C)"
         )
 
-    return get_temperature_meteocalc_object(
-        (
-            1.98
-            * (temp_obj.f - (0.55 - (0.0055 * relative_humidity)) * (temp_obj.f - 58.0))
-            - 56.83
-        ),
-        UnitSystem.IMPERIAL,
+    return (
+        1.98
+        * (
+            temperature_f
+            - (0.55 - (0.0055 * relative_humidity)) * (temperature_f - 58.0)
+        )
+        - 56.83
     )
 
 
-def get_temperature_meteocalc_object(
-    temperature: float, unit_system: UnitSystem
-) -> meteocalc.Temp:
-    """Get a temperature meteocalc object.
+def get_temperature_in_celsius(temperature: float, unit_system: UnitSystem) -> float:
+    """Get a temperature in Celsius.
 
     Args:
         temperature: A float representing temperature.
-        unit_system: A target unit system.
+        unit_system: The unit system the temperature is in.
 
     Returns:
-        A meteocalc.Temp object.
+        A temperature in Celsius.
     """
     if unit_system == UnitSystem.IMPERIAL:
-        unit = "f"
-    else:
-        unit = "c"
-    return meteocalc.Temp(temperature, unit)
+        return fahrenheit_to_celsius(temperature)
+    return float(temperature)
 
 
-def get_wind_chill_meteocalc_object(
-    temperature: float, wind_speed: float, unit_system: UnitSystem
-) -> meteocalc.Temp:
-    """Get a wind chill meteocalc object.
+def get_temperature_in_fahrenheit(temperature: float, unit_system: UnitSystem) -> float:
+    """Get a temperature in Fahrenheit.
 
     Args:
         temperature: A float representing temperature.
+        unit_system: The unit system the temperature is in.
+
+    Returns:
+        A temperature in Fahrenheit.
+    """
+    if unit_system == UnitSystem.IMPERIAL:
+        return float(temperature)
+    return celsius_to_fahrenheit(temperature)
+
+
+def get_wind_chill_in_fahrenheit(temperature_f: float, wind_speed: float) -> float:
+    """Get a wind chill.
+
+    Args:
+        temperature_f: A temperature in Fahrenheit.
         wind_speed: A float representing wind speed.
-        unit_system: A target unit system.
 
     Returns:
-        A meteocalc.Temp object.
+        A wind chill in Fahrenheit.
+
+    Raises:
+        ValueError: Raised when the wind chill cannot be calculated.
     """
-    temp_obj = get_temperature_meteocalc_object(temperature, unit_system)
-    return meteocalc.wind_chill(temp_obj, wind_speed)
+    if temperature_f > 50 or wind_speed <= 3:
+        raise ValueError(
+            "Wind Chill Temperature is only defined for temperatures at or below 50 F "
+            "and wind speeds above 3 mph."
+        )
+
+    wind_speed_factor = math.pow(wind_speed, 0.16)
+    return (
+        35.74
+        + (0.6215 * temperature_f)
+        - 35.75 * wind_speed_factor
+        + 0.4275 * temperature_f * wind_speed_factor
+    )
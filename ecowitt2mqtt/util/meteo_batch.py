@@ -0,0 +1,190 @@
+"""Define meteorological calculations over batches of values.
+
+If NumPy is installed, each calculation is done for a whole batch at once; otherwise
+(or for batches too small to be worth it), every value goes through the scalar
+functions in util.meteo. Both produce the same results (give or take the last bit of a
+float).
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from ecowitt2mqtt.util.meteo import (
+    DEW_POINT_CONSTANTS_NEGATIVE,
+    DEW_POINT_CONSTANTS_POSITIVE,
+    HEAT_INDEX_C1,
+    HEAT_INDEX_C2,
+    HEAT_INDEX_C3,
+    HEAT_INDEX_C4,
+    HEAT_INDEX_C5,
+    HEAT_INDEX_C6,
+    HEAT_INDEX_C7,
+    HEAT_INDEX_C8,
+    HEAT_INDEX_C9,
+    get_absolute_humidity_in_metric,
+    get_dew_point_in_celsius,
+    get_frost_point_from_dew_point_in_celsius,
+    get_heat_index_in_fahrenheit,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+# Below this many values (e.g., the eight channels of a single payload), NumPy's
+# per-call overhead outweighs what it saves:
+NUMPY_MIN_BATCH_SIZE = 64
+
+
+@dataclass(frozen=True)
+class HumidityMetrics:
+    """Define the humidity-derived metrics of a batch of temperature/humidity pairs.
+
+    Each attribute holds one value per pair (in order); dew and frost points are None
+    for pairs whose relative humidity is out of range.
+    """
+
+    absolute_humidity: list[float]
+    dew_point_c: list[float | None]
+    frost_point_c: list[float | None]
+    heat_index_f: list[float]
+
+
+def get_humidity_metrics(
+    temperatures_c: Sequence[float],
+    temperatures_f: Sequence[float],
+    relative_humidities: Sequence[float],
+) -> HumidityMetrics:
+    """Get the humidity-derived metrics of a batch of temperature/humidity pairs.
+
+    Args:
+        temperatures_c: The temperatures in Celsius.
+        temperatures_f: The same temperatures in Fahrenheit.
+        relative_humidities: The relative humidities.
+
+    Returns:
+        A HumidityMetrics object.
+    """
+    if np is not None and len(temperatures_c) >= NUMPY_MIN_BATCH_SIZE:
+        return _get_humidity_metrics_numpy(
+            temperatures_c, temperatures_f, relative_humidities
+        )
+
+    absolute_humidity: list[float] = []
+    dew_point_c: list[float | None] = []
+    frost_point_c: list[float | None] = []
+    heat_index_f: list[float] = []
+
+    for temperature_c, temperature_f, relative_humidity in zip(
+        temperatures_c, temperatures_f, relative_humidities
+    ):
+        absolute_humidity.append(
+            get_absolute_humidity_in_metric(temperature_c, relative_humidity)
+        )
+        heat_index_f.append(
+            get_heat_index_in_fahrenheit(temperature_f, relative_humidity)
+        )
+        try:
+            dew_point = get_dew_point_in_celsius(temperature_c, relative_humidity)
+        except ValueError:
+            dew_point_c.append(None)
+            frost_point_c.append(None)
+        else:
+            dew_point_c.append(dew_point)
+            frost_point_c.append(
+                get_frost_point_from_dew_point_in_celsius(temperature_c, dew_point)
+            )
+
+    return HumidityMetrics(absolute_humidity, dew_point_c, frost_point_c, heat_index_f)
+
+
+def _get_humidity_metrics_numpy(
+    temperatures_c: Sequence[float],
+    temperatures_f: Sequence[float],
+    relative_humidities: Sequence[float],
+) -> HumidityMetrics:
+    """Get the humidity-derived metrics of a batch of pairs with NumPy.
+
+    Args:
+        temperatures_c: The temperatures in Celsius.
+        temperatures_f: The same temperatures in Fahrenheit.
+        relative_humidities: The relative humidities.
+
+    Returns:
+        A HumidityMetrics object.
+    """
+    temp_c = np.asarray(temperatures_c, dtype=np.float64)
+    temp_f = np.asarray(temperatures_f, dtype=np.float64)
+    humidity = np.asarray(relative_humidities, dtype=np.float64)
+
+    absolute_humidity = (
+        6.112 * np.exp((17.67 * temp_c) / (temp_c + 243.5)) * humidity * 2.1674
+    ) / (273.15 + temp_c)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        positive = temp_c > 0
+        b = np.where(
+            positive, DEW_POINT_CONSTANTS_POSITIVE[0], DEW_POINT_CONSTANTS_NEGATIVE[0]
+        )
+        c = np.where(
+            positive, DEW_POINT_CONSTANTS_POSITIVE[1], DEW_POINT_CONSTANTS_NEGATIVE[1]
+        )
+        log_pa = np.log(humidity / 100.0 * np.exp(b * temp_c / (c + temp_c)))
+        dew_point_c = np.where(
+            (humidity < 1) | (humidity > 100), np.nan, c * log_pa / (b - log_pa)
+        )
+
+    absolute_temp_c = temp_c + 273.15
+    frost_point_c = (
+        dew_point_c
+        + 273.15
+        + (
+            2671.02
+            / (
+                (2954.61 / absolute_temp_c)
+                + 2.193665 * np.log(absolute_temp_c)
+                - 13.3448
+            )
+        )
+        - absolute_temp_c
+    ) - 273.15
+
+    simple_heat_index_f = 0.5 * (
+        temp_f + 61.0 + (temp_f - 68.0) * 1.2 + humidity * 0.094
+    )
+    heat_index_f = np.where(
+        simple_heat_index_f < 80,
+        simple_heat_index_f,
+        HEAT_INDEX_C1
+        + HEAT_INDEX_C2 * temp_f
+        + HEAT_INDEX_C3 * humidity
+        + HEAT_INDEX_C4 * temp_f * humidity
+        + HEAT_INDEX_C5 * temp_f**2
+        + HEAT_INDEX_C6 * humidity**2
+        + HEAT_INDEX_C7 * temp_f**2 * humidity
+        + HEAT_INDEX_C8 * temp_f * humidity**2
+        + HEAT_INDEX_C9 * temp_f**2 * humidity**2,
+    )
+
+    return HumidityMetrics(
+        absolute_humidity.tolist(),
+        _nan_to_none(dew_point_c.tolist()),
+        _nan_to_none(frost_point_c.tolist()),
+        heat_index_f.tolist(),
+    )
+
+
+def _nan_to_none(values: list[float]) -> list[float | None]:
+    """Replace the NaNs in a list of floats with None.
+
+    Args:
+        values: A list of floats.
+
+    Returns:
+        A list of floats (or None).
+    """
+    return [None if math.isnan(value) else value for value in values]
@@ -0,0 +1,43 @@
+"""Define network utilities."""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+class BrokerAddress(NamedTuple):
+    """Define the address of an MQTT broker."""
+
+    host: str
+    port: int
+
+    def __str__(self) -> str:
+        """Define a string representation of this object.
+
+        Returns:
+            A string representation.
+        """
+        return f"{self.host}:{self.port}"
+
+
+def parse_broker_address(value: str, default_port: int) -> BrokerAddress:
+    """Parse a broker address in the "host" or "host:port" format.
+
+    IPv6 addresses must be wrapped in brackets when they come with a port (e.g.,
+    "[::1]:1883").
+
+    Args:
+        value: The broker address.
+        default_port: The port to use if the address doesn't include one.
+
+    Returns:
+        A BrokerAddress object.
+
+    Raises:
+        ValueError: Raised if the port is invalid.
+    """
+    host, separator, port = value.rpartition(":")
+    if not separator or (":" in host and not host.endswith("]")):
+        # There's no port (or the address is a bare IPv6 address):
+        return BrokerAddress(value.strip("[]"), default_port)
+    return BrokerAddress(host.strip("[]"), int(port))
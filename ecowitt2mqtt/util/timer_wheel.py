@@ -0,0 +1,104 @@
+"""Define a hashed timer wheel."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+DEFAULT_SLOT_COUNT = 512
+
+_KeyT = TypeVar("_KeyT", bound=Hashable)
+
+
+class TimerWheel(Generic[_KeyT]):
+    """Define a hashed timer wheel that tracks deadlines for many keys at once.
+
+    Time is divided into ticks (of a given resolution) and each key lives in the slot
+    that its deadline tick hashes to. Scheduling, rescheduling, and cancelling a key
+    are O(1); advancing the wheel only visits the slots for the ticks that have passed
+    (at most one full revolution), so the cost of tracking a key doesn't depend on how
+    many other keys are being tracked.
+    """
+
+    def __init__(
+        self, resolution: float, *, slot_count: int = DEFAULT_SLOT_COUNT
+    ) -> None:
+        """Initialize.
+
+        Args:
+            resolution: The length of a tick (in seconds).
+            slot_count: The number of slots in the wheel.
+        """
+        self._current_tick = -1
+        self._deadlines: dict[_KeyT, int] = {}
+        self._resolution = resolution
+        self._slots: list[set[_KeyT]] = [set() for _ in range(slot_count)]
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a key has a pending deadline.
+
+        Args:
+            key: The key to check.
+
+        Returns:
+            Whether the key has a pending deadline.
+        """
+        return key in self._deadlines
+
+    def __len__(self) -> int:
+        """Return the number of keys with a pending deadline.
+
+        Returns:
+            A key count.
+        """
+        return len(self._deadlines)
+
+    def advance(self, now: float) -> list[_KeyT]:
+        """Advance the wheel to a point in time.
+
+        Args:
+            now: The current time (in seconds).
+
+        Returns:
+            The keys whose deadlines have passed (which are no longer tracked).
+        """
+        target_tick = math.floor(now / self._resolution)
+        slot_count = len(self._slots)
+        expired: list[_KeyT] = []
+
+        # If more than a revolution has passed, every slot only needs a single visit:
+        for tick in range(
+            max(self._current_tick + 1, target_tick - slot_count + 1), target_tick + 1
+        ):
+            slot = self._slots[tick % slot_count]
+            # Keys in this slot may belong to a later revolution, so check each one:
+            for key in [key for key in slot if self._deadlines[key] <= target_tick]:
+                slot.remove(key)
+                del self._deadlines[key]
+                expired.append(key)
+
+        self._current_tick = max(self._current_tick, target_tick)
+        return expired
+
+    def cancel(self, key: _KeyT) -> None:
+        """Stop tracking a key (if it is being tracked).
+
+        Args:
+            key: The key to stop tracking.
+        """
+        if (tick := self._deadlines.pop(key, None)) is not None:
+            self._slots[tick % len(self._slots)].discard(key)
+
+    def schedule(self, key: _KeyT, deadline: float) -> None:
+        """Set the deadline of a key (replacing any existing deadline).
+
+        Args:
+            key: The key to track.
+            deadline: The time (in seconds) at which the key expires.
+        """
+        self.cancel(key)
+        # A deadline that falls in a tick we've already passed expires on the next one:
+        tick = max(math.ceil(deadline / self._resolution), self._current_tick + 1)
+        self._deadlines[key] = tick
+        self._slots[tick % len(self._slots)].add(key)
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
 
 from ecowitt2mqtt.backports.enum import StrEnum
 from ecowitt2mqtt.const import (
@@ -53,6 +56,19 @@ _POUND_TO_GRAM = 453.59237
 _STANDARD_GRAVITY = 9.80665
 _MERCURY_DENSITY = 13.5951
 
+# Temperature conversion constants (the offset and divisor that convert each unit to
+# Celsius and the multiplier and offset that convert Celsius to each unit):
+_TO_CELSIUS: dict[str, tuple[float, float]] = {
+    UnitOfTemperature.CELSIUS: (0.0, 1.0),
+    UnitOfTemperature.FAHRENHEIT: (-32.0, 1.8),
+    UnitOfTemperature.KELVIN: (-273.15, 1.0),
+}
+_FROM_CELSIUS: dict[str, tuple[float, float]] = {
+    UnitOfTemperature.CELSIUS: (1.0, 0.0),
+    UnitOfTemperature.FAHRENHEIT: (1.8, 32.0),
+    UnitOfTemperature.KELVIN: (1.0, 273.15),
+}
+
 # Volume conversion constants:
 _CUBIC_FOOT_TO_CUBIC_METER = pow(_FOOT_TO_M, 3)
 
@@ -63,8 +79,49 @@ class UnitConversionError(EcowittError):
     pass
 
 
+@dataclass(frozen=True)
+class UnitConversion:
+    """Define a conversion from one unit of measurement to another.
+
+    A value is converted as ((value + offset_in) / divisor) * multiplier + offset_out
+    (leaving out zero offsets); then, it is rounded to its own precision plus
+    precision_offset digits.
+    """
+
+    divisor: float
+    multiplier: float
+    precision_offset: int
+    offset_in: float = 0.0
+    offset_out: float = 0.0
+
+    def convert(self, value: float) -> float:
+        """Convert a value.
+
+        Args:
+            value: The value to convert.
+
+        Returns:
+            A converted value.
+        """
+        if self.offset_in:
+            value = value + self.offset_in
+        value = value / self.divisor * self.multiplier
+        if self.offset_out:
+            value = value + self.offset_out
+
+        value_s = str(value)
+        precision = len(value_s) - value_s.index(".") - 1 if "." in value_s else 0
+        precision = precision + self.precision_offset
+        return round(value) if precision == 0 else round(value, precision)
+
+
 class BaseUnitConverter:
-    """Define the format of a conversion utility."""
+    """Define the format of a conversion utility.
+
+    Every pair of units a subclass supports is compiled into a UnitConversion when the
+    subclass is defined, so converting a value doesn't have to look up (or validate) its
+    units again.
+    """
 
     UNIT_CLASS: str
     VALID_UNITS: type[StrEnum]
@@ -73,45 +130,76 @@ class BaseUnitConverter:
     # documentation:
     NORMALIZED_UNIT: str
 
+    _CONVERSIONS: dict[tuple[str, str], UnitConversion]
     _UNIT_CONVERSION: dict[str, float]
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Compile the conversions between every pair of units of a subclass.
+
+        Args:
+            **kwargs: Keyword arguments for the superclass.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._CONVERSIONS = {
+            (from_unit, to_unit): cls._compile_conversion(from_unit, to_unit)
+            for from_unit in cls._UNIT_CONVERSION
+            for to_unit in cls._UNIT_CONVERSION
+            if from_unit != to_unit
+        }
+
     @classmethod
-    def _trim_value_precision_to_ratio(
-        cls, value: float, from_unit: str, to_unit: str
-    ) -> float:
-        """Trim a value to the appropriate precision using the unit ratio.
+    def _compile_conversion(cls, from_unit: str, to_unit: str) -> UnitConversion:
+        """Compile the conversion between two units of measurement.
 
         Args:
-            value: The value to trim.
             from_unit: The unit we are converting from.
             to_unit: The unit we are converting to.
 
         Returns:
-            A trimmed value.
+            A UnitConversion object.
         """
-        value_s = str(value)
-        precision = len(value_s) - value_s.index(".") - 1 if "." in value_s else 0
-        ratio_log = max(0, math.log10(cls.get_unit_ratio(from_unit, to_unit)))
-        precision = precision + math.floor(ratio_log)
-        return round(value) if precision == 0 else round(value, precision)
+        return UnitConversion(
+            cls._UNIT_CONVERSION[from_unit],
+            cls._UNIT_CONVERSION[to_unit],
+            cls._get_precision_offset(from_unit, to_unit),
+        )
 
     @classmethod
-    def _validate_unit(cls, unit: str) -> None:
-        """Validate a unit of measurement.
+    def _get_conversion(cls, from_unit: str, to_unit: str) -> UnitConversion:
+        """Get the compiled conversion between two units of measurement.
 
         Args:
-            unit: The unit to validate.
+            from_unit: The unit we are converting from.
+            to_unit: The unit we are converting to.
+
+        Returns:
+            A UnitConversion object.
 
         Raises:
-            ValueError: Raised when a unit is not recognized.
+            UnitConversionError: Raised when a unit cannot be recognized.
         """
         try:
-            cls.VALID_UNITS(unit)
-        except ValueError as err:
+            return cls._CONVERSIONS[(from_unit, to_unit)]
+        except KeyError as err:
+            # Every pair of valid units is compiled, so one of them isn't valid:
+            unit = to_unit if from_unit in cls._UNIT_CONVERSION else from_unit
             raise UnitConversionError(
                 UNIT_NOT_RECOGNIZED_TEMPLATE.format(unit, cls.UNIT_CLASS)
             ) from err
 
+    @classmethod
+    def _get_precision_offset(cls, from_unit: str, to_unit: str) -> int:
+        """Get the number of digits of precision that converting between units adds.
+
+        Args:
+            from_unit: The unit we are converting from.
+            to_unit: The unit we are converting to.
+
+        Returns:
+            A number of digits.
+        """
+        return math.floor(max(0, math.log10(cls.get_unit_ratio(from_unit, to_unit))))
+
     @classmethod
     def convert(cls, value: float, from_unit: str, to_unit: str) -> float:
         """Convert one unit of measurement to another.
@@ -123,21 +211,41 @@ class BaseUnitConverter:
 
         Returns:
             A converted value.
-
-        Raises:
-            UnitConversionError: Raised when a unit cannot be recognized.
         """
         if from_unit == to_unit:
             return value
+        return cls._get_conversion(from_unit, to_unit).convert(value)
 
-        for unit in (from_unit, to_unit):
-            cls._validate_unit(unit)
+    @classmethod
+    def convert_many(
+        cls, values: Iterable[float], from_unit: str, to_unit: str
+    ) -> list[float]:
+        """Convert a series of values from one unit of measurement to another.
 
-        from_ratio = cls._UNIT_CONVERSION[from_unit]
-        to_ratio = cls._UNIT_CONVERSION[to_unit]
-        value = value / from_ratio
-        value = value * to_ratio
-        return cls._trim_value_precision_to_ratio(value, from_unit, to_unit)
+        The result is the same as converting each value on its own, but the conversion
+        is only looked up once.
+
+        Args:
+            values: The values to convert (e.g., a list, an array.array, or a NumPy
+                array).
+            from_unit: The unit we are converting from.
+            to_unit: The unit we are converting to.
+
+        Returns:
+            A list of converted values.
+        """
+        if (tolist := getattr(values, "tolist", None)) is not None:
+            # Convert array.array and NumPy array items to floats in one go:
+            values = tolist()
+        if from_unit == to_unit:
+            return list(values)
+
+        if (conversion := cls._CONVERSIONS.get((from_unit, to_unit))) is None:
+            # Some converters handle units that aren't compiled (e.g., percentages);
+            # invalid units raise from here, too:
+            return [cls.convert(value, from_unit, to_unit) for value in values]
+        convert = conversion.convert
+        return [convert(value) for value in values]
 
     @classmethod
     def get_unit_ratio(cls, from_unit: str, to_unit: str) -> float:
@@ -299,94 +407,29 @@ class TemperatureConverter(BaseUnitConverter):
     }
 
     @classmethod
-    def _celsius_to_fahrenheit(cls, celsius: float) -> float:
-        """Convert a temperature in Celsius to Fahrenheit.
-
-        Args:
-            celsius: A Celsius temperature
-
-        Returns:
-            A converted temperature.
-        """
-        return celsius * 1.8 + 32.0
-
-    @classmethod
-    def _celsius_to_kelvin(cls, celsius: float) -> float:
-        """Convert a temperature in Celsius to Kelvin.
-
-        Args:
-            celsius: A Celsius temperature
-
-        Returns:
-            A converted temperature.
-        """
-        return celsius + 273.15
-
-    @classmethod
-    def _fahrenheit_to_celsius(cls, fahrenheit: float) -> float:
-        """Convert a temperature in Fahrenheit to Celsius.
-
-        Args:
-            fahrenheit: A Fahrenheit temperature
-
-        Returns:
-            A converted temperature.
-        """
-        return (fahrenheit - 32.0) / 1.8
-
-    @classmethod
-    def _kelvin_to_celsius(cls, kelvin: float) -> float:
-        """Convert a temperature in Kelvin to Celsius.
-
-        Args:
-            kelvin: A Kelvin temperature
-
-        Returns:
-            A converted temperature.
-        """
-        return kelvin - 273.15
-
-    @classmethod
-    def convert(cls, value: float, from_unit: str, to_unit: str) -> float:
-        """Convert a temperature from one unit to another.
+    def _compile_conversion(cls, from_unit: str, to_unit: str) -> UnitConversion:
+        """Compile the conversion between two temperature units.
 
         We cannot use the implementation from BaseUnitConverter because the temperature
-        units do not use the same floor (0°C and 0°F do not align).
+        units do not use the same floor (0°C and 0°F do not align); every conversion
+        goes through Celsius instead.
 
         Args:
-            value: The value to convert.
             from_unit: The unit we are converting from.
             to_unit: The unit we are converting to.
 
         Returns:
-            A converted value.
-
-        Raises:
-            UnitConversionError: Raised when a unit cannot be recognized.
+            A UnitConversion object.
         """
-        if from_unit == to_unit:
-            return value
-
-        for unit in (from_unit, to_unit):
-            cls._validate_unit(unit)
-
-        if from_unit == UnitOfTemperature.CELSIUS:
-            if to_unit == UnitOfTemperature.FAHRENHEIT:
-                value = cls._celsius_to_fahrenheit(value)
-            elif to_unit == UnitOfTemperature.KELVIN:
-                value = cls._celsius_to_kelvin(value)
-        elif from_unit == UnitOfTemperature.FAHRENHEIT:
-            if to_unit == UnitOfTemperature.CELSIUS:
-                value = cls._fahrenheit_to_celsius(value)
-            elif to_unit == UnitOfTemperature.KELVIN:
-                value = cls._celsius_to_kelvin(cls._fahrenheit_to_celsius(value))
-        elif from_unit == UnitOfTemperature.KELVIN:
-            if to_unit == UnitOfTemperature.CELSIUS:
-                value = cls._kelvin_to_celsius(value)
-            if to_unit == UnitOfTemperature.FAHRENHEIT:
-                value = cls._celsius_to_fahrenheit(cls._kelvin_to_celsius(value))
-
-        return cls._trim_value_precision_to_ratio(value, from_unit, to_unit)
+        offset_in, divisor = _TO_CELSIUS[from_unit]
+        multiplier, offset_out = _FROM_CELSIUS[to_unit]
+        return UnitConversion(
+            divisor,
+            multiplier,
+            cls._get_precision_offset(from_unit, to_unit),
+            offset_in=offset_in,
+            offset_out=offset_out,
+        )
 
 
 class VolumeConverter(BaseUnitConverter):
@@ -89,9 +89,25 @@ def mock_aiomqtt_client_fixture(mqtt_publish_side_effect: AsyncMock) -> MagicMoc
         connect=AsyncMock(),
         disconnect=AsyncMock(),
         publish=AsyncMock(side_effect=mqtt_publish_side_effect),
+        subscribe=AsyncMock(),
     )
 
 
+@pytest.fixture(name="mock_aiomqtt_client_class")
+def mock_aiomqtt_client_class_fixture(mock_aiomqtt_client: MagicMock) -> MagicMock:
+    """Define a mock asyncio-mqtt Client class.
+
+    Args:
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+
+    Returns:
+        A mocked asyncio-mqtt Client class.
+    """
+    mock_client_class = MagicMock()
+    mock_client_class.return_value.__aenter__.return_value = mock_aiomqtt_client
+    return mock_client_class
+
+
 @pytest_asyncio.fixture(name="mqtt_publish_side_effect")
 async def mqtt_publish_side_effect_fixture() -> AsyncMock:
     """Define a fixture for the return value of a MQTT client publish.
@@ -114,15 +130,14 @@ def raw_config_fixture() -> str:
 
 @pytest_asyncio.fixture(name="setup_aiomqtt")
 async def setup_aiomqtt_fixture(
-    mock_aiomqtt_client: MagicMock,
+    mock_aiomqtt_client_class: MagicMock,
 ) -> AsyncGenerator[None]:
     """Define a fixture to patch asyncio-mqtt properly.
 
     Args:
-        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        mock_aiomqtt_client_class: A mocked aiomqtt Client class.
     """
-    with patch("ecowitt2mqtt.runtime.Client") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_aiomqtt_client
+    with patch("ecowitt2mqtt.runtime.Client", mock_aiomqtt_client_class):
         yield
 
 
@@ -426,6 +426,34 @@ def test_battery_config(device_data: dict[str, Any], ecowitt: Ecowitt) -> None:
             attributes={},
             data_type=DataPointType.NON_BOOLEAN,
         ),
+        "dewpoint1": CalculatedDataPoint(
+            data_point_key="dewpoint",
+            value=58.13706901331017,
+            unit=UnitOfTemperature.FAHRENHEIT,
+            attributes={},
+            data_type=DataPointType.NON_BOOLEAN,
+        ),
+        "frostrisk1": CalculatedDataPoint(
+            data_point_key="frostrisk",
+            value=FrostRisk.NO_RISK,
+            unit=None,
+            attributes={},
+            data_type=DataPointType.NON_BOOLEAN,
+        ),
+        "heatindex1": CalculatedDataPoint(
+            data_point_key="heatindex",
+            value=77.56700000000001,
+            unit=UnitOfTemperature.FAHRENHEIT,
+            attributes={},
+            data_type=DataPointType.NON_BOOLEAN,
+        ),
+        "humidityabs1": CalculatedDataPoint(
+            data_point_key="humidityabs",
+            value=0.000749306954633812,
+            unit=UnitOfVolume.POUNDS_PER_CUBIC_FOOT,
+            attributes={},
+            data_type=DataPointType.NON_BOOLEAN,
+        ),
     }
 
 
@@ -809,6 +837,34 @@ def test_default_battery_strategy(
             attributes={},
             data_type=DataPointType.NON_BOOLEAN,
         ),
+        "dewpoint1": CalculatedDataPoint(
+            data_point_key="dewpoint",
+            value=58.13706901331017,
+            unit=UnitOfTemperature.FAHRENHEIT,
+            attributes={},
+            data_type=DataPointType.NON_BOOLEAN,
+        ),
+        "frostrisk1": CalculatedDataPoint(
+            data_point_key="frostrisk",
+            value=FrostRisk.NO_RISK,
+            unit=None,
+            attributes={},
+            data_type=DataPointType.NON_BOOLEAN,
+        ),
+        "heatindex1": CalculatedDataPoint(
+            data_point_key="heatindex",
+            value=77.56700000000001,
+            unit=UnitOfTemperature.FAHRENHEIT,
+            attributes={},
+            data_type=DataPointType.NON_BOOLEAN,
+        ),
+        "humidityabs1": CalculatedDataPoint(
+            data_point_key="humidityabs",
+            value=0.000749306954633812,
+            unit=UnitOfVolume.POUNDS_PER_CUBIC_FOOT,
+            attributes={},
+            data_type=DataPointType.NON_BOOLEAN,
+        ),
     }
 
 
@@ -663,6 +663,30 @@ def test_missing_distance(device_data: dict[str, Any], ecowitt: Ecowitt) -> None
     }
 
 
+@pytest.mark.parametrize("device_data_filename", ["payload_gw2000a_2.json"])
+def test_invalid_humidity(device_data: dict[str, Any], ecowitt: Ecowitt) -> None:
+    """Test that data points derived from the dew point are unavailable.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: An Ecowitt object.
+    """
+    device_data["humidity"] = "0"
+    processed_data = ProcessedData(ecowitt.configs.default_config, device_data)
+
+    for data_point_key in (
+        "dewpoint",
+        "frostpoint",
+        "frostrisk",
+        "humidex",
+        "humidex_perception",
+        "thermalperception",
+    ):
+        assert processed_data.output[data_point_key].value is None
+    assert processed_data.output["humidityabs"].value == 0.0
+    assert processed_data.output["heatindex"].value is not None
+
+
 def test_nonnumeric_value(device_data: dict[str, Any], ecowitt: Ecowitt) -> None:
     """Test a value that can't be parsed as a number.
 
@@ -2537,6 +2561,34 @@ def test_precision(device_data: dict[str, Any], ecowitt: Ecowitt) -> None:
                     attributes={},
                     data_type=DataPointType.NON_BOOLEAN,
                 ),
+                "dewpoint1": CalculatedDataPoint(
+                    data_point_key="dewpoint",
+                    value=58.13706901331017,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "frostrisk1": CalculatedDataPoint(
+                    data_point_key="frostrisk",
+                    value=FrostRisk.NO_RISK,
+                    unit=None,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "heatindex1": CalculatedDataPoint(
+                    data_point_key="heatindex",
+                    value=77.56700000000001,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "humidityabs1": CalculatedDataPoint(
+                    data_point_key="humidityabs",
+                    value=0.000749306954633812,
+                    unit=UnitOfVolume.POUNDS_PER_CUBIC_FOOT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
             },
         ),
         (
@@ -4485,6 +4537,230 @@ def test_precision(device_data: dict[str, Any], ecowitt: Ecowitt) -> None:
                     attributes={},
                     data_type=DataPointType.NON_BOOLEAN,
                 ),
+                "dewpoint1": CalculatedDataPoint(
+                    data_point_key="dewpoint",
+                    value=57.06844609238176,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "frostrisk1": CalculatedDataPoint(
+                    data_point_key="frostrisk",
+                    value=FrostRisk.NO_RISK,
+                    unit=None,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "heatindex1": CalculatedDataPoint(
+                    data_point_key="heatindex",
+                    value=70.887,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "humidityabs1": CalculatedDataPoint(
+                    data_point_key="humidityabs",
+                    value=0.0007296348474644097,
+                    unit=UnitOfVolume.POUNDS_PER_CUBIC_FOOT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "dewpoint2": CalculatedDataPoint(
+                    data_point_key="dewpoint",
+                    value=55.674376031172166,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "frostrisk2": CalculatedDataPoint(
+                    data_point_key="frostrisk",
+                    value=FrostRisk.NO_RISK,
+                    unit=None,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "heatindex2": CalculatedDataPoint(
+                    data_point_key="heatindex",
+                    value=70.746,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "humidityabs2": CalculatedDataPoint(
+                    data_point_key="humidityabs",
+                    value=0.0006937511664415698,
+                    unit=UnitOfVolume.POUNDS_PER_CUBIC_FOOT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "dewpoint3": CalculatedDataPoint(
+                    data_point_key="dewpoint",
+                    value=56.40994867547506,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "frostrisk3": CalculatedDataPoint(
+                    data_point_key="frostrisk",
+                    value=FrostRisk.NO_RISK,
+                    unit=None,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "heatindex3": CalculatedDataPoint(
+                    data_point_key="heatindex",
+                    value=70.117,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "humidityabs3": CalculatedDataPoint(
+                    data_point_key="humidityabs",
+                    value=0.0007134066749998285,
+                    unit=UnitOfVolume.POUNDS_PER_CUBIC_FOOT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "dewpoint4": CalculatedDataPoint(
+                    data_point_key="dewpoint",
+                    value=57.357006912336686,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "frostrisk4": CalculatedDataPoint(
+                    data_point_key="frostrisk",
+                    value=FrostRisk.NO_RISK,
+                    unit=None,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "heatindex4": CalculatedDataPoint(
+                    data_point_key="heatindex",
+                    value=72.726,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "humidityabs4": CalculatedDataPoint(
+                    data_point_key="humidityabs",
+                    value=0.0007348305885348104,
+                    unit=UnitOfVolume.POUNDS_PER_CUBIC_FOOT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "dewpoint5": CalculatedDataPoint(
+                    data_point_key="dewpoint",
+                    value=60.033821495607135,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "frostrisk5": CalculatedDataPoint(
+                    data_point_key="frostrisk",
+                    value=FrostRisk.NO_RISK,
+                    unit=None,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "heatindex5": CalculatedDataPoint(
+                    data_point_key="heatindex",
+                    value=70.713,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "humidityabs5": CalculatedDataPoint(
+                    data_point_key="humidityabs",
+                    value=0.0008121764929882305,
+                    unit=UnitOfVolume.POUNDS_PER_CUBIC_FOOT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "dewpoint6": CalculatedDataPoint(
+                    data_point_key="dewpoint",
+                    value=57.076598097227645,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "frostrisk6": CalculatedDataPoint(
+                    data_point_key="frostrisk",
+                    value=FrostRisk.NO_RISK,
+                    unit=None,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "heatindex6": CalculatedDataPoint(
+                    data_point_key="heatindex",
+                    value=72.396,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "humidityabs6": CalculatedDataPoint(
+                    data_point_key="humidityabs",
+                    value=0.0007278414269704565,
+                    unit=UnitOfVolume.POUNDS_PER_CUBIC_FOOT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "dewpoint7": CalculatedDataPoint(
+                    data_point_key="dewpoint",
+                    value=49.91226462486226,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "frostrisk7": CalculatedDataPoint(
+                    data_point_key="frostrisk",
+                    value=FrostRisk.NO_RISK,
+                    unit=None,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "heatindex7": CalculatedDataPoint(
+                    data_point_key="heatindex",
+                    value=66.04799999999999,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "humidityabs7": CalculatedDataPoint(
+                    data_point_key="humidityabs",
+                    value=0.0005656272974391719,
+                    unit=UnitOfVolume.POUNDS_PER_CUBIC_FOOT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "dewpoint8": CalculatedDataPoint(
+                    data_point_key="dewpoint",
+                    value=51.72964501034069,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "frostrisk8": CalculatedDataPoint(
+                    data_point_key="frostrisk",
+                    value=FrostRisk.NO_RISK,
+                    unit=None,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "heatindex8": CalculatedDataPoint(
+                    data_point_key="heatindex",
+                    value=67.132,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "humidityabs8": CalculatedDataPoint(
+                    data_point_key="humidityabs",
+                    value=0.0006040393491759256,
+                    unit=UnitOfVolume.POUNDS_PER_CUBIC_FOOT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
             },
         ),
         (
@@ -4923,6 +5199,34 @@ def test_precision(device_data: dict[str, Any], ecowitt: Ecowitt) -> None:
                     attributes={},
                     data_type=DataPointType.NON_BOOLEAN,
                 ),
+                "dewpoint1": CalculatedDataPoint(
+                    data_point_key="dewpoint",
+                    value=55.92645325304791,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "frostrisk1": CalculatedDataPoint(
+                    data_point_key="frostrisk",
+                    value=FrostRisk.NO_RISK,
+                    unit=None,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "heatindex1": CalculatedDataPoint(
+                    data_point_key="heatindex",
+                    value=65.983,
+                    unit=UnitOfTemperature.FAHRENHEIT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
+                "humidityabs1": CalculatedDataPoint(
+                    data_point_key="humidityabs",
+                    value=0.0007063854035432051,
+                    unit=UnitOfVolume.POUNDS_PER_CUBIC_FOOT,
+                    attributes={},
+                    data_type=DataPointType.NON_BOOLEAN,
+                ),
             },
         ),
         (
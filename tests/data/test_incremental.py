@@ -0,0 +1,98 @@
+"""Define tests for incremental data processing."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+from ecowitt2mqtt.config import Configs
+from ecowitt2mqtt.const import (
+    DATA_POINT_BEAUFORT_SCALE,
+    DATA_POINT_DEWPOINT,
+    DATA_POINT_HUMIDITY_ABS_IN,
+)
+from ecowitt2mqtt.core import Ecowitt
+from ecowitt2mqtt.data import ProcessedData, ProcessedDataCache
+from tests.common import TEST_CONFIG_JSON
+
+
+def test_incremental_processing(device_data: dict[str, Any], ecowitt: Ecowitt) -> None:
+    """Test that data points whose inputs haven't changed are reused.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: An Ecowitt object.
+    """
+    config = ecowitt.configs.default_config
+    first = ProcessedData(config, device_data)
+    second = ProcessedData(config, device_data, first)
+    assert second.output == first.output
+    assert all(
+        data_point is first.output[key] for key, data_point in second.output.items()
+    )
+
+    # Only the outdoor temperature changes:
+    updated_device_data = device_data | {"tempf": "70.0"}
+    third = ProcessedData(config, updated_device_data, second)
+    assert third.output == ProcessedData(config, updated_device_data).output
+
+    # Raw and calculated data points that don't depend on it are reused...
+    for key in ("humidity", "tempin", DATA_POINT_BEAUFORT_SCALE):
+        assert third.output[key] is second.output[key]
+    assert (
+        third.output[DATA_POINT_HUMIDITY_ABS_IN]
+        is second.output[DATA_POINT_HUMIDITY_ABS_IN]
+    )
+
+    # ...while the ones that do are recalculated:
+    for key in ("temp", DATA_POINT_DEWPOINT):
+        assert third.output[key] is not second.output[key]
+        assert third.output[key] != second.output[key]
+
+
+def test_incremental_processing_new_config(
+    device_data: dict[str, Any], ecowitt: Ecowitt
+) -> None:
+    """Test that nothing is reused when the config changes.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: An Ecowitt object.
+    """
+    previous = ProcessedData(ecowitt.configs.default_config, device_data)
+    processed_data = ProcessedData(
+        Configs(TEST_CONFIG_JSON).default_config, device_data, previous
+    )
+
+    assert processed_data.output == previous.output
+    assert not any(
+        data_point is previous.output[key]
+        for key, data_point in processed_data.output.items()
+    )
+
+
+def test_processed_data_cache(device_data: dict[str, Any], ecowitt: Ecowitt) -> None:
+    """Test that the cache evicts quiet gateways and stays within its size.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: An Ecowitt object.
+    """
+    cache = ProcessedDataCache(max_size=2, ttl=60.0)
+    processed_data = ProcessedData(ecowitt.configs.default_config, device_data)
+
+    with patch("ecowitt2mqtt.util.expiring_cache.time.monotonic", return_value=0.0):
+        cache.set("gateway1", processed_data)
+        cache.set("gateway2", processed_data)
+    with patch("ecowitt2mqtt.util.expiring_cache.time.monotonic", return_value=30.0):
+        cache.set("gateway1", processed_data)
+        cache.set("gateway3", processed_data)
+        # The gateway that posted least recently is evicted to make room:
+        assert len(cache) == 2
+        assert cache.get("gateway1") is processed_data
+        assert cache.get("gateway2") is None
+
+    with patch("ecowitt2mqtt.util.expiring_cache.time.monotonic", return_value=90.0):
+        # Both gateways have gone quiet since:
+        assert cache.get("gateway3") is None
+        assert len(cache) == 0
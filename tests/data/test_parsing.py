@@ -0,0 +1,164 @@
+"""Define tests for parsing payload values."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+import math
+
+import pytest
+
+from ecowitt2mqtt.config import Configs
+from ecowitt2mqtt.const import (
+    DATA_POINT_DEWPOINT,
+    DATA_POINT_LIGHTNING,
+    DATA_POINT_LIGHTNING_TIME,
+)
+from ecowitt2mqtt.data import (
+    PayloadValues,
+    ProcessedData,
+    get_payload_key_schema,
+    get_payload_schema,
+    get_typed_number,
+    get_typed_value,
+)
+from ecowitt2mqtt.helpers.calculator import round_value
+from ecowitt2mqtt.helpers.typing import CalculatedValueType
+from tests.common import TEST_CONFIG_JSON
+
+TEST_PAYLOAD = {"PASSKEY": "12345", "stationtype": "EasyWeatherV1.6.4"}
+
+
+def test_empty_values() -> None:
+    """Test that empty values of data points with a calculator are skipped."""
+    processed_data = ProcessedData(
+        Configs(TEST_CONFIG_JSON).default_config,
+        TEST_PAYLOAD
+        | {
+            "humidity": "65",
+            "leak_ch1": "",
+            "lightning": "",
+            "Random New Key": "",
+            "tempf": "",
+            "windspeedmph": "",
+        },
+    )
+    assert "humidity" in processed_data.output
+    for key in ("leak_ch1", DATA_POINT_LIGHTNING, "temp", "windspeed"):
+        assert key not in processed_data.output
+    # Data points calculated from a skipped value are skipped, too:
+    assert DATA_POINT_DEWPOINT not in processed_data.output
+    # Data points without a calculator are kept as-is:
+    assert processed_data.output["Random New Key"].value == ""
+
+
+def test_nonnumeric_values() -> None:
+    """Test that non-numeric values of data points that need a number are dropped."""
+    processed_data = ProcessedData(
+        Configs(TEST_CONFIG_JSON).default_config,
+        TEST_PAYLOAD | {"lightning": "far", "lightning_time": "yesterday"},
+    )
+    assert DATA_POINT_LIGHTNING not in processed_data.output
+    assert DATA_POINT_LIGHTNING_TIME not in processed_data.output
+
+
+@pytest.mark.parametrize(
+    "payload_key,key,parse",
+    [
+        ("Random New Key", "Random New Key", get_typed_value),
+        ("baromrelin", "baromrel", get_typed_number),
+        ("lightning_time", "lightning_time", get_typed_number),
+        ("tempf", "temp", get_typed_number),
+    ],
+)
+def test_payload_key_schema(payload_key: str, key: str, parse: Any) -> None:
+    """Test getting how a payload key is normalized and parsed.
+
+    Args:
+        payload_key: An Ecowitt payload key.
+        key: The normalized key.
+        parse: The value parser.
+    """
+    assert get_payload_key_schema(payload_key) == (key, parse)
+
+
+def test_payload_schema() -> None:
+    """Test that payloads with the same keys share a key schema."""
+    config = Configs(TEST_CONFIG_JSON).default_config
+    first = ProcessedData(config, TEST_PAYLOAD | {"humidity": "65", "tempf": "68.5"})
+    second = ProcessedData(config, TEST_PAYLOAD | {"humidity": "40", "tempf": "30.2"})
+    assert second.schema is first.schema
+    assert first.schema.key_schemas[:2] == (None, None)
+    assert first.schema.positions == {"humidity": 0, "temp": 1}
+
+    # A new key set reuses the key schemas of the gateway's previous payload:
+    third = ProcessedData(config, TEST_PAYLOAD | {"tempf": "68.5"}, first)
+    assert third.schema is not first.schema
+    assert third.schema.key_schemas[2] is first.schema.key_schemas[3]
+    assert get_payload_schema(tuple(third.data)) is third.schema
+
+
+def test_payload_values() -> None:
+    """Test getting the normalized values of a payload."""
+    schema = get_payload_schema(("tempf", "humidity", "model", "wh65batt"))
+    values = PayloadValues(
+        schema, {"temp": 68.5, "humidity": math.nan, "wh65batt": "Unknown"}
+    )
+    assert values.get("temp") == 68.5
+    humidity = values.get("humidity")
+    assert isinstance(humidity, float) and math.isnan(humidity)
+    assert values.get("wh65batt") == "Unknown"
+    assert values.get("model") is None
+
+    values = PayloadValues(schema, {"temp": 68.5})
+    assert values.get("humidity") is None
+
+
+@pytest.mark.parametrize(
+    "value,parsed_value",
+    [
+        ("", None),
+        ("12.5", 12.5),
+        (12, 12.0),
+        (12.5, 12.5),
+        ("Unknown", "Unknown"),
+    ],
+)
+def test_typed_number(value: float | str, parsed_value: float | str | None) -> None:
+    """Test parsing a value that should be a number.
+
+    Args:
+        value: A raw value.
+        parsed_value: The parsed value.
+    """
+    assert get_typed_number(value) == parsed_value
+
+
+@pytest.mark.parametrize(
+    "value,rounded_value",
+    [
+        (1.23456, 1.23),
+        (35, 35.0),
+        ("12.345", 12.35),
+        ("Comfortable", "Comfortable"),
+        ("V1.2.3", "V1.2.3"),
+        (None, None),
+        (
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+        ),
+    ],
+)
+def test_round_value(
+    rounded_value: CalculatedValueType, value: CalculatedValueType
+) -> None:
+    """Test rounding calculated values.
+
+    Args:
+        rounded_value: The rounded value.
+        value: The calculated value.
+    """
+    result = round_value(value, 2)
+    assert result == rounded_value
+    assert type(result) is type(rounded_value)
@@ -0,0 +1,172 @@
+"""Define tests for temperature/humidity channel calculations."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ecowitt2mqtt.config import Configs
+from ecowitt2mqtt.const import (
+    CONF_DISABLE_CALCULATED_DATA,
+    CONF_OUTPUT_UNIT_SYSTEM,
+    UnitSystem,
+)
+from ecowitt2mqtt.data import ProcessedData, ProcessingBatch
+from ecowitt2mqtt.helpers.calculator.channel import (
+    CHANNEL_DATA_POINTS,
+    CHANNELS,
+    calculate_channel_data_points,
+    get_channels,
+)
+from ecowitt2mqtt.helpers.calculator.temperature import FrostRisk, get_frost_risk
+from tests.common import TEST_CONFIG_JSON
+
+TEST_PAYLOAD = {
+    "PASSKEY": "12345",
+    "stationtype": "EasyWeatherV1.6.4",
+    "humidity1": "65",
+    "humidity2": "40",
+    "temp1f": "68.5",
+    "temp2f": "30.2",
+}
+
+
+def test_channel_data_points() -> None:
+    """Test that each channel gets the same data points as the outdoor sensor."""
+    config = Configs(TEST_CONFIG_JSON).default_config
+    processed_data = ProcessedData(config, TEST_PAYLOAD)
+
+    for channel, (humidity, temperature) in ((1, ("65", "68.5")), (2, ("40", "30.2"))):
+        outdoor_data = ProcessedData(
+            config, TEST_PAYLOAD | {"humidity": humidity, "tempf": temperature}
+        )
+        for data_point_key in CHANNEL_DATA_POINTS:
+            key = f"{data_point_key}{channel}"
+            assert processed_data.output[key] == outdoor_data.output[data_point_key]
+    assert processed_data.output["frostrisk2"].value == FrostRisk.UNLIKELY
+    assert "dewpoint3" not in processed_data.output
+
+
+def test_channel_data_points_disabled() -> None:
+    """Test that channel data points aren't calculated if calculated data is off."""
+    processed_data = ProcessedData(
+        Configs(TEST_CONFIG_JSON | {CONF_DISABLE_CALCULATED_DATA: True}).default_config,
+        TEST_PAYLOAD,
+    )
+    assert "dewpoint1" not in processed_data.output
+    assert "humidityabs2" not in processed_data.output
+
+
+def test_channel_data_points_incremental() -> None:
+    """Test that only channels whose values have changed are recalculated."""
+    config = Configs(TEST_CONFIG_JSON).default_config
+    previous = ProcessedData(config, TEST_PAYLOAD)
+    mock_calculate = Mock(wraps=calculate_channel_data_points)
+
+    with patch("ecowitt2mqtt.data.calculate_channel_data_points", mock_calculate):
+        processed_data = ProcessedData(
+            config, TEST_PAYLOAD | {"temp1f": "70.0"}, previous=previous
+        )
+
+    mock_calculate.assert_called_once()
+    assert mock_calculate.call_args.args[2] == [CHANNELS[0]]
+    assert processed_data.output["dewpoint1"] != previous.output["dewpoint1"]
+    assert processed_data.output["dewpoint2"] is previous.output["dewpoint2"]
+
+
+@pytest.mark.parametrize("gateway_count", [2, 30])
+def test_channel_data_points_batch(gateway_count: int) -> None:
+    """Test that a batch of payloads is processed like each payload on its own.
+
+    Args:
+        gateway_count: The number of gateways in the batch.
+    """
+    configs = Configs(TEST_CONFIG_JSON)
+    metric_config = Configs(
+        TEST_CONFIG_JSON | {CONF_OUTPUT_UNIT_SYSTEM: UnitSystem.METRIC}
+    ).default_config
+    items = [
+        (
+            configs.default_config if index % 2 else metric_config,
+            TEST_PAYLOAD
+            | {
+                "PASSKEY": str(index),
+                "humidity3": str(index * 5),
+                "temp1f": str(20 + index * 3.7),
+                "temp3f": "75.2",
+            },
+        )
+        for index in range(gateway_count)
+    ]
+
+    batch = ProcessingBatch()
+    batched_data = [
+        ProcessedData(config, payload, None, batch) for config, payload in items
+    ]
+    assert len(batch) == gateway_count
+    batch.finish()
+    assert len(batch) == 0
+
+    for (config, payload), processed_data in zip(items, batched_data):
+        expected_data = ProcessedData(config, payload)
+        assert processed_data.output.keys() == expected_data.output.keys()
+        for key, data_point in processed_data.output.items():
+            expected_data_point = expected_data.output[key]
+            assert data_point.unit == expected_data_point.unit
+            if isinstance(data_point.value, float):
+                # Large batches are calculated with NumPy (if it's installed):
+                assert data_point.value == pytest.approx(expected_data_point.value)
+            else:
+                assert data_point.value == expected_data_point.value
+
+
+def test_channel_invalid_humidity() -> None:
+    """Test that dew point and frost risk are unavailable for an invalid humidity."""
+    processed_data = ProcessedData(
+        Configs(TEST_CONFIG_JSON).default_config, TEST_PAYLOAD | {"humidity1": "0"}
+    )
+    assert processed_data.output["dewpoint1"].value is None
+    assert processed_data.output["frostrisk1"].value is None
+    assert processed_data.output["humidityabs1"].value == 0.0
+
+
+def test_get_channels() -> None:
+    """Test that only channels with a numeric temperature and humidity are used."""
+    payload: dict[str, float | str] = {
+        "humidity1": 65.0,
+        "humidity2": 40.0,
+        "humidity3": 50.0,
+        "temp1": 20.0,
+        "temp2": "None",
+    }
+    assert get_channels(payload) == [CHANNELS[0]]
+
+
+@pytest.mark.parametrize(
+    "temperature_c,frost_point_c,absolute_humidity,frost_risk",
+    [
+        (0.5, -1.0, 2.0, FrostRisk.UNLIKELY),
+        (0.5, -1.0, 4.0, FrostRisk.VERY_PROBABLE),
+        (3.0, 0.2, 4.0, FrostRisk.PROBABLE),
+        (3.0, 0.2, 2.0, FrostRisk.NO_RISK),
+        (10.0, 5.0, 8.0, FrostRisk.NO_RISK),
+    ],
+)
+def test_get_frost_risk(
+    absolute_humidity: float,
+    frost_point_c: float,
+    frost_risk: FrostRisk,
+    temperature_c: float,
+) -> None:
+    """Test getting the risk of frost forming.
+
+    Args:
+        absolute_humidity: An absolute humidity (in g/m³).
+        frost_point_c: A frost point in Celsius.
+        frost_risk: The expected frost risk.
+        temperature_c: A temperature in Celsius.
+    """
+    assert get_frost_risk(temperature_c, frost_point_c, absolute_humidity) == (
+        frost_risk
+    )
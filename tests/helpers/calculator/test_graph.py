@@ -0,0 +1,93 @@
+"""Define tests for the calculated data point graph."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ecowitt2mqtt.config import Configs
+from ecowitt2mqtt.const import (
+    DATA_POINT_DEWPOINT,
+    DATA_POINT_FROST_POINT,
+    DATA_POINT_HUMIDEX,
+    DATA_POINT_HUMIDITY,
+    DATA_POINT_RELATIVE_STRAIN_INDEX,
+    DATA_POINT_RELATIVE_STRAIN_INDEX_PERCEPTION,
+    DATA_POINT_THERMAL_PERCEPTION,
+)
+from ecowitt2mqtt.data import ProcessedData
+from ecowitt2mqtt.helpers.calculator.graph import (
+    INTERMEDIATE_DEW_POINT_C,
+    INTERMEDIATE_TEMP_C,
+    CalculationGraph,
+)
+from ecowitt2mqtt.util.meteo import (
+    get_dew_point_in_celsius,
+    get_relative_strain_index,
+)
+from tests.common import TEST_CONFIG_JSON
+
+TEST_PAYLOAD = {"PASSKEY": "12345", "stationtype": "EasyWeatherV1.6.4"}
+
+
+def test_intermediate_calculated_once() -> None:
+    """Test that an intermediate shared by several data points is calculated once."""
+    config = Configs(TEST_CONFIG_JSON).default_config
+    mock_dew_point = Mock(wraps=get_dew_point_in_celsius)
+
+    with patch(
+        "ecowitt2mqtt.helpers.calculator.graph.get_dew_point_in_celsius",
+        mock_dew_point,
+    ):
+        processed_data = ProcessedData(
+            config, TEST_PAYLOAD | {"humidity": "65", "tempf": "68.5"}
+        )
+
+    for key in (
+        DATA_POINT_DEWPOINT,
+        DATA_POINT_FROST_POINT,
+        DATA_POINT_HUMIDEX,
+        DATA_POINT_THERMAL_PERCEPTION,
+    ):
+        assert processed_data.output[key].value is not None
+    mock_dew_point.assert_called_once()
+
+
+def test_failed_intermediate_calculated_once() -> None:
+    """Test that an intermediate whose calculation fails is only attempted once."""
+    config = Configs(TEST_CONFIG_JSON).default_config
+    mock_rsi = Mock(wraps=get_relative_strain_index)
+
+    with patch(
+        "ecowitt2mqtt.helpers.calculator.graph.get_relative_strain_index", mock_rsi
+    ):
+        processed_data = ProcessedData(
+            config, TEST_PAYLOAD | {"humidity": "65", "tempf": "68.5"}
+        )
+
+    assert processed_data.output[DATA_POINT_RELATIVE_STRAIN_INDEX].value is None
+    assert (
+        processed_data.output[DATA_POINT_RELATIVE_STRAIN_INDEX_PERCEPTION].value is None
+    )
+    mock_rsi.assert_called_once()
+
+
+def test_missing_inputs() -> None:
+    """Test that intermediates depending on a missing payload key are unavailable."""
+    config = Configs(TEST_CONFIG_JSON).default_config
+    payload = {DATA_POINT_HUMIDITY: 65.0}
+    graph = CalculationGraph(config, payload)
+
+    assert DATA_POINT_HUMIDITY in graph
+    assert INTERMEDIATE_TEMP_C not in graph
+    assert not graph.has_inputs((DATA_POINT_HUMIDITY, INTERMEDIATE_DEW_POINT_C))
+    with pytest.raises(KeyError):
+        graph[INTERMEDIATE_DEW_POINT_C]
+
+    # Intermediates aren't payload keys:
+    assert dict(graph) == payload
+    assert len(graph) == 1
+
+    processed_data = ProcessedData(config, TEST_PAYLOAD | {"humidity": "65"})
+    assert DATA_POINT_DEWPOINT not in processed_data.output
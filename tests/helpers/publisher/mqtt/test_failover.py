@@ -0,0 +1,318 @@
+"""Define tests for MQTT broker failover."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from collections.abc import AsyncGenerator
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+import pytest_asyncio
+
+from ecowitt2mqtt.config import Config, Configs
+from ecowitt2mqtt.const import (
+    CONF_MQTT_BROKER,
+    CONF_MQTT_FAILBACK,
+    CONF_MQTT_FAILOVER_BROKERS,
+    CONF_MQTT_HEALTH_CHECK_INTERVAL,
+    CONF_MQTT_PORT,
+    CONF_MQTT_TLS,
+    CONF_MQTT_TLS_VERIFY,
+)
+from ecowitt2mqtt.helpers.metrics import MetricsRegistry
+from ecowitt2mqtt.helpers.publisher.mqtt.failover import BrokerPool, DnsCache
+from ecowitt2mqtt.util.network import BrokerAddress
+from tests.common import TEST_CONFIG_JSON, TEST_MQTT_BROKER, TEST_MQTT_PORT
+
+
+def get_addrinfo(*addresses: str) -> list[tuple[Any, ...]]:
+    """Get a getaddrinfo result for a list of addresses.
+
+    Args:
+        *addresses: IP addresses.
+
+    Returns:
+        A list of getaddrinfo tuples.
+    """
+    return [
+        (socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, 0))
+        for address in addresses
+    ]
+
+
+def get_config(**options: Any) -> Config:
+    """Get a config with extra options.
+
+    Args:
+        **options: Config options to add to the test config.
+
+    Returns:
+        A Config object.
+    """
+    return Configs(TEST_CONFIG_JSON | options).default_config
+
+
+@pytest.fixture(name="closed_port")
+def closed_port_fixture() -> int:
+    """Define a fixture to return a local port that nothing listens on.
+
+    Returns:
+        A port number.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+    return port
+
+
+@pytest_asyncio.fixture(name="open_port")
+async def open_port_fixture() -> AsyncGenerator[int]:
+    """Define a fixture to return a local port that accepts connections.
+
+    Yields:
+        A port number.
+    """
+    server = await asyncio.start_server(
+        lambda _, writer: writer.close(), "127.0.0.1", 0
+    )
+    yield server.sockets[0].getsockname()[1]
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_dns_cache() -> None:
+    """Test that resolved addresses are reused until their TTL expires."""
+    loop = asyncio.get_running_loop()
+    dns_cache = DnsCache(60)
+
+    with patch.object(
+        loop,
+        "getaddrinfo",
+        AsyncMock(return_value=get_addrinfo("10.0.0.1", "10.0.0.1", "10.0.0.2")),
+    ) as mock_getaddrinfo:
+        # IP addresses don't need resolving:
+        assert await dns_cache.async_resolve("192.168.1.100") == "192.168.1.100"
+        mock_getaddrinfo.assert_not_awaited()
+
+        assert await dns_cache.async_resolve("broker.local") == "10.0.0.1"
+        assert await dns_cache.async_resolve("broker.local") == "10.0.0.1"
+        mock_getaddrinfo.assert_awaited_once()
+
+        # An address that failed goes to the back of the line:
+        dns_cache.demote("broker.local", "10.0.0.1")
+        assert await dns_cache.async_resolve("broker.local") == "10.0.0.2"
+        dns_cache.demote("unknown.local", "10.0.0.1")
+
+
+@pytest.mark.asyncio
+async def test_dns_cache_resolution_failure(caplog: Mock) -> None:
+    """Test that the last known address is used when resolution fails.
+
+    Args:
+        caplog: A mock logging utility.
+    """
+    loop = asyncio.get_running_loop()
+    dns_cache = DnsCache(0)
+
+    with patch.object(
+        loop,
+        "getaddrinfo",
+        AsyncMock(side_effect=[socket.gaierror("Failed"), get_addrinfo("10.0.0.1")]),
+    ):
+        # Without a known address, the hostname is left for the MQTT client to resolve:
+        assert await dns_cache.async_resolve("broker.local") == "broker.local"
+        assert await dns_cache.async_resolve("broker.local") == "10.0.0.1"
+
+    with patch.object(
+        loop, "getaddrinfo", AsyncMock(side_effect=socket.gaierror("Failed"))
+    ):
+        assert await dns_cache.async_resolve("broker.local") == "10.0.0.1"
+    assert any(m for m in caplog.messages if "using its last known address" in m)
+
+
+@pytest.mark.asyncio
+async def test_fail_over() -> None:
+    """Test failing over to the next healthy broker."""
+    metrics = MetricsRegistry()
+    broker_pool = BrokerPool(
+        get_config(
+            **{CONF_MQTT_FAILOVER_BROKERS: ["broker2.local", "broker3.local:1884"]}
+        ),
+        "default",
+        metrics,
+    )
+    assert broker_pool.current == BrokerAddress(TEST_MQTT_BROKER, TEST_MQTT_PORT)
+    assert await broker_pool.async_get_host() == TEST_MQTT_BROKER
+
+    # Brokers are assumed to be healthy until proven otherwise:
+    assert broker_pool.fail_over() is True
+    assert broker_pool.current == BrokerAddress("broker2.local", 1883)
+    assert broker_pool.fail_over() is True
+    assert broker_pool.current == BrokerAddress("broker3.local", 1884)
+
+    # Once every broker has failed, the next one is tried after a backoff:
+    assert broker_pool.fail_over() is False
+    assert broker_pool.current == BrokerAddress(TEST_MQTT_BROKER, TEST_MQTT_PORT)
+    recovered = [broker_pool.recovered]
+    await broker_pool.async_wait_for_recovery(0.01)
+
+    broker_pool.mark_connected()
+    recovered.append(broker_pool.recovered)
+    assert recovered == [False, True]
+
+    failovers = metrics.counter("ecowitt2mqtt_mqtt_failovers_total", "")
+    assert failovers.get(gateway="default", broker="broker2.local:1883") == 1
+    assert failovers.get(gateway="default", broker="broker3.local:1884") == 1
+    failover_time = metrics.histogram("ecowitt2mqtt_mqtt_failover_seconds", "")
+    assert failover_time.get_count(gateway="default") == 1
+    broker_up = metrics.gauge("ecowitt2mqtt_mqtt_broker_up", "")
+    assert broker_up.get(gateway="default", broker="127.0.0.1:1883") == 1
+    assert broker_up.get(gateway="default", broker="broker2.local:1883") == 0
+
+
+@pytest.mark.asyncio
+async def test_fail_over_single_broker() -> None:
+    """Test that a single broker is simply retried (after a backoff)."""
+    broker_pool = BrokerPool(get_config(), "default")
+    broker_pool.start(Mock())
+
+    assert broker_pool.fail_over() is False
+    assert broker_pool.current == BrokerAddress(TEST_MQTT_BROKER, TEST_MQTT_PORT)
+    assert broker_pool.failback_broker is None
+    await broker_pool.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_fail_over_demotes_address() -> None:
+    """Test that an address that failed isn't used for the next attempt."""
+    broker_pool = BrokerPool(
+        get_config(**{CONF_MQTT_BROKER: "broker.local"}), "default"
+    )
+
+    with patch.object(
+        asyncio.get_running_loop(),
+        "getaddrinfo",
+        AsyncMock(return_value=get_addrinfo("10.0.0.1", "10.0.0.2")),
+    ):
+        assert await broker_pool.async_get_host() == "10.0.0.1"
+        broker_pool.fail_over()
+        assert await broker_pool.async_get_host() == "10.0.0.2"
+
+
+@pytest.mark.asyncio
+async def test_fail_over_tls() -> None:
+    """Test that TLS connections use the broker's hostname."""
+    broker_pool = BrokerPool(
+        get_config(**{CONF_MQTT_BROKER: "broker.local", CONF_MQTT_TLS: True}),
+        "default",
+    )
+    assert await broker_pool.async_get_host() == "broker.local"
+
+
+@pytest.mark.asyncio
+async def test_failback(closed_port: int, open_port: int) -> None:
+    """Test failing back to a preferred broker once it is healthy again.
+
+    Args:
+        closed_port: A local port that nothing listens on.
+        open_port: A local port that accepts connections.
+    """
+    metrics = MetricsRegistry()
+    broker_pool = BrokerPool(
+        get_config(
+            **{
+                CONF_MQTT_FAILBACK: True,
+                CONF_MQTT_FAILOVER_BROKERS: [f"127.0.0.1:{closed_port}"],
+                CONF_MQTT_HEALTH_CHECK_INTERVAL: 0.01,
+                CONF_MQTT_PORT: open_port,
+            }
+        ),
+        "default",
+        metrics,
+    )
+    on_change = Mock()
+
+    assert broker_pool.fail_over() is True
+    assert broker_pool.current.port == closed_port
+
+    broker_pool.start(on_change)
+    await asyncio.sleep(0.1)
+    failback_brokers = [broker_pool.failback_broker]
+    on_change.assert_called()
+
+    broker_pool.fail_back()
+    assert broker_pool.current.port == open_port
+    failback_brokers.append(broker_pool.failback_broker)
+    assert failback_brokers == [BrokerAddress("127.0.0.1", open_port), None]
+    # There's nothing left to fail back to:
+    broker_pool.fail_back()
+    assert broker_pool.current.port == open_port
+    await broker_pool.async_stop()
+
+    broker_up = metrics.gauge("ecowitt2mqtt_mqtt_broker_up", "")
+    assert broker_up.get(gateway="default", broker=f"127.0.0.1:{open_port}") == 1
+    assert broker_up.get(gateway="default", broker=f"127.0.0.1:{closed_port}") == 0
+
+
+@pytest.mark.asyncio
+async def test_recovery(closed_port: int, open_port: int) -> None:
+    """Test that a broker passing a health check cuts the backoff short.
+
+    Args:
+        closed_port: A local port that nothing listens on.
+        open_port: A local port that accepts connections.
+    """
+    broker_pool = BrokerPool(
+        get_config(
+            **{
+                CONF_MQTT_FAILOVER_BROKERS: [f"127.0.0.1:{closed_port}"],
+                CONF_MQTT_HEALTH_CHECK_INTERVAL: 0.01,
+                CONF_MQTT_PORT: open_port,
+            }
+        ),
+        "default",
+    )
+    on_change = Mock()
+
+    assert broker_pool.fail_over() is True
+    assert broker_pool.fail_over() is False
+    recovered = [broker_pool.recovered]
+
+    broker_pool.start(on_change)
+    await asyncio.wait_for(broker_pool.async_wait_for_recovery(5), 1)
+    await asyncio.sleep(0.05)
+    recovered.append(broker_pool.recovered)
+    assert recovered == [False, True]
+    # Without failback, the only change worth waking up for is the recovery:
+    on_change.assert_called_once()
+    assert broker_pool.failback_broker is None
+    await broker_pool.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_tls_context() -> None:
+    """Test that each broker gets an SSL context of its own."""
+    assert BrokerPool(get_config(), "default").tls_context is None
+
+    broker_pool = BrokerPool(
+        get_config(
+            **{
+                CONF_MQTT_FAILOVER_BROKERS: ["broker2.local"],
+                CONF_MQTT_TLS: True,
+                CONF_MQTT_TLS_VERIFY: "none",
+            }
+        ),
+        "default",
+    )
+    context = broker_pool.tls_context
+    assert context is not None
+    # The context is built once, so that its TLS session can be resumed:
+    assert broker_pool.tls_context is context
+
+    broker_pool.fail_over()
+    assert broker_pool.tls_context is not context
+    broker_pool.fail_over()
+    assert broker_pool.tls_context is context
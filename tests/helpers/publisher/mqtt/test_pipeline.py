@@ -0,0 +1,224 @@
+"""Define tests for publisher pipelines."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from aiomqtt import MqttError
+
+from ecowitt2mqtt.const import CONF_PUBLISHER_QUEUE_SIZE, CONF_PUBLISHER_RETRIES
+from ecowitt2mqtt.core import Ecowitt
+from ecowitt2mqtt.helpers.metrics import MetricsRegistry
+from ecowitt2mqtt.helpers.publisher.factory import get_publishers
+from ecowitt2mqtt.helpers.publisher.mqtt.pipeline import (
+    PublisherPipeline,
+    QueuedPayload,
+)
+from tests.common import TEST_CONFIG_JSON
+
+TEST_LABELS = {"gateway": "default", "publisher": "TopicPublisher"}
+
+
+def get_pipeline(
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    metrics: MetricsRegistry | None = None,
+) -> PublisherPipeline:
+    """Get a pipeline in front of the topic publisher.
+
+    Args:
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mock aiomqtt Client object.
+        metrics: A MetricsRegistry object to record metrics in.
+
+    Returns:
+        A PublisherPipeline object.
+    """
+    config = ecowitt.configs.default_config
+    publishers = get_publishers(config, mock_aiomqtt_client)
+    return PublisherPipeline(config, publishers[0], "default", metrics)
+
+
+def get_queued_payload(sequence: int, device_data: dict[str, Any]) -> QueuedPayload:
+    """Get a queued payload.
+
+    Args:
+        sequence: The payload's sequence number.
+        device_data: A dictionary of device data.
+
+    Returns:
+        A QueuedPayload object.
+    """
+    return QueuedPayload(sequence, device_data, asyncio.get_running_loop().time())
+
+
+@pytest.mark.asyncio
+async def test_publish(
+    device_data: dict[str, Any], ecowitt: Ecowitt, mock_aiomqtt_client: MagicMock
+) -> None:
+    """Test publishing payloads through a pipeline.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mock aiomqtt Client object.
+    """
+    metrics = MetricsRegistry()
+    pipeline = get_pipeline(ecowitt, mock_aiomqtt_client, metrics)
+    pipeline.start(Mock())
+
+    for sequence in range(3):
+        pipeline.submit(get_queued_payload(sequence, device_data))
+    await pipeline.async_wait_idle()
+
+    assert mock_aiomqtt_client.publish.await_count == 3
+    latency = metrics.histogram("ecowitt2mqtt_publisher_latency_seconds", "")
+    assert latency.get_count(**TEST_LABELS) == 3
+    assert await pipeline.async_stop() == []
+
+
+@pytest.mark.asyncio
+async def test_publish_error(
+    device_data: dict[str, Any], ecowitt: Ecowitt, mock_aiomqtt_client: MagicMock
+) -> None:
+    """Test that an unexpected error only costs the payload that caused it.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mock aiomqtt Client object.
+    """
+    metrics = MetricsRegistry()
+    pipeline = get_pipeline(ecowitt, mock_aiomqtt_client, metrics)
+    on_error = Mock()
+    pipeline.start(on_error)
+
+    mock_aiomqtt_client.publish.side_effect = [Exception("Something went wrong"), None]
+    for sequence in range(2):
+        pipeline.submit(get_queued_payload(sequence, device_data))
+    await pipeline.async_wait_idle()
+
+    assert mock_aiomqtt_client.publish.await_count == 2
+    assert pipeline.error is None
+    on_error.assert_not_called()
+    errors = metrics.counter("ecowitt2mqtt_publisher_errors_total", "")
+    assert errors.get(**TEST_LABELS) == 1
+    await pipeline.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_publish_retry(
+    device_data: dict[str, Any], ecowitt: Ecowitt, mock_aiomqtt_client: MagicMock
+) -> None:
+    """Test that MQTT errors are retried.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mock aiomqtt Client object.
+    """
+    metrics = MetricsRegistry()
+    pipeline = get_pipeline(ecowitt, mock_aiomqtt_client, metrics)
+    on_error = Mock()
+    pipeline.start(on_error)
+
+    mock_aiomqtt_client.publish.side_effect = [
+        MqttError("Timed out"),
+        MqttError("Timed out"),
+        None,
+    ]
+    with patch("ecowitt2mqtt.helpers.publisher.mqtt.pipeline.RETRY_BASE_DELAY", 0):
+        pipeline.submit(get_queued_payload(0, device_data))
+        await pipeline.async_wait_idle()
+
+    assert mock_aiomqtt_client.publish.await_count == 3
+    assert pipeline.error is None
+    on_error.assert_not_called()
+    retries = metrics.counter("ecowitt2mqtt_publisher_retries_total", "")
+    assert retries.get(**TEST_LABELS) == 2
+    await pipeline.async_stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [TEST_CONFIG_JSON | {CONF_PUBLISHER_RETRIES: 1}])
+async def test_publish_retries_exhausted(
+    device_data: dict[str, Any], ecowitt: Ecowitt, mock_aiomqtt_client: MagicMock
+) -> None:
+    """Test that a pipeline stops once it runs out of retries.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mock aiomqtt Client object.
+    """
+    pipeline = get_pipeline(ecowitt, mock_aiomqtt_client)
+    on_error = Mock()
+    pipeline.start(on_error)
+
+    mock_aiomqtt_client.publish.side_effect = MqttError("Disconnected")
+    first_payload = get_queued_payload(0, device_data)
+    second_payload = get_queued_payload(1, device_data)
+    with patch("ecowitt2mqtt.helpers.publisher.mqtt.pipeline.RETRY_BASE_DELAY", 0):
+        pipeline.submit(first_payload)
+        await pipeline.async_wait_idle()
+
+    assert mock_aiomqtt_client.publish.await_count == 2
+    assert isinstance(pipeline.error, MqttError)
+    on_error.assert_called_once()
+
+    # A failed pipeline holds on to payloads (including the one that failed):
+    pipeline.submit(second_payload)
+    await pipeline.async_wait_idle()
+    assert await pipeline.async_stop() == [first_payload, second_payload]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [TEST_CONFIG_JSON | {CONF_PUBLISHER_QUEUE_SIZE: 2}])
+async def test_queue_full(
+    device_data: dict[str, Any], ecowitt: Ecowitt, mock_aiomqtt_client: MagicMock
+) -> None:
+    """Test that a full queue drops its oldest payloads.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mock aiomqtt Client object.
+    """
+    metrics = MetricsRegistry()
+    pipeline = get_pipeline(ecowitt, mock_aiomqtt_client, metrics)
+    pipeline.start(Mock())
+
+    event = asyncio.Event()
+
+    async def slow_publish(*args: Any, **kwargs: Any) -> None:
+        """Publish once the event is set.
+
+        Args:
+            *args: Any positional arguments.
+            **kwargs: Any keyword arguments.
+        """
+        await event.wait()
+
+    mock_aiomqtt_client.publish.side_effect = slow_publish
+    queued_payloads = [
+        get_queued_payload(sequence, device_data) for sequence in range(4)
+    ]
+    for queued_payload in queued_payloads:
+        pipeline.submit(queued_payload)
+        await asyncio.sleep(0)
+
+    queue_size = metrics.gauge("ecowitt2mqtt_publisher_queue_size", "")
+    assert queue_size.get(**TEST_LABELS) == 2
+    dropped = metrics.counter("ecowitt2mqtt_publisher_dropped_payloads_total", "")
+    assert dropped.get(**TEST_LABELS) == 1
+
+    # The in-flight payload is handed back along with the queued ones:
+    assert await pipeline.async_stop() == [
+        queued_payloads[0],
+        queued_payloads[2],
+        queued_payloads[3],
+    ]
+    assert queue_size.get(**TEST_LABELS) == 0
@@ -0,0 +1,153 @@
+"""Define tests for the MQTT publish throttle."""
+
+from __future__ import annotations
+
+import asyncio
+import pytest
+
+from ecowitt2mqtt.const import (
+    CONF_MQTT_BYTE_RATE_LIMIT,
+    CONF_MQTT_MAX_INFLIGHT,
+    CONF_MQTT_RATE_LIMIT,
+)
+from ecowitt2mqtt.core import Ecowitt
+from ecowitt2mqtt.helpers.metrics import MetricsRegistry
+from ecowitt2mqtt.helpers.publisher.mqtt.throttle import PublishThrottle, TokenBucket
+from tests.common import TEST_CONFIG_JSON
+
+TEST_BROKER = f"{TEST_CONFIG_JSON['mqtt_broker']}:1883"
+
+
+async def async_publish(
+    throttle: PublishThrottle, size: int, event: asyncio.Event | None = None
+) -> None:
+    """Publish a fake message through a throttle.
+
+    Args:
+        throttle: A PublishThrottle object.
+        size: The size (in bytes) of the message.
+        event: An optional event to wait on while the message is "in flight".
+    """
+    async with throttle.async_reserve(size):
+        if event:
+            await event.wait()
+
+
+@pytest.mark.asyncio
+async def test_token_bucket() -> None:
+    """Test that a token bucket allows a burst and then paces requests."""
+    loop = asyncio.get_running_loop()
+    bucket = TokenBucket(20, capacity=2)
+
+    start = loop.time()
+    assert await bucket.async_acquire() == 0
+    assert await bucket.async_acquire() == 0
+    assert await bucket.async_acquire() > 0
+    assert await bucket.async_acquire() > 0
+    assert loop.time() - start >= 0.09
+
+    # Requests larger than the bucket wait for the deficit to refill:
+    await asyncio.sleep(0.1)
+    assert await bucket.async_acquire(4) == pytest.approx(0.1, abs=0.02)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config", [TEST_CONFIG_JSON | {CONF_MQTT_RATE_LIMIT: 20, CONF_MQTT_MAX_INFLIGHT: 2}]
+)
+async def test_message_rate_limit(ecowitt: Ecowitt) -> None:
+    """Test limiting the number of messages published per second.
+
+    Args:
+        ecowitt: A parsed Ecowitt object.
+    """
+    loop = asyncio.get_running_loop()
+    metrics = MetricsRegistry()
+    throttle = PublishThrottle(ecowitt.configs.default_config, metrics)
+
+    start = loop.time()
+    await asyncio.gather(*(async_publish(throttle, 10) for _ in range(25)))
+    # The first second's worth go out at once; the rest are paced:
+    assert loop.time() - start >= 0.2
+
+    assert (
+        metrics.counter("ecowitt2mqtt_mqtt_published_messages_total", "").get(
+            broker=TEST_BROKER
+        )
+        == 25
+    )
+    assert (
+        metrics.counter("ecowitt2mqtt_mqtt_published_bytes_total", "").get(
+            broker=TEST_BROKER
+        )
+        == 250
+    )
+    assert (
+        metrics.counter("ecowitt2mqtt_mqtt_throttled_seconds_total", "").get(
+            broker=TEST_BROKER
+        )
+        > 0
+    )
+
+    limits = metrics.gauge("ecowitt2mqtt_mqtt_limit", "")
+    assert limits.get(broker=TEST_BROKER, limit="messages_per_second") == 20
+    assert limits.get(broker=TEST_BROKER, limit="bytes_per_second") == 0
+    assert limits.get(broker=TEST_BROKER, limit="inflight_messages") == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config", [TEST_CONFIG_JSON | {CONF_MQTT_BYTE_RATE_LIMIT: 1000}]
+)
+async def test_byte_rate_limit(ecowitt: Ecowitt) -> None:
+    """Test limiting the number of bytes published per second.
+
+    Args:
+        ecowitt: A parsed Ecowitt object.
+    """
+    loop = asyncio.get_running_loop()
+    throttle = PublishThrottle(ecowitt.configs.default_config)
+
+    start = loop.time()
+    await async_publish(throttle, 1000)
+    await async_publish(throttle, 200)
+    assert loop.time() - start >= 0.15
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [TEST_CONFIG_JSON | {CONF_MQTT_MAX_INFLIGHT: 2}])
+async def test_max_inflight(ecowitt: Ecowitt) -> None:
+    """Test limiting the number of messages awaiting acknowledgement.
+
+    Args:
+        ecowitt: A parsed Ecowitt object.
+    """
+    metrics = MetricsRegistry()
+    throttle = PublishThrottle(ecowitt.configs.default_config, metrics)
+    inflight = metrics.gauge("ecowitt2mqtt_mqtt_inflight_messages", "")
+
+    event = asyncio.Event()
+    tasks = [
+        asyncio.create_task(async_publish(throttle, 10, event=event)) for _ in range(5)
+    ]
+    await asyncio.sleep(0.05)
+    assert inflight.get(broker=TEST_BROKER) == 2
+
+    event.set()
+    await asyncio.gather(*tasks)
+    assert inflight.get(broker=TEST_BROKER) == 0
+
+
+@pytest.mark.asyncio
+async def test_no_limits(ecowitt: Ecowitt) -> None:
+    """Test that a throttle without limits doesn't delay anything.
+
+    Args:
+        ecowitt: A parsed Ecowitt object.
+    """
+    loop = asyncio.get_running_loop()
+    throttle = PublishThrottle(ecowitt.configs.default_config)
+
+    start = loop.time()
+    await asyncio.gather(*(async_publish(throttle, 1000) for _ in range(100)))
+    assert loop.time() - start < 0.1
@@ -0,0 +1,210 @@
+"""Define tests for MQTT TLS helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import socket
+import ssl
+from collections.abc import AsyncGenerator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from ecowitt2mqtt.config import Config, Configs
+from ecowitt2mqtt.const import (
+    CONF_MQTT_TLS,
+    CONF_MQTT_TLS_ALPN,
+    CONF_MQTT_TLS_CA_FILE,
+    CONF_MQTT_TLS_CERTFILE,
+    CONF_MQTT_TLS_KEYFILE,
+    CONF_MQTT_TLS_VERIFY,
+)
+from ecowitt2mqtt.helpers.publisher.mqtt.tls import (
+    ResumableSSLContext,
+    get_tls_context,
+)
+from tests.common import TEST_CONFIG_JSON
+
+
+def get_config(**options: Any) -> Config:
+    """Get a TLS config with extra options.
+
+    Args:
+        **options: Config options to add to the test config.
+
+    Returns:
+        A Config object.
+    """
+    return Configs(TEST_CONFIG_JSON | {CONF_MQTT_TLS: True} | options).default_config
+
+
+@pytest.fixture(name="tls_files", scope="session")
+def tls_files_fixture(tmp_path_factory: pytest.TempPathFactory) -> tuple[str, str]:
+    """Define a fixture to return a self-signed certificate (and its key) for localhost.
+
+    The certificate doubles as the CA that issued it, so it can be used by both the
+    server and the client.
+
+    Args:
+        tmp_path_factory: A factory for temporary directories.
+
+    Returns:
+        The paths of the certificate file and the key file.
+    """
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.now(timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=1))
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [
+                    x509.DNSName("localhost"),
+                    x509.IPAddress(ipaddress.ip_address("127.0.0.1")),
+                ]
+            ),
+            critical=False,
+        )
+        .sign(key, hashes.SHA256())
+    )
+
+    directory: Path = tmp_path_factory.mktemp("tls")
+    certfile = directory / "cert.pem"
+    certfile.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    keyfile = directory / "key.pem"
+    keyfile.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return str(certfile), str(keyfile)
+
+
+@pytest_asyncio.fixture(name="tls_port")
+async def tls_port_fixture(tls_files: tuple[str, str]) -> AsyncGenerator[int]:
+    """Define a fixture to return the port of a local TLS server.
+
+    The server requires a client certificate and speaks just enough MQTT to answer a
+    CONNECT packet with a CONNACK packet.
+
+    Args:
+        tls_files: The paths of a certificate file and its key file.
+
+    Yields:
+        A port number.
+    """
+    certfile, keyfile = tls_files
+
+    async def handle_client(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Handle a client connection.
+
+        Args:
+            reader: The stream to read from.
+            writer: The stream to write to.
+        """
+        await reader.readexactly(2)
+        writer.write(b"\x20\x02\x00\x00")
+        await writer.drain()
+        await reader.read()
+        writer.close()
+
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(certfile, keyfile)
+    server_context.load_verify_locations(cafile=certfile)
+    server_context.set_alpn_protocols(["mqtt"])
+    server_context.verify_mode = ssl.CERT_REQUIRED
+
+    server = await asyncio.start_server(
+        handle_client, "127.0.0.1", 0, ssl=server_context
+    )
+    yield server.sockets[0].getsockname()[1]
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.parametrize(
+    "verify,check_hostname,verify_mode",
+    [
+        ("full", True, ssl.CERT_REQUIRED),
+        ("certificate", False, ssl.CERT_REQUIRED),
+        ("none", False, ssl.CERT_NONE),
+    ],
+)
+def test_get_tls_context(
+    check_hostname: bool, verify: str, verify_mode: ssl.VerifyMode
+) -> None:
+    """Test how much of a broker's certificate each verification mode verifies.
+
+    Args:
+        check_hostname: Whether the context should check the broker's hostname.
+        verify: The verification mode.
+        verify_mode: The expected verification mode of the context.
+    """
+    context = get_tls_context(get_config(**{CONF_MQTT_TLS_VERIFY: verify}))
+    assert isinstance(context, ResumableSSLContext)
+    assert context.check_hostname is check_hostname
+    assert context.verify_mode == verify_mode
+    assert context.session is None
+
+
+@pytest.mark.asyncio
+async def test_session_resumption(tls_files: tuple[str, str], tls_port: int) -> None:
+    """Test that reconnecting with the same context resumes the last TLS session.
+
+    Args:
+        tls_files: The paths of a certificate file and its key file.
+        tls_port: The port of a local TLS server.
+    """
+    certfile, keyfile = tls_files
+    context = get_tls_context(
+        get_config(
+            **{
+                CONF_MQTT_TLS_ALPN: "mqtt",
+                CONF_MQTT_TLS_CA_FILE: certfile,
+                CONF_MQTT_TLS_CERTFILE: certfile,
+                CONF_MQTT_TLS_KEYFILE: keyfile,
+            }
+        )
+    )
+
+    def connect() -> tuple[bool | None, str | None]:
+        """Connect to the server the same way the MQTT client does.
+
+        Returns:
+            A tuple of whether the session was resumed and the negotiated ALPN
+            protocol.
+        """
+        sock = context.wrap_socket(
+            socket.create_connection(("127.0.0.1", tls_port)),
+            server_hostname="localhost",
+            do_handshake_on_connect=False,
+        )
+        sock.do_handshake()
+        sock.sendall(b"\x10\x00")
+        sock.recv(4)
+        result = sock.session_reused, sock.selected_alpn_protocol()
+        sock.close()
+        return result
+
+    assert await asyncio.to_thread(connect) == (False, "mqtt")
+    assert context.session is not None
+    assert await asyncio.to_thread(connect) == (True, "mqtt")
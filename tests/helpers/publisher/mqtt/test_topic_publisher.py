@@ -1,15 +1,38 @@
 """Define tests for the MQTT Topic publisher."""
 
 # pylint: disable=line-too-long
-from typing import Any
-from unittest.mock import MagicMock
+import json
+import zlib
+from datetime import datetime
+from typing import Any, cast
+from unittest.mock import MagicMock, call, patch
 
+import cbor2
+import msgpack
 import pytest
+from aiomqtt import MqttError
 
-from ecowitt2mqtt.const import CONF_MQTT_RETAIN, CONF_RAW_DATA
+from ecowitt2mqtt.const import (
+    CONF_MQTT_COMPRESSION_THRESHOLD,
+    CONF_MQTT_ENCODING,
+    CONF_MQTT_MESSAGE_EXPIRY,
+    CONF_MQTT_QOS,
+    CONF_MQTT_RETAIN,
+    CONF_MQTT_SUBTOPIC_UNITS,
+    CONF_MQTT_SUBTOPICS,
+    CONF_MQTT_V5,
+    CONF_RAW_DATA,
+    MqttEncoding,
+)
 from ecowitt2mqtt.core import Ecowitt
 from ecowitt2mqtt.helpers.publisher.factory import get_publishers
-from ecowitt2mqtt.helpers.publisher.mqtt import TopicPublisher, generate_mqtt_payload
+from ecowitt2mqtt.helpers.publisher.mqtt import (
+    SUBTOPIC_CACHE_TTL,
+    TopicPublisher,
+    encode_mqtt_payload,
+    generate_mqtt_payload,
+)
+from ecowitt2mqtt.util.dt import utc_from_timestamp
 from tests.common import TEST_CONFIG_JSON, TEST_MQTT_TOPIC
 
 
@@ -42,6 +65,7 @@ async def test_publish_processed(
     mock_aiomqtt_client.publish.assert_awaited_with(
         TEST_MQTT_TOPIC,
         payload=b'{"runtime": 319206.0, "tempin": 79.52, "humidityin": 31.0, "baromrel": 24.74, "baromabs": 24.74, "temp": 93.2, "humidity": 64.0, "winddir": 139.0, "windspeed": 20.89, "windgust": 1.12, "maxdailygust": 8.05, "solarradiation": 264.61, "uv": 2.0, "rainrate": 0.0, "eventrain": 0.0, "hourlyrain": 0.0, "dailyrain": 0.0, "weeklyrain": 0.0, "monthlyrain": 2.177, "yearlyrain": 4.441, "lightning_num": 13.0, "lightning": 0.6213711922373341, "lightning_time": "2022-04-20T17:17:17+00:00", "wh65batt": "OFF", "beaufortscale": 5, "dewpoint": 79.19328776816637, "feelslike": 111.0553021896001, "frostpoint": 70.28882284994654, "frostrisk": "No risk", "heatindex": 111.0553021896001, "humidex": 48, "humidex_perception": "Dangerous", "humidityabs": 0.001501643470436062, "humidityabsin": 0.00048196665596089087, "relative_strain_index": 0.54, "relative_strain_index_perception": "Extreme discomfort", "safe_exposure_time_skin_type_1": 83.3, "safe_exposure_time_skin_type_2": 100.0, "safe_exposure_time_skin_type_3": 133.3, "safe_exposure_time_skin_type_4": 166.7, "safe_exposure_time_skin_type_5": 266.7, "safe_exposure_time_skin_type_6": 433.3, "simmerindex": 113.90619200000002, "simmerzone": "Danger of heatstroke", "solarradiation_perceived": 90.49958322993245, "thermalperception": "Severely high", "windchill": null, "winddir_name": "SE"}',
+        qos=0,
         retain=False,
     )
 
@@ -63,7 +87,7 @@ async def test_publish_raw(
     publishers = get_publishers(ecowitt.configs.default_config, mock_aiomqtt_client)
     await publishers[0].async_publish(device_data)
     mock_aiomqtt_client.publish.assert_awaited_with(
-        TEST_MQTT_TOPIC, payload=generate_mqtt_payload(device_data), retain=False
+        TEST_MQTT_TOPIC, payload=generate_mqtt_payload(device_data), qos=0, retain=False
     )
 
 
@@ -86,5 +110,312 @@ async def test_publish_retain(
     publishers = get_publishers(ecowitt.configs.default_config, mock_aiomqtt_client)
     await publishers[0].async_publish(device_data)
     mock_aiomqtt_client.publish.assert_awaited_with(
-        TEST_MQTT_TOPIC, payload=generate_mqtt_payload(device_data), retain=True
+        TEST_MQTT_TOPIC, payload=generate_mqtt_payload(device_data), qos=0, retain=True
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config", [TEST_CONFIG_JSON | {CONF_MQTT_QOS: 2, CONF_RAW_DATA: True}]
+)
+async def test_publish_qos(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+) -> None:
+    """Test publishing a raw payload to an TopicPublisher with a custom QoS level.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mock aiomqtt Client object.
+    """
+    publishers = get_publishers(ecowitt.configs.default_config, mock_aiomqtt_client)
+    await publishers[0].async_publish(device_data)
+    mock_aiomqtt_client.publish.assert_awaited_with(
+        TEST_MQTT_TOPIC, payload=generate_mqtt_payload(device_data), qos=2, retain=False
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        TEST_CONFIG_JSON
+        | {CONF_MQTT_MESSAGE_EXPIRY: 300, CONF_MQTT_V5: True, CONF_RAW_DATA: True}
+    ],
+)
+async def test_publish_v5(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+) -> None:
+    """Test publishing to an TopicPublisher with MQTT v5.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mock aiomqtt Client object.
+    """
+    publishers = get_publishers(ecowitt.configs.default_config, mock_aiomqtt_client)
+    publisher = publishers[0]
+    for _ in range(3):
+        await publisher.async_publish(device_data)
+
+    # The topic is replaced by an alias once the broker knows it:
+    assert [
+        (publish_call.args[0], publish_call.kwargs["properties"].json())
+        for publish_call in mock_aiomqtt_client.publish.await_args_list
+    ] == [
+        (TEST_MQTT_TOPIC, {"MessageExpiryInterval": 300}),
+        (TEST_MQTT_TOPIC, {"MessageExpiryInterval": 300, "TopicAlias": 1}),
+        ("", {"MessageExpiryInterval": 300, "TopicAlias": 1}),
+    ]
+
+    # Aliases start over with a new connection:
+    mock_aiomqtt_client.publish.reset_mock()
+    publisher.client = mock_aiomqtt_client
+    await publisher.async_publish(device_data)
+    mock_aiomqtt_client.publish.assert_awaited_once()
+    assert mock_aiomqtt_client.publish.await_args.args[0] == TEST_MQTT_TOPIC
+
+
+@pytest.mark.parametrize(
+    "encoding,decode",
+    [
+        (MqttEncoding.CBOR, cbor2.loads),
+        (MqttEncoding.JSON, json.loads),
+        (MqttEncoding.MSGPACK, lambda payload: msgpack.unpackb(payload, timestamp=3)),
+    ],
+)
+@pytest.mark.parametrize("compression_threshold", [None, 1, 10000])
+def test_encode_mqtt_payload(
+    compression_threshold: int | None,
+    decode: Any,
+    encoding: MqttEncoding,
+) -> None:
+    """Test encoding payloads (including datetimes and enum values).
+
+    Args:
+        compression_threshold: The payload size (in bytes) at which to compress.
+        decode: A function that decodes a payload.
+        encoding: The encoding to use.
+    """
+    data = {
+        "lightning_time": utc_from_timestamp(1650475037),
+        "temp": 93.2,
+        "uv": 2,
+        "wh65batt": MqttEncoding.JSON,
+    }
+    payload = encode_mqtt_payload(data, encoding, compression_threshold)
+
+    # Compressed payloads are recognizable by the zlib header:
+    compressed = compression_threshold == 1
+    assert (payload[0] == 0x78) is compressed
+    if compressed:
+        payload = zlib.decompress(payload)
+
+    decoded = decode(payload)
+    assert decoded["temp"] == 93.2
+    assert decoded["uv"] == 2
+    assert decoded["wh65batt"] == "json"
+    if encoding == MqttEncoding.JSON:
+        assert payload == generate_mqtt_payload(data)
+        assert decoded["lightning_time"] == "2022-04-20T17:17:17+00:00"
+    else:
+        assert decoded["lightning_time"] == datetime.fromisoformat(
+            "2022-04-20T17:17:17+00:00"
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        TEST_CONFIG_JSON
+        | {CONF_MQTT_COMPRESSION_THRESHOLD: 1024, CONF_MQTT_ENCODING: "msgpack"}
+    ],
+)
+async def test_publish_encoding(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+) -> None:
+    """Test publishing to an TopicPublisher with a binary encoding.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mock aiomqtt Client object.
+    """
+    publishers = get_publishers(ecowitt.configs.default_config, mock_aiomqtt_client)
+    await publishers[0].async_publish(device_data)
+
+    payload = mock_aiomqtt_client.publish.await_args.kwargs["payload"]
+    data = msgpack.unpackb(zlib.decompress(payload), timestamp=3)
+    assert data["lightning_time"] == datetime.fromisoformat("2022-04-20T17:17:17+00:00")
+    assert data["wh65batt"] == "OFF"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        TEST_CONFIG_JSON
+        | {
+            CONF_MQTT_RETAIN: True,
+            CONF_MQTT_SUBTOPIC_UNITS: True,
+            CONF_MQTT_SUBTOPICS: True,
+        }
+    ],
+)
+async def test_publish_subtopics(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+) -> None:
+    """Test publishing each data point to its own subtopic.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mock aiomqtt Client object.
+    """
+    publishers = get_publishers(ecowitt.configs.default_config, mock_aiomqtt_client)
+    await publishers[0].async_publish(device_data)
+
+    assert mock_aiomqtt_client.publish.await_count == 85
+    for expected_call in (
+        call("topic/tempin", payload=b"79.52", qos=0, retain=True),
+        call("topic/tempin/unit", payload=b"\xc2\xb0F", qos=0, retain=True),
+        call(
+            "topic/lightning_time",
+            payload=b"2022-04-20T17:17:17+00:00",
+            qos=0,
+            retain=True,
+        ),
+        call("topic/wh65batt", payload=b"OFF", qos=0, retain=True),
+        call("topic/windchill", payload=b"null", qos=0, retain=True),
+    ):
+        assert expected_call in mock_aiomqtt_client.publish.await_args_list
+
+    # Units are only published again when they change:
+    mock_aiomqtt_client.publish.reset_mock()
+    await publishers[0].async_publish(device_data)
+    assert mock_aiomqtt_client.publish.await_count == 48
+    assert not any(
+        publish_call.args[0].endswith("/unit")
+        for publish_call in mock_aiomqtt_client.publish.await_args_list
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        TEST_CONFIG_JSON
+        | {
+            CONF_MQTT_SUBTOPIC_UNITS: True,
+            CONF_MQTT_SUBTOPICS: True,
+            CONF_RAW_DATA: True,
+        }
+    ],
+)
+async def test_publish_subtopics_raw(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+) -> None:
+    """Test publishing raw data points to subtopics (which have no units).
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mock aiomqtt Client object.
+    """
+    publishers = get_publishers(ecowitt.configs.default_config, mock_aiomqtt_client)
+    await publishers[0].async_publish(device_data)
+
+    assert [
+        publish_call.args[0]
+        for publish_call in mock_aiomqtt_client.publish.await_args_list
+    ] == [f"topic/{key}" for key in device_data]
+    mock_aiomqtt_client.publish.assert_any_await(
+        "topic/tempinf", payload=b"79.52", qos=0, retain=False
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [TEST_CONFIG_JSON | {CONF_MQTT_SUBTOPIC_UNITS: True, CONF_MQTT_SUBTOPICS: True}],
+)
+async def test_publish_subtopics_cache(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+) -> None:
+    """Test that the subtopics and units a publisher remembers are bounded.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mock aiomqtt Client object.
+    """
+    with patch("ecowitt2mqtt.helpers.publisher.mqtt.SUBTOPIC_CACHE_MAX_SIZE", 2), patch(
+        "ecowitt2mqtt.util.expiring_cache.time.monotonic", return_value=0.0
+    ):
+        publisher = cast(
+            TopicPublisher,
+            get_publishers(ecowitt.configs.default_config, mock_aiomqtt_client)[0],
+        )
+        # Every set of keys gets its own subtopics, but only the latest are kept:
+        for dropped_key in ("tempinf", "humidityin", "baromrelin"):
+            payload = {
+                key: value for key, value in device_data.items() if key != dropped_key
+            }
+            await publisher.async_publish(payload)
+        assert len(publisher._subtopics) == 2
+
+    # Units that go unpublished for a day are forgotten (and so published again):
+    mock_aiomqtt_client.publish.reset_mock()
+    with patch(
+        "ecowitt2mqtt.util.expiring_cache.time.monotonic",
+        return_value=SUBTOPIC_CACHE_TTL,
+    ):
+        await publisher.async_publish(device_data)
+    assert len(publisher._subtopics) == 1
+    mock_aiomqtt_client.publish.assert_any_await(
+        "topic/tempin/unit", payload=b"\xc2\xb0F", qos=0, retain=True
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [TEST_CONFIG_JSON | {CONF_MQTT_SUBTOPIC_UNITS: True, CONF_MQTT_SUBTOPICS: True}],
+)
+async def test_publish_subtopics_error(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+) -> None:
+    """Test that units are published again after a failed publish.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mock aiomqtt Client object.
+    """
+    publishers = get_publishers(ecowitt.configs.default_config, mock_aiomqtt_client)
+
+    mock_aiomqtt_client.publish.side_effect = MqttError("Disconnected")
+    with pytest.raises(MqttError):
+        await publishers[0].async_publish(device_data)
+
+    mock_aiomqtt_client.publish.side_effect = None
+    mock_aiomqtt_client.publish.reset_mock()
+    await publishers[0].async_publish(device_data)
+    mock_aiomqtt_client.publish.assert_any_await(
+        "topic/tempin/unit", payload=b"\xc2\xb0F", qos=0, retain=True
     )
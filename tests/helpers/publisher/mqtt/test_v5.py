@@ -0,0 +1,142 @@
+"""Define tests for the MQTT v5 helpers."""
+
+from typing import Any
+
+import pytest
+from paho.mqtt.properties import Properties
+
+from ecowitt2mqtt.config import Configs
+from ecowitt2mqtt.const import (
+    CONF_MQTT_MESSAGE_EXPIRY,
+    CONF_MQTT_SESSION_EXPIRY,
+    CONF_MQTT_TARGETS,
+    CONF_MQTT_TOPIC,
+    CONF_MQTT_V5,
+)
+from ecowitt2mqtt.core import Ecowitt
+from ecowitt2mqtt.helpers.publisher.mqtt import MqttMessage
+from ecowitt2mqtt.helpers.publisher.mqtt.v5 import (
+    TopicAliases,
+    get_client_session_options,
+    get_connect_properties,
+    get_publish_properties,
+)
+from tests.common import TEST_CONFIG_JSON
+
+
+def get_set_properties(properties: Properties) -> dict[str, Any]:
+    """Get the MQTT v5 properties that have been set (like the untyped json()).
+
+    Args:
+        properties: A paho-mqtt Properties object.
+
+    Returns:
+        A dictionary of property names and values.
+    """
+    names = (name.replace(" ", "") for name in properties.names)
+    return {
+        name: getattr(properties, name) for name in names if hasattr(properties, name)
+    }
+
+
+def test_topic_aliases() -> None:
+    """Test assigning topic aliases."""
+    topic_aliases = TopicAliases(2)
+
+    # A topic earns an alias once it is published again:
+    assert topic_aliases.get("topic/a") == ("topic/a", None)
+    assert topic_aliases.get("topic/a") == ("topic/a", 1)
+    assert topic_aliases.get("topic/a") == ("", 1)
+
+    # Once the aliases run out, topics are published in full:
+    for topic in ("topic/b", "topic/c"):
+        topic_aliases.get(topic)
+    assert topic_aliases.get("topic/b") == ("topic/b", 2)
+    assert topic_aliases.get("topic/c") == ("topic/c", None)
+    assert len(topic_aliases) == 2
+
+    topic_aliases.reset()
+    assert not topic_aliases
+    assert topic_aliases.get("topic/a") == ("topic/a", None)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        TEST_CONFIG_JSON
+        | {
+            CONF_MQTT_MESSAGE_EXPIRY: 300,
+            CONF_MQTT_SESSION_EXPIRY: 60,
+            CONF_MQTT_V5: True,
+        }
+    ],
+)
+def test_properties(ecowitt: Ecowitt) -> None:
+    """Test getting MQTT v5 properties.
+
+    Args:
+        ecowitt: A parsed Ecowitt object.
+    """
+    default_config = ecowitt.configs.default_config
+    connect_properties = get_connect_properties(default_config)
+    assert connect_properties
+    assert get_set_properties(connect_properties) == {"SessionExpiryInterval": 60}
+
+    topic_aliases = TopicAliases(10)
+    topic, properties = get_publish_properties(
+        default_config, MqttMessage("topic/a", b"{}", False, 0), topic_aliases
+    )
+    assert topic == "topic/a"
+    assert get_set_properties(properties) == {}
+
+    # Only messages that expire get an expiry interval:
+    topic, properties = get_publish_properties(
+        default_config,
+        MqttMessage("topic/a", b"{}", False, 0, expires=True),
+        topic_aliases,
+    )
+    assert topic == "topic/a"
+    assert get_set_properties(properties) == {
+        "MessageExpiryInterval": 300,
+        "TopicAlias": 1,
+    }
+
+
+def test_properties_v3(ecowitt: Ecowitt) -> None:
+    """Test that there are no connection properties without MQTT v5.
+
+    Args:
+        ecowitt: A parsed Ecowitt object.
+    """
+    assert get_connect_properties(ecowitt.configs.default_config) is None
+
+
+def test_client_session_options() -> None:
+    """Test that MQTT v5 sessions use a client ID that survives a restart."""
+    config = TEST_CONFIG_JSON | {
+        CONF_MQTT_TARGETS: [{CONF_MQTT_TOPIC: "aggregate/weather"}],
+        CONF_MQTT_V5: True,
+    }
+    default_config = Configs(config).default_config
+    options = get_client_session_options(default_config)
+    assert options["clean_start"] is False
+    assert options["identifier"].startswith("ecowitt2mqtt-")
+    assert len(options["identifier"]) == 23
+
+    # The same config gets the same client ID the next time it's loaded...
+    restarted_config = Configs(config).default_config
+    assert restarted_config.uuid != default_config.uuid
+    assert get_client_session_options(restarted_config) == options
+
+    # ...while other targets get their own:
+    target_options = get_client_session_options(default_config.mqtt_targets[0])
+    assert target_options["identifier"] != options["identifier"]
+
+
+def test_client_session_options_v3(ecowitt: Ecowitt) -> None:
+    """Test that MQTT 3.1.1 clients keep their default session options.
+
+    Args:
+        ecowitt: A parsed Ecowitt object.
+    """
+    assert get_client_session_options(ecowitt.configs.default_config) == {}
@@ -0,0 +1,75 @@
+"""Define tests for the metrics registry."""
+
+import pytest
+
+from ecowitt2mqtt.helpers.metrics import MetricsRegistry
+
+
+def test_counter() -> None:
+    """Test counters (with and without labels)."""
+    metrics = MetricsRegistry()
+    counter = metrics.counter("test_total", "A test counter")
+    assert metrics.counter("test_total", "A test counter") is counter
+
+    counter.inc()
+    counter.inc(2.5)
+    counter.inc(broker="localhost:1883")
+    assert counter.get() == 3.5
+    assert counter.get(broker="localhost:1883") == 1
+    assert counter.get(broker="unknown") == 0
+
+
+def test_gauge() -> None:
+    """Test gauges."""
+    metrics = MetricsRegistry()
+    gauge = metrics.gauge("test_gauge", "A test gauge")
+
+    gauge.set(5, broker="localhost:1883", limit="a")
+    gauge.inc(limit="a", broker="localhost:1883")
+    gauge.dec(3, broker="localhost:1883", limit="a")
+    assert gauge.get(broker="localhost:1883", limit="a") == 3
+
+
+def test_histogram() -> None:
+    """Test histograms."""
+    metrics = MetricsRegistry()
+    histogram = metrics.histogram("test_seconds", "A test histogram")
+
+    for value in (0.003, 0.2, 0.2, 30):
+        histogram.observe(value, publisher="TopicPublisher")
+    assert histogram.get(publisher="TopicPublisher") == pytest.approx(30.403)
+    assert histogram.get_count(publisher="TopicPublisher") == 4
+    assert histogram.get_count(publisher="unknown") == 0
+
+    lines = histogram.render()
+    assert 'test_seconds_bucket{publisher="TopicPublisher",le="0.005"} 1' in lines
+    assert 'test_seconds_bucket{publisher="TopicPublisher",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{publisher="TopicPublisher",le="0.25"} 3' in lines
+    assert 'test_seconds_bucket{publisher="TopicPublisher",le="10"} 3' in lines
+    assert 'test_seconds_bucket{publisher="TopicPublisher",le="+Inf"} 4' in lines
+    assert 'test_seconds_sum{publisher="TopicPublisher"} 30.403' in lines
+    assert 'test_seconds_count{publisher="TopicPublisher"} 4' in lines
+
+
+def test_render() -> None:
+    """Test rendering metrics in the Prometheus text format."""
+    metrics = MetricsRegistry()
+    metrics.gauge("b_gauge", "A test gauge").set(0.25, label='a "quoted"\\value\n')
+    metrics.counter("a_total", "A test counter").inc(1234567)
+
+    assert metrics.render() == (
+        "# HELP a_total A test counter\n"
+        "# TYPE a_total counter\n"
+        "a_total 1234567\n"
+        "# HELP b_gauge A test gauge\n"
+        "# TYPE b_gauge gauge\n"
+        'b_gauge{label="a \\"quoted\\"\\\\value\\n"} 0.25\n'
+    )
+
+
+def test_type_conflict() -> None:
+    """Test that a metric can't be registered with two types."""
+    metrics = MetricsRegistry()
+    metrics.counter("test_total", "A test counter")
+    with pytest.raises(TypeError):
+        metrics.gauge("test_total", "A test gauge")
@@ -0,0 +1,251 @@
+"""Define tests for the payload spool."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ecowitt2mqtt.helpers.spool import Spool, SpooledPayload, SpoolFsyncPolicy
+
+TEST_MAX_AGE = 60.0
+TEST_MAX_SIZE = 1024 * 1024
+
+
+def get_spool(directory: Path, **kwargs: float | int | SpoolFsyncPolicy) -> Spool:
+    """Get a spool with test-friendly defaults.
+
+    Args:
+        directory: The directory to store segment files in.
+        **kwargs: Any parameters to override.
+
+    Returns:
+        A Spool object.
+    """
+    params: dict = {
+        "fsync": SpoolFsyncPolicy.ALWAYS,
+        "max_age": TEST_MAX_AGE,
+        "max_size": TEST_MAX_SIZE,
+        "segment_size": 64,
+    } | kwargs
+    return Spool(directory, **params)
+
+
+def test_append_and_replay(tmp_path: Path) -> None:
+    """Test that payloads are replayed in order (across segments).
+
+    Args:
+        tmp_path: A temporary directory.
+    """
+    spool = get_spool(tmp_path)
+    assert spool.peek() is None
+    spool.pop()
+
+    for idx in range(5):
+        spool.append({"idx": idx})
+    assert len(spool) == 5
+    assert len(list(tmp_path.iterdir())) > 1
+
+    replayed = []
+    while (spooled := spool.peek()) is not None:
+        # Peeking doesn't remove the payload:
+        assert spool.peek() == spooled
+        replayed.append(spooled.payload["idx"])
+        spool.pop()
+
+    assert replayed == [0, 1, 2, 3, 4]
+    assert not spool
+    assert not list(tmp_path.iterdir())
+
+
+def test_append_during_replay(tmp_path: Path) -> None:
+    """Test that payloads appended during a replay are replayed after older ones.
+
+    Args:
+        tmp_path: A temporary directory.
+    """
+    spool = get_spool(tmp_path, segment_size=TEST_MAX_SIZE)
+    spool.append({"idx": 0})
+    spool.append({"idx": 1})
+
+    assert spool.peek() == SpooledPayload({"idx": 0})
+    spool.append({"idx": 2})
+    spool.pop()
+
+    replayed = []
+    while (spooled := spool.peek()) is not None:
+        replayed.append(spooled.payload["idx"])
+        spool.pop()
+    assert replayed == [1, 2]
+
+
+def test_reopen(tmp_path: Path) -> None:
+    """Test that spooled payloads survive a restart (and a partially written record).
+
+    Args:
+        tmp_path: A temporary directory.
+    """
+    spool = get_spool(tmp_path)
+    for idx in range(3):
+        spool.append({"idx": idx})
+    spool.close()
+
+    # Simulate a crash in the middle of writing a record and an empty segment:
+    newest_segment = sorted(tmp_path.iterdir())[-1]
+    with newest_segment.open("ab") as segment_file:
+        segment_file.write(b"\x00" * 20)
+    (tmp_path / f"{'9' * 20}.seg").touch()
+
+    spool = get_spool(tmp_path)
+    assert len(spool) == 3
+    assert not (tmp_path / f"{'9' * 20}.seg").exists()
+
+    replayed = []
+    while (spooled := spool.peek()) is not None:
+        replayed.append(spooled.payload["idx"])
+        spool.pop()
+    assert replayed == [0, 1, 2]
+
+
+def test_publishers(tmp_path: Path) -> None:
+    """Test that the publishers that still need a payload survive a restart.
+
+    Args:
+        tmp_path: A temporary directory.
+    """
+    spool = get_spool(tmp_path)
+    spool.append({"idx": 0})
+    spool.append({"idx": 1}, {"TopicPublisher"})
+    spool.close()
+
+    spool = get_spool(tmp_path)
+    assert spool.peek() == SpooledPayload({"idx": 0})
+    spool.pop()
+    assert spool.peek() == SpooledPayload({"idx": 1}, frozenset({"TopicPublisher"}))
+
+
+def test_narrow(tmp_path: Path) -> None:
+    """Test narrowing down the publishers that still need the oldest payload.
+
+    Args:
+        tmp_path: A temporary directory.
+    """
+    spool = get_spool(tmp_path)
+    spool.append({"idx": 0})
+    spool.append({"idx": 1}, {"HomeAssistantDiscoveryPublisher", "TopicPublisher"})
+    spool.append({"idx": 2})
+
+    assert spool.peek() == SpooledPayload({"idx": 0})
+    spool.narrow({"TopicPublisher"})
+    assert spool.peek() == SpooledPayload({"idx": 0}, frozenset({"TopicPublisher"}))
+    spool.pop()
+
+    assert spool.peek() == SpooledPayload(
+        {"idx": 1}, frozenset({"HomeAssistantDiscoveryPublisher", "TopicPublisher"})
+    )
+    spool.narrow({"TopicPublisher"})
+    assert spool.peek() == SpooledPayload({"idx": 1}, frozenset({"TopicPublisher"}))
+    spool.pop()
+
+    # Only the payload that was narrowed down is affected:
+    assert spool.peek() == SpooledPayload({"idx": 2})
+
+
+def test_corrupt_record(tmp_path: Path) -> None:
+    """Test that a record that fails its checksum ends the segment.
+
+    Args:
+        tmp_path: A temporary directory.
+    """
+    spool = get_spool(tmp_path, segment_size=TEST_MAX_SIZE)
+    spool.append({"idx": 0})
+    spool.append({"idx": 1})
+    spool.close()
+
+    segment = next(tmp_path.iterdir())
+    data = bytearray(segment.read_bytes())
+    data[-2] ^= 0xFF
+    segment.write_bytes(bytes(data))
+
+    spool = get_spool(tmp_path)
+    assert len(spool) == 1
+    assert spool.peek() == SpooledPayload({"idx": 0})
+
+
+def test_retention_max_age(caplog: Mock, tmp_path: Path) -> None:
+    """Test that payloads older than the maximum age are dropped.
+
+    Args:
+        caplog: A mocked logging utility.
+        tmp_path: A temporary directory.
+    """
+    with patch("ecowitt2mqtt.helpers.spool.time.time", return_value=1000.0):
+        spool = get_spool(tmp_path)
+        for idx in range(3):
+            spool.append({"idx": idx})
+
+    with patch("ecowitt2mqtt.helpers.spool.time.time", return_value=1040.0):
+        spool.append({"idx": 3})
+
+    # Payloads that expire in a segment that is still being written are skipped
+    # during the replay:
+    with patch("ecowitt2mqtt.helpers.spool.time.time", return_value=1080.0):
+        assert spool.peek() == SpooledPayload({"idx": 3})
+        spool.close()
+
+    # Whole segments that have expired are dropped when the spool is opened:
+    with patch("ecowitt2mqtt.helpers.spool.time.time", return_value=1200.0):
+        spool = get_spool(tmp_path)
+    assert not spool
+    assert any(m for m in caplog.messages if "older than the maximum age" in m)
+
+
+def test_retention_max_size(caplog: Mock, tmp_path: Path) -> None:
+    """Test that the oldest payloads are dropped once the spool is full.
+
+    Args:
+        caplog: A mocked logging utility.
+        tmp_path: A temporary directory.
+    """
+    spool = get_spool(tmp_path, max_size=200)
+    for idx in range(20):
+        spool.append({"idx": idx})
+
+    assert sum(path.stat().st_size for path in tmp_path.iterdir()) <= 200
+    assert spool.peek() != SpooledPayload({"idx": 0})
+    assert any(m for m in caplog.messages if "over the maximum size" in m)
+
+    # The newest payloads are kept:
+    replayed = []
+    while (spooled := spool.peek()) is not None:
+        replayed.append(spooled.payload["idx"])
+        spool.pop()
+    assert replayed[-1] == 19
+
+
+@pytest.mark.parametrize(
+    "fsync,expected_call_count",
+    [
+        (SpoolFsyncPolicy.ALWAYS, 4),
+        (SpoolFsyncPolicy.NEVER, 0),
+        (SpoolFsyncPolicy.SEGMENT, 1),
+    ],
+)
+def test_fsync(
+    expected_call_count: int, fsync: SpoolFsyncPolicy, tmp_path: Path
+) -> None:
+    """Test the fsync policies.
+
+    Args:
+        expected_call_count: The expected number of fsync calls.
+        fsync: The fsync policy to use.
+        tmp_path: A temporary directory.
+    """
+    with patch("ecowitt2mqtt.helpers.spool.os.fsync") as mock_fsync:
+        spool = get_spool(tmp_path, fsync=fsync, segment_size=TEST_MAX_SIZE)
+        for idx in range(3):
+            spool.append({"idx": idx})
+        spool.close()
+
+    assert mock_fsync.call_count == expected_call_count
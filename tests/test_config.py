@@ -5,18 +5,50 @@ from __future__ import annotations
 import json
 import os
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
 from ecowitt2mqtt.config import ConfigError, Configs
 from ecowitt2mqtt.const import (
+    CONF_BATCH_WINDOW,
     CONF_BATTERY_OVERRIDES,
     CONF_BOOLEAN_BATTERY_TRUE_VALUE,
     CONF_CONFIG,
     CONF_DEFAULT_BATTERY_STRATEGY,
     CONF_GATEWAYS,
+    CONF_HASS_ATTRIBUTES_QOS,
+    CONF_HASS_DISCOVERY,
+    CONF_HASS_DISCOVERY_MODE,
+    CONF_HASS_DISCOVERY_QOS,
+    CONF_HASS_DISCOVERY_RATE_LIMIT,
+    CONF_HASS_REDISCOVERY_WINDOW,
+    CONF_HASS_STALE_SENSOR_INTERVALS,
+    CONF_HASS_STATE_QOS,
+    CONF_MQTT_AVAILABILITY_QOS,
+    CONF_MQTT_AVAILABILITY_TOPIC,
     CONF_MQTT_BROKER,
+    CONF_MQTT_BYTE_RATE_LIMIT,
+    CONF_MQTT_COMPRESSION_THRESHOLD,
+    CONF_MQTT_DNS_CACHE_TTL,
+    CONF_MQTT_ENCODING,
+    CONF_MQTT_FAILBACK,
+    CONF_MQTT_FAILOVER_BROKERS,
+    CONF_MQTT_HEALTH_CHECK_INTERVAL,
+    CONF_MQTT_IDLE_TIMEOUT,
+    CONF_MQTT_MAX_INFLIGHT,
+    CONF_MQTT_MESSAGE_EXPIRY,
     CONF_MQTT_PASSWORD,
+    CONF_MQTT_PORT,
+    CONF_MQTT_QOS,
+    CONF_MQTT_RATE_LIMIT,
+    CONF_MQTT_SESSION_EXPIRY,
+    CONF_MQTT_TARGETS,
+    CONF_MQTT_TLS_ALPN,
+    CONF_MQTT_TLS_CERTFILE,
+    CONF_MQTT_TLS_KEYFILE,
+    CONF_MQTT_TLS_VERIFY,
+    CONF_MQTT_TOPIC_ALIAS_MAXIMUM,
     CONF_MQTT_TOPIC,
     CONF_MQTT_USERNAME,
     CONF_OUTPUT_UNIT_ACCUMULATED_PRECIPITATION,
@@ -29,8 +61,14 @@ from ecowitt2mqtt.const import (
     CONF_OUTPUT_UNIT_TEMPERATURE,
     CONF_PORT,
     CONF_PRECISION,
+    CONF_PUBLISHER_QUEUE_SIZE,
+    CONF_PUBLISHER_RETRIES,
+    CONF_SPOOL_MAX_AGE,
+    CONF_SPOOL_MAX_SIZE,
+    CONF_SPOOL_REPLAY_RATE,
     CONF_VERBOSE,
     ENV_BATTERY_OVERRIDES,
+    HassDiscoveryMode,
     UnitOfAccumulatedPrecipitation,
     UnitOfIlluminance,
     UnitOfLength,
@@ -57,6 +95,33 @@ from tests.common import (
 )
 
 
+@pytest.mark.parametrize(
+    "value,is_valid",
+    [
+        (None, True),
+        ("0.05", True),
+        (0, False),
+        (-1, False),
+    ],
+)
+def test_batch_window(value: float | str | None, is_valid: bool) -> None:
+    """Test validating the payload batch window.
+
+    Args:
+        value: A value to use for the batch window.
+        is_valid: Whether the configuration is valid.
+    """
+    config = TEST_CONFIG_JSON | {CONF_BATCH_WINDOW: value}
+    if is_valid:
+        configs = Configs(config)
+        assert configs.default_config.batch_window == (
+            None if value is None else float(value)
+        )
+    else:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+
+
 @pytest.mark.parametrize(
     "config",
     [
@@ -281,6 +346,14 @@ def test_config_file_multiple_gateways(config_filepath: str) -> None:
     assert gateway_config.mqtt_broker == "my.mqtt.local"
     assert gateway_config.mqtt_topic == "Some Topic"
 
+    # Each gateway gets an availability topic of its own:
+    assert configs.default_config.mqtt_availability_topic == (
+        "ecowitt2mqtt/default/availability"
+    )
+    assert gateway_config.mqtt_availability_topic == (
+        "ecowitt2mqtt/passkey123/availability"
+    )
+
 
 @pytest.mark.parametrize(
     "raw_config",
@@ -348,6 +421,107 @@ def test_default_battery_strategy(config: dict[str, Any]) -> None:
     assert configs.default_config.default_battery_strategy == BatteryStrategy.NUMERIC
 
 
+@pytest.mark.parametrize(
+    "value,is_valid",
+    [
+        ("device", True),
+        ("entity", True),
+        ("component", False),
+    ],
+)
+def test_hass_discovery_mode(value: str, is_valid: bool) -> None:
+    """Test validating the MQTT Discovery mode.
+
+    Args:
+        value: A value to use for the MQTT Discovery mode.
+        is_valid: Whether the configuration is valid.
+    """
+    config = TEST_CONFIG_JSON | {CONF_HASS_DISCOVERY_MODE: value}
+    if is_valid:
+        configs = Configs(config)
+        assert configs.default_config.hass_discovery_mode == HassDiscoveryMode(value)
+    else:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+
+
+@pytest.mark.parametrize(
+    "value,is_valid",
+    [
+        (None, True),
+        ("12.5", True),
+        (0, False),
+        (-1, False),
+    ],
+)
+def test_hass_discovery_rate_limit(value: float | str | None, is_valid: bool) -> None:
+    """Test validating the MQTT Discovery rate limit.
+
+    Args:
+        value: A value to use for the rate limit.
+        is_valid: Whether the configuration is valid.
+    """
+    config = TEST_CONFIG_JSON | {CONF_HASS_DISCOVERY_RATE_LIMIT: value}
+    if is_valid:
+        configs = Configs(config)
+        assert configs.default_config.hass_discovery_rate_limit == (
+            None if value is None else float(value)
+        )
+    else:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+
+
+@pytest.mark.parametrize(
+    "value,is_valid",
+    [
+        (0, True),
+        ("30", True),
+        (-1, False),
+    ],
+)
+def test_hass_rediscovery_window(value: float | str, is_valid: bool) -> None:
+    """Test validating the MQTT Discovery rediscovery window.
+
+    Args:
+        value: A value to use for the rediscovery window.
+        is_valid: Whether the configuration is valid.
+    """
+    config = TEST_CONFIG_JSON | {CONF_HASS_REDISCOVERY_WINDOW: value}
+    if is_valid:
+        configs = Configs(config)
+        assert configs.default_config.hass_rediscovery_window == float(value)
+    else:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+
+
+@pytest.mark.parametrize(
+    "value,is_valid",
+    [
+        (None, True),
+        ("3", True),
+        (0, False),
+    ],
+)
+def test_hass_stale_sensor_intervals(value: int | str | None, is_valid: bool) -> None:
+    """Test validating the number of intervals before a sensor is stale.
+
+    Args:
+        value: A value to use for the number of intervals.
+        is_valid: Whether the configuration is valid.
+    """
+    config = TEST_CONFIG_JSON | {CONF_HASS_STALE_SENSOR_INTERVALS: value}
+    if is_valid:
+        configs = Configs(config)
+        assert configs.default_config.hass_stale_sensor_intervals == (
+            None if value is None else int(value)
+        )
+    else:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+
+
 @pytest.mark.parametrize(
     "config", [TEST_CONFIG_JSON | {CONF_VERBOSE: "This isn't a real value"}]
 )
@@ -409,6 +583,327 @@ def test_mqtt_auth(config: dict[str, Any], valid: bool) -> None:
             _ = Configs(config)
 
 
+@pytest.mark.parametrize(
+    "value,brokers",
+    [
+        (None, ()),
+        ("", ()),
+        ("broker2.local, broker3.local:1884", ("broker2.local", "broker3.local:1884")),
+        (["broker2.local", "[::1]:8883"], ("broker2.local", "[::1]:8883")),
+        ("broker2.local:port", None),
+        (["broker2.local:0"], None),
+    ],
+)
+def test_mqtt_failover_brokers(
+    value: list[str] | str | None, brokers: tuple[str, ...] | None
+) -> None:
+    """Test validating the MQTT failover brokers.
+
+    Args:
+        value: A value to use for the failover brokers.
+        brokers: The expected failover brokers (or None if the value is invalid).
+    """
+    config = TEST_CONFIG_JSON | {CONF_MQTT_FAILOVER_BROKERS: value}
+    if brokers is None:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+    else:
+        configs = Configs(config)
+        assert configs.default_config.mqtt_failover_brokers == brokers
+
+
+@pytest.mark.parametrize(
+    "config_option,value,parsed",
+    [
+        (CONF_MQTT_DNS_CACHE_TTL, "0", 0.0),
+        (CONF_MQTT_DNS_CACHE_TTL, -1, None),
+        (CONF_MQTT_FAILBACK, "yes", True),
+        (CONF_MQTT_FAILBACK, "maybe", None),
+        (CONF_MQTT_HEALTH_CHECK_INTERVAL, "0.5", 0.5),
+        (CONF_MQTT_HEALTH_CHECK_INTERVAL, 0, None),
+    ],
+)
+def test_mqtt_failover_options(
+    config_option: str, value: float | str, parsed: bool | float | None
+) -> None:
+    """Test validating the MQTT failover options.
+
+    Args:
+        config_option: The option to test.
+        value: A value to use for the option.
+        parsed: The expected parsed value (or None if the value is invalid).
+    """
+    config = TEST_CONFIG_JSON | {config_option: value}
+    if parsed is None:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+    else:
+        configs = Configs(config)
+        assert getattr(configs.default_config, config_option) == parsed
+
+
+@pytest.mark.parametrize(
+    "options,parsed",
+    [
+        ({CONF_MQTT_TLS_ALPN: None}, {CONF_MQTT_TLS_ALPN: ()}),
+        (
+            {CONF_MQTT_TLS_ALPN: "mqtt, x-amzn-mqtt-ca"},
+            {CONF_MQTT_TLS_ALPN: ("mqtt", "x-amzn-mqtt-ca")},
+        ),
+        ({CONF_MQTT_TLS_ALPN: ["mqtt"]}, {CONF_MQTT_TLS_ALPN: ("mqtt",)}),
+        (
+            {CONF_MQTT_TLS_CERTFILE: "client.pem"},
+            {CONF_MQTT_TLS_CERTFILE: "client.pem", CONF_MQTT_TLS_KEYFILE: None},
+        ),
+        (
+            {CONF_MQTT_TLS_CERTFILE: "client.crt", CONF_MQTT_TLS_KEYFILE: "client.key"},
+            {CONF_MQTT_TLS_CERTFILE: "client.crt", CONF_MQTT_TLS_KEYFILE: "client.key"},
+        ),
+        ({CONF_MQTT_TLS_KEYFILE: "client.key"}, None),
+        ({}, {CONF_MQTT_TLS_VERIFY: "full"}),
+        ({CONF_MQTT_TLS_VERIFY: "certificate"}, {CONF_MQTT_TLS_VERIFY: "certificate"}),
+        ({CONF_MQTT_TLS_VERIFY: "sometimes"}, None),
+    ],
+)
+def test_mqtt_tls_options(
+    options: dict[str, Any], parsed: dict[str, Any] | None
+) -> None:
+    """Test validating the MQTT TLS options.
+
+    Args:
+        options: The options to test.
+        parsed: The expected parsed values (or None if the options are invalid).
+    """
+    config = TEST_CONFIG_JSON | options
+    if parsed is None:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+    else:
+        configs = Configs(config)
+        for config_option, value in parsed.items():
+            assert getattr(configs.default_config, config_option) == value
+
+
+@pytest.mark.parametrize(
+    "value,is_valid",
+    [
+        (None, True),
+        ("3600", True),
+        (0, False),
+        (-1, False),
+    ],
+)
+def test_mqtt_idle_timeout(value: float | str | None, is_valid: bool) -> None:
+    """Test validating the MQTT idle timeout.
+
+    Args:
+        value: A value to use for the idle timeout.
+        is_valid: Whether the configuration is valid.
+    """
+    config = TEST_CONFIG_JSON | {CONF_MQTT_IDLE_TIMEOUT: value}
+    if is_valid:
+        configs = Configs(config)
+        assert configs.default_config.mqtt_idle_timeout == (
+            None if value is None else float(value)
+        )
+    else:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+
+
+@pytest.mark.parametrize(
+    "value,is_valid",
+    [
+        (None, True),
+        ("10", True),
+        (0, False),
+    ],
+)
+def test_mqtt_max_inflight(value: int | str | None, is_valid: bool) -> None:
+    """Test validating the maximum number of in-flight messages.
+
+    Args:
+        value: A value to use for the maximum.
+        is_valid: Whether the configuration is valid.
+    """
+    config = TEST_CONFIG_JSON | {CONF_MQTT_MAX_INFLIGHT: value}
+    if is_valid:
+        configs = Configs(config)
+        assert configs.default_config.mqtt_max_inflight == (
+            None if value is None else int(value)
+        )
+    else:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+
+
+@pytest.mark.parametrize(
+    "config_option", [CONF_MQTT_BYTE_RATE_LIMIT, CONF_MQTT_RATE_LIMIT]
+)
+@pytest.mark.parametrize(
+    "value,is_valid",
+    [
+        (None, True),
+        ("2.5", True),
+        (0, False),
+    ],
+)
+def test_mqtt_rate_limits(
+    config_option: str, value: float | str | None, is_valid: bool
+) -> None:
+    """Test validating the MQTT publish rate limits.
+
+    Args:
+        config_option: The rate limit to test.
+        value: A value to use for the rate limit.
+        is_valid: Whether the configuration is valid.
+    """
+    config = TEST_CONFIG_JSON | {config_option: value}
+    if is_valid:
+        configs = Configs(config)
+        assert getattr(configs.default_config, config_option) == (
+            None if value is None else float(value)
+        )
+    else:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+
+
+@pytest.mark.parametrize(
+    "config_option,value,is_valid",
+    [
+        (CONF_MQTT_MESSAGE_EXPIRY, None, True),
+        (CONF_MQTT_MESSAGE_EXPIRY, "300", True),
+        (CONF_MQTT_MESSAGE_EXPIRY, 0, False),
+        (CONF_MQTT_SESSION_EXPIRY, 0, True),
+        (CONF_MQTT_SESSION_EXPIRY, "60", True),
+        (CONF_MQTT_SESSION_EXPIRY, -1, False),
+        (CONF_MQTT_TOPIC_ALIAS_MAXIMUM, 0, True),
+        (CONF_MQTT_TOPIC_ALIAS_MAXIMUM, "65535", True),
+        (CONF_MQTT_TOPIC_ALIAS_MAXIMUM, 65536, False),
+    ],
+)
+def test_mqtt_v5_options(
+    config_option: str, value: int | str | None, is_valid: bool
+) -> None:
+    """Test validating the MQTT v5 options.
+
+    Args:
+        config_option: The option to test.
+        value: A value to use for the option.
+        is_valid: Whether the configuration is valid.
+    """
+    config = TEST_CONFIG_JSON | {config_option: value}
+    if is_valid:
+        configs = Configs(config)
+        assert getattr(configs.default_config, config_option) == (
+            None if value is None else int(value)
+        )
+    else:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+
+
+@pytest.mark.parametrize(
+    "value,is_valid",
+    [
+        (None, True),
+        ("1024", True),
+        (0, False),
+    ],
+)
+def test_mqtt_compression_threshold(value: int | str | None, is_valid: bool) -> None:
+    """Test validating the MQTT payload compression threshold.
+
+    Args:
+        value: A value to use for the threshold.
+        is_valid: Whether the configuration is valid.
+    """
+    config = TEST_CONFIG_JSON | {CONF_MQTT_COMPRESSION_THRESHOLD: value}
+    if is_valid:
+        configs = Configs(config)
+        assert configs.default_config.mqtt_compression_threshold == (
+            None if value is None else int(value)
+        )
+    else:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+
+
+@pytest.mark.parametrize(
+    "value,is_valid",
+    [
+        ("cbor", True),
+        ("json", True),
+        ("msgpack", True),
+        ("protobuf", False),
+    ],
+)
+def test_mqtt_encoding(value: str, is_valid: bool) -> None:
+    """Test validating the MQTT payload encoding.
+
+    Args:
+        value: A value to use for the encoding.
+        is_valid: Whether the configuration is valid.
+    """
+    config = TEST_CONFIG_JSON | {CONF_MQTT_ENCODING: value}
+    if is_valid:
+        configs = Configs(config)
+        assert configs.default_config.mqtt_encoding == value
+    else:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+
+
+@pytest.mark.parametrize("value", ["cbor", "msgpack"])
+def test_mqtt_encoding_missing_package(value: str) -> None:
+    """Test that a binary encoding requires its (optional) package.
+
+    Args:
+        value: A value to use for the encoding.
+    """
+    with patch("ecowitt2mqtt.config.find_spec", return_value=None), pytest.raises(
+        ConfigError, match="ecowitt2mqtt\\[encodings\\]"
+    ):
+        _ = Configs(TEST_CONFIG_JSON | {CONF_MQTT_ENCODING: value})
+
+
+@pytest.mark.parametrize(
+    "config_option",
+    [
+        CONF_HASS_ATTRIBUTES_QOS,
+        CONF_HASS_DISCOVERY_QOS,
+        CONF_HASS_STATE_QOS,
+        CONF_MQTT_AVAILABILITY_QOS,
+        CONF_MQTT_QOS,
+    ],
+)
+@pytest.mark.parametrize(
+    "value,is_valid",
+    [
+        (0, True),
+        ("2", True),
+        (3, False),
+        (-1, False),
+    ],
+)
+def test_qos(config_option: str, value: int | str, is_valid: bool) -> None:
+    """Test validating MQTT QoS levels.
+
+    Args:
+        config_option: The QoS level to test.
+        value: A value to use for the QoS level.
+        is_valid: Whether the configuration is valid.
+    """
+    config = TEST_CONFIG_JSON | {config_option: value}
+    if is_valid:
+        configs = Configs(config)
+        assert getattr(configs.default_config, config_option) == int(value)
+    else:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+
+
 @pytest.mark.parametrize(
     "config_option,value",
     [
@@ -492,6 +987,34 @@ def test_port(config: dict[str, Any], is_valid: bool) -> None:
             _ = Configs(config)
 
 
+@pytest.mark.parametrize(
+    "config_option", [CONF_SPOOL_MAX_AGE, CONF_SPOOL_MAX_SIZE, CONF_SPOOL_REPLAY_RATE]
+)
+@pytest.mark.parametrize(
+    "value,is_valid",
+    [
+        ("2.5", True),
+        (0, False),
+        (-1, False),
+    ],
+)
+def test_spool_limits(config_option: str, value: float | str, is_valid: bool) -> None:
+    """Test validating the spool limits.
+
+    Args:
+        config_option: The spool limit to test.
+        value: A value to use for the limit.
+        is_valid: Whether the configuration is valid.
+    """
+    config = TEST_CONFIG_JSON | {config_option: value}
+    if is_valid:
+        configs = Configs(config)
+        assert getattr(configs.default_config, config_option) == float(value)
+    else:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+
+
 @pytest.mark.parametrize(
     "config,verbose_value",
     [
@@ -511,3 +1034,112 @@ def test_valid_boolean_config_validation(
     """
     configs = Configs(config)
     assert configs.default_config.verbose is verbose_value
+
+
+@pytest.mark.parametrize(
+    "config_option,value,is_valid",
+    [
+        (CONF_PUBLISHER_QUEUE_SIZE, "10", True),
+        (CONF_PUBLISHER_QUEUE_SIZE, 0, False),
+        (CONF_PUBLISHER_RETRIES, 0, True),
+        (CONF_PUBLISHER_RETRIES, "5", True),
+        (CONF_PUBLISHER_RETRIES, -1, False),
+    ],
+)
+def test_publisher_options(
+    config_option: str, value: int | str, is_valid: bool
+) -> None:
+    """Test validating the publisher options.
+
+    Args:
+        config_option: The option to test.
+        value: A value to use for the option.
+        is_valid: Whether the configuration is valid.
+    """
+    config = TEST_CONFIG_JSON | {config_option: value}
+    if is_valid:
+        configs = Configs(config)
+        assert getattr(configs.default_config, config_option) == int(value)
+    else:
+        with pytest.raises(ConfigError):
+            _ = Configs(config)
+
+
+def test_mqtt_targets() -> None:
+    """Test that MQTT broker targets are merged onto the rest of the config."""
+    configs = Configs(
+        TEST_CONFIG_JSON
+        | {
+            CONF_PRECISION: 2,
+            CONF_MQTT_TARGETS: [
+                {CONF_MQTT_BROKER: "192.168.1.100", CONF_HASS_DISCOVERY: True},
+                {CONF_MQTT_TOPIC: "aggregate/weather"},
+            ],
+        }
+    )
+    default_config = configs.default_config
+    assert len(default_config.mqtt_targets) == 2
+
+    first_target, second_target = default_config.mqtt_targets
+    assert first_target.mqtt_broker == "192.168.1.100"
+    assert first_target.hass_discovery is True
+    assert first_target.mqtt_topic == TEST_MQTT_TOPIC
+    assert first_target.precision == 2
+    assert first_target.mqtt_targets == ()
+    assert second_target.mqtt_broker == TEST_MQTT_BROKER
+    assert second_target.mqtt_topic == "aggregate/weather"
+    assert len({default_config.uuid, first_target.uuid, second_target.uuid}) == 3
+
+    assert list(configs.targets()) == [
+        ("default", default_config),
+        ("default.1", first_target),
+        ("default.2", second_target),
+    ]
+    assert [config.name for _, config in configs.targets()] == [
+        "default",
+        "default.1",
+        "default.2",
+    ]
+    assert [config.mqtt_availability_topic for _, config in configs.targets()] == [
+        "ecowitt2mqtt/default/availability",
+        "ecowitt2mqtt/default.1/availability",
+        "ecowitt2mqtt/default.2/availability",
+    ]
+
+
+def test_mqtt_targets_availability_topic() -> None:
+    """Test that an explicit availability topic is shared by MQTT broker targets."""
+    configs = Configs(
+        TEST_CONFIG_JSON
+        | {
+            CONF_MQTT_AVAILABILITY_TOPIC: "weather/availability",
+            CONF_MQTT_TARGETS: [
+                {CONF_MQTT_BROKER: "192.168.1.100"},
+                {CONF_MQTT_AVAILABILITY_TOPIC: "aggregate/availability"},
+            ],
+        }
+    )
+    assert [config.mqtt_availability_topic for _, config in configs.targets()] == [
+        "weather/availability",
+        "weather/availability",
+        "aggregate/availability",
+    ]
+
+
+@pytest.mark.parametrize(
+    "target",
+    [
+        "192.168.1.100",
+        {CONF_PRECISION: 2},
+        {CONF_MQTT_TARGETS: []},
+        {CONF_MQTT_PORT: "not a port"},
+    ],
+)
+def test_mqtt_targets_invalid(target: Any) -> None:
+    """Test that invalid MQTT broker targets are rejected.
+
+    Args:
+        target: An MQTT broker target.
+    """
+    with pytest.raises(ConfigError):
+        _ = Configs(TEST_CONFIG_JSON | {CONF_MQTT_TARGETS: [target]})
@@ -6,32 +6,77 @@ from __future__ import annotations
 import asyncio
 import json
 import urllib.parse
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
 
 import pytest
 from aiohttp import ClientSession
-from aiomqtt import MqttError
+from aiomqtt import Message, MqttError, ProtocolVersion, Will
 
+from ecowitt2mqtt import runtime
 from ecowitt2mqtt.const import (
+    CONF_BATCH_WINDOW,
     CONF_DIAGNOSTICS,
     CONF_DISABLE_CALCULATED_DATA,
     CONF_ENDPOINT,
+    CONF_HASS_DISCOVERY,
+    CONF_HASS_DISCOVERY_RATE_LIMIT,
+    CONF_HASS_REDISCOVERY_WINDOW,
+    CONF_HASS_STALE_SENSOR_INTERVALS,
     CONF_INPUT_DATA_FORMAT,
+    CONF_MQTT_BROKER,
+    CONF_MQTT_FAILBACK,
+    CONF_MQTT_FAILOVER_BROKERS,
+    CONF_MQTT_HEALTH_CHECK_INTERVAL,
+    CONF_MQTT_IDLE_TIMEOUT,
+    CONF_MQTT_RATE_LIMIT,
+    CONF_MQTT_TARGETS,
+    CONF_MQTT_TLS,
+    CONF_MQTT_TLS_VERIFY,
+    CONF_MQTT_V5,
+    CONF_PUBLISHER_RETRIES,
+    CONF_RAW_DATA,
+    CONF_VERBOSE,
 )
 from ecowitt2mqtt.core import Ecowitt
+from ecowitt2mqtt.data import ProcessedData, ProcessingBatch
+from ecowitt2mqtt.helpers.publisher.factory import get_publishers
+from ecowitt2mqtt.helpers.publisher.mqtt.pipeline import (
+    PublisherPipeline,
+    QueuedPayload,
+)
+from ecowitt2mqtt.helpers.publisher.mqtt.tls import ResumableSSLContext
+from ecowitt2mqtt.helpers.publisher.mqtt.v5 import get_client_id
 from ecowitt2mqtt.helpers.server import InputDataFormat
+from ecowitt2mqtt.helpers.spool import Spool, SpooledPayload, SpoolFsyncPolicy
 from tests.common import (
     TEST_CONFIG_JSON,
     TEST_ENDPOINT,
+    TEST_MQTT_BROKER,
     TEST_MQTT_TOPIC,
     TEST_PORT,
     load_fixture,
 )
 
 
+@pytest.fixture(name="mock_broker_probe")
+def mock_broker_probe_fixture() -> Generator[AsyncMock]:
+    """Define a fixture to report every MQTT broker as healthy.
+
+    Yields:
+        A mocked broker health check.
+    """
+    with patch(
+        "ecowitt2mqtt.helpers.publisher.mqtt.failover.BrokerPool._async_probe",
+        AsyncMock(return_value=True),
+    ) as mock_probe:
+        yield mock_probe
+
+
 @pytest.mark.asyncio
+@pytest.mark.parametrize("config", [TEST_CONFIG_JSON | {CONF_PUBLISHER_RETRIES: 0}])
 @pytest.mark.parametrize("mqtt_publish_side_effect", [AsyncMock(side_effect=MqttError)])
 async def test_publish_failure(
     caplog: Mock,
@@ -58,6 +103,272 @@ async def test_publish_failure(
     assert any(m for m in caplog.messages if "There was an MQTT error" in m)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [TEST_CONFIG_JSON | {CONF_HASS_DISCOVERY: True, CONF_HASS_REDISCOVERY_WINDOW: 0}],
+)
+async def test_hass_birth_message(
+    caplog: Mock,
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that Home Assistant's birth message is routed to the discovery publisher.
+
+    Args:
+        caplog: A mock logging utility.
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    mock_aiomqtt_client.messages.__aiter__.return_value = [
+        Message("some/other/topic", b"online", 0, False, 1, None),
+        Message("homeassistant/status", b"online", 0, False, 1, None),
+    ]
+
+    async with ClientSession() as session:
+        await session.request(
+            "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+        )
+
+    await asyncio.sleep(0.1)
+    mock_aiomqtt_client.subscribe.assert_awaited_once_with("homeassistant/status")
+    assert len([m for m in caplog.messages if "Home Assistant came online" in m]) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config", [TEST_CONFIG_JSON | {CONF_HASS_DISCOVERY: True, CONF_VERBOSE: True}]
+)
+async def test_hass_birth_message_error_mqtt(
+    caplog: Mock,
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that an MQTT error while listening for messages doesn't affect publishing.
+
+    Args:
+        caplog: A mock logging utility.
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    mock_aiomqtt_client.messages.__aiter__.side_effect = MqttError("Disconnected")
+
+    async with ClientSession() as session:
+        await session.request(
+            "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+        )
+
+    await asyncio.sleep(0.1)
+    assert any(m for m in caplog.messages if "Stopped listening" in m)
+    mock_aiomqtt_client.publish.assert_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [TEST_CONFIG_JSON | {CONF_PUBLISHER_RETRIES: 0}])
+@pytest.mark.parametrize(
+    "mqtt_publish_side_effect",
+    [AsyncMock(side_effect=[None, MqttError("Disconnected"), None, None, None])],
+)
+async def test_publish_reconnect(
+    caplog: Mock,
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that publishing resumes after reconnecting to the MQTT broker.
+
+    Args:
+        caplog: A mock logging utility.
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    with patch("ecowitt2mqtt.runtime.DEFAULT_MAX_RETRY_INTERVAL", 0):
+        async with ClientSession() as session:
+            for _ in range(2):
+                await session.request(
+                    "post",
+                    f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}",
+                    data=device_data,
+                )
+                await asyncio.sleep(0.1)
+
+    assert any(m for m in caplog.messages if "Attempting MQTT reconnection" in m)
+    # The payload that failed is published again after reconnecting:
+    assert mock_aiomqtt_client.publish.await_count == 5
+
+    # Availability is published each time we (re)connect:
+    availability_call = call(
+        "ecowitt2mqtt/default/availability", payload="online", qos=1, retain=True
+    )
+    assert mock_aiomqtt_client.publish.await_args_list[0] == availability_call
+    assert mock_aiomqtt_client.publish.await_args_list[2] == availability_call
+
+
+@pytest.mark.asyncio
+async def test_availability(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    mock_aiomqtt_client_class: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that ecowitt2mqtt's availability is published on connect and shutdown.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        mock_aiomqtt_client_class: A mocked aiomqtt Client class.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    async with ClientSession() as session:
+        await session.request(
+            "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+        )
+
+    await asyncio.sleep(0.1)
+
+    # The broker is told to mark us offline if we go away unexpectedly...
+    assert mock_aiomqtt_client_class.call_args.kwargs["will"] == Will(
+        "ecowitt2mqtt/default/availability", payload="offline", qos=1, retain=True
+    )
+    assert mock_aiomqtt_client.publish.await_args_list[0] == call(
+        "ecowitt2mqtt/default/availability", payload="online", qos=1, retain=True
+    )
+
+    # ...while a clean shutdown marks us offline ourselves:
+    ecowitt.runtime.stop()
+    await asyncio.sleep(0.5)
+    mock_aiomqtt_client.publish.assert_awaited_with(
+        "ecowitt2mqtt/default/availability", payload="offline", qos=1, retain=True
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [TEST_CONFIG_JSON | {CONF_MQTT_V5: True}])
+async def test_mqtt_v5(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client_class: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test connecting to the MQTT broker with MQTT v5.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client_class: A mocked aiomqtt Client class.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    async with ClientSession() as session:
+        await session.request(
+            "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+        )
+
+    await asyncio.sleep(0.1)
+
+    client_kwargs = mock_aiomqtt_client_class.call_args.kwargs
+    assert client_kwargs["protocol"] == ProtocolVersion.V5
+    assert client_kwargs["clean_start"] is False
+    assert client_kwargs["identifier"] == get_client_id(ecowitt.configs.default_config)
+    assert client_kwargs["properties"].json() == {"SessionExpiryInterval": 3600}
+
+
+@pytest.mark.asyncio
+async def test_mqtt_v3(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client_class: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test connecting to the MQTT broker with MQTT 3.1.1.
+
+    paho-mqtt refuses to connect with MQTT 3.1.1 if a clean start option is given, so
+    the client's session defaults must be left alone.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client_class: A mocked aiomqtt Client class.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    async with ClientSession() as session:
+        await session.request(
+            "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+        )
+
+    await asyncio.sleep(0.1)
+
+    client_kwargs = mock_aiomqtt_client_class.call_args.kwargs
+    assert client_kwargs["protocol"] is None
+    assert client_kwargs["properties"] is None
+    assert "clean_start" not in client_kwargs
+    assert "identifier" not in client_kwargs
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [TEST_CONFIG_JSON | {CONF_MQTT_RATE_LIMIT: 50}])
+async def test_metrics(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    mock_aiomqtt_client_class: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that publish metrics are exposed in the Prometheus text format.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        mock_aiomqtt_client_class: A mocked aiomqtt Client class.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    async with ClientSession() as session:
+        await session.request(
+            "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+        )
+        await asyncio.sleep(0.1)
+
+        resp = await session.request("get", f"http://127.0.0.1:{TEST_PORT}/metrics")
+        assert resp.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        metrics = await resp.text()
+
+    assert mock_aiomqtt_client_class.call_args.kwargs["max_inflight_messages"] is None
+    broker = f'broker="{TEST_CONFIG_JSON["mqtt_broker"]}:1883"'
+    # The availability message and the payload:
+    assert f"ecowitt2mqtt_mqtt_published_messages_total{{{broker}}} 2" in metrics
+    assert f"ecowitt2mqtt_mqtt_inflight_messages{{{broker}}} 0" in metrics
+    assert (
+        f'ecowitt2mqtt_mqtt_limit{{{broker},limit="messages_per_second"}} 50' in metrics
+    )
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "config",
@@ -97,6 +408,7 @@ async def test_publish_ambient_weather_new_format_success(
     mock_aiomqtt_client.publish.assert_awaited_with(
         TEST_MQTT_TOPIC,
         payload=b'{"tempin": 67.3, "humidityin": 33.0, "baromrel": 29.616, "baromabs": 24.679, "temp": 53.8, "humidity": 30.0, "winddir": 99.0, "windspeed": 4.5, "windgust": 6.9, "maxdailygust": 14.8, "hourlyrain": 0.0, "eventrain": 0.0, "dailyrain": 0.0, "weeklyrain": 0.024, "monthlyrain": 0.311, "totalrain": 48.811, "solarradiation": 39.02, "uv": 0.0, "batt_co2": "ON", "beaufortscale": 2, "dewpoint": 23.12793817902528, "feelslike": 53.8, "frostpoint": 20.34536144435649, "frostrisk": "No risk", "heatindex": 50.28999999999999, "humidex": 9, "humidex_perception": "Comfortable", "humidityabs": 0.00020090062644380612, "humidityabsin": 0.000347925375450316, "relative_strain_index": null, "relative_strain_index_perception": null, "safe_exposure_time_skin_type_1": null, "safe_exposure_time_skin_type_2": null, "safe_exposure_time_skin_type_3": null, "safe_exposure_time_skin_type_4": null, "safe_exposure_time_skin_type_5": null, "safe_exposure_time_skin_type_6": null, "simmerindex": null, "simmerzone": null, "solarradiation_perceived": 73.87320347536115, "thermalperception": "Dry", "windchill": null, "winddir_name": "E"}',
+        qos=0,
         retain=False,
     )
 
@@ -139,6 +451,7 @@ async def test_publish_ambient_weather_old_format_success(
     mock_aiomqtt_client.publish.assert_awaited_with(
         TEST_MQTT_TOPIC,
         payload=b'{"tempin": 67.3, "humidityin": 33.0, "baromrel": 29.616, "baromabs": 24.679, "temp": 53.8, "humidity": 30.0, "winddir": 99.0, "windspeed": 4.5, "windgust": 6.9, "maxdailygust": 14.8, "hourlyrain": 0.0, "eventrain": 0.0, "dailyrain": 0.0, "weeklyrain": 0.024, "monthlyrain": 0.311, "totalrain": 48.811, "solarradiation": 39.02, "uv": 0.0, "batt_co2": "ON", "beaufortscale": 2, "dewpoint": 23.12793817902528, "feelslike": 53.8, "frostpoint": 20.34536144435649, "frostrisk": "No risk", "heatindex": 50.28999999999999, "humidex": 9, "humidex_perception": "Comfortable", "humidityabs": 0.00020090062644380612, "humidityabsin": 0.000347925375450316, "relative_strain_index": null, "relative_strain_index_perception": null, "safe_exposure_time_skin_type_1": null, "safe_exposure_time_skin_type_2": null, "safe_exposure_time_skin_type_3": null, "safe_exposure_time_skin_type_4": null, "safe_exposure_time_skin_type_5": null, "safe_exposure_time_skin_type_6": null, "simmerindex": null, "simmerzone": null, "solarradiation_perceived": 73.87320347536115, "thermalperception": "Dry", "windchill": null, "winddir_name": "E"}',
+        qos=0,
         retain=False,
     )
 
@@ -185,6 +498,7 @@ async def test_publish_ecowitt_success(
     mock_aiomqtt_client.publish.assert_awaited_with(
         TEST_MQTT_TOPIC,
         payload=b'{"runtime": 319206.0, "tempin": 79.52, "humidityin": 31.0, "baromrel": 24.74, "baromabs": 24.74, "temp": 93.2, "humidity": 64.0, "winddir": 139.0, "windspeed": 20.89, "windgust": 1.12, "maxdailygust": 8.05, "solarradiation": 264.61, "uv": 2.0, "rainrate": 0.0, "eventrain": 0.0, "hourlyrain": 0.0, "dailyrain": 0.0, "weeklyrain": 0.0, "monthlyrain": 2.177, "yearlyrain": 4.441, "lightning_num": 13.0, "lightning": 0.6213711922373341, "lightning_time": "2022-04-20T17:17:17+00:00", "wh65batt": "OFF", "beaufortscale": 5, "dewpoint": 79.19328776816637, "feelslike": 111.0553021896001, "frostpoint": 70.28882284994654, "frostrisk": "No risk", "heatindex": 111.0553021896001, "humidex": 48, "humidex_perception": "Dangerous", "humidityabs": 0.001501643470436062, "humidityabsin": 0.00048196665596089087, "relative_strain_index": 0.54, "relative_strain_index_perception": "Extreme discomfort", "safe_exposure_time_skin_type_1": 83.3, "safe_exposure_time_skin_type_2": 100.0, "safe_exposure_time_skin_type_3": 133.3, "safe_exposure_time_skin_type_4": 166.7, "safe_exposure_time_skin_type_5": 266.7, "safe_exposure_time_skin_type_6": 433.3, "simmerindex": 113.90619200000002, "simmerzone": "Danger of heatstroke", "solarradiation_perceived": 90.49958322993245, "thermalperception": "Severely high", "windchill": null, "winddir_name": "SE"}',
+        qos=0,
         retain=False,
     )
 
@@ -234,6 +548,7 @@ async def test_publish_wunderground_disable_calculated_data(
     mock_aiomqtt_client.publish.assert_awaited_with(
         TEST_MQTT_TOPIC,
         payload=b'{"ID": "MCKEAN", "PASSWORD": 1909.0, "temp": 89.42, "humidity": 54.0, "dewptf": 70.7, "windchill": 89.42, "winddir": 269.0, "windspeed": 0.0, "windgust": 9.17, "rain": 0.0, "dailyrain": 0.0, "weeklyrain": 0.476, "monthlyrain": 4.831, "yearlyrain": 4.831, "solarradiation": 732.04, "UV": 6.0, "indoortemp": 79.34, "indoorhumidity": 55.0, "barom": 30.135, "lowbatt": "OFF", "action": "updateraw", "realtime": 1.0, "rtfreq": 5.0}',  # noqa: E501
+        qos=0,
         retain=False,
     )
 
@@ -276,6 +591,7 @@ async def test_publish_wunderground_success(
     mock_aiomqtt_client.publish.assert_awaited_with(
         TEST_MQTT_TOPIC,
         payload=b'{"ID": "MCKEAN", "PASSWORD": 1909.0, "temp": 89.42, "humidity": 54.0, "dewptf": 70.7, "winddir": 269.0, "windspeed": 0.0, "windgust": 9.17, "rain": 0.0, "dailyrain": 0.0, "weeklyrain": 0.476, "monthlyrain": 4.831, "yearlyrain": 4.831, "solarradiation": 732.04, "UV": 6.0, "indoortemp": 79.34, "indoorhumidity": 55.0, "barom": 30.135, "lowbatt": "OFF", "action": "updateraw", "realtime": 1.0, "rtfreq": 5.0, "beaufortscale": 0, "dewpoint": 70.5763744258485, "feelslike": 95.3087917601561, "frostpoint": 62.320677884203384, "frostrisk": "No risk", "heatindex": 95.3087917601561, "humidex": 41, "humidex_perception": "Great discomfort", "humidityabs": 0.0011334789215741161, "relative_strain_index": 0.34, "relative_strain_index_perception": "Discomfort", "simmerindex": 104.48206520000001, "simmerzone": "Caution: Heat exhaustion", "solarradiation_perceived": 99.33815442116924, "thermalperception": "Quite uncomfortable", "windchill": null, "winddir_name": "W"}',
+        qos=0,
         retain=False,
     )
 
@@ -308,3 +624,801 @@ async def test_unknown_exception_shutdown(
 
     await asyncio.sleep(0.1)
     assert any(m for m in caplog.messages if "Something horrible happened" in m)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mqtt_publish_side_effect",
+    [AsyncMock(side_effect=[None, MqttError("Timed out"), None])],
+)
+async def test_publish_retry(
+    caplog: Mock,
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that a publisher retries an MQTT error without dropping the connection.
+
+    Args:
+        caplog: A mock logging utility.
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    with patch("ecowitt2mqtt.helpers.publisher.mqtt.pipeline.RETRY_BASE_DELAY", 0):
+        async with ClientSession() as session:
+            await session.request(
+                "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+            )
+        await asyncio.sleep(0.1)
+
+    assert any(m for m in caplog.messages if "TopicPublisher failed to publish" in m)
+    assert not any(m for m in caplog.messages if "There was an MQTT error" in m)
+    # The availability message, the failed attempt, and the retry:
+    assert mock_aiomqtt_client.publish.await_count == 3
+    runtime.Client.return_value.__aenter__.assert_awaited_once()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [TEST_CONFIG_JSON | {CONF_HASS_DISCOVERY: True, CONF_HASS_REDISCOVERY_WINDOW: 0}],
+)
+async def test_slow_publisher(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that a slow publisher doesn't hold up the others.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    event = asyncio.Event()
+
+    async def slow_publish(topic: str, *args: Any, **kwargs: Any) -> None:
+        """Publish to Home Assistant once the event is set.
+
+        Args:
+            topic: The topic to publish to.
+            *args: Any positional arguments.
+            **kwargs: Any keyword arguments.
+        """
+        if topic.startswith("homeassistant/"):
+            await event.wait()
+
+    mock_aiomqtt_client.publish.side_effect = slow_publish
+
+    async with ClientSession() as session:
+        for _ in range(2):
+            await session.request(
+                "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+            )
+        await asyncio.sleep(0.1)
+
+        resp = await session.request("get", f"http://127.0.0.1:{TEST_PORT}/metrics")
+        metrics = await resp.text()
+
+    topic_publish_calls = [
+        publish_call
+        for publish_call in mock_aiomqtt_client.publish.await_args_list
+        if publish_call.args[0] == TEST_MQTT_TOPIC
+    ]
+    assert len(topic_publish_calls) == 2
+
+    labels = 'gateway="default",publisher="{}"'
+    assert (
+        "ecowitt2mqtt_publisher_queue_size"
+        f"{{{labels.format('HomeAssistantDiscoveryPublisher')}}} 1"
+    ) in metrics
+    assert (
+        "ecowitt2mqtt_publisher_latency_seconds_count"
+        f"{{{labels.format('TopicPublisher')}}} 2"
+    ) in metrics
+    event.set()
+
+
+@pytest.mark.asyncio
+async def test_stop_pipelines(
+    device_data: dict[str, Any], ecowitt: Ecowitt, mock_aiomqtt_client: MagicMock
+) -> None:
+    """Test that payloads a publisher hadn't gotten to go back to the front of the queue.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+    """
+    config = ecowitt.configs.default_config
+    pipelines = [
+        PublisherPipeline(config, publisher, "default")
+        for publisher in get_publishers(config, mock_aiomqtt_client)
+    ]
+    queued_payloads = [
+        QueuedPayload(sequence, device_data | {"sequence": sequence}, 0)
+        for sequence in range(3)
+    ]
+    for sequence in (1, 0):
+        for pipeline in pipelines:
+            pipeline.submit(queued_payloads[sequence])
+
+    queue: asyncio.Queue = asyncio.Queue()
+    queue.put_nowait(queued_payloads[2])
+    await runtime.Runtime._async_stop_pipelines(  # pylint: disable=protected-access
+        pipelines, queue, None
+    )
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == queued_payloads
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [TEST_CONFIG_JSON | {CONF_HASS_DISCOVERY: True}])
+@pytest.mark.parametrize("spooled", [False, True])
+async def test_stop_pipelines_partially_published(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    spooled: bool,
+    tmp_path: Path,
+) -> None:
+    """Test that payloads are only handed back to the publishers that still need them.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        spooled: Whether the payloads are spooled.
+        tmp_path: A temporary directory.
+    """
+    config = ecowitt.configs.default_config
+    hass_pipeline, topic_pipeline = [
+        PublisherPipeline(config, publisher, "default")
+        for publisher in get_publishers(config, mock_aiomqtt_client)
+    ]
+    queued_payloads = [
+        QueuedPayload(sequence, device_data | {"sequence": sequence}, 0)
+        for sequence in range(2)
+    ]
+    # The topic publisher has already published the first payload:
+    hass_pipeline.submit(queued_payloads[0])
+    for pipeline in (hass_pipeline, topic_pipeline):
+        pipeline.submit(queued_payloads[1])
+
+    queue: asyncio.Queue = asyncio.Queue()
+    spool = None
+    if spooled:
+        spool = Spool(
+            tmp_path, fsync=SpoolFsyncPolicy.NEVER, max_age=60.0, max_size=1024**2
+        )
+    await runtime.Runtime._async_stop_pipelines(  # pylint: disable=protected-access
+        [hass_pipeline, topic_pipeline], queue, spool
+    )
+
+    if spool is not None:
+        assert spool.peek() == SpooledPayload(
+            queued_payloads[0].payload,
+            frozenset({"HomeAssistantDiscoveryPublisher"}),
+        )
+        spool.pop()
+        assert spool.peek() == SpooledPayload(queued_payloads[1].payload)
+        return
+
+    requeued_payloads = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert requeued_payloads == [
+        queued_payloads[0]._replace(
+            publishers=frozenset({"HomeAssistantDiscoveryPublisher"})
+        ),
+        queued_payloads[1],
+    ]
+
+    # Once resubmitted, each payload only reaches the publishers that still need it:
+    for queued_payload in requeued_payloads:
+        runtime.Runtime._submit_payload(  # pylint: disable=protected-access
+            queued_payload, [hass_pipeline, topic_pipeline]
+        )
+    assert [payload.sequence for payload in await hass_pipeline.async_stop()] == [0, 1]
+    assert [payload.sequence for payload in await topic_pipeline.async_stop()] == [1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        TEST_CONFIG_JSON
+        | {
+            CONF_MQTT_TARGETS: [
+                {CONF_MQTT_BROKER: "192.168.1.100", CONF_HASS_DISCOVERY: True}
+            ]
+        }
+    ],
+)
+async def test_mqtt_targets(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that a payload is processed once and published to every broker target.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    with patch(
+        "ecowitt2mqtt.runtime.ProcessedData", wraps=ProcessedData
+    ) as mock_processed_data, patch(
+        "ecowitt2mqtt.helpers.publisher.mqtt.ProcessedData"
+    ) as mock_topic_processed_data, patch(
+        "ecowitt2mqtt.helpers.publisher.mqtt.hass.ProcessedData"
+    ) as mock_hass_processed_data:
+        async with ClientSession() as session:
+            await session.request(
+                "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+            )
+        await asyncio.sleep(0.1)
+
+    assert [
+        client_call.args[0]
+        for client_call in runtime.Client.call_args_list  # type: ignore[attr-defined]
+    ] == [TEST_MQTT_BROKER, "192.168.1.100"]
+
+    mock_processed_data.assert_called_once()
+    mock_topic_processed_data.assert_not_called()
+    mock_hass_processed_data.assert_not_called()
+
+    # Both targets publish to the topic; only the second one uses HASS Discovery:
+    topics = [
+        publish_call.args[0]
+        for publish_call in mock_aiomqtt_client.publish.call_args_list
+    ]
+    assert topics.count(TEST_MQTT_TOPIC) == 2
+    assert any(topic.startswith("homeassistant/") for topic in topics)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [TEST_CONFIG_JSON | {CONF_MQTT_IDLE_TIMEOUT: 0.2}])
+async def test_idle_timeout(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that an MQTT loop without payloads is torn down (until the next one).
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    config_uuid = ecowitt.configs.default_config.uuid
+    loop_tasks = ecowitt.runtime._mqtt_loop_tasks  # pylint: disable=protected-access
+
+    async with ClientSession() as session:
+        await session.request(
+            "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+        )
+        await asyncio.sleep(0.1)
+        first_loop_task = loop_tasks[config_uuid]
+
+        await asyncio.sleep(0.3)
+        assert first_loop_task.done()
+        assert not loop_tasks
+        assert not ecowitt.runtime._payload_events  # pylint: disable=protected-access
+        assert not ecowitt.runtime._payload_queues  # pylint: disable=protected-access
+        # A clean disconnection marks us offline ourselves:
+        mock_aiomqtt_client.publish.assert_awaited_with(
+            "ecowitt2mqtt/default/availability", payload="offline", qos=1, retain=True
+        )
+
+        await session.request(
+            "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+        )
+        await asyncio.sleep(0.1)
+
+    assert loop_tasks[config_uuid] is not first_loop_task
+    assert runtime.Client.call_count == 2  # type: ignore[attr-defined]
+    topic_publishes = [
+        publish_call
+        for publish_call in mock_aiomqtt_client.publish.await_args_list
+        if publish_call.args[0] == TEST_MQTT_TOPIC
+    ]
+    assert len(topic_publishes) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [TEST_CONFIG_JSON | {CONF_MQTT_IDLE_TIMEOUT: 0.2}])
+async def test_idle_timeout_payload_while_disconnecting(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that a payload arriving while an idle MQTT loop disconnects is published.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+
+    async def publish(topic: str, **kwargs: Any) -> None:
+        """Post a payload while the loop marks us offline.
+
+        Args:
+            topic: The MQTT topic.
+            **kwargs: The other publish arguments.
+        """
+        if kwargs.get("payload") == "offline" and runtime.Client.call_count == 1:  # type: ignore[attr-defined]
+            ecowitt.runtime._process_payload(device_data)  # pylint: disable=protected-access
+
+    mock_aiomqtt_client.publish.side_effect = publish
+
+    async with ClientSession() as session:
+        await session.request(
+            "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+        )
+    await asyncio.sleep(0.35)
+
+    # The loop is recreated right away to publish it:
+    assert runtime.Client.call_count == 2  # type: ignore[attr-defined]
+    topic_publishes = [
+        publish_call
+        for publish_call in mock_aiomqtt_client.publish.await_args_list
+        if publish_call.args[0] == TEST_MQTT_TOPIC
+    ]
+    assert len(topic_publishes) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        TEST_CONFIG_JSON
+        | {
+            CONF_HASS_DISCOVERY: True,
+            CONF_HASS_DISCOVERY_RATE_LIMIT: 1,
+            CONF_HASS_REDISCOVERY_WINDOW: 60,
+            CONF_HASS_STALE_SENSOR_INTERVALS: 100,
+            CONF_MQTT_IDLE_TIMEOUT: 0.3,
+        }
+    ],
+)
+async def test_idle_timeout_stops_publishers(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that an idle MQTT loop doesn't leave its publishers' tasks behind.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+
+    async def messages() -> AsyncGenerator[Message]:
+        """Send Home Assistant's birth message once the payload has been published.
+
+        Yields:
+            An MQTT Message object.
+        """
+        await asyncio.sleep(0.1)
+        yield Message("homeassistant/status", b"online", 0, False, 1, None)
+
+    def get_publisher_tasks() -> set[str]:
+        """Get the publisher tasks that are still pending.
+
+        Returns:
+            The qualified names of the tasks' coroutines.
+        """
+        return {
+            task.get_coro().__qualname__  # type: ignore[union-attr]
+            for task in asyncio.all_tasks()
+            if not task.done()
+        } & {
+            "DiscoveryScheduler._async_run",
+            "HomeAssistantDiscoveryPublisher._async_expire_stale_sensors",
+            "HomeAssistantDiscoveryPublisher._async_rediscover",
+        }
+
+    mock_aiomqtt_client.messages = messages()
+    loop_tasks = ecowitt.runtime._mqtt_loop_tasks  # pylint: disable=protected-access
+
+    async with ClientSession() as session:
+        await session.request(
+            "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+        )
+    await asyncio.sleep(0.2)
+    assert len(get_publisher_tasks()) == 3
+
+    await asyncio.sleep(0.4)
+    assert not loop_tasks
+    assert not get_publisher_tasks()
+
+
+@pytest.mark.asyncio
+async def test_incremental_processing(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that a gateway's payload is processed incrementally from its last one.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    with patch(
+        "ecowitt2mqtt.runtime.ProcessedData", wraps=ProcessedData
+    ) as mock_processed_data:
+        async with ClientSession() as session:
+            for _ in range(2):
+                await session.request(
+                    "post",
+                    f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}",
+                    data=device_data,
+                )
+        await asyncio.sleep(0.1)
+
+    first_call, second_call = mock_processed_data.call_args_list
+    assert first_call.args[2] is None
+    previous = second_call.args[2]
+    assert isinstance(previous, ProcessedData)
+    processed_data = ecowitt.runtime._processed_data_cache.get(  # pylint: disable=protected-access
+        device_data["PASSKEY"]
+    )
+    assert processed_data is not None
+    assert all(
+        data_point is previous.output[key]
+        for key, data_point in processed_data.output.items()
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [TEST_CONFIG_JSON | {CONF_BATCH_WINDOW: 0.05}])
+@pytest.mark.parametrize("device_data_filename", ["payload_gw2000a_2.json"])
+async def test_batch_processing(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that payloads arriving within the batch window are processed together.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    with patch(
+        "ecowitt2mqtt.runtime.ProcessedData", wraps=ProcessedData
+    ) as mock_processed_data:
+        async with ClientSession() as session:
+            for _ in range(2):
+                await session.request(
+                    "post",
+                    f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}",
+                    data=device_data,
+                )
+        # Nothing is processed until the window closes:
+        mock_processed_data.assert_not_called()
+        await asyncio.sleep(0.2)
+
+    first_call, second_call = mock_processed_data.call_args_list
+    batch = first_call.args[3]
+    assert isinstance(batch, ProcessingBatch)
+    assert second_call.args[3] is batch
+    assert len(batch) == 0
+
+    # The second payload builds on the first, even though they were in the same batch:
+    first_processed_data = second_call.args[2]
+    processed_data = ecowitt.runtime._processed_data_cache.get(  # pylint: disable=protected-access
+        device_data["PASSKEY"]
+    )
+    assert processed_data is not None
+    assert processed_data.output == first_processed_data.output
+    assert processed_data.output["tempin"] is first_processed_data.output["tempin"]
+    assert "dewpoint1" in processed_data.output
+
+    topic_publishes = [
+        publish_call
+        for publish_call in mock_aiomqtt_client.publish.await_args_list
+        if publish_call.args[0] == TEST_MQTT_TOPIC
+    ]
+    assert len(topic_publishes) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [TEST_CONFIG_JSON | {CONF_BATCH_WINDOW: 0.05}])
+@pytest.mark.parametrize("device_data_filename", ["payload_gw2000a_2.json"])
+async def test_batch_processing_failure(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that publishers process payloads themselves if their batch fails.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    with patch.object(ProcessingBatch, "finish", side_effect=ValueError("Bad batch")):
+        async with ClientSession() as session:
+            await session.request(
+                "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+            )
+        await asyncio.sleep(0.2)
+
+    # The availability message and the data:
+    assert mock_aiomqtt_client.publish.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [TEST_CONFIG_JSON | {CONF_RAW_DATA: True}])
+async def test_processing_skipped(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that a payload isn't processed when no publisher needs it to be.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    with patch("ecowitt2mqtt.runtime.ProcessedData") as mock_processed_data:
+        async with ClientSession() as session:
+            await session.request(
+                "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+            )
+        await asyncio.sleep(0.1)
+
+    mock_processed_data.assert_not_called()
+    mock_aiomqtt_client.publish.assert_any_await(
+        TEST_MQTT_TOPIC,
+        payload=json.dumps(device_data).encode("utf-8"),
+        qos=0,
+        retain=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_processing_failure(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that publishers process a payload themselves if processing it up front fails.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    with patch(
+        "ecowitt2mqtt.runtime.ProcessedData", side_effect=ValueError("Bad payload")
+    ):
+        async with ClientSession() as session:
+            await session.request(
+                "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+            )
+        await asyncio.sleep(0.1)
+
+    # The availability message and the data:
+    assert mock_aiomqtt_client.publish.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        TEST_CONFIG_JSON
+        | {
+            CONF_MQTT_FAILOVER_BROKERS: ["192.168.1.100"],
+            CONF_PUBLISHER_RETRIES: 0,
+        }
+    ],
+)
+@pytest.mark.parametrize(
+    "mqtt_publish_side_effect",
+    [AsyncMock(side_effect=[None, MqttError("Disconnected"), None, None, None])],
+)
+async def test_failover(
+    caplog: Mock,
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    mock_aiomqtt_client_class: MagicMock,
+    mock_broker_probe: AsyncMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that losing an MQTT broker fails over to a healthy one right away.
+
+    Args:
+        caplog: A mock logging utility.
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        mock_aiomqtt_client_class: A mocked aiomqtt Client class.
+        mock_broker_probe: A mocked broker health check.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    async with ClientSession() as session:
+        for _ in range(2):
+            await session.request(
+                "post",
+                f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}",
+                data=device_data,
+            )
+            await asyncio.sleep(0.1)
+
+    assert [c.args[0] for c in mock_aiomqtt_client_class.call_args_list] == [
+        TEST_MQTT_BROKER,
+        "192.168.1.100",
+    ]
+    assert any(m for m in caplog.messages if "Failing over to MQTT broker" in m)
+    # There's no backoff when another broker is healthy:
+    assert not any(m for m in caplog.messages if "Attempting MQTT reconnection" in m)
+    assert mock_aiomqtt_client.publish.await_count == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config",
+    [
+        TEST_CONFIG_JSON
+        | {
+            CONF_MQTT_FAILBACK: True,
+            CONF_MQTT_FAILOVER_BROKERS: ["192.168.1.100"],
+            CONF_MQTT_HEALTH_CHECK_INTERVAL: 0.01,
+            CONF_PUBLISHER_RETRIES: 0,
+        }
+    ],
+)
+@pytest.mark.parametrize(
+    "mqtt_publish_side_effect",
+    [AsyncMock(side_effect=[None, MqttError("Disconnected"), *[None] * 10])],
+)
+async def test_failback(
+    caplog: Mock,
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    mock_aiomqtt_client_class: MagicMock,
+    mock_broker_probe: AsyncMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that the connection moves back to the preferred broker once it's healthy.
+
+    Args:
+        caplog: A mock logging utility.
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        mock_aiomqtt_client_class: A mocked aiomqtt Client class.
+        mock_broker_probe: A mocked broker health check.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    async with ClientSession() as session:
+        await session.request(
+            "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+        )
+    await asyncio.sleep(0.2)
+
+    assert [c.args[0] for c in mock_aiomqtt_client_class.call_args_list] == [
+        TEST_MQTT_BROKER,
+        "192.168.1.100",
+        TEST_MQTT_BROKER,
+    ]
+    assert any(m for m in caplog.messages if "Failing back to MQTT broker" in m)
+    # The broker being left behind is told that we're offline:
+    assert (
+        call("ecowitt2mqtt/default/availability", payload="offline", qos=1, retain=True)
+        in mock_aiomqtt_client.publish.await_args_list
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config,mqtt_publish_side_effect,tls_insecure",
+    [
+        (
+            TEST_CONFIG_JSON | {CONF_MQTT_TLS: True, CONF_PUBLISHER_RETRIES: 0},
+            AsyncMock(side_effect=[None, MqttError("Disconnected"), None, None, None]),
+            False,
+        ),
+        (
+            TEST_CONFIG_JSON
+            | {
+                CONF_MQTT_TLS: True,
+                CONF_MQTT_TLS_VERIFY: "certificate",
+                CONF_PUBLISHER_RETRIES: 0,
+            },
+            AsyncMock(side_effect=[None, MqttError("Disconnected"), None, None, None]),
+            True,
+        ),
+    ],
+)
+async def test_tls(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    mock_aiomqtt_client_class: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+    tls_insecure: bool,
+) -> None:
+    """Test that reconnecting to the MQTT broker reuses its SSL context.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        mock_aiomqtt_client_class: A mocked aiomqtt Client class.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+        tls_insecure: Whether the client should skip its own hostname check.
+    """
+    with patch("ecowitt2mqtt.runtime.DEFAULT_MAX_RETRY_INTERVAL", 0):
+        async with ClientSession() as session:
+            for _ in range(2):
+                await session.request(
+                    "post",
+                    f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}",
+                    data=device_data,
+                )
+                await asyncio.sleep(0.1)
+
+    first_call, second_call = mock_aiomqtt_client_class.call_args_list
+    assert isinstance(first_call.kwargs["tls_context"], ResumableSSLContext)
+    assert second_call.kwargs["tls_context"] is first_call.kwargs["tls_context"]
+    assert first_call.kwargs["tls_insecure"] is tls_insecure
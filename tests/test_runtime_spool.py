@@ -0,0 +1,462 @@
+"""Define tests for spooling payloads while the MQTT broker is unreachable."""
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments,unused-argument
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from aiohttp import ClientSession
+from aiomqtt import MqttError
+
+from ecowitt2mqtt import runtime
+from ecowitt2mqtt.const import (
+    CONF_BATCH_WINDOW,
+    CONF_HASS_DISCOVERY,
+    CONF_PUBLISHER_RETRIES,
+    CONF_SPOOL_DIRECTORY,
+    CONF_SPOOL_REPLAY_RATE,
+)
+from ecowitt2mqtt.core import Ecowitt
+from ecowitt2mqtt.helpers.publisher.mqtt import TopicPublisher
+from ecowitt2mqtt.helpers.publisher.mqtt.hass import HomeAssistantDiscoveryPublisher
+from ecowitt2mqtt.helpers.spool import Spool, SpoolFsyncPolicy
+from tests.common import TEST_CONFIG_JSON, TEST_ENDPOINT, TEST_MQTT_TOPIC, TEST_PORT
+
+
+@pytest.fixture(name="config")
+def config_fixture(
+    batch_window: float | None,
+    hass_discovery: bool,
+    spool_directory: Path,
+    spool_replay_rate: float,
+) -> dict[str, Any]:
+    """Define a fixture to return configuration data with spooling enabled.
+
+    Args:
+        batch_window: The amount of time to collect payloads for (if any).
+        hass_discovery: Whether to publish to MQTT Discovery.
+        spool_directory: The directory to spool payloads to.
+        spool_replay_rate: The number of spooled payloads to replay per second.
+
+    Returns:
+        Configuration data.
+    """
+    return TEST_CONFIG_JSON | {
+        CONF_BATCH_WINDOW: batch_window,
+        CONF_HASS_DISCOVERY: hass_discovery,
+        # Publishers give up on the first MQTT error, which drops the connection:
+        CONF_PUBLISHER_RETRIES: 0,
+        CONF_SPOOL_DIRECTORY: str(spool_directory),
+        CONF_SPOOL_REPLAY_RATE: spool_replay_rate,
+    }
+
+
+@pytest.fixture(name="batch_window")
+def batch_window_fixture() -> float | None:
+    """Define a fixture to return the amount of time to collect payloads for.
+
+    Returns:
+        A batch window (or None to process payloads as they arrive).
+    """
+    return None
+
+
+@pytest.fixture(name="hass_discovery")
+def hass_discovery_fixture() -> bool:
+    """Define a fixture to return whether to publish to MQTT Discovery.
+
+    Returns:
+        Whether to publish to MQTT Discovery.
+    """
+    return False
+
+
+@pytest.fixture(name="spool_directory")
+def spool_directory_fixture(tmp_path: Path) -> Path:
+    """Define a fixture to return the directory to spool payloads to.
+
+    Args:
+        tmp_path: A temporary directory.
+
+    Returns:
+        A directory path.
+    """
+    return tmp_path / "spool"
+
+
+@pytest.fixture(name="spool_replay_rate")
+def spool_replay_rate_fixture() -> float:
+    """Define a fixture to return the number of spooled payloads to replay per second.
+
+    Returns:
+        A replay rate.
+    """
+    return 1000
+
+
+@pytest.fixture(name="spooled_payloads")
+def spooled_payloads_fixture(
+    device_data: dict[str, Any], spool_directory: Path
+) -> None:
+    """Define a fixture to spool payloads before the runtime starts.
+
+    Args:
+        device_data: A dictionary of device data.
+        spool_directory: The directory to spool payloads to.
+    """
+    spool = get_spool(spool_directory)
+    for _ in range(2):
+        spool.append(device_data)
+    spool.close()
+
+
+def get_spool(spool_directory: Path) -> Spool:
+    """Get the spool used for the default config.
+
+    Args:
+        spool_directory: The directory to spool payloads to.
+
+    Returns:
+        A Spool object.
+    """
+    return Spool(
+        spool_directory / "default",
+        fsync=SpoolFsyncPolicy.ALWAYS,
+        max_age=60,
+        max_size=1024 * 1024,
+    )
+
+
+def get_topic_publish_count(mock_aiomqtt_client: MagicMock) -> int:
+    """Get the number of payloads that were published to the test MQTT topic.
+
+    Args:
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+
+    Returns:
+        A publish count.
+    """
+    return len(
+        [
+            publish_call
+            for publish_call in mock_aiomqtt_client.publish.await_args_list
+            if publish_call.args[0] == TEST_MQTT_TOPIC
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_spool_while_disconnected(
+    caplog: Mock,
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+    spool_directory: Path,
+) -> None:
+    """Test that payloads received while disconnected are replayed on reconnection.
+
+    Args:
+        caplog: A mock logging utility.
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+        spool_directory: The directory to spool payloads to.
+    """
+    runtime.Client.return_value.__aenter__.side_effect = [  # type: ignore[attr-defined]
+        MqttError("Connection refused"),
+        mock_aiomqtt_client,
+    ]
+
+    with patch("ecowitt2mqtt.runtime.DEFAULT_MAX_RETRY_INTERVAL", 0.5):
+        async with ClientSession() as session:
+            for _ in range(2):
+                await session.request(
+                    "post",
+                    f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}",
+                    data=device_data,
+                )
+                await asyncio.sleep(0.1)
+
+        assert get_topic_publish_count(mock_aiomqtt_client) == 0
+        assert len(list((spool_directory / "default").iterdir())) == 1
+        await asyncio.sleep(0.6)
+
+    assert any(m for m in caplog.messages if "Replaying 2 spooled payload(s)" in m)
+    assert get_topic_publish_count(mock_aiomqtt_client) == 2
+    assert not list((spool_directory / "default").iterdir())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mqtt_publish_side_effect",
+    [AsyncMock(side_effect=[None, MqttError("Disconnected"), None, None])],
+)
+async def test_spool_in_flight_payload(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that a payload that fails to publish is replayed on reconnection.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    with patch("ecowitt2mqtt.runtime.DEFAULT_MAX_RETRY_INTERVAL", 0):
+        async with ClientSession() as session:
+            await session.request(
+                "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+            )
+        await asyncio.sleep(0.1)
+
+    # The failed attempt and the replay:
+    assert get_topic_publish_count(mock_aiomqtt_client) == 2
+    assert mock_aiomqtt_client.publish.await_count == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("hass_discovery", [True])
+async def test_spool_replay_publisher_failure(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+    spool_directory: Path,
+) -> None:
+    """Test that a publisher failing during a replay doesn't cause duplicates.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+        spool_directory: The directory to spool payloads to.
+    """
+    published: dict[str, list[int]] = {"hass": [], "topic": []}
+
+    async def hass_publish(_: Any, data: dict[str, Any], *args: Any) -> None:
+        """Fail to publish the first payload the first time around.
+
+        Args:
+            data: A data payload.
+            *args: Any other positional arguments.
+
+        Raises:
+            MqttError: Raised for the first payload.
+        """
+        published["hass"].append(int(data["sequence"]))
+        if published["hass"] == [0]:
+            raise MqttError("Disconnected")
+
+    async def topic_publish(_: Any, data: dict[str, Any], *args: Any) -> None:
+        """Record a published payload.
+
+        Args:
+            data: A data payload.
+            *args: Any other positional arguments.
+        """
+        published["topic"].append(int(data["sequence"]))
+
+    runtime.Client.return_value.__aenter__.side_effect = [  # type: ignore[attr-defined]
+        MqttError("Connection refused"),
+        mock_aiomqtt_client,
+        mock_aiomqtt_client,
+    ]
+
+    with patch("ecowitt2mqtt.runtime.DEFAULT_MAX_RETRY_INTERVAL", 0.5), patch.object(
+        HomeAssistantDiscoveryPublisher, "async_publish", hass_publish
+    ), patch.object(TopicPublisher, "async_publish", topic_publish):
+        async with ClientSession() as session:
+            for sequence in range(3):
+                await session.request(
+                    "post",
+                    f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}",
+                    data=device_data | {"sequence": sequence},
+                )
+        await asyncio.sleep(1.5)
+
+    # Each publisher gets every payload once (and in order) after the failure:
+    assert published == {"hass": [0, 0, 1, 2], "topic": [0, 1, 2]}
+    assert not list((spool_directory / "default").iterdir())
+
+
+@pytest.mark.asyncio
+async def test_spool_replay_on_startup(
+    spooled_payloads: None,
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that payloads spooled before a restart are replayed right away.
+
+    Args:
+        spooled_payloads: Payloads spooled before startup.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    assert get_topic_publish_count(mock_aiomqtt_client) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("spool_replay_rate", [5])
+async def test_spool_replay_rate(
+    spooled_payloads: None,
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+) -> None:
+    """Test that spooled payloads are replayed at a limited rate (and in order).
+
+    Args:
+        spooled_payloads: Payloads spooled before startup.
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+    """
+    assert get_topic_publish_count(mock_aiomqtt_client) == 1
+
+    # A payload that arrives during the replay waits for the spooled ones:
+    async with ClientSession() as session:
+        await session.request(
+            "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+        )
+    assert get_topic_publish_count(mock_aiomqtt_client) == 1
+
+    await asyncio.sleep(0.5)
+    assert get_topic_publish_count(mock_aiomqtt_client) == 3
+
+
+@pytest.mark.asyncio
+async def test_spool_on_shutdown(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    mock_aiomqtt_client: MagicMock,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+    spool_directory: Path,
+) -> None:
+    """Test that payloads that haven't been published are spooled on shutdown.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        mock_aiomqtt_client: A mocked aiomqtt Client object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+        spool_directory: The directory to spool payloads to.
+    """
+
+    async def slow_publish(topic: str, *args: Any, **kwargs: Any) -> None:
+        """Publish slowly enough that payloads pile up.
+
+        Args:
+            topic: The topic to publish to.
+            *args: Any positional arguments.
+            **kwargs: Any keyword arguments.
+        """
+        if topic == TEST_MQTT_TOPIC:
+            await asyncio.sleep(1)
+
+    mock_aiomqtt_client.publish.side_effect = slow_publish
+
+    async with ClientSession() as session:
+        for _ in range(3):
+            await session.request(
+                "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+            )
+
+    await asyncio.sleep(0.1)
+    ecowitt.runtime.stop()
+    await asyncio.sleep(0.5)
+
+    # The payload that was being published is kept along with the others:
+    assert len(get_spool(spool_directory)) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_window", [60])
+async def test_spool_batch_on_shutdown(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+    spool_directory: Path,
+) -> None:
+    """Test that payloads waiting for the batch window are spooled on shutdown.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+        spool_directory: The directory to spool payloads to.
+    """
+    async with ClientSession() as session:
+        await session.request(
+            "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+        )
+
+    await asyncio.sleep(0.1)
+    ecowitt.runtime.stop()
+    await asyncio.sleep(0.5)
+
+    assert len(get_spool(spool_directory)) == 1
+
+
+@pytest.mark.asyncio
+async def test_spool_on_shutdown_while_connecting(
+    device_data: dict[str, Any],
+    ecowitt: Ecowitt,
+    setup_aiomqtt: AsyncGenerator[None],
+    setup_uvicorn_server: AsyncGenerator[None],
+    spool_directory: Path,
+) -> None:
+    """Test that payloads received while connecting are spooled on shutdown.
+
+    Args:
+        device_data: A dictionary of device data.
+        ecowitt: A parsed Ecowitt object.
+        setup_aiomqtt: A mock aiomqtt client connection.
+        setup_uvicorn_server: A mock Uvicorn + FastAPI application.
+        spool_directory: The directory to spool payloads to.
+    """
+
+    async def slow_connect() -> None:
+        """Connect slowly enough that payloads pile up."""
+        await asyncio.sleep(10)
+
+    runtime.Client.return_value.__aenter__.side_effect = slow_connect  # type: ignore[attr-defined]
+
+    async with ClientSession() as session:
+        await session.request(
+            "post", f"http://127.0.0.1:{TEST_PORT}{TEST_ENDPOINT}", data=device_data
+        )
+
+    await asyncio.sleep(0.1)
+    ecowitt.runtime.stop()
+    await asyncio.sleep(0.5)
+
+    assert len(get_spool(spool_directory)) == 1
@@ -0,0 +1,169 @@
+"""Define tests for banded classification tables."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Any
+
+import pytest
+
+from ecowitt2mqtt.config import Configs
+from ecowitt2mqtt.const import DATA_POINT_BEAUFORT_SCALE, UnitSystem
+from ecowitt2mqtt.data import ProcessedData
+from ecowitt2mqtt.helpers.calculator.temperature import (
+    HUMIDEX_PERCEPTION_BANDS,
+    HUMIDEX_PERCEPTION_RATINGS,
+    RELATIVE_STRAIN_INDEX_PERCEPTION_BANDS,
+    RELATIVE_STRAIN_INDEX_PERCEPTION_RATINGS,
+    SIMMER_ZONE_BANDS,
+    SIMMER_ZONE_RATINGS,
+    THERMAL_PERCEPTION_BANDS,
+    THERMAL_PERCEPTION_RATINGS,
+)
+from ecowitt2mqtt.helpers.calculator.wind import (
+    BEAUFORT_SCALE_BANDS,
+    BEAUFORT_SCALE_RATINGS,
+)
+from ecowitt2mqtt.util.bands import BandTable
+from tests.common import TEST_CONFIG_JSON
+
+TEST_PAYLOAD = {"PASSKEY": "12345", "stationtype": "EasyWeatherV1.6.4"}
+
+
+def get_test_values(boundaries: list[float]) -> list[float]:
+    """Get values on, just around, and between a series of band boundaries.
+
+    Args:
+        boundaries: A series of band boundaries.
+
+    Returns:
+        A list of test values.
+    """
+    values = [-math.inf, math.inf, math.nan]
+    for boundary in boundaries:
+        values += [
+            boundary,
+            math.nextafter(boundary, -math.inf),
+            math.nextafter(boundary, math.inf),
+            boundary - 0.5,
+            boundary + 0.5,
+        ]
+    return values
+
+
+def test_band_table() -> None:
+    """Test classifying values into (unsorted and non-contiguous) bands."""
+    table = BandTable([(10.0, 20.0, "high"), (0.0, 5.0, "low"), (5.0, 10.0, "mid")])
+
+    assert table.classify(-0.1) is None
+    assert table.classify(0.0) == "low"
+    assert table.classify(5.0) == "mid"
+    assert table.classify(19.999) == "high"
+    assert table.classify(20.0) is None
+    assert table.classify(math.nan) is None
+
+    gapped_table = BandTable([(0.0, 5.0, "low"), (10.0, 20.0, "high")])
+    assert gapped_table.classify(4.0) == "low"
+    assert gapped_table.classify(7.5) is None
+    assert gapped_table.classify(10.0) == "high"
+
+    values = [-1.0, 0.0, 7.5, 10.0, 25.0]
+    assert gapped_table.classify_many(values) == [
+        gapped_table.classify(value) for value in values
+    ]
+    assert gapped_table.classify_many(array("d", values)) == [
+        None,
+        "low",
+        None,
+        "high",
+        None,
+    ]
+
+
+@pytest.mark.parametrize(
+    "bands,error",
+    [
+        ([(0.0, 5.0, "low"), (4.0, 10.0, "high")], "overlaps the previous band"),
+        ([(5.0, 5.0, "empty")], "is empty"),
+    ],
+)
+def test_band_table_invalid(bands: list[tuple[float, float, str]], error: str) -> None:
+    """Test that invalid bands are rejected.
+
+    Args:
+        bands: A series of (minimum, maximum, classification) tuples.
+        error: The expected error message.
+    """
+    with pytest.raises(ValueError) as err:
+        _ = BandTable(bands)
+    assert error in str(err.value)
+
+
+@pytest.mark.parametrize(
+    "table,bands",
+    [
+        (
+            BEAUFORT_SCALE_BANDS[UnitSystem.IMPERIAL],
+            [(r.minimum_mph, r.maximum_mph, r) for r in BEAUFORT_SCALE_RATINGS],
+        ),
+        (
+            BEAUFORT_SCALE_BANDS[UnitSystem.METRIC],
+            [(r.minimum_kmh, r.maximum_kmh, r) for r in BEAUFORT_SCALE_RATINGS],
+        ),
+        (
+            HUMIDEX_PERCEPTION_BANDS,
+            [(r.minimum, r.maximum, r.perception) for r in HUMIDEX_PERCEPTION_RATINGS],
+        ),
+        (
+            RELATIVE_STRAIN_INDEX_PERCEPTION_BANDS,
+            [
+                (r.minimum, r.maximum, r.perception)
+                for r in RELATIVE_STRAIN_INDEX_PERCEPTION_RATINGS
+            ],
+        ),
+        (
+            SIMMER_ZONE_BANDS,
+            [(r.minimum_f, r.maximum_f, r.zone) for r in SIMMER_ZONE_RATINGS],
+        ),
+        (
+            THERMAL_PERCEPTION_BANDS,
+            [
+                (r.minimum_c, r.maximum_c, r.perception)
+                for r in THERMAL_PERCEPTION_RATINGS
+            ],
+        ),
+    ],
+)
+def test_rating_tables(
+    bands: list[tuple[float, float, Any]], table: BandTable[Any]
+) -> None:
+    """Test that the rating tables classify values like a scan over the ratings would.
+
+    Args:
+        bands: The (minimum, maximum, classification) tuples of the ratings (in the
+            order they are listed).
+        table: The BandTable compiled from the ratings.
+    """
+    values = get_test_values([b for band in bands for b in band[:2]])
+    expected = [
+        next((c for minimum, maximum, c in bands if minimum <= value < maximum), None)
+        for value in values
+    ]
+
+    assert [table.classify(value) for value in values] == expected
+    assert table.classify_many(values) == expected
+
+
+@pytest.mark.parametrize("wind_speed", ["-1.0", "250.0"])
+def test_beaufort_scale_out_of_range(wind_speed: str) -> None:
+    """Test that a wind speed outside of the Beaufort scale isn't rated.
+
+    Args:
+        wind_speed: A wind speed (in mph).
+    """
+    processed_data = ProcessedData(
+        Configs(TEST_CONFIG_JSON).default_config,
+        TEST_PAYLOAD | {"windspeedmph": wind_speed},
+    )
+    assert processed_data.output[DATA_POINT_BEAUFORT_SCALE].value is None
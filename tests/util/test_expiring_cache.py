@@ -0,0 +1,52 @@
+"""Test the expiring cache."""
+
+from unittest.mock import patch
+
+from ecowitt2mqtt.util.expiring_cache import ExpiringCache
+
+
+def test_lru_eviction() -> None:
+    """Test that the least recently used key is evicted once the cache is full."""
+    cache: ExpiringCache[str, int] = ExpiringCache(max_size=2, ttl=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Looking a key up counts as using it:
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert "b" not in cache
+    assert cache.items() == [("a", 1), ("c", 3)]
+
+
+def test_ttl_eviction() -> None:
+    """Test that keys that go unused for the TTL are evicted."""
+    cache: ExpiringCache[str, int] = ExpiringCache(max_size=10, ttl=60.0)
+
+    with patch("ecowitt2mqtt.util.expiring_cache.time.monotonic", return_value=0.0):
+        cache.set("a", 1)
+        cache.set("b", 2)
+    with patch("ecowitt2mqtt.util.expiring_cache.time.monotonic", return_value=30.0):
+        assert cache.get("a") == 1
+        # Checking whether a key is cached doesn't count as using it:
+        assert "b" in cache
+    with patch("ecowitt2mqtt.util.expiring_cache.time.monotonic", return_value=60.0):
+        assert "b" not in cache
+        assert cache.items() == [("a", 1)]
+    with patch("ecowitt2mqtt.util.expiring_cache.time.monotonic", return_value=90.0):
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+def test_pop_and_clear() -> None:
+    """Test removing keys."""
+    cache: ExpiringCache[str, int] = ExpiringCache(max_size=10, ttl=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+    assert cache.items() == [("b", 2)]
+
+    cache.clear()
+    assert len(cache) == 0
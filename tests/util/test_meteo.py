@@ -0,0 +1,107 @@
+"""Test meteorological utils."""
+
+from collections.abc import Callable
+
+import pytest
+
+from ecowitt2mqtt.const import UnitSystem
+from ecowitt2mqtt.util.meteo import (
+    celsius_to_fahrenheit,
+    fahrenheit_to_celsius,
+    get_absolute_humidity_in_metric,
+    get_dew_point_in_celsius,
+    get_feels_like_in_fahrenheit,
+    get_frost_point_in_celsius,
+    get_heat_index_in_fahrenheit,
+    get_humidex,
+    get_relative_strain_index,
+    get_simmer_index_in_fahrenheit,
+    get_temperature_in_celsius,
+    get_temperature_in_fahrenheit,
+    get_wind_chill_in_fahrenheit,
+)
+
+
+@pytest.mark.parametrize(
+    "func,args,expected",
+    [
+        (get_absolute_humidity_in_metric, (20.5, 65.0), 11.563843665851993),
+        (get_dew_point_in_celsius, (20.5, 65.0), 13.697630152664694),
+        (get_dew_point_in_celsius, (-5.5, 65.0), -11.03548834724018),
+        (get_feels_like_in_fahrenheit, (10.0, 40.0, 10.0), -3.5402167842280603),
+        (get_feels_like_in_fahrenheit, (95.3, 65.0, 10.0), 118.64787299080018),
+        (get_feels_like_in_fahrenheit, (70.0, 65.0, 10.0), 70.0),
+        (get_frost_point_in_celsius, (-5.5, 65.0), -10.407535144846406),
+        (get_heat_index_in_fahrenheit, (70.0, 40.0), 68.58),
+        (get_heat_index_in_fahrenheit, (95.3, 65.0), 118.64787299080018),
+        (get_humidex, (30.0, 65.0), 40),
+        (get_relative_strain_index, (30.0, 65.0), 0.3),
+        (get_simmer_index_in_fahrenheit, (80.0, 65.0), 93.1847),
+        (get_wind_chill_in_fahrenheit, (10.0, 10.0), -3.5402167842280603),
+    ],
+)
+def test_meteo(
+    args: tuple[float, ...], expected: float, func: Callable[..., float]
+) -> None:
+    """Test meteorological calculations.
+
+    Args:
+        args: The arguments to pass to the function.
+        expected: The expected result.
+        func: The function to test.
+    """
+    assert func(*args) == pytest.approx(expected, abs=1e-9)
+
+
+@pytest.mark.parametrize(
+    "func,args",
+    [
+        (get_dew_point_in_celsius, (20.5, 0.5)),
+        (get_dew_point_in_celsius, (20.5, 101.0)),
+        (get_relative_strain_index, (25.0, 65.0)),
+        (get_relative_strain_index, (36.0, 65.0)),
+        (get_simmer_index_in_fahrenheit, (69.9, 65.0)),
+        (get_wind_chill_in_fahrenheit, (51.0, 10.0)),
+        (get_wind_chill_in_fahrenheit, (10.0, 3.0)),
+    ],
+)
+def test_meteo_out_of_range(
+    args: tuple[float, ...], func: Callable[..., float]
+) -> None:
+    """Test meteorological calculations that aren't valid for their inputs.
+
+    Args:
+        args: The arguments to pass to the function.
+        func: The function to test.
+    """
+    with pytest.raises(ValueError):
+        func(*args)
+
+
+@pytest.mark.parametrize(
+    "temperature,unit_system,temperature_c,temperature_f",
+    [
+        (68.0, UnitSystem.IMPERIAL, 20.0, 68.0),
+        (20.0, UnitSystem.METRIC, 20.0, 68.0),
+        (-40, UnitSystem.METRIC, -40.0, -40.0),
+    ],
+)
+def test_temperature(
+    temperature: float,
+    temperature_c: float,
+    temperature_f: float,
+    unit_system: UnitSystem,
+) -> None:
+    """Test getting a temperature in a particular unit.
+
+    Args:
+        temperature: A temperature in the unit system.
+        temperature_c: The expected temperature in Celsius.
+        temperature_f: The expected temperature in Fahrenheit.
+        unit_system: The unit system of the temperature.
+    """
+    assert get_temperature_in_celsius(temperature, unit_system) == temperature_c
+    assert get_temperature_in_fahrenheit(temperature, unit_system) == temperature_f
+    assert fahrenheit_to_celsius(celsius_to_fahrenheit(temperature_c)) == pytest.approx(
+        temperature_c
+    )
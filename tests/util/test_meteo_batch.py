@@ -0,0 +1,98 @@
+"""Define tests for batched meteorological calculations."""
+
+from __future__ import annotations
+
+import pytest
+
+from ecowitt2mqtt.util import meteo_batch
+from ecowitt2mqtt.util.meteo import (
+    celsius_to_fahrenheit,
+    get_absolute_humidity_in_metric,
+    get_dew_point_in_celsius,
+    get_frost_point_from_dew_point_in_celsius,
+    get_heat_index_in_fahrenheit,
+)
+from ecowitt2mqtt.util.meteo_batch import HumidityMetrics, get_humidity_metrics
+
+TEMPERATURES_C = [-25.0, -5.5, 0.0, 0.5, 12.3, 20.0, 27.0, 33.3, 41.0]
+HUMIDITIES = [0.0, 1.0, 15.0, 40.0, 55.5, 65.0, 80.0, 100.0, 101.0]
+
+
+def get_test_batch() -> tuple[list[float], list[float], list[float]]:
+    """Get every combination of the test temperatures and humidities.
+
+    Returns:
+        Lists of temperatures (in Celsius and Fahrenheit) and relative humidities.
+    """
+    temperatures_c = [t for t in TEMPERATURES_C for _ in HUMIDITIES]
+    humidities = [h for _ in TEMPERATURES_C for h in HUMIDITIES]
+    temperatures_f = [celsius_to_fahrenheit(t) for t in temperatures_c]
+    return temperatures_c, temperatures_f, humidities
+
+
+def test_humidity_metrics() -> None:
+    """Test that a batch gets the same metrics as the scalar functions."""
+    temperatures_c, temperatures_f, humidities = get_test_batch()
+    metrics = get_humidity_metrics(
+        temperatures_c[:8], temperatures_f[:8], humidities[:8]
+    )
+
+    for index, (temperature_c, temperature_f, humidity) in enumerate(
+        zip(temperatures_c[:8], temperatures_f[:8], humidities[:8])
+    ):
+        assert metrics.absolute_humidity[index] == get_absolute_humidity_in_metric(
+            temperature_c, humidity
+        )
+        assert metrics.heat_index_f[index] == get_heat_index_in_fahrenheit(
+            temperature_f, humidity
+        )
+        try:
+            dew_point_c = get_dew_point_in_celsius(temperature_c, humidity)
+        except ValueError:
+            assert metrics.dew_point_c[index] is None
+            assert metrics.frost_point_c[index] is None
+        else:
+            assert metrics.dew_point_c[index] == dew_point_c
+            assert metrics.frost_point_c[index] == (
+                get_frost_point_from_dew_point_in_celsius(temperature_c, dew_point_c)
+            )
+
+
+def test_humidity_metrics_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that NumPy gets the same metrics as the scalar functions.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    if meteo_batch.np is None:  # pragma: no cover
+        pytest.skip("NumPy isn't installed")
+
+    batch = get_test_batch()
+    monkeypatch.setattr(meteo_batch, "NUMPY_MIN_BATCH_SIZE", len(batch[0]) + 1)
+    expected = get_humidity_metrics(*batch)
+    monkeypatch.setattr(meteo_batch, "NUMPY_MIN_BATCH_SIZE", 0)
+    metrics = get_humidity_metrics(*batch)
+
+    assert metrics.absolute_humidity == pytest.approx(expected.absolute_humidity)
+    assert metrics.heat_index_f == pytest.approx(expected.heat_index_f)
+    for field in ("dew_point_c", "frost_point_c"):
+        for value, expected_value in zip(
+            getattr(metrics, field), getattr(expected, field)
+        ):
+            if expected_value is None:
+                assert value is None
+            else:
+                assert value == pytest.approx(expected_value)
+
+
+def test_humidity_metrics_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a large batch is calculated without NumPy when it isn't installed.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(meteo_batch, "np", None)
+    monkeypatch.setattr(meteo_batch, "NUMPY_MIN_BATCH_SIZE", 0)
+    assert get_humidity_metrics([20.0], [68.0], [0.0]) == HumidityMetrics(
+        [0.0], [None], [None], [get_heat_index_in_fahrenheit(68.0, 0.0)]
+    )
@@ -0,0 +1,37 @@
+"""Test network utilities."""
+
+import pytest
+
+from ecowitt2mqtt.util.network import BrokerAddress, parse_broker_address
+
+
+@pytest.mark.parametrize(
+    "value,address",
+    [
+        ("broker.local", BrokerAddress("broker.local", 1883)),
+        ("broker.local:8883", BrokerAddress("broker.local", 8883)),
+        ("192.168.1.100:1884", BrokerAddress("192.168.1.100", 1884)),
+        ("::1", BrokerAddress("::1", 1883)),
+        ("[::1]", BrokerAddress("::1", 1883)),
+        ("[fe80::1]:8883", BrokerAddress("fe80::1", 8883)),
+    ],
+)
+def test_parse_broker_address(value: str, address: BrokerAddress) -> None:
+    """Test parsing broker addresses.
+
+    Args:
+        value: A broker address.
+        address: The expected BrokerAddress object.
+    """
+    assert parse_broker_address(value, 1883) == address
+
+
+def test_parse_broker_address_invalid_port() -> None:
+    """Test that a broker address with an invalid port is rejected."""
+    with pytest.raises(ValueError):
+        parse_broker_address("broker.local:port", 1883)
+
+
+def test_broker_address_str() -> None:
+    """Test the string representation of a broker address."""
+    assert str(BrokerAddress("broker.local", 1883)) == "broker.local:1883"
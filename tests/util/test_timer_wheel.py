@@ -0,0 +1,62 @@
+"""Test the timer wheel."""
+
+from ecowitt2mqtt.util.timer_wheel import TimerWheel
+
+
+def test_advance() -> None:
+    """Test that keys expire once their deadline passes."""
+    wheel: TimerWheel[str] = TimerWheel(1.0, slot_count=8)
+    wheel.schedule("a", 2.5)
+    wheel.schedule("b", 4.0)
+    assert len(wheel) == 2
+    assert "a" in wheel
+
+    assert not wheel.advance(2.9)
+    assert wheel.advance(3.0) == ["a"]
+    assert "a" not in wheel
+    assert wheel.advance(4.0) == ["b"]
+    assert not wheel
+
+
+def test_cancel() -> None:
+    """Test cancelling and rescheduling keys."""
+    wheel: TimerWheel[str] = TimerWheel(1.0, slot_count=8)
+    wheel.schedule("a", 2.0)
+    wheel.schedule("b", 2.0)
+    wheel.cancel("a")
+    wheel.cancel("c")
+    assert wheel.advance(2.0) == ["b"]
+
+    # Rescheduling a key replaces its deadline:
+    wheel.schedule("a", 3.0)
+    wheel.schedule("a", 5.0)
+    assert not wheel.advance(4.0)
+    assert wheel.advance(5.0) == ["a"]
+
+
+def test_later_revolutions() -> None:
+    """Test deadlines that lie more than one revolution away."""
+    wheel: TimerWheel[str] = TimerWheel(1.0, slot_count=8)
+    wheel.schedule("near", 3.0)
+    wheel.schedule("far", 19.0)
+
+    # Both keys share a slot, but only the near one is due on the first revolution:
+    assert wheel.advance(3.0) == ["near"]
+    assert not wheel.advance(18.0)
+    assert wheel.advance(19.0) == ["far"]
+
+
+def test_large_jump() -> None:
+    """Test advancing the wheel across many revolutions at once."""
+    wheel: TimerWheel[int] = TimerWheel(0.5, slot_count=8)
+    for key in range(100):
+        wheel.schedule(key, 1000.0 + key)
+    assert sorted(wheel.advance(10_000.0)) == list(range(100))
+
+
+def test_past_deadline() -> None:
+    """Test that a deadline in the past expires on the next tick."""
+    wheel: TimerWheel[str] = TimerWheel(1.0, slot_count=8)
+    assert not wheel.advance(10.0)
+    wheel.schedule("a", 5.0)
+    assert wheel.advance(11.0) == ["a"]
@@ -1,5 +1,7 @@
 """Test unit conversion helpers."""
 
+from array import array
+
 import pytest
 
 from ecowitt2mqtt.util.unit_conversion import (
@@ -41,6 +43,149 @@ def test_accumulated_precipitation_conversion(
     )
 
 
+@pytest.mark.parametrize(
+    "converter,from_unit,to_unit",
+    [
+        (DistanceConverter, "km", "km"),
+        (DistanceConverter, "km", "mi"),
+        (IlluminanceConverter, "W/m²", "%"),
+        (IlluminanceConverter, "%", "lx"),
+        (PressureConverter, "inHg", "hPa"),
+        (SpeedConverter, "mph", "m/s"),
+        (TemperatureConverter, "°F", "°C"),
+        (TemperatureConverter, "K", "°F"),
+    ],
+)
+def test_convert_many(
+    converter: type[BaseUnitConverter], from_unit: str, to_unit: str
+) -> None:
+    """Test that converting a series of values matches converting each one.
+
+    Args:
+        converter: A BaseUnitConverter subclass.
+        from_unit: The unit being converted from.
+        to_unit: The unit being converted to.
+    """
+    values = [-12.5, -0.0, 0, 1.5e-05, 10, 33.3, 264.61, 1013.25]
+    converted_values = [
+        converter.convert(value, from_unit, to_unit) for value in values
+    ]
+    assert converter.convert_many(values, from_unit, to_unit) == converted_values
+    assert converter.convert_many(
+        array("d", values), from_unit, to_unit
+    ) == converter.convert_many([float(value) for value in values], from_unit, to_unit)
+
+
+@pytest.mark.parametrize(
+    "converter,from_unit,to_unit,value,converted_value",
+    [
+        # Results of the conversions before they were compiled (which they must
+        # match bit-for-bit):
+        (AccumulatedPrecipitationConverter, "in", "mm", -12.5, -317.5),
+        (AccumulatedPrecipitationConverter, "in", "mm", -0.0, -0.0),
+        (AccumulatedPrecipitationConverter, "in", "mm", 10, 254.0),
+        (AccumulatedPrecipitationConverter, "in", "mm", 1.5e-05, 0.000381),
+        (AccumulatedPrecipitationConverter, "in", "mm", 264.61, 6721.094),
+        (AccumulatedPrecipitationConverter, "mm", "in", -12.5, -0.4921259842519685),
+        (AccumulatedPrecipitationConverter, "mm", "in", -0.0, -0.0),
+        (AccumulatedPrecipitationConverter, "mm", "in", 10, 0.39370078740157477),
+        (AccumulatedPrecipitationConverter, "mm", "in", 1.5e-05, 5.9055118110236e-07),
+        (AccumulatedPrecipitationConverter, "mm", "in", 264.61, 10.41771653543307),
+        (DistanceConverter, "km", "mi", -12.5, -7.767139902966675),
+        (DistanceConverter, "km", "mi", -0.0, -0.0),
+        (DistanceConverter, "km", "mi", 10, 6.21371192237334),
+        (DistanceConverter, "km", "mi", 1.5e-05, 9.32056788356e-06),
+        (DistanceConverter, "km", "mi", 264.61, 164.42103117792095),
+        (IlluminanceConverter, "W/m²", "%", -12.5, 0.0),
+        (IlluminanceConverter, "W/m²", "%", -0.0, 0.0),
+        (IlluminanceConverter, "W/m²", "%", 10, 62.04745817419117),
+        (IlluminanceConverter, "W/m²", "%", 1.5e-05, -54.4307166446952),
+        (IlluminanceConverter, "W/m²", "%", 264.61, 90.49958322993245),
+        (IlluminanceConverter, "%", "lx", -12.5, 0.23713737056616552),
+        (IlluminanceConverter, "%", "lx", -0.0, 1.0),
+        (IlluminanceConverter, "%", "lx", 10, 3.1622776601683795),
+        (IlluminanceConverter, "%", "lx", 1.5e-05, 1.000001726940311),
+        (IlluminanceConverter, "%", "lx", 264.61, 17001999536423.62),
+        (PrecipitationRateConverter, "in/h", "mm/h", -12.5, -317.5),
+        (PrecipitationRateConverter, "in/h", "mm/h", -0.0, -0.0),
+        (PrecipitationRateConverter, "in/h", "mm/h", 10, 254.0),
+        (PrecipitationRateConverter, "in/h", "mm/h", 1.5e-05, 0.000381),
+        (PrecipitationRateConverter, "in/h", "mm/h", 264.61, 6721.094),
+        (PressureConverter, "inHg", "hPa", -12.5, -423.29858004262496),
+        (PressureConverter, "inHg", "hPa", -0.0, -0.0),
+        (PressureConverter, "inHg", "hPa", 10, 338.6388640341),
+        (PressureConverter, "inHg", "hPa", 1.5e-05, 0.0005079582960511499),
+        (PressureConverter, "inHg", "hPa", 264.61, 8960.72298120632),
+        (SpeedConverter, "mph", "m/s", -12.5, -5.587999999999999),
+        (SpeedConverter, "mph", "m/s", -0.0, -0.0),
+        (SpeedConverter, "mph", "m/s", 10, 4.4704),
+        (SpeedConverter, "mph", "m/s", 1.5e-05, 6.71e-06),
+        (SpeedConverter, "mph", "m/s", 264.61, 118.2912544),
+        (TemperatureConverter, "°F", "°C", -12.5, -24.72222222222222),
+        (TemperatureConverter, "°F", "°C", -0.0, -17.77777777777778),
+        (TemperatureConverter, "°F", "°C", 10, -12.222222222222221),
+        (TemperatureConverter, "°F", "°C", 1.5e-05, -17.777769444444445),
+        (TemperatureConverter, "°F", "°C", 264.61, 129.2277777777778),
+        (TemperatureConverter, "K", "°F", -12.5, -482.16999999999996),
+        (TemperatureConverter, "K", "°F", -0.0, -459.66999999999996),
+        (TemperatureConverter, "K", "°F", 10, -441.66999999999996),
+        (TemperatureConverter, "K", "°F", 1.5e-05, -459.6699729999999),
+        (TemperatureConverter, "K", "°F", 264.61, 16.628000000000064),
+        (VolumeConverter, "g/m³", "lbs/ft³", -12.5, -0.0007803495072018074),
+        (VolumeConverter, "g/m³", "lbs/ft³", -0.0, -0.0),
+        (VolumeConverter, "g/m³", "lbs/ft³", 10, 0.0006242796057614459),
+        (VolumeConverter, "g/m³", "lbs/ft³", 1.5e-05, 9.364194086422e-10),
+        (VolumeConverter, "g/m³", "lbs/ft³", 264.61, 0.016519062648053622),
+        (DistanceConverter, "km", "km", -0.0, -0.0),
+        (DistanceConverter, "km", "km", 10, 10),
+        (TemperatureConverter, "°C", "°C", -0.0, -0.0),
+        (TemperatureConverter, "°C", "°C", 10, 10),
+    ],
+)
+def test_convert_previous_results(
+    converted_value: float,
+    converter: type[BaseUnitConverter],
+    from_unit: str,
+    to_unit: str,
+    value: float,
+) -> None:
+    """Test that conversions match the results of the previous implementation.
+
+    Args:
+        converted_value: The converted value.
+        converter: A BaseUnitConverter subclass.
+        from_unit: The unit being converted from.
+        to_unit: The unit being converted to.
+        value: The original value.
+    """
+    # Comparing reprs tells -0.0 from 0.0 (and integers from floats):
+    assert repr(converter.convert(value, from_unit, to_unit)) == repr(converted_value)
+    assert repr(converter.convert_many([value], from_unit, to_unit)[0]) == repr(
+        converted_value
+    )
+
+
+@pytest.mark.parametrize(
+    "converter,from_unit,to_unit",
+    [
+        (DistanceConverter, "miles", "ft"),
+        (TemperatureConverter, "°C", "Bolts"),
+    ],
+)
+def test_convert_many_invalid_units(
+    converter: type[BaseUnitConverter], from_unit: str, to_unit: str
+) -> None:
+    """Test that converting a series of values between invalid units raises an error.
+
+    Args:
+        converter: A BaseUnitConverter subclass.
+        from_unit: The unit being converted from.
+        to_unit: The unit being converted to.
+    """
+    with pytest.raises(UnitConversionError):
+        _ = converter.convert_many([10.0], from_unit, to_unit)
+
+
 @pytest.mark.parametrize(
     "value,from_unit,to_unit,converted_value",
     [